@@ -2,20 +2,145 @@ from pathlib import Path
 
 _asb_root = Path(__file__).parent
 
-from aerosandbox.common import *
-from aerosandbox.optimization import *
-from aerosandbox.modeling import *
-from aerosandbox.geometry import *
-from aerosandbox.atmosphere import *
-from aerosandbox.weights import *
-from aerosandbox.performance import *
-from aerosandbox.dynamics import *
-from aerosandbox.aerodynamics import *
-from aerosandbox.propulsion import *
-from aerosandbox.structures import *
-
 __version__ = "3.5.13"
 
+### Lazy loading of subpackages
+# Subpackages are imported on first use (PEP 562), rather than when `aerosandbox` itself is imported. So,
+# `import aerosandbox as asb` is nearly instant, and `asb.Airplane` only pulls in the subpackages that it needs.
+#
+# The public namespace is the same as if each of these subpackages had been star-imported, in this order (so,
+# if two subpackages export the same name, the later one wins):
+_lazy_subpackages = [
+    "common",
+    "optimization",
+    "modeling",
+    "geometry",
+    "atmosphere",
+    "weights",
+    "performance",
+    "dynamics",
+    "aerodynamics",
+    "propulsion",
+    "structures",
+]
+
+
+# The subpackage that provides each name in the public namespace, so that looking it up only loads that subpackage.
+# As with star-imports, if two subpackages export different objects under the same name, the later one is listed;
+# if they export the same object (e.g., one re-exports the other's), the earlier one is listed, since it is cheaper to
+# import. Any name not listed here (e.g., a submodule) is resolved by loading all subpackages.
+#
+# This is kept in sync with the subpackages' exports by `test_lazy_namespace_matches_eager_namespace()`, in
+# `aerosandbox/tools/test_tools/test_import_time.py`; when adding a public name to a subpackage, add it here too.
+_lazy_attributes = {
+    **{name: "common" for name in [
+        "AeroSandboxObject", "Any", "Dict", "ExplicitAnalysis", "ImplicitAnalysis", "Opti", "Tuple", "abstractmethod",
+        "cas", "copy", "functools", "inspect", "np",
+    ]},
+    **{name: "optimization" for name in [
+        "Callable", "List", "MultiStartSolution", "ScalingReport", "SolveReport", "SortedDict", "Union",
+        "compare_solve_reports", "deduplicate_solutions", "inspect_tools", "json", "sample_initial_guesses",
+        "solve_least_squares",
+    ]},
+    **{name: "modeling" for name in [
+        "FittedModel", "InterpolatedModel", "MultiOutputInterpolatedModel", "UnstructuredInterpolatedModel",
+    ]},
+    **{name: "geometry" for name in [
+        "Airfoil", "Airplane", "ControlSurface", "Fuselage", "FuselageXSec", "Wing", "WingXSec", "is_casadi_type",
+        "mesh_utils", "reflect_over_XZ_plane",
+    ]},
+    **{name: "atmosphere" for name in [
+        "Atmosphere",
+    ]},
+    **{name: "weights" for name in [
+        "MassProperties", "MassPropertiesSet", "mass_properties_from_radius_of_gyration",
+    ]},
+    **{name: "performance" for name in [
+        "OperatingPoint", "trim_string",
+    ]},
+    **{name: "dynamics" for name in [
+        "DynamicsPointMass1DHorizontal", "DynamicsPointMass1DVertical", "DynamicsPointMass2DCartesian",
+        "DynamicsPointMass2DSpeedGamma", "DynamicsPointMass3DCartesian", "DynamicsPointMass3DSpeedGammaTrack",
+        "DynamicsRigidBody2DBody", "DynamicsRigidBody3DBodyEuler",
+    ]},
+    **{name: "aerodynamics" for name in [
+        "AVL", "AeroBuildup", "AeroDatabase", "AirfoilInviscid", "LiftingLine", "MSES", "Path", "VortexLatticeMethod",
+        "XFoil", "aero", "aerolib", "calculate_induced_velocity_horseshoe", "critical_mach",
+        "fuselage_base_drag_coefficient", "fuselage_form_factor", "itertools", "jorgensen_eta", "subprocess", "tall",
+        "tempfile", "transonic", "warnings", "wide",
+    ]},
+}
+
+_all_subpackages_loaded = False
+
+
+def _load_all_subpackages() -> None:
+    """
+    Imports all subpackages into this namespace, exactly as `from aerosandbox.<subpackage> import *` would.
+    """
+    global _all_subpackages_loaded
+    if _all_subpackages_loaded:
+        return
+
+    import importlib
+
+    own_names = {"docs", "run_tests", "__version__"}
+
+    for subpackage in _lazy_subpackages:
+        module = importlib.import_module(f"aerosandbox.{subpackage}")
+        try:
+            names = module.__all__
+        except AttributeError:
+            names = [name for name in vars(module) if not name.startswith("_")]
+        globals().update({
+            name: getattr(module, name)
+            for name in names
+            if name not in own_names
+        })
+
+    _all_subpackages_loaded = True
+
+
+def __getattr__(name: str):
+    import importlib
+    import importlib.util
+    import sys
+
+    # Submodules that are already (perhaps partially) imported, e.g. by `import aerosandbox.numpy as np`.
+    if f"aerosandbox.{name}" in sys.modules:
+        return sys.modules[f"aerosandbox.{name}"]
+
+    if name == "__all__":
+        _load_all_subpackages()
+        return [
+            name
+            for name in globals()
+            if not name.startswith("_")
+        ]
+
+    if name.startswith("__"):  # Other dunder lookups (e.g., by `copy` or `inspect`) shouldn't trigger any loading.
+        raise AttributeError(f"module 'aerosandbox' has no attribute '{name}'")
+
+    if name in _lazy_attributes:
+        module = importlib.import_module(f"aerosandbox.{_lazy_attributes[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    _load_all_subpackages()
+    if name in globals():
+        return globals()[name]
+
+    # Other subpackages (e.g., `aerosandbox.library`) are available as attributes too.
+    if importlib.util.find_spec(f"aerosandbox.{name}") is not None:
+        return importlib.import_module(f"aerosandbox.{name}")
+
+    raise AttributeError(f"module 'aerosandbox' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
+
 
 def docs():
     """
@@ -1,4 +1,5 @@
 from .vortex_lattice_method import *
 from .lifting_line import *
 from .aero_buildup import *
+from .aero_database import *
 from .avl import *
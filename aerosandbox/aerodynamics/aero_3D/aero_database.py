@@ -0,0 +1,564 @@
+from typing import Union, Dict, List, Any
+from pathlib import Path
+import itertools
+import copy
+import json
+import aerosandbox.numpy as np
+from aerosandbox.common import AeroSandboxObject
+from aerosandbox.geometry import Airplane
+from aerosandbox.atmosphere import Atmosphere
+from aerosandbox.performance import OperatingPoint
+from aerosandbox.modeling.interpolation_multi_output import MultiOutputInterpolatedModel
+from aerosandbox.aerodynamics.aero_3D.aero_buildup import AeroBuildup
+
+_save_format_version = 1
+
+_coefficient_names = ["CL", "CY", "CD", "Cl", "Cm", "Cn"]
+_rate_names = ["p", "q", "r"]
+
+
+class AeroDatabase(AeroSandboxObject):
+    """
+    A precomputed, gridded database of the aerodynamic coefficients of an airplane, which can be used in place of
+    an aerodynamic analysis (e.g., AeroBuildup) within a simulation or optimization.
+
+    The static coefficients (CL, CY, CD, Cl, Cm, Cn) and their derivatives with respect to the nondimensional rotation
+    rates (e.g., Cmq, Clp, Cnr) are tabulated over a grid of alpha, beta, Mach, and control surface deflections,
+    and are interpolated (with a single MultiOutputInterpolatedModel) at evaluation time. Rotation rates are then
+    accounted for by linearly applying the rate derivatives. So, each evaluation costs microseconds rather than a full
+    aerodynamic analysis, and it works with both numeric and CasADi (i.e., optimization or simulation) inputs.
+
+    Example usage:
+
+    >>> database = asb.AeroDatabase.from_aero_buildup(  # Sweeps AeroBuildup over a grid; slow, but done once.
+    >>>     airplane=my_airplane,
+    >>>     alpha=np.linspace(-10, 15, 26),
+    >>>     beta=np.linspace(-10, 10, 11),
+    >>>     control_deflections={"elevator": np.linspace(-20, 20, 9)},
+    >>>     n_workers=None,  # Uses all CPUs
+    >>> )
+    >>> database.save("my_airplane_aero.npz")
+    >>>
+    >>> database = asb.AeroDatabase.load("my_airplane_aero.npz")
+    >>> aero = database.aerodynamics(op_point=my_op_point, control_deflections={"elevator": 5})
+    >>>
+    >>> def forces(dyn, t):  # For use with, e.g., `Dynamics.simulate()`
+    >>>     dyn.add_gravity_force()
+    >>>     database.add_to_dynamics(dyn, control_deflections={"elevator": 5})
+
+    """
+
+    def __init__(self,
+                 x_data_coordinates: Dict[str, np.ndarray],
+                 y_data_structured: Dict[str, np.ndarray],
+                 s_ref: float,
+                 c_ref: float,
+                 b_ref: float,
+                 xyz_ref: Union[np.ndarray, List[float]] = None,
+                 method: str = "bspline",
+                 fill_value=None,  # Default behavior: clamp inputs to the edges of the database.
+                 ):
+        """
+        Creates an AeroDatabase from already-computed data. (Most users will instead want
+        `AeroDatabase.from_aero_buildup()` or `AeroDatabase.load()`.)
+
+        Args:
+
+            x_data_coordinates: The coordinates of each axis of the grid, as a dict, where keys are axis names and
+            values are 1D arrays. Keys must include "alpha" [deg], "beta" [deg], and "mach" [-]; any other keys are
+            names of control surfaces (with deflections in [deg]). Axes with only a single value are held constant
+            (i.e., are ignored at evaluation time).
+
+            y_data_structured: The tabulated data, as a dict, where keys are output names and values are arrays with
+            one axis per entry in `x_data_coordinates`. Must include the keys "CL", "CY", "CD", "Cl", "Cm",
+            and "Cn", and may also include rate derivatives (e.g., "Cmq"; see `AeroBuildup.run_with_stability_derivatives()`).
+
+            s_ref: The reference area used to nondimensionalize the data [m^2].
+
+            c_ref: The reference chord used to nondimensionalize the data [m].
+
+            b_ref: The reference span used to nondimensionalize the data [m].
+
+            xyz_ref: The moment reference point of the data [m]. For use in simulation, this should be the center of
+            gravity.
+
+            method: The method of interpolation. See `InterpolatedModel.__init__()`.
+
+            fill_value: The value to return for inputs outside of the database. If None (default), inputs are
+            clamped to the edges of the database.
+
+        """
+        ### Validate inputs
+        for k in ["alpha", "beta", "mach"]:
+            if k not in x_data_coordinates:
+                raise ValueError(f"`x_data_coordinates` must have the key '{k}'.")
+        for k in _coefficient_names:
+            if k not in y_data_structured:
+                raise ValueError(f"`y_data_structured` must have the key '{k}'.")
+
+        x_data_coordinates = {
+            k: np.array(v, dtype=float).reshape(-1)
+            for k, v in x_data_coordinates.items()
+        }
+        implied_y_data_shape = tuple(len(v) for v in x_data_coordinates.values())
+        for k, v in y_data_structured.items():
+            if not np.shape(v) == implied_y_data_shape:
+                raise ValueError(f"The shape of `y_data_structured['{k}']` should be {implied_y_data_shape}.")
+
+        ### Store data
+        self.x_data_coordinates = x_data_coordinates
+        self.y_data_structured = y_data_structured
+        self.s_ref = s_ref
+        self.c_ref = c_ref
+        self.b_ref = b_ref
+        self.xyz_ref = xyz_ref
+        self.method = method
+        self.fill_value = fill_value
+
+        ### Build the interpolated model over all axes that actually vary
+        varying_axes = [
+            i for i, v in enumerate(x_data_coordinates.values())
+            if len(v) > 1
+        ]
+        if len(varying_axes) == 0:
+            raise ValueError("At least one axis of `x_data_coordinates` must have more than one value.")
+
+        varying_shape = tuple(implied_y_data_shape[i] for i in varying_axes)
+        axis_names = list(x_data_coordinates.keys())
+
+        self.model = MultiOutputInterpolatedModel(
+            x_data_coordinates={
+                axis_names[i]: x_data_coordinates[axis_names[i]]
+                for i in varying_axes
+            },
+            y_data_structured={
+                k: np.array(v, dtype=float).reshape(varying_shape)
+                for k, v in y_data_structured.items()
+            },
+            method=method,
+            fill_value=fill_value,
+        )
+
+    def __repr__(self) -> str:
+        axes = ", ".join([
+            f"{k} ({len(v)})"
+            for k, v in self.x_data_coordinates.items()
+        ])
+        return f"AeroDatabase(axes: {axes}; outputs: {list(self.y_data_structured.keys())})"
+
+    @property
+    def control_surface_names(self) -> List[str]:
+        """
+        The names of the control surfaces that this database is tabulated over.
+        """
+        return [
+            k for k in self.x_data_coordinates.keys()
+            if k not in ["alpha", "beta", "mach"]
+        ]
+
+    @classmethod
+    def from_aero_buildup(cls,
+                          airplane: Airplane,
+                          alpha: Union[float, np.ndarray],
+                          beta: Union[float, np.ndarray] = 0.,
+                          mach: Union[float, np.ndarray] = 0.1,
+                          control_deflections: Dict[str, Union[float, np.ndarray]] = None,
+                          atmosphere: Atmosphere = Atmosphere(altitude=0),
+                          xyz_ref: Union[np.ndarray, List[float]] = None,
+                          include_rate_derivatives: bool = True,
+                          method: str = "bspline",
+                          fill_value=None,
+                          n_workers: int = 1,
+                          ) -> "AeroDatabase":
+        """
+        Builds an AeroDatabase by running AeroBuildup over a grid of flight conditions.
+
+        For each combination of control surface deflections and Mach number, AeroBuildup is run once,
+        vectorized over the full grid of alpha and beta. These runs are independent, and can be spread across worker
+        processes with `n_workers`.
+
+        Args:
+
+            airplane: The airplane to analyze. Must have reference values (`s_ref`, `c_ref`, `b_ref`).
+
+            alpha: The angles of attack to tabulate [deg], as a scalar or 1D array.
+
+            beta: The sideslip angles to tabulate [deg], as a scalar or 1D array.
+
+            mach: The Mach numbers to tabulate [-], as a scalar or 1D array.
+
+            control_deflections: [Optional] The control surface deflections to tabulate, as a dict, where keys are
+            control surface names (see `ControlSurface.name`) and values are deflections [deg], as a scalar or 1D
+            array. A deflection applies to all control surfaces on the airplane with that name.
+
+            atmosphere: The atmosphere at which to run the analysis. (Coefficients depend on this only through
+            Reynolds number effects.)
+
+            xyz_ref: The moment reference point [m]. Defaults to `airplane.xyz_ref`.
+
+            include_rate_derivatives: If True, also tabulates the derivatives of each coefficient with respect to
+            the nondimensional rotation rates (p, q, r), so that the database includes damping effects. Costs
+            roughly 4x as many AeroBuildup evaluations.
+
+            method: The method of interpolation. See `InterpolatedModel.__init__()`.
+
+            fill_value: The value to return for inputs outside of the database. If None (default), inputs are
+            clamped to the edges of the database.
+
+            n_workers: The number of worker processes to use. If 1 (default), runs serially in this process. If
+            None, uses one worker per CPU.
+
+        Returns: An AeroDatabase.
+
+        """
+        if control_deflections is None:
+            control_deflections = {}
+        if xyz_ref is None:
+            xyz_ref = airplane.xyz_ref
+
+        ### Check that each control surface exists on this airplane
+        control_surface_names = set(
+            surf.name
+            for wing in airplane.wings
+            for xsec in wing.xsecs
+            for surf in xsec.control_surfaces
+        )
+        for k in control_deflections.keys():
+            if k not in control_surface_names:
+                raise ValueError(f"This airplane does not have a control surface named '{k}'!")
+
+        x_data_coordinates = {
+            "alpha": alpha,
+            "beta" : beta,
+            "mach" : mach,
+            **control_deflections,
+        }
+        x_data_coordinates = {
+            k: np.array(v, dtype=float).reshape(-1)
+            for k, v in x_data_coordinates.items()
+        }
+        grid_shape = tuple(len(v) for v in x_data_coordinates.values())
+
+        output_names = _coefficient_names.copy()
+        if include_rate_derivatives:
+            output_names += [
+                f"{coefficient}{rate}"
+                for coefficient in _coefficient_names
+                for rate in _rate_names
+            ]
+
+        ### Assemble one task per combination of (Mach, control deflections), each vectorized over (alpha, beta)
+        Alpha, Beta = np.meshgrid(
+            x_data_coordinates["alpha"],
+            x_data_coordinates["beta"],
+            indexing="ij"
+        )
+        control_names = list(control_deflections.keys())
+
+        task_indices = list(itertools.product(*[
+            range(n) for n in grid_shape[2:]
+        ]))
+        tasks = [
+            dict(
+                airplane=airplane,
+                alpha=Alpha.reshape(-1),
+                beta=Beta.reshape(-1),
+                mach=x_data_coordinates["mach"][indices[0]],
+                control_deflections={
+                    k: x_data_coordinates[k][index]
+                    for k, index in zip(control_names, indices[1:])
+                },
+                atmosphere=atmosphere,
+                xyz_ref=xyz_ref,
+                include_rate_derivatives=include_rate_derivatives,
+                output_names=output_names,
+            )
+            for indices in task_indices
+        ]
+
+        if n_workers == 1:
+            results = [_run_aero_buildup(**task) for task in tasks]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = [
+                    executor.submit(_run_aero_buildup, **task)
+                    for task in tasks
+                ]
+                results = [future.result() for future in futures]
+
+        ### Gather the results onto the grid
+        y_data_structured = {
+            k: np.empty(grid_shape)
+            for k in output_names
+        }
+        for indices, result in zip(task_indices, results):
+            for k in output_names:
+                y_data_structured[k][(slice(None), slice(None)) + indices] = result[k].reshape(grid_shape[:2])
+
+        return cls(
+            x_data_coordinates=x_data_coordinates,
+            y_data_structured=y_data_structured,
+            s_ref=airplane.s_ref,
+            c_ref=airplane.c_ref,
+            b_ref=airplane.b_ref,
+            xyz_ref=xyz_ref,
+            method=method,
+            fill_value=fill_value,
+        )
+
+    def coefficients(self,
+                     op_point: OperatingPoint,
+                     control_deflections: Dict[str, Union[float, np.ndarray]] = None,
+                     ) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Evaluates the aerodynamic coefficients at a given operating point.
+
+        Args:
+
+            op_point: The operating point. May be vectorized, and may contain CasADi types.
+
+            control_deflections: [Optional] The control surface deflections [deg], as a dict, where keys are
+            control surface names. Any control surfaces in this database that are not given are taken to be
+            undeflected.
+
+        Returns: A dictionary with keys "CL", "CY", "CD" (in wind axes) and "Cl", "Cm", "Cn" (in body axes),
+        including the effects of rotation rates.
+
+        """
+        if control_deflections is None:
+            control_deflections = {}
+        for k in control_deflections.keys():
+            if k not in self.control_surface_names:
+                raise ValueError(f"This database does not have a control surface named '{k}'!")
+
+        inputs = {
+            "alpha": op_point.alpha,
+            "beta" : op_point.beta,
+            "mach" : op_point.mach(),
+            **{
+                k: control_deflections.get(k, 0.)
+                for k in self.control_surface_names
+            },
+        }
+        outputs = self.model({
+            k: inputs[k]
+            for k in self.model.x_data_coordinates.keys()
+        })
+
+        ### Apply the rate derivatives, with nondimensional rates
+        rates_nondimensional = {
+            "p": op_point.p * self.b_ref / (2 * op_point.velocity),
+            "q": op_point.q * self.c_ref / (2 * op_point.velocity),
+            "r": op_point.r * self.b_ref / (2 * op_point.velocity),
+        }
+
+        coefficients = {}
+        for coefficient in _coefficient_names:
+            value = outputs[coefficient]
+            for rate in _rate_names:
+                derivative_name = f"{coefficient}{rate}"
+                if derivative_name in outputs:
+                    value = value + outputs[derivative_name] * rates_nondimensional[rate]
+            coefficients[coefficient] = value
+
+        return coefficients
+
+    def aerodynamics(self,
+                     op_point: OperatingPoint,
+                     control_deflections: Dict[str, Union[float, np.ndarray]] = None,
+                     ) -> Dict[str, Any]:
+        """
+        Evaluates the aerodynamic forces and moments at a given operating point.
+
+        Args: See `AeroDatabase.coefficients()`.
+
+        Returns: A dictionary with the same format as (a subset of) the output of `AeroBuildup.run()`, with keys:
+
+            * "CL", "CY", "CD", "Cl", "Cm", "Cn": The coefficients. See `AeroDatabase.coefficients()`.
+
+            * "L", "Y", "D": The lift, side force, and drag [N], in wind axes.
+
+            * "l_b", "m_b", "n_b": The rolling, pitching, and yawing moments [Nm], in body axes.
+
+            * "F_w", "F_b": An [x, y, z] list of forces [N], in wind and body axes, respectively.
+
+            * "M_b": An [x, y, z] list of moments about `xyz_ref` [Nm], in body axes.
+
+        """
+        aero = self.coefficients(
+            op_point=op_point,
+            control_deflections=control_deflections,
+        )
+
+        qS = op_point.dynamic_pressure() * self.s_ref
+
+        aero["L"] = aero["CL"] * qS
+        aero["Y"] = aero["CY"] * qS
+        aero["D"] = aero["CD"] * qS
+        aero["l_b"] = aero["Cl"] * qS * self.b_ref
+        aero["m_b"] = aero["Cm"] * qS * self.c_ref
+        aero["n_b"] = aero["Cn"] * qS * self.b_ref
+
+        aero["F_w"] = [-aero["D"], aero["Y"], -aero["L"]]
+        aero["F_b"] = list(op_point.convert_axes(*aero["F_w"], from_axes="wind", to_axes="body"))
+        aero["M_b"] = [aero["l_b"], aero["m_b"], aero["n_b"]]
+
+        return aero
+
+    def add_to_dynamics(self,
+                        dyn,
+                        control_deflections: Dict[str, Union[float, np.ndarray]] = None,
+                        ) -> Dict[str, Any]:
+        """
+        Adds the aerodynamic forces (and, for rigid-body dynamics, moments) at the current state of a Dynamics
+        instance to that instance, in-place, using `dyn.add_force()` and `dyn.add_moment()`.
+
+        Moments are taken about this database's `xyz_ref`, which should be the center of gravity of `dyn`.
+
+        Args:
+
+            dyn: A Dynamics instance (e.g., `asb.DynamicsRigidBody3DBodyEuler`).
+
+            control_deflections: [Optional] The control surface deflections [deg]. See
+            `AeroDatabase.coefficients()`.
+
+        Returns: The aerodynamics, as given by `AeroDatabase.aerodynamics()`.
+
+        """
+        aero = self.aerodynamics(
+            op_point=dyn.op_point,
+            control_deflections=control_deflections,
+        )
+
+        dyn.add_force(*aero["F_w"], axes="wind")
+        if hasattr(dyn, "add_moment"):
+            dyn.add_moment(*aero["M_b"], axes="body")
+
+        return aero
+
+    def save(self, filename: Union[str, Path]) -> None:
+        """
+        Saves this database to a file, so that it can later be restored with `AeroDatabase.load()`.
+
+        The format is a NumPy `.npz` archive with no pickled objects, so it's safe to load from untrusted sources.
+
+        Args:
+            filename: The file to save to. Conventionally, a "*.npz" file.
+
+        Returns: None
+
+        """
+        metadata = {
+            "format_version": _save_format_version,
+            "axis_names"    : list(self.x_data_coordinates.keys()),
+            "output_names"  : list(self.y_data_structured.keys()),
+            "s_ref"         : float(self.s_ref),
+            "c_ref"         : float(self.c_ref),
+            "b_ref"         : float(self.b_ref),
+            "xyz_ref"       : None if self.xyz_ref is None else [float(x) for x in self.xyz_ref],
+            "method"        : self.method,
+            "fill_value"    : None if self.fill_value is None else float(self.fill_value),
+        }
+        arrays = {
+            **{
+                f"x_data_coordinates_{i}": np.asarray(v)
+                for i, v in enumerate(self.x_data_coordinates.values())
+            },
+            **{
+                f"y_data_structured_{i}": np.asarray(v)
+                for i, v in enumerate(self.y_data_structured.values())
+            },
+        }
+
+        with open(filename, "wb") as f:
+            np.savez(
+                f,
+                metadata=np.array(json.dumps(metadata)),
+                **arrays
+            )
+
+    @classmethod
+    def load(cls, filename: Union[str, Path]) -> "AeroDatabase":
+        """
+        Loads a database that was saved with `AeroDatabase.save()`.
+
+        Args:
+            filename: The file to load from.
+
+        Returns: An AeroDatabase, which behaves identically to the one that was saved.
+
+        """
+        with np.load(filename, allow_pickle=False) as archive:
+            metadata = json.loads(str(archive["metadata"]))
+
+            if metadata["format_version"] != _save_format_version:
+                raise ValueError(
+                    f"This file was saved in format version {metadata['format_version']}, but this version of "
+                    f"AeroSandbox reads format version {_save_format_version}."
+                )
+
+            return cls(
+                x_data_coordinates={
+                    k: archive[f"x_data_coordinates_{i}"]
+                    for i, k in enumerate(metadata["axis_names"])
+                },
+                y_data_structured={
+                    k: archive[f"y_data_structured_{i}"]
+                    for i, k in enumerate(metadata["output_names"])
+                },
+                s_ref=metadata["s_ref"],
+                c_ref=metadata["c_ref"],
+                b_ref=metadata["b_ref"],
+                xyz_ref=metadata["xyz_ref"],
+                method=metadata["method"],
+                fill_value=metadata["fill_value"],
+            )
+
+
+def _run_aero_buildup(
+        airplane: Airplane,
+        alpha: np.ndarray,
+        beta: np.ndarray,
+        mach: float,
+        control_deflections: Dict[str, float],
+        atmosphere: Atmosphere,
+        xyz_ref: Union[np.ndarray, List[float]],
+        include_rate_derivatives: bool,
+        output_names: List[str],
+) -> Dict[str, np.ndarray]:
+    """
+    Runs AeroBuildup once, vectorized over the given (alpha, beta) points, with the given Mach number and control
+    surface deflections. Defined at the module level so that it can be run in a worker process.
+
+    Returns: A dictionary, where keys are `output_names` and values are 1D arrays with the same length as `alpha`.
+    """
+    if len(control_deflections) != 0:
+        airplane = copy.deepcopy(airplane)
+        for wing in airplane.wings:
+            for xsec in wing.xsecs:
+                for surf in xsec.control_surfaces:
+                    if surf.name in control_deflections:
+                        surf.deflection = control_deflections[surf.name]
+
+    analysis = AeroBuildup(
+        airplane=airplane,
+        op_point=OperatingPoint(
+            atmosphere=atmosphere,
+            velocity=mach * atmosphere.speed_of_sound(),
+            alpha=alpha,
+            beta=beta,
+        ),
+        xyz_ref=xyz_ref,
+    )
+
+    if include_rate_derivatives:
+        aero = analysis.run_with_stability_derivatives(alpha=False, beta=False, p=True, q=True, r=True)
+    else:
+        aero = analysis.run()
+
+    return {
+        k: np.broadcast_to(np.array(aero[k], dtype=float), np.shape(alpha)).copy()
+        for k in output_names
+    }
@@ -0,0 +1,158 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+import copy
+from aerosandbox.aerodynamics.aero_3D.test_aero_3D.geometries.conventional import airplane as conventional_airplane
+
+airplane = copy.deepcopy(conventional_airplane)
+for xsec in airplane.wings[1].xsecs:
+    xsec.control_surfaces.append(asb.ControlSurface(name="elevator"))
+
+
+def airplane_with_elevator(deflection):
+    airplane_deflected = copy.deepcopy(airplane)
+    for xsec in airplane_deflected.wings[1].xsecs:
+        xsec.control_surfaces[0].deflection = deflection
+    return airplane_deflected
+
+
+def get_database(**kwargs):
+    return asb.AeroDatabase.from_aero_buildup(
+        airplane=airplane,
+        alpha=np.linspace(-8, 8, 9),
+        beta=np.linspace(-4, 4, 5),
+        mach=0.1,
+        control_deflections={"elevator": np.linspace(-10, 10, 5)},
+        **kwargs
+    )
+
+
+@pytest.fixture(scope="module")
+def database():
+    return get_database()
+
+
+def test_matches_aero_buildup_on_grid(database):
+    op_point = asb.OperatingPoint(
+        velocity=0.1 * asb.Atmosphere(altitude=0).speed_of_sound(),
+        alpha=4,
+        beta=-2,
+    )
+    reference = asb.AeroBuildup(
+        airplane=airplane_with_elevator(5),
+        op_point=op_point,
+    ).run()
+    aero = database.aerodynamics(op_point=op_point, control_deflections={"elevator": 5})
+
+    for k in ["CL", "CY", "CD", "Cl", "Cm", "Cn"]:
+        assert aero[k] == pytest.approx(reference[k], rel=1e-6, abs=1e-9)
+    for i in range(3):
+        assert aero["F_b"][i] == pytest.approx(reference["F_b"][i], rel=1e-6, abs=1e-6)
+
+
+def test_matches_aero_buildup_with_rates(database):
+    op_point = asb.OperatingPoint(
+        velocity=0.1 * asb.Atmosphere(altitude=0).speed_of_sound(),
+        alpha=3.3,
+        beta=1.7,
+        p=0.3,
+        q=0.4,
+        r=-0.2,
+    )
+    reference = asb.AeroBuildup(
+        airplane=airplane_with_elevator(-7),
+        op_point=op_point,
+    ).run()
+    aero = database.aerodynamics(op_point=op_point, control_deflections={"elevator": -7})
+
+    assert aero["CL"] == pytest.approx(reference["CL"], rel=1e-2)
+    assert aero["CD"] == pytest.approx(reference["CD"], rel=1e-2)
+    assert aero["Cm"] == pytest.approx(reference["Cm"], abs=1e-3)
+    assert aero["Cl"] == pytest.approx(reference["Cl"], abs=1e-4)
+
+
+def test_vectorized_and_symbolic(database):
+    alpha = np.linspace(-5, 5, 4)
+    aero = database.coefficients(
+        op_point=asb.OperatingPoint(velocity=30, alpha=alpha),
+    )
+    assert np.shape(aero["CL"]) == (4,)
+
+    opti = asb.Opti()
+    alpha_trim = opti.variable(init_guess=0)
+    aero = database.coefficients(
+        op_point=asb.OperatingPoint(velocity=30, alpha=alpha_trim),
+    )
+    opti.subject_to(aero["CL"] == 0.3)
+    sol = opti.solve(verbose=False)
+
+    assert database.coefficients(
+        op_point=asb.OperatingPoint(velocity=30, alpha=sol.value(alpha_trim)),
+    )["CL"] == pytest.approx(0.3)
+
+
+def test_save_load(database, tmp_path):
+    filename = tmp_path / "aero_database.npz"
+    database.save(filename)
+    loaded = asb.AeroDatabase.load(filename)
+
+    op_point = asb.OperatingPoint(velocity=30, alpha=2.5, beta=1, q=0.2)
+    expected = database.coefficients(op_point, control_deflections={"elevator": 3})
+    actual = loaded.coefficients(op_point, control_deflections={"elevator": 3})
+    for k in expected.keys():
+        assert actual[k] == pytest.approx(expected[k])
+
+
+def test_parallel_build_matches_serial(database):
+    database_parallel = get_database(n_workers=2)
+    for k, v in database.y_data_structured.items():
+        assert database_parallel.y_data_structured[k] == pytest.approx(v)
+
+
+def test_simulate_with_database(database):
+    speed = 0.1 * asb.Atmosphere(altitude=0).speed_of_sound()  # The Mach number of the database
+    dyn = asb.DynamicsRigidBody3DBodyEuler(
+        mass_props=asb.MassProperties(mass=1, Ixx=0.1, Iyy=0.1, Izz=0.1),
+        u_b=speed * np.cosd(2),
+        w_b=speed * np.sind(2),
+    )
+
+    def forces(dyn, t):
+        dyn.add_gravity_force()
+        database.add_to_dynamics(dyn, control_deflections={"elevator": 2})
+
+    traj = dyn.simulate(time=np.linspace(0, 0.5, 11), forces=forces)
+    assert np.all(np.isfinite(np.array(traj.unpack_state(), dtype=float)))
+
+    ### The initial state derivatives should match those with AeroBuildup forces
+    dyn_reference = dyn.get_new_instance_with_state()
+    aero = asb.AeroBuildup(
+        airplane=airplane_with_elevator(2),
+        op_point=dyn_reference.op_point,
+    ).run()
+    dyn_reference.add_gravity_force()
+    dyn_reference.add_force(*aero["F_b"], axes="body")
+    dyn_reference.add_moment(*aero["M_b"], axes="body")
+
+    dyn_database = dyn.get_new_instance_with_state()
+    forces(dyn_database, 0)
+
+    expected = dyn_reference.state_derivatives()
+    actual = dyn_database.state_derivatives()
+    for k in ["u_b", "w_b", "q"]:
+        assert actual[k] == pytest.approx(expected[k], rel=1e-3, abs=1e-3)
+
+
+def test_unknown_control_surface(database):
+    with pytest.raises(ValueError):
+        database.coefficients(asb.OperatingPoint(), control_deflections={"aileron": 1})
+    with pytest.raises(ValueError):
+        asb.AeroDatabase.from_aero_buildup(
+            airplane=airplane,
+            alpha=np.linspace(-5, 5, 3),
+            control_deflections={"aileron": np.linspace(-5, 5, 3)},
+        )
+
+
+if __name__ == '__main__':
+    pytest.main()
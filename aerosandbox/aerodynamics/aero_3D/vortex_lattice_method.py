@@ -271,27 +271,28 @@ class VortexLatticeMethod(ExplicitAnalysis):
         force_geometry = np.sum(forces_geometry, axis=0)
         moment_geometry = np.sum(moments_geometry, axis=0)
 
-        force_body = self.op_point.convert_axes(
-            force_geometry[0], force_geometry[1], force_geometry[2],
+        # Convert the force and moment together, with one batched conversion per axes system
+        force_and_moment_geometry = np.concatenate([
+            np.reshape(force_geometry, (1, 3)),
+            np.reshape(moment_geometry, (1, 3)),
+        ], axis=0)
+
+        force_and_moment_body = self.op_point.convert_axes_batch(
+            force_and_moment_geometry,
             from_axes="geometry",
             to_axes="body"
         )
-        force_wind = self.op_point.convert_axes(
-            force_body[0], force_body[1], force_body[2],
-            from_axes="body",
-            to_axes="wind"
-        )
-        moment_body = self.op_point.convert_axes(
-            moment_geometry[0], moment_geometry[1], moment_geometry[2],
+        force_and_moment_wind = self.op_point.convert_axes_batch(
+            force_and_moment_geometry,
             from_axes="geometry",
-            to_axes="body"
-        )
-        moment_wind = self.op_point.convert_axes(
-            moment_body[0], moment_body[1], moment_body[2],
-            from_axes="body",
             to_axes="wind"
         )
 
+        force_body = tuple(force_and_moment_body[0, i] for i in range(3))
+        moment_body = tuple(force_and_moment_body[1, i] for i in range(3))
+        force_wind = tuple(force_and_moment_wind[0, i] for i in range(3))
+        moment_wind = tuple(force_and_moment_wind[1, i] for i in range(3))
+
         ### Save things to the instance for later access
         self.forces_geometry = forces_geometry
         self.moments_geometry = moments_geometry
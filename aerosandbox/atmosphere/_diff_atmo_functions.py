@@ -1,7 +1,7 @@
 import aerosandbox.numpy as np
-from pathlib import Path
+from functools import lru_cache
 from aerosandbox.modeling.interpolation import InterpolatedModel
-from aerosandbox.atmosphere._isa_atmo_functions import pressure_isa, temperature_isa, isa_base_altitude
+from aerosandbox.atmosphere._isa_atmo_functions import pressure_isa, temperature_isa
 
 # Define the altitudes of knot points
 
@@ -26,18 +26,96 @@ altitude_knot_points = np.array(
 
 altitude_knot_points = np.sort(np.unique(altitude_knot_points))
 
-temperature_knot_points = temperature_isa(altitude_knot_points)
-pressure_knot_points = pressure_isa(altitude_knot_points)
 
-# creates interpolated model for temperature and pressure
-interpolated_temperature = InterpolatedModel(
-    x_data_coordinates=altitude_knot_points,
-    y_data_structured=temperature_knot_points,
-)
-interpolated_log_pressure = InterpolatedModel(
-    x_data_coordinates=altitude_knot_points,
-    y_data_structured=np.log(pressure_knot_points),
-)
+# creates interpolated model for temperature and pressure (on first use, rather than at import time)
+@lru_cache(maxsize=None)
+def _interpolated_models():
+    temperature_knot_points = temperature_isa(altitude_knot_points)
+    pressure_knot_points = pressure_isa(altitude_knot_points)
+
+    interpolated_temperature = InterpolatedModel(
+        x_data_coordinates=altitude_knot_points,
+        y_data_structured=temperature_knot_points,
+    )
+    interpolated_log_pressure = InterpolatedModel(
+        x_data_coordinates=altitude_knot_points,
+        y_data_structured=np.log(pressure_knot_points),
+    )
+    return interpolated_temperature, interpolated_log_pressure
+
+
+@lru_cache(maxsize=None)
+def _lookup_tables():
+    """
+    Tabulates the values and (analytic, via automatic differentiation) derivatives of the interpolated temperature
+    and log-pressure models at the altitude knot points.
+
+    These models are cubic B-splines with knots at these points, so cubic Hermite interpolation of this table
+    reproduces them exactly (to within roundoff) - but it is much faster to evaluate on large numeric arrays than the
+    CasADi interpolants themselves.
+
+    Returns: A tuple of (values, derivatives) tuples, one for temperature and one for log-pressure.
+    """
+    import casadi as cas
+
+    altitude = cas.MX.sym("altitude")
+
+    tables = []
+    for interpolated_model in _interpolated_models():
+        value = interpolated_model(altitude)
+        evaluate = cas.Function(
+            "evaluate",
+            [altitude],
+            [value, cas.jacobian(value, altitude)]
+        ).map(len(altitude_knot_points))
+
+        values, derivatives = evaluate(np.reshape(altitude_knot_points, (1, -1)))
+        tables.append((
+            values.full().reshape(-1),
+            derivatives.full().reshape(-1),
+        ))
+
+    return tuple(tables)
+
+
+def _hermite_interpolate(altitude, values, derivatives):
+    """
+    Evaluates the cubic Hermite interpolant of a table of values and derivatives at the altitude knot points,
+    at some numeric altitude(s). Returns NaN outside of the range of the knot points.
+    """
+    altitude = np.asarray(altitude, dtype=float)
+
+    i = np.searchsorted(altitude_knot_points, altitude, side="right") - 1
+    i = np.fmin(np.fmax(i, 0), len(altitude_knot_points) - 2)
+
+    h_a = altitude_knot_points[i]
+    h_b = altitude_knot_points[i + 1]
+    dh = h_b - h_a
+    t = (altitude - h_a) / dh
+
+    value = (
+            (1 + 2 * t) * (1 - t) ** 2 * values[i] +
+            t * (1 - t) ** 2 * dh * derivatives[i] +
+            t ** 2 * (3 - 2 * t) * values[i + 1] +
+            t ** 2 * (t - 1) * dh * derivatives[i + 1]
+    )
+
+    return np.where(
+        np.logical_or(
+            altitude < altitude_knot_points[0],
+            altitude > altitude_knot_points[-1],
+        ),
+        np.nan,
+        value
+    )
+
+
+def __getattr__(name):
+    names = ["interpolated_temperature", "interpolated_log_pressure"]
+    if name in names:
+        return _interpolated_models()[names.index(name)]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 def pressure_differentiable(altitude):
@@ -50,6 +128,10 @@ def pressure_differentiable(altitude):
     Returns: Pressure [Pa]
 
     """
+    if not np.is_casadi_type(altitude, recursive=False):  # Fast path for numeric inputs
+        return np.exp(_hermite_interpolate(altitude, *_lookup_tables()[1]))
+
+    interpolated_temperature, interpolated_log_pressure = _interpolated_models()
     return np.exp(interpolated_log_pressure(altitude))
 
 
@@ -63,4 +145,8 @@ def temperature_differentiable(altitude):
     Returns: Temperature [K]
 
     """
+    if not np.is_casadi_type(altitude, recursive=False):  # Fast path for numeric inputs
+        return _hermite_interpolate(altitude, *_lookup_tables()[0])
+
+    interpolated_temperature, interpolated_log_pressure = _interpolated_models()
     return interpolated_temperature(altitude)
@@ -1,6 +1,6 @@
 import aerosandbox.numpy as np
-import pandas as pd
 from pathlib import Path
+from functools import lru_cache
 
 ### Define constants
 gas_constant_universal = 8.31432  # J/(mol*K); universal gas constant
@@ -8,14 +8,7 @@ molecular_mass_air = 28.9644e-3  # kg/mol; molecular mass of air
 gas_constant_air = gas_constant_universal / molecular_mass_air  # J/(kg*K); gas constant of air
 g = 9.81  # m/s^2, gravitational acceleration on earth
 
-### Read ISA table data
-isa_table = pd.read_csv(Path(__file__).parent.absolute() / "isa_data/isa_table.csv")
-isa_base_altitude = isa_table["Base Altitude [m]"].values
-isa_lapse_rate = isa_table["Lapse Rate [K/km]"].values / 1000
-isa_base_temperature = isa_table["Base Temperature [C]"].values + 273.15
-
 
-### Calculate pressure at each ISA level programmatically using the barometric pressure equation with linear temperature.
 def barometric_formula(
         P_b,
         T_b,
@@ -49,16 +42,69 @@ def barometric_formula(
         )
 
 
-isa_pressure = [101325.]  # Pascals
-for i in range(len(isa_table) - 1):
-    isa_pressure.append(
-        barometric_formula(
-            P_b=isa_pressure[i],
-            T_b=isa_base_temperature[i],
-            L_b=isa_lapse_rate[i],
-            h=isa_base_altitude[i + 1],
-            h_b=isa_base_altitude[i]
+### Read ISA table data
+@lru_cache(maxsize=None)
+def _isa_data():
+    """
+    Reads the ISA table and computes the pressure at the base of each ISA layer. This is done on first use,
+    rather than at import time.
+
+    Returns: A tuple of (base altitude [m], lapse rate [K/m], base temperature [K], base pressure [Pa]) arrays,
+    one entry per ISA layer.
+    """
+    isa_table = np.loadtxt(
+        Path(__file__).parent.absolute() / "isa_data/isa_table.csv",
+        delimiter=",",
+        skiprows=1,
+        encoding="utf-8-sig",
+    )
+    isa_base_altitude = isa_table[:, 0]
+    isa_lapse_rate = isa_table[:, 1] / 1000
+    isa_base_temperature = isa_table[:, 2] + 273.15
+
+    ### Calculate pressure at each ISA level programmatically using the barometric pressure equation with linear
+    # temperature.
+    isa_pressure = [101325.]  # Pascals
+    for i in range(len(isa_table) - 1):
+        isa_pressure.append(
+            barometric_formula(
+                P_b=isa_pressure[i],
+                T_b=isa_base_temperature[i],
+                L_b=isa_lapse_rate[i],
+                h=isa_base_altitude[i + 1],
+                h_b=isa_base_altitude[i]
+            )
         )
+
+    return isa_base_altitude, isa_lapse_rate, isa_base_temperature, isa_pressure
+
+
+def __getattr__(name):
+    # The ISA table data used to be read at import time; it's still available under the same names, loaded lazily.
+    if name == "isa_table":
+        import pandas as pd
+        return pd.read_csv(Path(__file__).parent.absolute() / "isa_data/isa_table.csv")
+
+    names = ["isa_base_altitude", "isa_lapse_rate", "isa_base_temperature", "isa_pressure"]
+    if name in names:
+        return _isa_data()[names.index(name)]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def _layer_index(altitude: np.ndarray) -> np.ndarray:
+    """
+    Returns the index of the ISA layer that each (numeric) altitude is in, found by binary search.
+
+    An altitude exactly at the base of a layer is considered to be in the layer below it, and altitudes below the
+    lowest layer are considered to be in the lowest layer. (This matches the np.where()-based logic used for CasADi
+    inputs.)
+    """
+    isa_base_altitude = _isa_data()[0]
+
+    return np.fmax(
+        np.searchsorted(isa_base_altitude, altitude, side="left") - 1,
+        0
     )
 
 
@@ -74,9 +120,29 @@ def pressure_isa(altitude):
     Returns: Pressure [Pa]
 
     """
+    isa_base_altitude, isa_lapse_rate, isa_base_temperature, isa_pressure = _isa_data()
+
+    if not np.is_casadi_type(altitude, recursive=False):  # Fast path for numeric inputs
+        altitude = np.asarray(altitude, dtype=float)
+        i = _layer_index(altitude)
+
+        P_b = np.asarray(isa_pressure)[i]
+        T_b = isa_base_temperature[i]
+        L_b = isa_lapse_rate[i]
+        h_b = isa_base_altitude[i]
+
+        # Same as barometric_formula(), but with the layer properties varying elementwise.
+        T = np.fmax(T_b + L_b * (altitude - h_b), 1)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return np.where(
+                L_b != 0,
+                P_b * (T / T_b) ** (-g / (gas_constant_air * L_b)),
+                P_b * np.exp(np.clip(-g * (altitude - h_b) / (gas_constant_air * T_b), -500, 500))
+            )
+
     pressure = 0 * altitude  # Initialize the pressure to all zeros.
 
-    for i in range(len(isa_table)):
+    for i in range(len(isa_base_altitude)):
         pressure = np.where(
             altitude > isa_base_altitude[i],
             barometric_formula(
@@ -115,9 +181,17 @@ def temperature_isa(altitude):
     Returns: Temperature [K]
 
     """
+    isa_base_altitude, isa_lapse_rate, isa_base_temperature, isa_pressure = _isa_data()
+
+    if not np.is_casadi_type(altitude, recursive=False):  # Fast path for numeric inputs
+        altitude = np.asarray(altitude, dtype=float)
+        i = _layer_index(altitude)
+
+        return (altitude - isa_base_altitude[i]) * isa_lapse_rate[i] + isa_base_temperature[i]
+
     temp = 0 * altitude  # Initialize the temperature to all zeros.
 
-    for i in range(len(isa_table)):
+    for i in range(len(isa_base_altitude)):
         temp = np.where(
             altitude > isa_base_altitude[i],
             (altitude - isa_base_altitude[i]) * isa_lapse_rate[i] + isa_base_temperature[i],
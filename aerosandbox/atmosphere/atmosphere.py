@@ -1,5 +1,6 @@
 from aerosandbox.common import AeroSandboxObject
 import aerosandbox.numpy as np
+from typing import Union, Dict
 from aerosandbox.atmosphere._isa_atmo_functions import pressure_isa, temperature_isa
 from aerosandbox.atmosphere._diff_atmo_functions import pressure_differentiable, temperature_differentiable
 
@@ -68,16 +69,13 @@ class Atmosphere(AeroSandboxObject):
         """
         Returns the density, in kg/m^3.
         """
-        rho = self.pressure() / (self.temperature() * gas_constant_air)
-
-        return rho
+        return _density(self.pressure(), self.temperature())
 
     def speed_of_sound(self):
         """
         Returns the speed of sound, in m/s.
         """
-        temperature = self.temperature()
-        return (self.ratio_of_specific_heats() * gas_constant_air * temperature) ** 0.5
+        return _speed_of_sound(self.temperature(), self.ratio_of_specific_heats())
 
     def dynamic_viscosity(self):
         """
@@ -91,16 +89,7 @@ class Atmosphere(AeroSandboxObject):
         According to White, F. M., & Corfield, I. (2006). Viscous fluid flow (Vol. 3, pp. 433-434). New York: McGraw-Hill.:
         The error is no more than approximately 2% for air between 170K and 1900K.
         """
-
-        # Sutherland constants
-        C1 = 1.458e-6  # kg/(m*s*sqrt(K))
-        S = 110.4  # K
-
-        # Sutherland equation
-        temperature = self.temperature()
-        mu = C1 * temperature ** 1.5 / (temperature + S)
-
-        return mu
+        return _dynamic_viscosity(self.temperature())
 
     def kinematic_viscosity(self):
         """
@@ -129,9 +118,8 @@ class Atmosphere(AeroSandboxObject):
         From Vincenti, W. G. and Kruger, C. H. (1965). Introduction to physical gas dynamics. Krieger Publishing Company. p. 414.
 
         """
-        return self.dynamic_viscosity() / self.pressure() * np.sqrt(
-            np.pi * gas_constant_universal * self.temperature() / (2 * molecular_mass_air)
-        )
+        temperature = self.temperature()
+        return _mean_free_path(self.pressure(), temperature, _dynamic_viscosity(temperature))
 
     def knudsen(self, length):
         """
@@ -139,6 +127,85 @@ class Atmosphere(AeroSandboxObject):
         """
         return self.mean_free_path() / length
 
+    def all_properties(self) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Computes all of the atmospheric properties at once.
+
+        This evaluates the pressure and temperature models only once, and then computes all derived quantities from
+        them - which is much cheaper than calling each of the individual methods (each of which re-evaluates pressure
+        and/or temperature) when many properties are needed.
+
+        Returns: A dictionary with keys:
+
+            * "pressure" [Pa]
+            * "temperature" [K]
+            * "density" [kg/m^3]
+            * "speed_of_sound" [m/s]
+            * "dynamic_viscosity" [kg/(m*s)]
+            * "kinematic_viscosity" [m^2/s]
+            * "mean_free_path" [m]
+
+        Example:
+            >>> atmo = Atmosphere(altitude=np.linspace(0, 20e3, 1000))
+            >>> properties = atmo.all_properties()
+            >>> rho = properties["density"]
+
+        """
+        pressure = self.pressure()
+        temperature = self.temperature()
+
+        density = _density(pressure, temperature)
+        dynamic_viscosity = _dynamic_viscosity(temperature)
+
+        return {
+            "pressure"           : pressure,
+            "temperature"        : temperature,
+            "density"            : density,
+            "speed_of_sound"     : _speed_of_sound(temperature, self.ratio_of_specific_heats()),
+            "dynamic_viscosity"  : dynamic_viscosity,
+            "kinematic_viscosity": dynamic_viscosity / density,
+            "mean_free_path"     : _mean_free_path(pressure, temperature, dynamic_viscosity),
+        }
+
+
+### Define the models of derived quantities, as functions of the state variables.
+
+def _density(pressure, temperature):
+    """
+    Returns the density, in kg/m^3, from the ideal gas law.
+    """
+    return pressure / (temperature * gas_constant_air)
+
+
+def _speed_of_sound(temperature, ratio_of_specific_heats):
+    """
+    Returns the speed of sound, in m/s.
+    """
+    return (ratio_of_specific_heats * gas_constant_air * temperature) ** 0.5
+
+
+def _dynamic_viscosity(temperature):
+    """
+    Returns the dynamic viscosity (mu), in kg/(m*s), from Sutherland's Law. See `Atmosphere.dynamic_viscosity()`.
+    """
+    # Sutherland constants
+    C1 = 1.458e-6  # kg/(m*s*sqrt(K))
+    S = 110.4  # K
+
+    # Sutherland equation
+    mu = C1 * temperature ** 1.5 / (temperature + S)
+
+    return mu
+
+
+def _mean_free_path(pressure, temperature, dynamic_viscosity):
+    """
+    Returns the mean free path of an air molecule, in meters. See `Atmosphere.mean_free_path()`.
+    """
+    return dynamic_viscosity / pressure * np.sqrt(
+        np.pi * gas_constant_universal * temperature / (2 * molecular_mass_air)
+    )
+
 
 if __name__ == "__main__":
     # Make AeroSandbox Atmosphere
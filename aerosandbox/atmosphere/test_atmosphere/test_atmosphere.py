@@ -79,6 +79,38 @@ def plot_isa_residuals():
     plt.show()
 
 
+@pytest.mark.parametrize("method", ["isa", "differentiable"])
+def test_numeric_and_symbolic_paths_agree(method):
+    import casadi as cas
+
+    altitudes = np.concatenate([
+        np.linspace(-50e3, 200e3, 2001),
+        [0, 11000, 20000, 84852],  # Layer boundaries
+    ])
+
+    atmo = Atmosphere(altitude=altitudes, method=method)
+
+    altitude_sym = cas.MX.sym("altitude", len(altitudes))
+    atmo_sym = Atmosphere(altitude=altitude_sym, method=method)
+    f = cas.Function("f", [altitude_sym], [atmo_sym.pressure(), atmo_sym.temperature()])
+    pressure_sym, temperature_sym = [v.full().reshape(-1) for v in f(altitudes)]
+
+    assert atmo.pressure() == pytest.approx(pressure_sym, rel=1e-10)
+    assert atmo.temperature() == pytest.approx(temperature_sym, rel=1e-10)
+
+
+@pytest.mark.parametrize("method", ["isa", "differentiable"])
+def test_all_properties(method):
+    atmo = Atmosphere(altitude=np.linspace(-1e3, 80e3, 50), method=method)
+    properties = atmo.all_properties()
+
+    for name, value in properties.items():
+        assert value == pytest.approx(getattr(atmo, name)()), name
+
+    atmo = Atmosphere(altitude=5000., method=method)
+    assert atmo.all_properties()["density"] == pytest.approx(atmo.density())
+
+
 if __name__ == '__main__':
     # plot_isa_residuals()
     pytest.main()
@@ -2,7 +2,9 @@ import aerosandbox.numpy as np
 from aerosandbox.optimization.opti import Opti
 from abc import abstractmethod
 import copy
-from typing import Dict, Any
+import functools
+import inspect
+from typing import Dict, Any, Tuple
 import casadi as cas
 
 
@@ -346,3 +348,15 @@ class ImplicitAnalysis(AeroSandboxObject):
     @abstractmethod
     def opti_provided(self, value: bool):
         self._opti_provided = value
+
+
+@functools.lru_cache(maxsize=None)
+def _get_init_arg_names(cls: type) -> Tuple[str, ...]:
+    """
+    Returns the names of the arguments of a class's constructor (excluding `self`), in order.
+
+    This is cached per class, since `inspect.signature()` is slow (tens of microseconds) relative to the
+    constructors of lightweight objects like OperatingPoint or Dynamics instances, which are rebuilt often (e.g.,
+    within integration loops, or when indexing).
+    """
+    return tuple(inspect.signature(cls.__init__).parameters.keys())[1:]  # Ignore 'self'
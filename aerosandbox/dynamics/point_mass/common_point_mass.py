@@ -1,10 +1,9 @@
 import aerosandbox.numpy as np
-from aerosandbox.common import AeroSandboxObject
+from aerosandbox.common import AeroSandboxObject, _get_init_arg_names
 from abc import ABC, abstractmethod, abstractproperty
-from typing import Union, Dict, Tuple, List
+from typing import Union, Dict, Tuple, List, Callable
 from aerosandbox import MassProperties, Opti, OperatingPoint, Atmosphere, Airplane, _asb_root
 from aerosandbox.tools.string_formatting import trim_string
-import inspect
 import copy
 
 
@@ -59,14 +58,10 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         """
 
-        ### Get a list of all the inputs that the class constructor wants to see
-        init_signature = inspect.signature(self.__class__.__init__)
-        init_args = list(init_signature.parameters.keys())[1:]  # Ignore 'self'
-
         ### Create a new instance, and give the constructor all the inputs it wants to see (based on values in this instance)
         new_dyn: __class__ = self.__class__(**{
             k: getattr(self, k)
-            for k in init_args
+            for k in _get_init_arg_names(self.__class__)
         })
 
         ### Overwrite the state variables in the new instance with those from the input
@@ -197,6 +192,8 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
         """
 
         def get_item_of_attribute(a):
+            if isinstance(a, (int, float)):  # Fast path, since scalars are not subscriptable
+                return a
             try:
                 return a[index]
             except TypeError as e:  # object is not subscriptable
@@ -208,8 +205,10 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
 
         new_instance = self.get_new_instance_with_state()
 
-        for k, v in new_instance.__dict__.items():
-            setattr(new_instance, k, get_item_of_attribute(v))
+        new_instance.__dict__.update({
+            k: get_item_of_attribute(v)
+            for k, v in new_instance.__dict__.items()
+        })
 
         return new_instance
 
@@ -296,6 +295,423 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
             except Exception as e:
                 raise ValueError(f"Error while constraining state variable '{state_var_name}': \n{e}")
 
+    def simulate(self,
+                 time: np.ndarray,
+                 forces: Callable[["_DynamicsPointMassBaseClass", float], None] = None,
+                 method: str = "rk4",
+                 n_substeps: int = 1,
+                 integrator_options: Dict = None,
+                 ) -> "_DynamicsPointMassBaseClass":
+        """
+        Simulates the motion of this dynamical system forward in time (i.e., an open-loop simulation), starting from
+        the current state of this instance.
+
+        The equations of motion (`state_derivatives()`, along with any forces added by `forces`) are traced only
+        once into a CasADi Function, which is then integrated entirely within CasADi. This is typically orders of
+        magnitude faster than calling `scipy.integrate.solve_ivp()` on a Python function that creates a new
+        Dynamics instance at every step.
+
+        Example:
+            >>> dyn = asb.DynamicsPointMass2DCartesian(mass_props=asb.MassProperties(mass=1), u_e=10, w_e=-10)
+            >>>
+            >>> def forces(dyn, t):  # Adds forces to a Dynamics instance, at a given time.
+            >>>     dyn.add_gravity_force()
+            >>>     dyn.add_force(Fx=-0.01 * dyn.speed ** 2, axes="wind")
+            >>>
+            >>> traj = dyn.simulate(time=np.linspace(0, 10, 101), forces=forces)
+            >>> traj.x_e  # An array of length 101
+
+        Args:
+
+            time: The times at which to report the state, as a 1D array. The first entry is the time of the current
+            state of this instance.
+
+            forces: [Optional] A function with call syntax `forces(dyn, t)`, which adds forces (and moments, for rigid
+            bodies) to a Dynamics instance `dyn` at time `t`, in-place, using `dyn.add_force()` and similar. This
+            is where state- or time-dependent forces (e.g., gravity, aerodynamics) should be added. It is evaluated
+            only once, with symbolic (CasADi) inputs, so it must be written with `aerosandbox.numpy` functions and
+            without any branching on the values of the state or time.
+
+            method: The integration method to use. One of:
+
+                * "rk4": A fixed-step, 4th-order Runge-Kutta method, with `n_substeps` steps per interval of `time`.
+                The default; fast, but accuracy is controlled by the time step.
+
+                * "cvodes": The adaptive, variable-order CVODES integrator from SUNDIALS, restarted at each interval
+                of `time`. Use `integrator_options` to set tolerances (by default, {"abstol": 1e-10, "reltol": 1e-9}).
+
+            n_substeps: For method "rk4", the number of integration steps to take within each interval of `time`.
+
+            integrator_options: For method "cvodes", a dictionary of options to pass to `casadi.integrator()`.
+
+        Control variables (forces, moments, and indirect controls such as `alpha` or `bank`) are taken from their
+        current values on this instance. Each may be a scalar (held constant) or an array with the same length as
+        `time` (held constant over each interval, at the value from the start of that interval). Forces added by
+        `forces` are added on top of these.
+
+        Returns: A new Dynamics instance of the same type, where each state variable is an array with the same length
+        as `time`. (As with `get_new_instance_with_state()`, the forces and moments on the returned instance are zero.)
+
+        """
+        import casadi as cas
+
+        time = np.array(time, dtype=float).reshape(-1)
+        n_intervals = len(time) - 1
+        if n_intervals < 1:
+            raise ValueError("`time` must have at least two entries.")
+
+        for k, v in self.state.items():
+            if np.length(v) != 1:
+                raise ValueError(
+                    f"To simulate, the state of this instance must be scalar, but state variable '{k}' is not.")
+
+        state_names = list(self.state.keys())
+
+        dynamics = self._trace_dynamics(forces=forces)
+        x0 = np.array([float(v) for v in self.unpack_state()])
+        u = self._control_schedule(time)
+
+        ### Integrate
+        if method not in ["rk4", "cvodes"]:
+            raise ValueError("Bad value of `method`!")
+
+        if method == "cvodes":
+            # Since the integrator restarts at each interval, errors accumulate across intervals; so, tolerances
+            # default to tighter than CVODES's own defaults (reltol 1e-6, abstol 1e-8).
+            integrator_options = {
+                "abstol": 1e-10,
+                "reltol": 1e-9,
+                **({} if integrator_options is None else integrator_options)
+            }
+
+        step = _interval_step_function(
+            dynamics,
+            integrator=method,
+            n_substeps=n_substeps,
+            integrator_options=integrator_options,
+        )
+        simulator = step.mapaccum("simulator", n_intervals)
+
+        x = simulator(
+            x0,
+            u,
+            np.reshape(time[:-1], (1, -1)),
+            np.reshape(np.diff(time), (1, -1)),
+        )
+
+        x = np.concatenate([
+            np.reshape(x0, (-1, 1)),
+            np.array(x.full() if isinstance(x, cas.DM) else x, dtype=float),
+        ], axis=1)
+
+        return self.get_new_instance_with_state({
+            k: x[i, :]
+            for i, k in enumerate(state_names)
+        })
+
+    def simulate_ensemble(self,
+                          time: np.ndarray,
+                          initial_states: Union[Dict[str, Union[float, np.ndarray]], np.ndarray] = None,
+                          parameters: Dict[str, Union[float, np.ndarray]] = None,
+                          forces: Callable[["_DynamicsPointMassBaseClass", float, Dict], None] = None,
+                          n_members: int = None,
+                          n_substeps: int = 1,
+                          n_threads: int = 1,
+                          percentiles: Union[List[float], Tuple[float]] = (5, 50, 95),
+                          keep_history: bool = False,
+                          ) -> Dict[str, Union[np.ndarray, List, Dict]]:
+        """
+        Simulates an ensemble of many copies of this dynamical system forward in time (e.g., for a Monte Carlo
+        dispersion analysis), where each member of the ensemble may have a different initial state and different
+        parameters (e.g., mass properties, gusts, or control gains).
+
+        As with `simulate()`, the equations of motion are traced only once into a CasADi Function. Each RK4 step is
+        then mapped over all members at once (with `casadi.Function.map()`, optionally multithreaded), so the state
+        of the whole ensemble is advanced in a single call per time step. Statistics of the ensemble are accumulated
+        at each step, so the full history of each member does not need to be kept.
+
+        Example:
+            >>> dyn = asb.DynamicsPointMass2DCartesian(mass_props=asb.MassProperties(mass=1), u_e=10, w_e=-10)
+            >>>
+            >>> def forces(dyn, t, params):  # `params` is a dict of this member's parameters
+            >>>     dyn.mass_props = asb.MassProperties(mass=params["mass"])
+            >>>     dyn.add_gravity_force()
+            >>>     dyn.add_force(Fx=-params["drag_coefficient"] * dyn.speed ** 2, axes="wind")
+            >>>
+            >>> ensemble = dyn.simulate_ensemble(
+            >>>     time=np.linspace(0, 10, 101),
+            >>>     initial_states={"u_e": np.random.normal(10, 1, 1000)},
+            >>>     parameters={"mass": np.random.uniform(0.9, 1.1, 1000), "drag_coefficient": 0.01},
+            >>>     forces=forces,
+            >>> )
+            >>> ensemble["mean"]  # An array of shape (101, n_states)
+
+        Args:
+
+            time: The times at which to report statistics, as a 1D array. The first entry is the time of the initial
+            states.
+
+            initial_states: [Optional] The initial state of each member, either as:
+
+                * A dict, where keys are state variable names and values are either scalars (shared by all members) or
+                1D arrays of length `n_members`. Any state variables not given take their value from this instance.
+
+                * An array of shape (n_members, n_states), with columns in the order of `self.state.keys()`.
+
+            parameters: [Optional] A dict of parameters of each member, where keys are parameter names and values are
+            either scalars or 1D arrays of length `n_members`. These are passed to `forces`.
+
+            forces: [Optional] A function with call syntax `forces(dyn, t, params)`, which adds forces (and moments,
+            for rigid bodies) to a Dynamics instance `dyn` at time `t`, in-place. `params` is a dict with the same
+            keys as `parameters`. See `simulate()` for more details; the same restrictions apply.
+
+            n_members: [Optional] The number of members of the ensemble. By default, this is inferred from the
+            lengths of `initial_states` and `parameters`.
+
+            n_substeps: The number of RK4 steps to take within each interval of `time`.
+
+            n_threads: The number of threads to evaluate the members with. If 1 (default), members are evaluated
+            serially.
+
+            percentiles: The percentiles (in the range [0, 100]) of each state variable to report at each time.
+
+            keep_history: If True, also returns the full history of every member. This takes memory proportional to
+            len(time) * n_members * n_states, so it is off by default.
+
+        Control variables are taken from this instance, in the same way as in `simulate()`, and are shared by all
+        members.
+
+        Returns: A dictionary with keys:
+
+            * "time": The `time` array, of length N.
+
+            * "state_names": The names of the state variables, in the order used by all arrays below.
+
+            * "mean": The ensemble mean of the state at each time, of shape (N, n_states).
+
+            * "covariance": The ensemble covariance of the state at each time, of shape (N, n_states, n_states).
+
+            * "percentiles": A dict, where keys are the requested percentiles and values are arrays of shape (N,
+            n_states).
+
+            * "final_states": The state of each member at the final time, of shape (n_members, n_states).
+
+            * "history": Only if `keep_history` is True. The state of each member at each time, of shape (N,
+            n_members, n_states).
+
+        """
+        time = np.array(time, dtype=float).reshape(-1)
+        n_intervals = len(time) - 1
+        if n_intervals < 1:
+            raise ValueError("`time` must have at least two entries.")
+
+        for k, v in self.state.items():
+            if np.length(v) != 1:
+                raise ValueError(
+                    f"To simulate, the state of this instance must be scalar, but state variable '{k}' is not.")
+
+        state_names = list(self.state.keys())
+        if parameters is None:
+            parameters = {}
+        parameter_names = list(parameters.keys())
+
+        ### Determine the number of members
+        if initial_states is None:
+            initial_states = {}
+
+        if isinstance(initial_states, dict):
+            for k in initial_states.keys():
+                if k not in state_names:
+                    raise ValueError(f"This dynamics instance does not have a state named '{k}'!")
+            member_values = list(initial_states.values()) + list(parameters.values())
+        else:
+            initial_states = np.array(initial_states, dtype=float)
+            if not (initial_states.ndim == 2 and initial_states.shape[1] == len(state_names)):
+                raise ValueError("If `initial_states` is an array, it must have the shape (n_members, n_states).")
+            member_values = [initial_states[:, 0]] + list(parameters.values())
+
+        lengths = set(
+            np.length(np.array(v).reshape(-1))
+            for v in member_values
+        ) - {1}
+        if n_members is not None:
+            lengths.add(n_members)
+        if len(lengths) > 1:
+            raise ValueError("All arrays in `initial_states` and `parameters` must have the same length, `n_members`.")
+        n_members = lengths.pop() if len(lengths) == 1 else 1
+
+        def per_member(value):
+            value = np.array(value, dtype=float).reshape(-1)
+            return value * np.ones(n_members)
+
+        ### Assemble the initial states and parameters, with one column per member
+        if isinstance(initial_states, dict):
+            x = np.stack([
+                per_member(initial_states[k] if k in initial_states else v)
+                for k, v in self.state.items()
+            ], axis=0)
+        else:
+            x = initial_states.T.copy()
+
+        p = np.stack([
+            per_member(v)
+            for v in parameters.values()
+        ], axis=0) if len(parameter_names) != 0 else np.zeros((0, n_members))
+
+        u = self._control_schedule(time)
+
+        ### Build a step Function that advances all members at once
+        dynamics = self._trace_dynamics(forces=forces, parameter_names=parameter_names)
+        step = _interval_step_function(dynamics, n_substeps=n_substeps)
+        try:
+            step = step.expand()  # Much cheaper to evaluate, if all operations in the graph can be expanded to SX.
+        except RuntimeError:  # e.g., if it contains an interpolant or other external Function
+            pass
+        if n_threads is not None and n_threads > 1:
+            step = step.map(n_members, "thread", n_threads)
+        else:
+            step = step.map(n_members)
+
+        ### Step through time, accumulating statistics
+        percentiles = list(percentiles)
+        mean = np.empty((len(time), len(state_names)))
+        covariance = np.empty((len(time), len(state_names), len(state_names)))
+        percentile_values = np.empty((len(percentiles), len(time), len(state_names)))
+        history = np.empty((len(time), n_members, len(state_names))) if keep_history else None
+
+        def record(i, states):  # `states` has shape (n_members, n_states)
+            mean[i] = np.mean(states, axis=0)
+            deviations = states - mean[i]
+            covariance[i] = deviations.T @ deviations / max(n_members - 1, 1)
+            if len(percentiles) != 0:
+                percentile_values[:, i, :] = np.percentile(states, percentiles, axis=0)
+            if keep_history:
+                history[i] = states
+
+        record(0, x.T)
+        for i in range(n_intervals):
+            x = step(
+                x,
+                np.concatenate([np.tile(u[:, i:i + 1], (1, n_members)), p], axis=0),
+                time[i],
+                time[i + 1] - time[i],
+            ).full()
+            record(i + 1, x.T)
+
+        result = {
+            "time"        : time,
+            "state_names" : state_names,
+            "mean"        : mean,
+            "covariance"  : covariance,
+            "percentiles" : {
+                q: percentile_values[j]
+                for j, q in enumerate(percentiles)
+            },
+            "final_states": x.T,
+        }
+        if keep_history:
+            result["history"] = history
+
+        return result
+
+    def _trace_dynamics(self,
+                        forces: Callable = None,
+                        parameter_names: List[str] = None,
+                        output_names: List[str] = None,
+                        ):
+        """
+        Traces the equations of motion of this Dynamics instance into a CasADi Function, with call syntax `dynamics(
+        t, x, u, p)` -> `x_dot`, where `x` is the state (in the order of `self.state.keys()`), `u` is the control
+        variables (in the order of `self.control_variables.keys()`), and `p` is the parameters (in the order of
+        `parameter_names`).
+
+        Args:
+
+            forces: [Optional] A function that adds forces to a Dynamics instance, in-place. If `parameter_names` is
+            None, it is called as `forces(dyn, t)`; otherwise, as `forces(dyn, t, params)`, where `params` is a dict
+            of symbolic parameters.
+
+            parameter_names: [Optional] The names of the parameters.
+
+            output_names: [Optional] The names of attributes (e.g., state variables, or properties such as "speed"
+            or "alpha") of the Dynamics instance to also return, evaluated after `forces` is applied. If given,
+            the Function has call syntax `dynamics(t, x, u, p)` -> `(x_dot, y)`, where `y` is these outputs.
+
+        Returns: A CasADi Function.
+        """
+        import casadi as cas
+
+        state_names = list(self.state.keys())
+        control_names = list(self.control_variables.keys())
+
+        t_sym = cas.MX.sym("t")
+        x_sym = cas.MX.sym("x", len(state_names))
+        u_sym = cas.MX.sym("u", len(control_names))
+        p_sym = cas.MX.sym("p", 0 if parameter_names is None else len(parameter_names))
+
+        dyn = self.get_new_instance_with_state(
+            self.pack_state(cas.vertsplit(x_sym))
+        )
+        for i, k in enumerate(control_names):
+            setattr(dyn, k, u_sym[i])
+        if forces is not None:
+            if parameter_names is None:
+                forces(dyn, t_sym)
+            else:
+                forces(dyn, t_sym, {
+                    k: p_sym[i]
+                    for i, k in enumerate(parameter_names)
+                })
+
+        state_derivatives = dyn.state_derivatives()
+        x_dot = cas.vertcat(*[
+            0 if state_derivatives[k] is None else state_derivatives[k]
+            for k in state_names
+        ])
+
+        if output_names is None:
+            return cas.Function(
+                "dynamics",
+                [t_sym, x_sym, u_sym, p_sym],
+                [x_dot],
+            )
+
+        y = cas.vertcat(*[
+            getattr(dyn, k)
+            for k in output_names
+        ])
+
+        return cas.Function(
+            "dynamics",
+            [t_sym, x_sym, u_sym, p_sym],
+            [x_dot, y],
+        )
+
+    def _control_schedule(self, time: np.ndarray) -> np.ndarray:
+        """
+        Returns the control variables of this instance over each interval of `time`, as an array of shape (
+        n_controls, len(time) - 1). See `simulate()` for how control variables are interpreted.
+        """
+        n_intervals = len(time) - 1
+
+        def control_values(value):
+            value = np.array(value, dtype=float).reshape(-1)
+            if len(value) == 1:
+                return value[0] * np.ones(n_intervals)
+            elif len(value) == len(time):
+                return value[:-1]
+            else:
+                raise ValueError(
+                    "Each control variable must be either a scalar or an array with the same length as `time`.")
+
+        if len(self.control_variables) == 0:
+            return np.zeros((0, n_intervals))
+
+        return np.stack([
+            control_values(v)
+            for v in self.control_variables.values()
+        ], axis=0)
+
     @abstractmethod
     def convert_axes(self,
                      x_from: float,
@@ -555,3 +971,48 @@ class _DynamicsPointMassBaseClass(AeroSandboxObject, ABC):
         PE = mgh
         """
         return self.mass_props.mass * g * self.altitude
+
+
+def _interval_step_function(dynamics,
+                            integrator: str = "rk4",
+                            n_substeps: int = 1,
+                            integrator_options: Dict = None,
+                            ):
+    """
+    Builds a CasADi Function that advances the given equations of motion across one time interval, with the control
+    variables and parameters held constant. Uses the same integrators as `Opti` does for shooting (see
+    `aerosandbox.optimization.opti._interval_integrator_function()`).
+
+    Args:
+        dynamics: A CasADi Function with call syntax `dynamics(t, x, u, p)` -> `x_dot`. See
+        `_DynamicsPointMassBaseClass._trace_dynamics()`.
+
+        integrator: "rk4" for a fixed-step, fourth-order Runge-Kutta method with `n_substeps` steps, or a CasADi
+        integrator plugin name (e.g., "cvodes").
+
+        n_substeps: The number of RK4 steps to take within the time interval.
+
+        integrator_options: Options to pass to `casadi.integrator()`. Not used with the "rk4" integrator.
+
+    Returns: A CasADi Function with call syntax `step(x, v, t, dt)` -> `x_next`, where `v` is the control variables
+    and parameters, stacked as `vertcat(u, p)`.
+    """
+    import casadi as cas
+    from aerosandbox.optimization.opti import _interval_integrator_function
+
+    n_controls = dynamics.size1_in(2)
+
+    x_sym = cas.MX.sym("x", dynamics.size1_in(1))
+    v_sym = cas.MX.sym("v", n_controls + dynamics.size1_in(3))
+    t_sym = cas.MX.sym("t")
+
+    return _interval_integrator_function(
+        cas.Function(
+            "dynamics",
+            [x_sym, v_sym, t_sym],
+            [dynamics(t_sym, x_sym, v_sym[:n_controls], v_sym[n_controls:])],
+        ),
+        integrator=integrator,
+        n_substeps=n_substeps,
+        integrator_options=integrator_options,
+    )
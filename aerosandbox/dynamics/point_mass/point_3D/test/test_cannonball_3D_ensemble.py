@@ -0,0 +1,108 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+from test_cannonball_3D import time, u_e_0, v_e_0, w_e_0
+
+
+def forces(dyn, t, params):
+    dyn.mass_props = asb.MassProperties(mass=params["mass"])
+    dyn.add_gravity_force()
+    q = 0.5 * 1.225 * dyn.speed ** 2
+    dyn.add_force(
+        Fx=-1 * (0.1) ** 2 * q,
+        axes="wind"
+    )
+
+
+def get_dyn():
+    return asb.DynamicsPointMass3DCartesian(
+        mass_props=asb.MassProperties(mass=1),
+        u_e=u_e_0,
+        v_e=v_e_0,
+        w_e=w_e_0,
+    )
+
+
+@pytest.mark.parametrize("n_threads", [1, 2])
+def test_ensemble_matches_simulate(n_threads):
+    dyn = get_dyn()
+    rng = np.random.default_rng(0)
+    n_members = 20
+    u_e = u_e_0 + rng.normal(0, 0.1, n_members)
+    mass = rng.uniform(0.9, 1.1, n_members)
+
+    ensemble = dyn.simulate_ensemble(
+        time=time,
+        initial_states={"u_e": u_e},
+        parameters={"mass": mass},
+        forces=forces,
+        n_threads=n_threads,
+        keep_history=True,
+    )
+    assert ensemble["state_names"] == list(dyn.state.keys())
+    assert ensemble["history"].shape == (len(time), n_members, len(dyn.state))
+    assert ensemble["final_states"] == pytest.approx(ensemble["history"][-1])
+
+    for i in [0, n_members - 1]:
+        member = asb.DynamicsPointMass3DCartesian(
+            mass_props=asb.MassProperties(mass=mass[i]),
+            u_e=u_e[i],
+            v_e=v_e_0,
+            w_e=w_e_0,
+        )
+        traj = member.simulate(
+            time=time,
+            forces=lambda dyn, t: forces(dyn, t, {"mass": mass[i]}),
+        )
+        assert ensemble["final_states"][i] == pytest.approx(
+            np.array(traj[-1].unpack_state(), dtype=float)
+        )
+
+
+def test_ensemble_statistics():
+    dyn = get_dyn()
+    rng = np.random.default_rng(1)
+    initial_states = np.array(dyn.unpack_state(), dtype=float) + rng.normal(0, 1, (50, len(dyn.state)))
+
+    ensemble = dyn.simulate_ensemble(
+        time=time,
+        initial_states=initial_states,
+        parameters={"mass": 1},
+        forces=forces,
+        percentiles=(0, 50, 100),
+        keep_history=True,
+    )
+    history = ensemble["history"]
+
+    assert ensemble["mean"] == pytest.approx(np.mean(history, axis=1))
+    assert ensemble["covariance"][-1] == pytest.approx(np.cov(history[-1], rowvar=False))
+    assert ensemble["percentiles"][0] == pytest.approx(history.min(axis=1))
+    assert ensemble["percentiles"][100] == pytest.approx(history.max(axis=1))
+
+
+def test_ensemble_with_no_spread():
+    dyn = get_dyn()
+    ensemble = dyn.simulate_ensemble(
+        time=time,
+        parameters={"mass": 1},
+        forces=forces,
+        n_members=3,
+    )
+    assert "history" not in ensemble
+    assert ensemble["final_states"].shape == (3, len(dyn.state))
+    assert ensemble["covariance"] == pytest.approx(0, abs=1e-12)
+
+
+def test_ensemble_mismatched_lengths():
+    dyn = get_dyn()
+    with pytest.raises(ValueError):
+        dyn.simulate_ensemble(
+            time=time,
+            initial_states={"u_e": np.ones(3)},
+            parameters={"mass": np.ones(4)},
+            forces=forces,
+        )
+
+
+if __name__ == '__main__':
+    pytest.main()
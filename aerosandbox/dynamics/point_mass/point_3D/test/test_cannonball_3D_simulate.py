@@ -0,0 +1,75 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+from test_cannonball_3D import get_trajectory, time, u_e_0, v_e_0, w_e_0, speed_0, gamma_0, track_0
+
+
+def forces(dyn, t):
+    dyn.add_gravity_force()
+    q = 0.5 * 1.225 * dyn.speed ** 2
+    dyn.add_force(
+        Fx=-1 * (0.1) ** 2 * q,
+        axes="wind"
+    )
+    dyn.add_force(
+        Fy=q * 1 * (0.1) ** 2 * np.sin(2 * np.pi * 5 * t),
+        axes="wind"
+    )
+
+
+@pytest.mark.parametrize("parameterization", [
+    asb.DynamicsPointMass3DCartesian,
+    asb.DynamicsPointMass3DSpeedGammaTrack,
+])
+@pytest.mark.parametrize("method", ["rk4", "cvodes"])
+def test_simulate_matches_solve_ivp(parameterization, method):
+    if parameterization is asb.DynamicsPointMass3DCartesian:
+        dyn = parameterization(
+            mass_props=asb.MassProperties(mass=1),
+            u_e=u_e_0,
+            v_e=v_e_0,
+            w_e=w_e_0,
+        )
+    else:
+        dyn = parameterization(
+            mass_props=asb.MassProperties(mass=1),
+            speed=speed_0,
+            gamma=gamma_0,
+            track=track_0,
+        )
+
+    traj = dyn.simulate(
+        time=time,
+        forces=forces,
+        method=method,
+        n_substeps=2,
+        integrator_options={"abstol": 1e-10, "reltol": 1e-10},
+    )
+    assert isinstance(traj, parameterization)
+    assert len(traj) == len(time)
+
+    reference = get_trajectory(parameterization=parameterization)
+    for k in ["x_e", "y_e", "z_e"]:
+        assert getattr(traj[-1], k) == pytest.approx(getattr(reference[-1], k), abs=1e-3)
+
+
+def test_simulate_with_control_schedule():
+    dyn = asb.DynamicsPointMass1DVertical(
+        mass_props=asb.MassProperties(mass=2),
+    )
+    time = np.linspace(0, 2, 201)
+    dyn.Fz_e = np.where(time < 1, -4, 0)  # 2 m/s^2 of upward acceleration for 1 second, then coast
+    traj = dyn.simulate(time=time)
+
+    assert traj[-1].w_e == pytest.approx(-2)
+    assert traj[-1].z_e == pytest.approx(-1 - 2)
+
+
+def test_simulate_requires_scalar_state():
+    dyn = asb.DynamicsPointMass1DVertical(z_e=np.zeros(3))
+    with pytest.raises(ValueError):
+        dyn.simulate(time=np.linspace(0, 1, 3))
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -363,6 +363,10 @@ class DynamicsRigidBody3DBodyEuler(_DynamicsRigidBodyBaseClass):
             sthe, cthe = sincos(self.theta)
             spsi, cpsi = sincos(self.psi)
 
+        if not (from_axes in ("earth", "body") and to_axes in ("earth", "body")):
+            # Built once (and only if needed), so that both conversions below share its cached rotation trig.
+            op_point = self.op_point
+
         if from_axes == "earth":
             x_b = (
                     (cthe * cpsi) * x_from +
@@ -379,8 +383,10 @@ class DynamicsRigidBody3DBodyEuler(_DynamicsRigidBodyBaseClass):
                     (cphi * sthe * spsi - sphi * cpsi) * y_from +
                     (cphi * cthe) * z_from
             )
+        elif from_axes == "body":
+            x_b, y_b, z_b = x_from, y_from, z_from
         else:
-            x_b, y_b, z_b = self.op_point.convert_axes(
+            x_b, y_b, z_b = op_point.convert_axes(
                 x_from, y_from, z_from,
                 from_axes=from_axes, to_axes="body"
             )
@@ -401,8 +407,10 @@ class DynamicsRigidBody3DBodyEuler(_DynamicsRigidBodyBaseClass):
                     (sphi * cthe) * y_b +
                     (cphi * cthe) * z_b
             )
+        elif to_axes == "body":
+            x_to, y_to, z_to = x_b, y_b, z_b
         else:
-            x_to, y_to, z_to = self.op_point.convert_axes(
+            x_to, y_to, z_to = op_point.convert_axes(
                 x_b, y_b, z_b,
                 from_axes="body", to_axes=to_axes
             )
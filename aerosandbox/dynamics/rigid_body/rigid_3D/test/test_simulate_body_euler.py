@@ -0,0 +1,45 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def test_simulate_constant_moment():
+    dyn = asb.DynamicsRigidBody3DBodyEuler(
+        mass_props=asb.MassProperties(mass=1, Ixx=1, Iyy=2, Izz=3),
+        u_b=10,
+    )
+    dyn.add_moment(My=0.4, axes="body")  # Angular acceleration of 0.2 rad/s^2 in pitch
+
+    time = np.linspace(0, 3, 61)
+    for method in ["rk4", "cvodes"]:
+        traj = dyn.simulate(time=time, method=method)
+
+        assert traj.q == pytest.approx(0.2 * time, abs=1e-8)
+        assert traj.theta == pytest.approx(0.1 * time ** 2, abs=1e-6)
+        assert traj.phi == pytest.approx(0, abs=1e-8)
+
+
+def test_simulate_gravity_and_drag():
+    dyn = asb.DynamicsRigidBody3DBodyEuler(
+        mass_props=asb.MassProperties(mass=1, Ixx=1, Iyy=1, Izz=1),
+        u_b=30,
+        theta=np.radians(30),
+    )
+
+    def forces(dyn, t):
+        dyn.add_gravity_force()
+        dyn.add_force(Fx=-0.01 * dyn.speed ** 2, axes="wind")
+
+    time = np.linspace(0, 5, 101)
+    traj_rk4 = dyn.simulate(time=time, forces=forces, method="rk4", n_substeps=4)
+    traj_cvodes = dyn.simulate(time=time, forces=forces, method="cvodes",
+                               integrator_options={"abstol": 1e-10, "reltol": 1e-10})
+
+    for k in traj_rk4.state.keys():
+        assert getattr(traj_rk4, k) == pytest.approx(getattr(traj_cvodes, k), abs=1e-5)
+
+    assert traj_rk4[-1].speed < 30  # Drag slows it down
+
+
+if __name__ == '__main__':
+    pytest.main()
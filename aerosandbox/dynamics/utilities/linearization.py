@@ -0,0 +1,397 @@
+import aerosandbox.numpy as np
+import casadi as cas
+from aerosandbox.optimization.least_squares import solve_least_squares
+from typing import Union, Dict, List, Callable, Any
+import warnings
+
+
+def trim(
+        dyn,
+        forces: Callable = None,
+        inputs: Dict[str, Union[float, np.ndarray]] = None,
+        free_states: List[str] = None,
+        targets: Dict[str, Union[float, np.ndarray]] = None,
+        zero_derivatives: List[str] = None,
+        max_iter: int = 100,
+        tolerance: float = 1e-9,
+        n_threads: int = 1,
+) -> Dict[str, Any]:
+    """
+    Finds a trim point (i.e., an equilibrium) of a dynamical system: a state and set of inputs at which the given
+    state derivatives are zero.
+
+    The equations of motion are traced once (with CasADi), and exact derivatives from automatic differentiation
+    are used to solve for the trim point with a Levenberg-Marquardt method (see `asb.solve_least_squares()`). If
+    any of the given values are arrays, many trim points (e.g., across a flight envelope) are solved for at once,
+    and each iteration evaluates all of them in a single (optionally multithreaded) call.
+
+    Example:
+        >>> dyn = asb.DynamicsPointMass2DSpeedGamma(mass_props=asb.MassProperties(mass=1), speed=20)
+        >>>
+        >>> def forces(dyn, t, inputs):
+        >>>     dyn.alpha = inputs["alpha"]
+        >>>     dyn.add_gravity_force()
+        >>>     q = 0.5 * 1.225 * dyn.speed ** 2
+        >>>     dyn.add_force(Fx=-q * 0.1 * (0.02 + 0.05 * (0.1 * dyn.alpha) ** 2) + inputs["thrust"], axes="wind")
+        >>>     dyn.add_force(Fz=-q * 0.1 * 0.1 * dyn.alpha, axes="wind")
+        >>>
+        >>> trimmed = trim(
+        >>>     dyn,
+        >>>     forces=forces,
+        >>>     inputs={"alpha": 5, "thrust": 1},  # Initial guesses
+        >>>     free_states=["speed"],
+        >>>     targets={"speed": np.linspace(15, 30, 16)},  # Trims at 16 different speeds at once
+        >>> )
+        >>> trimmed["inputs"]["alpha"]  # An array of length 16
+
+    Args:
+
+        dyn: A Dynamics instance. Its current state is used as the initial guess for (or, for states not in
+        `free_states`, the fixed value of) the trim state. Its control variables are held fixed.
+
+        forces: [Optional] A function with call syntax `forces(dyn, t, inputs)`, which adds forces (and moments,
+        for rigid bodies) to `dyn` in-place, where `inputs` is a dict with the same keys as `inputs`. See
+        `dyn.simulate_ensemble()` for more details; the same restrictions apply. It is evaluated at t = 0.
+
+        inputs: [Optional] The inputs (e.g., control deflections, thrust) that may be adjusted to trim, as a dict,
+        where keys are input names and values are initial guesses.
+
+        free_states: [Optional] The names of the state variables that may be adjusted to trim. By default,
+        no state variables are adjusted.
+
+        targets: [Optional] Additional conditions that the trim point must satisfy, as a dict, where keys are names
+        of attributes of `dyn` (e.g., state variables, or properties such as "speed" or "alpha") and values are the
+        values that these attributes must have.
+
+        zero_derivatives: [Optional] The names of the state variables whose derivatives must be zero. By default,
+        all state variables other than position (i.e., "x_e", "y_e", "z_e").
+
+        max_iter: The maximum number of iterations.
+
+        tolerance: The trim point is considered to be found when all residuals (i.e., state derivatives,
+        and differences from `targets`) are below this value, in absolute terms.
+
+        n_threads: The number of threads to evaluate trim points with, if solving for many at once.
+
+    Values of `dyn`'s state and control variables, `inputs`, and `targets` may each be either a scalar or an
+    array of length N, in which case N trim points are found.
+
+    Returns: A dictionary with keys:
+
+        * "dyn": A new Dynamics instance of the same type, at the trim state.
+
+        * "inputs": A dict of the inputs at trim.
+
+        * "residual": The largest absolute residual at the final iterate (an array of length N, if solving for N
+        trim points).
+
+        * "success": Whether the trim point was found (an array of length N, if solving for N trim points).
+
+    """
+    state_names = list(dyn.state.keys())
+    if inputs is None:
+        inputs = {}
+    if free_states is None:
+        free_states = []
+    if targets is None:
+        targets = {}
+    if zero_derivatives is None:
+        zero_derivatives = [
+            k for k in state_names
+            if k not in ["x_e", "y_e", "z_e"]
+        ]
+
+    for k in list(free_states) + list(zero_derivatives):
+        if k not in state_names:
+            raise ValueError(f"This dynamics instance does not have a state named '{k}'!")
+
+    input_names = list(inputs.keys())
+    target_names = list(targets.keys())
+
+    values = [
+        *dyn.state.values(),
+        *dyn.control_variables.values(),
+        *inputs.values(),
+        *targets.values(),
+    ]
+    n_points, batched = _get_n_points(values)
+
+    x_base = _stack_per_point(dyn.state.values(), n_points)
+    u = _stack_per_point(dyn.control_variables.values(), n_points)
+    z = np.concatenate([
+        _stack_per_point([dyn.state[k] for k in free_states], n_points),
+        _stack_per_point(inputs.values(), n_points),
+    ], axis=0)
+    y_target = _stack_per_point(targets.values(), n_points)
+
+    ### Trace the residuals, and their Jacobian with respect to the unknowns
+    dynamics = dyn._trace_dynamics(
+        forces=forces,
+        parameter_names=input_names,
+        output_names=target_names,
+    )
+
+    z_sym = cas.MX.sym("z", len(free_states) + len(input_names))
+    x_base_sym = cas.MX.sym("x_base", len(state_names))
+    u_sym = cas.MX.sym("u", u.shape[0])
+    y_target_sym = cas.MX.sym("y_target", len(target_names))
+
+    x_sym = cas.vertcat(*[
+        z_sym[free_states.index(k)] if k in free_states else x_base_sym[i]
+        for i, k in enumerate(state_names)
+    ])
+    p_sym = z_sym[len(free_states):]
+
+    x_dot, y = dynamics(0, x_sym, u_sym, p_sym)
+    residual = cas.vertcat(
+        *[x_dot[state_names.index(k)] for k in zero_derivatives],
+        y - y_target_sym,
+    )
+    residuals = _map(
+        cas.Function(
+            "trim_residuals",
+            [z_sym, x_base_sym, u_sym, y_target_sym],
+            [residual],
+        ),
+        n_points=n_points,
+        n_threads=n_threads,
+    )
+    residuals_and_jacobians = _map(
+        cas.Function(
+            "trim_residuals_and_jacobians",
+            [z_sym, x_base_sym, u_sym, y_target_sym],
+            [residual, cas.jacobian(residual, z_sym)],
+        ),
+        n_points=n_points,
+        n_threads=n_threads,
+    )
+
+    ### Solve, for all trim points at once
+    def cost(z):
+        r = residuals(z.T, x_base, u, y_target).full()  # Shape: (n_residuals, n_points)
+        return np.sum(r ** 2, axis=0)
+
+    def normal_equations(z):
+        r, J = residuals_and_jacobians(z.T, x_base, u, y_target)
+        r = r.full()  # Shape: (n_residuals, n_points)
+        J = _unstack(J, n_points)  # Shape: (n_points, n_residuals, n_unknowns)
+        return (
+            np.sum(r ** 2, axis=0),
+            np.einsum("nri,nrj->nij", J, J),
+            np.einsum("nri,rn->ni", J, r),
+        )
+
+    if z.shape[0] > 0:
+        z = solve_least_squares(
+            cost=cost,
+            normal_equations=normal_equations,
+            x0=z.T,
+            max_iter=max_iter,
+            absolute_cost_tolerance=tolerance ** 2,  # Which guarantees that every residual is within `tolerance`
+        )[0].T
+
+    residual_max = np.abs(
+        residuals(z, x_base, u, y_target).full()
+    ).max(axis=0, initial=0)
+    success = residual_max <= tolerance
+    if not np.all(success):
+        warnings.warn(
+            f"Trim was not found at {np.sum(~success)} of {n_points} points (largest residual: "
+            f"{np.max(residual_max):.3g}).",
+            stacklevel=2
+        )
+
+    ### Format the outputs
+    def format_output(value):
+        return value if batched else float(value[0])
+
+    x = x_base.copy()
+    for j, k in enumerate(free_states):
+        x[state_names.index(k)] = z[j]
+
+    return {
+        "dyn"     : dyn.get_new_instance_with_state({
+            k: format_output(x[i])
+            for i, k in enumerate(state_names)
+        }),
+        "inputs"  : {
+            k: format_output(z[len(free_states) + j])
+            for j, k in enumerate(input_names)
+        },
+        "residual": format_output(residual_max),
+        "success" : success if batched else bool(success[0]),
+    }
+
+
+def linearize(
+        dyn,
+        forces: Callable = None,
+        inputs: Dict[str, Union[float, np.ndarray]] = None,
+        outputs: List[str] = None,
+        n_threads: int = 1,
+) -> Dict[str, Any]:
+    """
+    Linearizes a dynamical system about its current state (typically, a trim point; see `trim()`), giving a
+    continuous-time state-space model:
+
+        d(dx)/dt = A @ dx + B @ du
+
+        dy = C @ dx + D @ du
+
+    where `dx`, `du`, and `dy` are small perturbations in the state, inputs, and outputs, respectively.
+
+    The matrices are computed exactly, with automatic differentiation (CasADi) of the traced equations of motion,
+    rather than by finite differences. If any of the given values are arrays, the system is linearized about many
+    points (e.g., across a flight envelope) at once, with a single (optionally multithreaded) call.
+
+    Example:
+        >>> trimmed = trim(dyn, forces=forces, inputs={"alpha": 5, "thrust": 1}, free_states=["gamma"])
+        >>> model = linearize(trimmed["dyn"], forces=forces, inputs=trimmed["inputs"], outputs=["speed", "gamma"])
+        >>> np.linalg.eigvals(model["A"])  # The eigenvalues of the dynamics, which give the modes of motion.
+
+    Args:
+
+        dyn: A Dynamics instance, at the state to linearize about. Its control variables are held fixed.
+
+        forces: [Optional] A function with call syntax `forces(dyn, t, inputs)`, which adds forces (and moments,
+        for rigid bodies) to `dyn` in-place. See `trim()`.
+
+        inputs: [Optional] The inputs to linearize with respect to, as a dict, where keys are input names and
+        values are the values to linearize about.
+
+        outputs: [Optional] The names of attributes of `dyn` (e.g., state variables, or properties such as "speed"
+        or "alpha") to use as outputs. By default, the state variables (so that C is the identity matrix,
+        and D is zero).
+
+        n_threads: The number of threads to evaluate with, if linearizing about many points at once.
+
+    Values of `dyn`'s state and control variables and `inputs` may each be either a scalar or an array of length
+    N, in which case the system is linearized about N points.
+
+    Returns: A dictionary with keys:
+
+        * "A", "B", "C", "D": The state-space matrices, of shapes (n_states, n_states), (n_states, n_inputs),
+        (n_outputs, n_states), and (n_outputs, n_inputs), respectively. If linearizing about N points, each has an
+        additional leading axis of length N.
+
+        * "state_names", "input_names", "output_names": The names of the states, inputs, and outputs, in the order
+        used by the matrices.
+
+    """
+    state_names = list(dyn.state.keys())
+    if inputs is None:
+        inputs = {}
+    input_names = list(inputs.keys())
+    if outputs is None:
+        outputs = state_names
+    output_names = list(outputs)
+
+    values = [
+        *dyn.state.values(),
+        *dyn.control_variables.values(),
+        *inputs.values(),
+    ]
+    n_points, batched = _get_n_points(values)
+
+    x = _stack_per_point(dyn.state.values(), n_points)
+    u = _stack_per_point(dyn.control_variables.values(), n_points)
+    p = _stack_per_point(inputs.values(), n_points)
+
+    ### Trace the equations of motion, and their Jacobians
+    dynamics = dyn._trace_dynamics(
+        forces=forces,
+        parameter_names=input_names,
+        output_names=output_names,
+    )
+
+    x_sym = cas.MX.sym("x", len(state_names))
+    u_sym = cas.MX.sym("u", u.shape[0])
+    p_sym = cas.MX.sym("p", len(input_names))
+
+    x_dot, y = dynamics(0, x_sym, u_sym, p_sym)
+    jacobians = _map(
+        cas.Function(
+            "linearization",
+            [x_sym, u_sym, p_sym],
+            [
+                cas.jacobian(x_dot, x_sym),
+                cas.jacobian(x_dot, p_sym),
+                cas.jacobian(y, x_sym),
+                cas.jacobian(y, p_sym),
+            ]
+        ),
+        n_points=n_points,
+        n_threads=n_threads,
+    )
+
+    A, B, C, D = [
+        _unstack(matrix, n_points) if batched else _unstack(matrix, n_points)[0]
+        for matrix in jacobians(x, u, p)
+    ]
+
+    return {
+        "A"           : A,
+        "B"           : B,
+        "C"           : C,
+        "D"           : D,
+        "state_names" : state_names,
+        "input_names" : input_names,
+        "output_names": output_names,
+    }
+
+
+def _get_n_points(values: List[Union[float, np.ndarray]]):
+    """
+    Determines the number of points to evaluate at from a list of values, each of which is a scalar or a 1D array.
+
+    Returns: A tuple of (n_points, batched), where `batched` is True if any value is an array.
+    """
+    lengths = set(
+        np.length(np.array(v).reshape(-1))
+        for v in values
+        if np.ndim(v) != 0
+    )
+    if len(lengths) > 1:
+        raise ValueError("All arrays (in the state, control variables, inputs, and targets) must have the same length.")
+    if len(lengths) == 0:
+        return 1, False
+    return lengths.pop(), True
+
+
+def _stack_per_point(values, n_points: int) -> np.ndarray:
+    """
+    Stacks a list of values (each a scalar or a 1D array of length `n_points`) into an array of shape (len(values),
+    n_points).
+    """
+    values = list(values)
+    if len(values) == 0:
+        return np.zeros((0, n_points))
+    return np.stack([
+        np.array(v, dtype=float).reshape(-1) * np.ones(n_points)
+        for v in values
+    ], axis=0)
+
+
+def _unstack(matrix: cas.DM, n_points: int) -> np.ndarray:
+    """
+    Converts the horizontally-concatenated output of a mapped CasADi Function, of shape (n_rows, n_points *
+    n_columns), into an array of shape (n_points, n_rows, n_columns).
+    """
+    matrix = matrix.full()
+    n_rows, n_columns = matrix.shape[0], matrix.shape[1] // n_points
+    return matrix.reshape((n_rows, n_points, n_columns)).transpose((1, 0, 2))
+
+
+def _map(function: cas.Function, n_points: int, n_threads: int = 1) -> cas.Function:
+    """
+    Maps a CasADi Function over `n_points` points, expanding it to SX (for speed) if possible.
+    """
+    try:
+        function = function.expand()
+    except RuntimeError:  # e.g., if it contains an interpolant or other external Function
+        pass
+
+    if n_threads is not None and n_threads > 1:
+        return function.map(n_points, "thread", n_threads)
+    else:
+        return function.map(n_points)
@@ -0,0 +1,126 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+from aerosandbox.dynamics.utilities.linearization import trim, linearize
+import pytest
+
+mass = 1
+S = 0.1
+CL_alpha = 0.1  # per degree
+
+
+def glider_forces(dyn, t, inputs):
+    dyn.alpha = inputs["alpha"]
+    dyn.add_gravity_force()
+    q = 0.5 * 1.225 * dyn.speed ** 2
+    CL = CL_alpha * dyn.alpha
+    dyn.add_force(Fx=-q * S * (0.02 + 0.05 * CL ** 2) + inputs["thrust"], axes="wind")
+    dyn.add_force(Fz=-q * S * CL, axes="wind")
+
+
+def test_linearize_spring_mass_damper():
+    k = 3
+    c = 0.5
+
+    def forces(dyn, t, inputs):
+        dyn.add_force(Fz=-k * dyn.z_e - c * dyn.w_e + inputs["F"], axes="earth")
+
+    dyn = asb.DynamicsPointMass1DVertical(
+        mass_props=asb.MassProperties(mass=2),
+        z_e=0.1,
+        w_e=-0.2,
+    )
+    model = linearize(dyn, forces=forces, inputs={"F": 0}, outputs=["z_e"])
+
+    assert model["state_names"] == ["z_e", "w_e"]
+    assert model["A"] == pytest.approx(np.array([[0, 1], [-k / 2, -c / 2]]))
+    assert model["B"] == pytest.approx(np.array([[0], [1 / 2]]))
+    assert model["C"] == pytest.approx(np.array([[1, 0]]))
+    assert model["D"] == pytest.approx(np.array([[0]]))
+
+
+def test_trim_level_flight_envelope():
+    speeds = np.linspace(15, 30, 16)
+    dyn = asb.DynamicsPointMass2DSpeedGamma(
+        mass_props=asb.MassProperties(mass=mass),
+        speed=20,
+    )
+    trimmed = trim(
+        dyn,
+        forces=glider_forces,
+        inputs={"alpha": 5, "thrust": 1},
+        free_states=["speed"],
+        targets={"speed": speeds},
+        n_threads=2,
+    )
+    assert np.all(trimmed["success"])
+
+    q = 0.5 * 1.225 * speeds ** 2
+    CL = mass * 9.81 / (q * S)
+    assert trimmed["inputs"]["alpha"] == pytest.approx(CL / CL_alpha)
+    assert trimmed["inputs"]["thrust"] == pytest.approx(q * S * (0.02 + 0.05 * CL ** 2))
+    assert trimmed["dyn"].speed == pytest.approx(speeds)
+
+    ### Linearize about all trim points at once, and compare to a single point
+    model = linearize(
+        trimmed["dyn"],
+        forces=glider_forces,
+        inputs=trimmed["inputs"],
+        outputs=["speed", "gamma"],
+    )
+    assert model["A"].shape == (16, 4, 4)
+    assert model["B"].shape == (16, 4, 2)
+    assert model["C"].shape == (16, 2, 4)
+
+    model_single = linearize(
+        trimmed["dyn"][3],
+        forces=glider_forces,
+        inputs={k: v[3] for k, v in trimmed["inputs"].items()},
+        outputs=["speed", "gamma"],
+    )
+    for k in ["A", "B", "C", "D"]:
+        assert model_single[k] == pytest.approx(model[k][3])
+
+
+def test_linearize_matches_finite_differences():
+    dyn = asb.DynamicsPointMass2DSpeedGamma(
+        mass_props=asb.MassProperties(mass=mass),
+        speed=18,
+        gamma=0.05,
+    )
+    inputs = {"alpha": 4, "thrust": 0.8}
+    model = linearize(dyn, forces=glider_forces, inputs=inputs)
+
+    def x_dot(dyn, inputs):
+        dyn = dyn.get_new_instance_with_state()
+        glider_forces(dyn, 0, inputs)
+        return np.array(dyn.unpack_state(dyn.state_derivatives()), dtype=float)
+
+    eps = 1e-6
+    for j, k in enumerate(model["state_names"]):
+        dyn_perturbed = dyn.get_new_instance_with_state({k: dyn.state[k] + eps})
+        assert model["A"][:, j] == pytest.approx(
+            (x_dot(dyn_perturbed, inputs) - x_dot(dyn, inputs)) / eps, abs=1e-4
+        )
+    for j, k in enumerate(model["input_names"]):
+        inputs_perturbed = {**inputs, k: inputs[k] + eps}
+        assert model["B"][:, j] == pytest.approx(
+            (x_dot(dyn, inputs_perturbed) - x_dot(dyn, inputs)) / eps, abs=1e-4
+        )
+
+
+def test_trim_failure_warns():
+    dyn = asb.DynamicsPointMass2DSpeedGamma(
+        mass_props=asb.MassProperties(mass=mass),
+        speed=20,
+    )
+    with pytest.warns(UserWarning):
+        trimmed = trim(
+            dyn,
+            forces=lambda dyn, t, inputs: glider_forces(dyn, t, {"alpha": 0, **inputs}),
+            inputs={"thrust": 1},  # At zero alpha, lift can't balance weight.
+        )
+    assert not trimmed["success"]
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -190,7 +190,8 @@ class Airfoil(Polygon):
 
             unstructured_interpolated_model_kwargs: Keyword arguments to pass into the UnstructuredInterpolatedModels
             that contain the polars themselves. See the aerosandbox.UnstructuredInterpolatedModel constructor for
-            options.
+            options. For example, `{"cache_directory": "polar_cache"}` caches the built polar surrogates, so that
+            regenerating them skips refitting.
 
             include_compressibility_effects: Includes compressibility effects in the polars, such as wave drag,
             mach tuck, CL effects across normal shocks. Note that accuracy here is dubious in the transonic regime
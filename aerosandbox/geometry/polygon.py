@@ -1,5 +1,4 @@
 import aerosandbox.numpy as np
-from matplotlib import path
 from aerosandbox.common import AeroSandboxObject
 from typing import Union
 
@@ -61,6 +60,8 @@ class Polygon(AeroSandboxObject):
 
         points = np.hstack((x, y))
 
+        from matplotlib import path
+
         contained = path.Path(
             vertices=self.coordinates
         ).contains_points(
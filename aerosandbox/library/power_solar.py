@@ -1,6 +1,6 @@
 import aerosandbox.numpy as np
 from aerosandbox.atmosphere.atmosphere import Atmosphere
-from typing import Union
+from typing import Union, Dict
 
 """
 Welcome to the AeroSandbox solar energy library!
@@ -211,6 +211,28 @@ def airmass(
     return airmass_at_altitude
 
 
+def _atmospheric_transmission_fraction(
+        relative_airmass: Union[float, np.ndarray],
+        air_quality: str = 'typical',
+) -> Union[float, np.ndarray]:
+    """
+    The fraction of direct-normal solar flux that is transmitted through the atmosphere, as a function of relative
+    airmass. See `solar_flux()` for the meaning of `air_quality`.
+    """
+    # Source: "Planning and installing..." Earthscan. Full citation in the docstring of `solar_flux()`.
+    if air_quality == 'typical':
+        base, exponent = 0.70, 0.678
+    elif air_quality == 'clean':
+        base, exponent = 0.76, 0.618
+    elif air_quality == 'polluted':
+        base, exponent = 0.56, 0.715
+    else:
+        raise ValueError("Bad value of `air_quality`!")
+
+    with np.errstate(under="ignore"):  # With the sun below the horizon, this underflows to zero by design.
+        return base ** (relative_airmass ** exponent)
+
+
 def solar_flux(
         latitude: Union[float, np.ndarray],
         day_of_year: Union[int, float, np.ndarray],
@@ -307,15 +329,10 @@ def solar_flux(
         altitude=altitude,
     )
 
-    # Source: "Planning and installing..." Earthscan. Full citation in docstring above.
-    if air_quality == 'typical':
-        atmospheric_transmission_fraction = 0.70 ** (relative_airmass ** 0.678)
-    elif air_quality == 'clean':
-        atmospheric_transmission_fraction = 0.76 ** (relative_airmass ** 0.618)
-    elif air_quality == 'polluted':
-        atmospheric_transmission_fraction = 0.56 ** (relative_airmass ** 0.715)
-    else:
-        raise ValueError("Bad value of `air_quality`!")
+    atmospheric_transmission_fraction = _atmospheric_transmission_fraction(
+        relative_airmass=relative_airmass,
+        air_quality=air_quality,
+    )
 
     direct_normal_irradiance = np.where(
         solar_elevation > 0.,
@@ -367,6 +384,294 @@ def solar_flux(
     return flux_on_panel
 
 
+def solar_energy_per_day(
+        latitude: Union[float, np.ndarray],
+        day_of_year: Union[int, float, np.ndarray],
+        altitude: Union[float, np.ndarray] = 0.,
+        panel_azimuth_angle: Union[float, np.ndarray] = 0.,
+        panel_tilt_angle: Union[float, np.ndarray] = 0.,
+        panel_area: Union[float, np.ndarray] = None,
+        air_quality: str = 'typical',
+        albedo: float = 0.2,
+        n_time_points: int = 144,
+        batch_size: int = 1_000_000,
+        n_workers: int = 1,
+) -> np.ndarray:
+    """
+    Computes the solar energy collected over one full day by flat (possibly tilted) panels. Same model as
+    `solar_flux()`, integrated over the day, but built for large sizing studies: e.g., every day of a multi-year
+    mission, times a grid of latitudes and altitudes, times every panel of a wing mesh.
+
+    The conditions (`latitude`, `day_of_year`, and `altitude`) are broadcast against each other, forming a grid of
+    daily conditions. The panels (`panel_azimuth_angle`, `panel_tilt_angle`, and `panel_area`) are broadcast against
+    each other, forming a set of panels. Every panel is evaluated at every daily condition.
+
+    Quantities that don't depend on the panel (e.g., solar declination, sun position, and airmass) are computed only
+    once per condition and time of day, and shared by all panels. Conditions are evaluated in batches, which caps
+    the memory used by intermediate arrays, and batches can be spread across a pool of processes.
+
+    Numeric inputs only; to optimize through this model, use `solar_flux()` directly.
+
+    Usage example, sizing a solar array on a wing:
+
+    >>> panels = panel_orientations_from_mesh(*wing.mesh_thin_surface(), heading=90) # Flying east
+    >>> energy = solar_energy_per_day(
+    >>>     latitude=np.linspace(-60, 60, 25).reshape((-1, 1)), # Shape: (25, 1)
+    >>>     day_of_year=np.arange(365), # Shape: (365,)
+    >>>     altitude=18000,
+    >>>     **panels,
+    >>> ) # Total energy collected by the wing on each day [J], of shape (25, 365).
+
+    Args:
+
+        latitude: Local geographic latitude [degrees]. Positive for north, negative for south.
+
+        day_of_year: Julian day (1 == Jan. 1, 365 == Dec. 31)
+
+        altitude: Altitude of the panels above sea level [meters].
+
+        panel_azimuth_angle: The azimuth angle of each panel normal [degrees]. See `solar_flux()`.
+
+        panel_tilt_angle: The angle between each panel normal and vertical (zenith) [degrees]. See `solar_flux()`.
+
+        panel_area: Optional; the area of each panel [m^2]. If given, the energy collected by all panels is summed.
+
+        air_quality: Indicates the amount of pollution in the air. See `solar_flux()`.
+
+        albedo: The fraction of light that hits the ground that is reflected. See `solar_flux()`.
+
+        n_time_points: The number of (evenly-spaced) times of day at which the solar flux is evaluated. The
+        integration over the day is done with the trapezoidal rule (which, for this periodic integrand, is the same
+        as the midpoint rule).
+
+        batch_size: The (approximate) maximum number of solar flux evaluations (conditions * times of day * panels)
+        to do at once.
+
+        n_workers: The number of processes to spread batches across. If 1 (default), runs serially in this process.
+
+    Returns: The solar energy collected over the day.
+
+        * If `panel_area` is None: the energy per unit area [J/m^2] on each panel. Shape is the broadcasted shape of
+        the conditions, followed by the broadcasted shape of the panels.
+
+        * If `panel_area` is given: the total energy [J] collected by all panels. Shape is the broadcasted shape of
+        the conditions.
+
+    """
+    latitude, day_of_year, altitude = np.broadcast_arrays(
+        np.asarray(latitude, dtype=float),
+        np.asarray(day_of_year, dtype=float),
+        np.asarray(altitude, dtype=float),
+    )
+    conditions_shape = latitude.shape
+
+    if panel_area is None:
+        panel_azimuth_angle, panel_tilt_angle = np.broadcast_arrays(
+            np.asarray(panel_azimuth_angle, dtype=float),
+            np.asarray(panel_tilt_angle, dtype=float),
+        )
+    else:
+        panel_azimuth_angle, panel_tilt_angle, panel_area = np.broadcast_arrays(
+            np.asarray(panel_azimuth_angle, dtype=float),
+            np.asarray(panel_tilt_angle, dtype=float),
+            np.asarray(panel_area, dtype=float),
+        )
+    panels_shape = panel_tilt_angle.shape
+
+    ### Precompute panel-only quantities.
+    # Each panel normal, as a unit vector in (north, east, up) components.
+    panel_normals = np.stack([
+        np.sind(panel_tilt_angle) * np.cosd(panel_azimuth_angle),
+        np.sind(panel_tilt_angle) * np.sind(panel_azimuth_angle),
+        np.cosd(panel_tilt_angle),
+    ], axis=-1).reshape((-1, 3))
+
+    panel_tilt_angle = np.mod(panel_tilt_angle.reshape(-1), 360)
+    fraction_of_panel_facing_sky = np.where(
+        panel_tilt_angle < 180,
+        1 - panel_tilt_angle / 180,
+        -1 + panel_tilt_angle / 180,
+    )
+    diffuse_view_factor = fraction_of_panel_facing_sky + albedo * (1 - fraction_of_panel_facing_sky)
+
+    ### Split the conditions into batches
+    latitude = latitude.reshape(-1)
+    day_of_year = day_of_year.reshape(-1)
+    altitude = altitude.reshape(-1)
+
+    n_conditions_per_batch = max(1, batch_size // (n_time_points * len(panel_normals)))
+    batches = [
+        dict(
+            latitude=latitude[batch_start:batch_start + n_conditions_per_batch],
+            day_of_year=day_of_year[batch_start:batch_start + n_conditions_per_batch],
+            altitude=altitude[batch_start:batch_start + n_conditions_per_batch],
+            panel_normals=panel_normals,
+            diffuse_view_factor=diffuse_view_factor,
+            air_quality=air_quality,
+            n_time_points=n_time_points,
+        )
+        for batch_start in range(0, len(latitude), n_conditions_per_batch)
+    ]
+
+    if n_workers == 1:
+        energies = [_solar_energy_per_day_batch(batch) for batch in batches]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            energies = list(executor.map(_solar_energy_per_day_batch, batches))
+
+    energy = np.concatenate(energies, axis=0) if len(energies) > 0 else np.zeros((0, len(panel_normals)))
+
+    if panel_area is None:
+        return energy.reshape(conditions_shape + panels_shape)
+    else:
+        return (energy @ panel_area.reshape(-1)).reshape(conditions_shape)
+
+
+def _solar_energy_per_day_batch(batch: dict) -> np.ndarray:
+    """
+    Computes the solar energy per unit area [J/m^2] collected over one day, for one batch of conditions (given as 1D
+    arrays of length N) and a set of M panels. Defined at module level, so that it can be run in worker processes.
+    See `solar_energy_per_day()`.
+
+    Returns: An array of shape (N, M).
+    """
+    n_time_points = batch["n_time_points"]
+    time = np.arange(n_time_points) * (86400 / n_time_points)  # Time after local solar noon [seconds]
+
+    latitude = batch["latitude"].reshape((-1, 1))
+    day_of_year = batch["day_of_year"].reshape((-1, 1))
+    altitude = batch["altitude"].reshape((-1, 1))
+
+    ### Sun position, computed once per condition and time of day. Shape: (N, T).
+    declination = declination_angle(day_of_year)
+    sdec = np.sind(declination)
+    cdec = np.cosd(declination)
+    slat = np.sind(latitude)
+    clat = np.cosd(latitude)
+    hour_angle = time / 86400 * 360
+
+    # The direction to the sun, as a unit vector in (north, east, up) components. Equivalent to the elevation and
+    # azimuth angles given by `solar_elevation_angle()` and `solar_azimuth_angle()`.
+    sun_up = sdec * slat + cdec * clat * np.cosd(hour_angle)
+    sun_north = sdec * clat - cdec * slat * np.cosd(hour_angle)
+    sun_east = np.broadcast_to(-cdec * np.sind(hour_angle), sun_up.shape)
+
+    solar_elevation = np.arcsind(np.clip(sun_up, -1, 1))
+
+    ### Irradiance, computed once per condition and time of day. Shape: (N, T).
+    flux_outside_atmosphere = solar_flux_outside_atmosphere_normal(day_of_year=day_of_year)
+
+    atmospheric_transmission_fraction = _atmospheric_transmission_fraction(
+        relative_airmass=airmass(
+            solar_elevation_angle=solar_elevation,
+            altitude=altitude,
+        ),
+        air_quality=batch["air_quality"],
+    )
+
+    direct_normal_irradiance = np.where(
+        solar_elevation > 0.,
+        flux_outside_atmosphere * atmospheric_transmission_fraction,
+        0.
+    )
+
+    # See `solar_flux()` for the assumptions behind this diffuse irradiance model.
+    scattering_losses = flux_outside_atmosphere * (1 - atmospheric_transmission_fraction) * (10. / 28.)
+    diffuse_irradiance_on_horizontal = scattering_losses * atmospheric_transmission_fraction
+
+    ### Per-panel quantities
+    # Cosine of the angle between each panel normal and the sun, for all panels in one matrix multiply. Shape: (N, T, M).
+    cosine_of_angle_between_panel_normal_and_sun = np.fmax(
+        np.stack([sun_north, sun_east, sun_up], axis=-1) @ batch["panel_normals"].T,
+        0
+    )
+
+    dt = 86400 / n_time_points
+    direct_energy = np.einsum(
+        "nt,ntm->nm",
+        direct_normal_irradiance,
+        cosine_of_angle_between_panel_normal_and_sun,
+    ) * dt
+    diffuse_energy = (
+            diffuse_irradiance_on_horizontal.sum(axis=1, keepdims=True) * dt
+            * batch["diffuse_view_factor"].reshape((1, -1))
+    )
+
+    return direct_energy + diffuse_energy
+
+
+def panel_orientations_from_mesh(
+        points: np.ndarray,
+        faces: np.ndarray,
+        heading: float = 0.,
+) -> Dict[str, np.ndarray]:
+    """
+    Computes the orientation and area of each face of a surface mesh (e.g., from `Wing.mesh_thin_surface()`), for
+    use as solar panels in `solar_energy_per_day()` or `solar_flux()`.
+
+    The mesh is assumed to be given in geometry axes, on an aircraft in level flight (zero pitch and bank) with the
+    given heading. The normal of each face follows the right-hand rule on its vertex order; for
+    `Wing.mesh_thin_surface()` meshes of horizontal wings, this is upwards.
+
+    Usage example:
+
+    >>> panels = panel_orientations_from_mesh(*wing.mesh_thin_surface(), heading=90)
+    >>> energy = solar_energy_per_day(latitude=30, day_of_year=172, **panels) # [J]
+
+    Args:
+
+        points: The vertices of the mesh, as an (N, 3) array in geometry axes.
+
+        faces: The faces of the mesh, as an (M, 3) array (for triangles) or an (M, 4) array (for quadrilaterals) of
+        indices into `points`. See `aerosandbox.geometry.mesh_utilities` for the (points, faces) mesh format.
+
+        heading: The compass heading of the aircraft [degrees]. 0 corresponds to North, 90 corresponds to East.
+
+    Returns: A dictionary with keys:
+
+        * "panel_azimuth_angle": The azimuth angle of each face normal [degrees], as an (M,) array.
+
+        * "panel_tilt_angle": The angle between each face normal and vertical (zenith) [degrees], as an (M,) array.
+
+        * "panel_area": The area of each face [m^2], as an (M,) array.
+
+    """
+    points = np.asarray(points, dtype=float)
+    faces = np.asarray(faces, dtype=int)
+
+    if faces.shape[1] == 3:
+        area_vectors = 0.5 * np.cross(
+            points[faces[:, 1]] - points[faces[:, 0]],
+            points[faces[:, 2]] - points[faces[:, 0]],
+        )
+    elif faces.shape[1] == 4:  # The cross product of the diagonals; exact for planar quadrilaterals.
+        area_vectors = 0.5 * np.cross(
+            points[faces[:, 2]] - points[faces[:, 0]],
+            points[faces[:, 3]] - points[faces[:, 1]],
+        )
+    else:
+        raise ValueError("`faces` must be an (M, 3) or (M, 4) array of vertex indices.")
+
+    panel_area = np.sum(area_vectors ** 2, axis=1) ** 0.5
+    normals = area_vectors / panel_area.reshape((-1, 1))
+
+    ### Convert the normals from geometry axes to (north, east, up) components.
+    # In geometry axes, x points aft, y points to starboard, and z points up.
+    forward_north = np.cosd(heading)
+    forward_east = np.sind(heading)
+
+    normal_north = -normals[:, 0] * forward_north - normals[:, 1] * forward_east
+    normal_east = -normals[:, 0] * forward_east + normals[:, 1] * forward_north
+    normal_up = normals[:, 2]
+
+    return {
+        "panel_azimuth_angle": np.mod(np.arctan2d(normal_east, normal_north), 360),
+        "panel_tilt_angle"   : np.arccosd(np.clip(normal_up, -1, 1)),
+        "panel_area"         : panel_area,
+    }
+
+
 def peak_sun_hours_per_day_on_horizontal(
         latitude: Union[float, np.ndarray],
         day_of_year: Union[int, float, np.ndarray]
@@ -0,0 +1,116 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+from aerosandbox.library import power_solar as lib_solar
+import pytest
+
+
+def reference_energy_per_day(latitude, day_of_year, altitude, panel_azimuth_angle, panel_tilt_angle, n_time_points):
+    time = np.arange(n_time_points) * (86400 / n_time_points)
+    flux = lib_solar.solar_flux(
+        latitude=latitude,
+        day_of_year=day_of_year,
+        time=time,
+        altitude=altitude,
+        panel_azimuth_angle=panel_azimuth_angle,
+        panel_tilt_angle=panel_tilt_angle,
+    )
+    return np.sum(flux) * (86400 / n_time_points)
+
+
+def test_solar_energy_per_day_matches_solar_flux():
+    latitude = np.array([-40, 0, 23.5, 65]).reshape((-1, 1))
+    day_of_year = np.array([1, 80, 172, 300])
+    altitude = np.array([0, 18000]).reshape((-1, 1, 1))
+    panel_azimuth_angle = np.array([0, 90, 200, 300])
+    panel_tilt_angle = np.array([0, 30, 90, 150])
+
+    energy = lib_solar.solar_energy_per_day(
+        latitude=latitude,
+        day_of_year=day_of_year,
+        altitude=altitude,
+        panel_azimuth_angle=panel_azimuth_angle,
+        panel_tilt_angle=panel_tilt_angle,
+        n_time_points=96,
+    )
+    assert energy.shape == (2, 4, 4, 4)
+
+    for i, j, k, m in [(0, 0, 0, 0), (1, 2, 2, 1), (0, 3, 1, 2), (1, 1, 3, 3), (1, 3, 2, 0)]:
+        assert energy[i, j, k, m] == pytest.approx(
+            reference_energy_per_day(
+                latitude=latitude[j, 0],
+                day_of_year=day_of_year[k],
+                altitude=altitude[i, 0, 0],
+                panel_azimuth_angle=panel_azimuth_angle[m],
+                panel_tilt_angle=panel_tilt_angle[m],
+                n_time_points=96,
+            ),
+            rel=1e-6
+        )
+
+    ### Total energy, weighted by panel area
+    panel_area = np.array([1, 2, 3, 4])
+    total_energy = lib_solar.solar_energy_per_day(
+        latitude=latitude,
+        day_of_year=day_of_year,
+        altitude=altitude,
+        panel_azimuth_angle=panel_azimuth_angle,
+        panel_tilt_angle=panel_tilt_angle,
+        panel_area=panel_area,
+        n_time_points=96,
+    )
+    assert total_energy.shape == (2, 4, 4)
+    assert total_energy == pytest.approx(np.sum(energy * panel_area, axis=-1))
+
+
+def test_solar_energy_per_day_batches():
+    kwargs = dict(
+        latitude=np.linspace(-60, 60, 7).reshape((-1, 1)),
+        day_of_year=np.arange(0, 365 * 2, 10),
+        panel_tilt_angle=np.array([0, 45]),
+    )
+    expected = lib_solar.solar_energy_per_day(**kwargs)
+
+    assert lib_solar.solar_energy_per_day(**kwargs, batch_size=1000) == pytest.approx(expected)
+    assert lib_solar.solar_energy_per_day(**kwargs, batch_size=1000, n_workers=2) == pytest.approx(expected)
+
+    ### Scalar conditions and panels give a scalar
+    assert np.shape(lib_solar.solar_energy_per_day(latitude=30, day_of_year=172)) == ()
+
+
+def test_panel_orientations_from_mesh():
+    wing = asb.Wing(
+        symmetric=True,
+        xsecs=[
+            asb.WingXSec(xyz_le=[0, 0, 0], chord=1),
+            asb.WingXSec(xyz_le=[0, 2, 0], chord=1),
+            asb.WingXSec(xyz_le=[0, 3, 1], chord=1),  # 45-degree dihedral tip panel
+        ]
+    )
+    for method in ["tri", "quad"]:
+        panels = lib_solar.panel_orientations_from_mesh(
+            *wing.mesh_thin_surface(method=method, chordwise_resolution=4, add_camber=False),
+            heading=90,  # Flying east, so the right wing points south, and its tip panel faces north.
+        )
+        assert np.sum(panels["panel_area"]) == pytest.approx(wing.area())
+
+        inboard = panels["panel_tilt_angle"] < 1
+        assert np.sum(panels["panel_area"][inboard]) == pytest.approx(4)
+        assert np.all(np.isclose(panels["panel_tilt_angle"][~inboard], 45))
+        assert set(np.round(np.cosd(panels["panel_azimuth_angle"][~inboard]))) == {-1, 1}  # North- and south-facing
+
+    ### South-facing (i.e., left-wing) tip panels collect more energy in northern-hemisphere winter
+    panels = lib_solar.panel_orientations_from_mesh(*wing.mesh_thin_surface(add_camber=False), heading=90)
+    energy = lib_solar.solar_energy_per_day(
+        latitude=45,
+        day_of_year=355,
+        panel_azimuth_angle=panels["panel_azimuth_angle"],
+        panel_tilt_angle=panels["panel_tilt_angle"],
+    )
+    tilted = panels["panel_tilt_angle"] > 1
+    facing_south = tilted & (np.cosd(panels["panel_azimuth_angle"]) < -0.99)
+    facing_north = tilted & (np.cosd(panels["panel_azimuth_angle"]) > 0.99)
+    assert np.min(energy[facing_south]) > np.max(energy[facing_north])
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,45 @@
+from aerosandbox.library import winds as lib_winds
+import aerosandbox.numpy as np
+import pytest
+
+
+def test_wind_speed_world_95_batched():
+    np.random.seed(0)  # Set a seed for repeatability.
+    altitude = np.random.uniform(10e3, 40e3, 1000)
+    latitude = np.random.uniform(-70, 70, 1000)
+    day_of_year = np.random.uniform(0, 365, 1000)
+
+    expected = lib_winds.wind_speed_world_95(altitude, latitude, day_of_year)
+
+    assert lib_winds.wind_speed_world_95_batched(
+        altitude, latitude, day_of_year, batch_size=128
+    ) == pytest.approx(expected)
+
+    ### Days of year outside of 0-365 wrap around
+    assert lib_winds.wind_speed_world_95_batched(
+        altitude, latitude, day_of_year + 365 * 3
+    ) == pytest.approx(expected)
+
+    ### Inputs broadcast
+    output = lib_winds.wind_speed_world_95_batched(
+        altitude.reshape((10, 100)), 30, 100
+    )
+    assert output.shape == (10, 100)
+    assert output[0, 0] == pytest.approx(lib_winds.wind_speed_world_95(altitude[0], 30, 100))
+
+
+def test_periodic_extension():
+    day_of_year, indices = lib_winds._periodic_extension(np.arange(12) + 0.5, period=12, extend_bounds=3)
+    assert day_of_year == pytest.approx(np.arange(-3, 15) + 0.5)
+    assert np.all(np.take(np.arange(12), indices, mode="wrap") == np.arange(-3, 15) % 12)
+
+
+def test_tropopause_altitude_is_periodic():
+    latitude = np.linspace(-80, 80, 9)
+    assert lib_winds.tropopause_altitude(latitude, 0) == pytest.approx(
+        lib_winds.tropopause_altitude(latitude, 365), rel=1e-2
+    )
+
+
+if __name__ == '__main__':
+    pytest.main()
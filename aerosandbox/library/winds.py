@@ -1,5 +1,6 @@
 import aerosandbox.numpy as np
 import datetime
+from functools import lru_cache
 from aerosandbox.modeling.interpolation import InterpolatedModel
 from pathlib import Path
 import os
@@ -45,66 +46,99 @@ def wind_speed_conus_summer_99(altitude, latitude):
 
 
 ### Prep data for global wind speed function
-# Import data
+# These datasets are loaded on first use, rather than at import time.
 root = Path(os.path.abspath(__file__)).parent
-altitudes_world = np.load(root / "datasets" / "winds_and_tropopause_global" / "altitudes.npy")
-latitudes_world = np.load(root / "datasets" / "winds_and_tropopause_global" / "latitudes.npy")
-day_of_year_world_boundaries = np.linspace(0, 365, 13)
-day_of_year_world = (day_of_year_world_boundaries[1:] + day_of_year_world_boundaries[:-1]) / 2
-winds_95_world = np.load(root / "datasets" / "winds_and_tropopause_global" / "winds_95_vs_altitude_latitude_day.npy")
-
-# Trim the poles
-latitudes_world = latitudes_world[1:-1]
-winds_95_world = winds_95_world[:, 1:-1, :]
-
-# Flip data appropriately
-altitudes_world = np.flip(altitudes_world)
-latitudes_world = np.flip(latitudes_world)
-### NOTE: winds_95_world has *already* been flipped appropriately
-
-# # Extend altitude range down to the ground # TODO review and redo properly
-# altitudes_world_to_extend = [-1000, 0, 5000]
-# altitudes_world = np.hstack((
-#     altitudes_world_to_extend,
-#     altitudes_world
-# ))
-# winds_95_world = np.concatenate(
-#     (
-#         np.tile(
-#             winds_95_world[0, :, :],
-#             (3, 1, 1)
-#         ),
-#         winds_95_world
-#     ),
-#     axis=0
-# )
-
-# Downsample
-latitudes_world = latitudes_world[::5]
-winds_95_world = winds_95_world[:, ::5, :]
-
-# Extend boundaries so that cubic spline interpolates around day_of_year appropriately.
-extend_bounds = 3
-day_of_year_world = np.hstack((
-    day_of_year_world[-extend_bounds:] - 365,
-    day_of_year_world,
-    day_of_year_world[:extend_bounds] + 365
-))
-winds_95_world = np.dstack((
-    winds_95_world[:, :, -extend_bounds:],
-    winds_95_world,
-    winds_95_world[:, :, :extend_bounds]
-))
-
-# Make the model
-winds_95_world_model = InterpolatedModel(
-    x_data_coordinates={
-        "altitude"   : altitudes_world,
-        "latitude"   : latitudes_world,
-        "day of year": day_of_year_world,
-    },
-    y_data_structured=winds_95_world,
-)
+
+
+def _periodic_extension(
+        coordinates: np.ndarray,
+        period: float,
+        extend_bounds: int,
+):
+    """
+    Extends the coordinates of one axis of a periodic dataset by `extend_bounds` points on each side, so that a
+    spline interpolant is smooth across the period boundary.
+
+    Args:
+        coordinates: The coordinates along the periodic axis, spanning one period.
+
+        period: The period.
+
+        extend_bounds: The number of points to add on each side.
+
+    Returns: A tuple of (extended_coordinates, indices), where `indices` are the (unwrapped) indices into the original
+    axis that each extended coordinate corresponds to. Use `np.take(data, indices, axis=..., mode="wrap")` to extend
+    the data along that axis accordingly.
+    """
+    n = len(coordinates)
+    indices = np.arange(-extend_bounds, n + extend_bounds)
+    extended_coordinates = coordinates[indices % n] + period * (indices // n)
+    return extended_coordinates, indices
+
+
+@lru_cache(maxsize=None)
+def _winds_95_world_data():
+    dataset_directory = root / "datasets" / "winds_and_tropopause_global"
+
+    # Import data. The wind dataset is memory-mapped, so only the parts of it that are used below are ever read.
+    altitudes_world = np.load(dataset_directory / "altitudes.npy")
+    latitudes_world = np.load(dataset_directory / "latitudes.npy")
+    day_of_year_world_boundaries = np.linspace(0, 365, 13)
+    day_of_year_world = (day_of_year_world_boundaries[1:] + day_of_year_world_boundaries[:-1]) / 2
+    winds_95_world = np.load(dataset_directory / "winds_95_vs_altitude_latitude_day.npy", mmap_mode="r")
+
+    # Trim the poles
+    latitudes_world = latitudes_world[1:-1]
+    winds_95_world = winds_95_world[:, 1:-1, :]  # A view, not a copy
+
+    # Flip data appropriately
+    altitudes_world = np.flip(altitudes_world)
+    latitudes_world = np.flip(latitudes_world)
+    ### NOTE: winds_95_world has *already* been flipped appropriately
+
+    # # Extend altitude range down to the ground # TODO review and redo properly
+    # altitudes_world_to_extend = [-1000, 0, 5000]
+    # altitudes_world = np.hstack((
+    #     altitudes_world_to_extend,
+    #     altitudes_world
+    # ))
+    # winds_95_world = np.concatenate(
+    #     (
+    #         np.tile(
+    #             winds_95_world[0, :, :],
+    #             (3, 1, 1)
+    #         ),
+    #         winds_95_world
+    #     ),
+    #     axis=0
+    # )
+
+    # Downsample
+    latitudes_world = latitudes_world[::5]
+    winds_95_world = winds_95_world[:, ::5, :]  # A view, not a copy
+
+    # Extend boundaries so that cubic spline interpolates around day_of_year appropriately. This is done by
+    # wrapping indices, so the padded array is gathered from the dataset in a single pass.
+    day_of_year_world, day_indices = _periodic_extension(day_of_year_world, period=365, extend_bounds=3)
+    winds_95_world = np.asarray(np.take(winds_95_world, day_indices, axis=2, mode="wrap"), dtype=float)
+
+    # Make the model
+    winds_95_world_model = InterpolatedModel(
+        x_data_coordinates={
+            "altitude"   : altitudes_world,
+            "latitude"   : latitudes_world,
+            "day of year": day_of_year_world,
+        },
+        y_data_structured=winds_95_world,
+    )
+
+    return {
+        "altitudes_world"     : altitudes_world,
+        "latitudes_world"     : latitudes_world,
+        "day_of_year_world"   : day_of_year_world,
+        "winds_95_world"      : winds_95_world,
+        "winds_95_world_model": winds_95_world_model,
+    }
 
 
 def wind_speed_world_95(
@@ -123,44 +157,107 @@ def wind_speed_world_95(
 
     """
 
-    return winds_95_world_model({
+    return _winds_95_world_data()["winds_95_world_model"]({
         "altitude"   : altitude,
         "latitude"   : latitude,
         "day of year": day_of_year
     })
 
 
+def wind_speed_world_95_batched(
+        altitude,
+        latitude,
+        day_of_year,
+        batch_size: int = 100_000,
+) -> np.ndarray:
+    """
+    Gives the 95th-percentile wind speed as a function of altitude, latitude, and day of year, for large numeric
+    arrays of query points. Same model as `wind_speed_world_95()`, with a few differences:
+
+        * Inputs are broadcast against each other, and the output has their broadcasted shape.
+
+        * `day_of_year` is wrapped into the range 0 to 365, so any day of year (e.g., from a multi-year mission) is
+        valid.
+
+        * Query points are evaluated in batches of (at most) `batch_size`, which caps the memory used by intermediate
+        arrays when evaluating millions of points.
+
+    Args:
+        altitude: Altitude, in meters
+        latitude: Latitude, in degrees north
+        day_of_year: Day of year (Julian day)
+        batch_size: The maximum number of query points to evaluate at once.
+
+    Returns: The 95th-percentile wind speed, in meters per second.
+
+    """
+    altitude, latitude, day_of_year = np.broadcast_arrays(
+        np.asarray(altitude, dtype=float),
+        np.asarray(latitude, dtype=float),
+        np.asarray(day_of_year, dtype=float),
+    )
+    shape = altitude.shape
+
+    altitude = altitude.reshape(-1)
+    latitude = latitude.reshape(-1)
+    day_of_year = np.mod(day_of_year.reshape(-1), 365)
+
+    winds_95_world_model = _winds_95_world_data()["winds_95_world_model"]
+
+    wind_speed = np.empty(len(altitude))
+    for batch_start in range(0, len(altitude), batch_size):
+        batch = slice(batch_start, batch_start + batch_size)
+        wind_speed[batch] = winds_95_world_model({
+            "altitude"   : altitude[batch],
+            "latitude"   : latitude[batch],
+            "day of year": day_of_year[batch],
+        })
+
+    return wind_speed.reshape(shape)
+
+
 ### Prep data for tropopause altitude function
-# Import data
-latitudes_trop = np.linspace(-80, 80, 50)
-day_of_year_trop_boundaries = np.linspace(0, 365, 13)
-day_of_year_trop = (day_of_year_trop_boundaries[1:] + day_of_year_trop_boundaries[:-1]) / 2
-tropopause_altitude_km = np.genfromtxt(
-    root / "datasets" / "winds_and_tropopause_global" / "strat-height-monthly.csv",
-    delimiter=","
-)
-
-# Extend boundaries
-extend_bounds = 3
-day_of_year_trop = np.hstack((
-    day_of_year_trop[-extend_bounds:] - 365,
-    day_of_year_trop,
-    day_of_year_trop[:extend_bounds] + 365
-))
-tropopause_altitude_km = np.hstack((
-    tropopause_altitude_km[:, -extend_bounds:],
-    tropopause_altitude_km,
-    tropopause_altitude_km[:, :extend_bounds]
-))
-
-# Make the model
-tropopause_altitude_model = InterpolatedModel(
-    x_data_coordinates={
-        "latitude"   : latitudes_trop,
-        "day of year": day_of_year_trop
-    },
-    y_data_structured=tropopause_altitude_km * 1e3
-)
+@lru_cache(maxsize=None)
+def _tropopause_altitude_data():
+    # Import data
+    latitudes_trop = np.linspace(-80, 80, 50)
+    day_of_year_trop_boundaries = np.linspace(0, 365, 13)
+    day_of_year_trop = (day_of_year_trop_boundaries[1:] + day_of_year_trop_boundaries[:-1]) / 2
+    tropopause_altitude_km = np.genfromtxt(
+        root / "datasets" / "winds_and_tropopause_global" / "strat-height-monthly.csv",
+        delimiter=","
+    )
+
+    # Extend boundaries
+    day_of_year_trop, day_indices = _periodic_extension(day_of_year_trop, period=365, extend_bounds=3)
+    tropopause_altitude_km = np.take(tropopause_altitude_km, day_indices, axis=1, mode="wrap")
+
+    # Make the model
+    tropopause_altitude_model = InterpolatedModel(
+        x_data_coordinates={
+            "latitude"   : latitudes_trop,
+            "day of year": day_of_year_trop
+        },
+        y_data_structured=tropopause_altitude_km * 1e3
+    )
+
+    return {
+        "latitudes_trop"           : latitudes_trop,
+        "day_of_year_trop"         : day_of_year_trop,
+        "tropopause_altitude_km"   : tropopause_altitude_km,
+        "tropopause_altitude_model": tropopause_altitude_model,
+    }
+
+
+def __getattr__(name):
+    # The datasets and models above used to be module-level variables; they're still available under the same
+    # names, loaded lazily.
+    if name in ["altitudes_world", "latitudes_world", "day_of_year_world", "winds_95_world", "winds_95_world_model"]:
+        return _winds_95_world_data()[name]
+    if name in ["latitudes_trop", "day_of_year_trop", "tropopause_altitude_km", "tropopause_altitude_model"]:
+        return _tropopause_altitude_data()[name]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 def tropopause_altitude(
@@ -178,7 +275,7 @@ def tropopause_altitude(
     Returns: The tropopause altitude, in meters.
 
     """
-    return tropopause_altitude_model({
+    return _tropopause_altitude_data()["tropopause_altitude_model"]({
         "latitude"   : latitude,
         "day of year": day_of_year
     })
@@ -1,3 +1,4 @@
 from aerosandbox.modeling.fitting import FittedModel
 from aerosandbox.modeling.interpolation import InterpolatedModel
+from aerosandbox.modeling.interpolation_multi_output import MultiOutputInterpolatedModel
 from aerosandbox.modeling.interpolation_unstructured import UnstructuredInterpolatedModel
@@ -1,8 +1,9 @@
 import aerosandbox.numpy as np
 from aerosandbox.optimization.opti import Opti
-from typing import Union, Dict, Callable, List
+from aerosandbox.optimization.least_squares import solve_least_squares
+from typing import Union, Dict, Callable, List, Any, Optional
 from aerosandbox.modeling.surrogate_model import SurrogateModel
-import copy
+import casadi as _cas
 import warnings
 
 
@@ -49,6 +50,8 @@ class FittedModel(SurrogateModel):
                  fit_type: str = "best",
                  weights: np.ndarray = None,
                  put_residuals_in_logspace: bool = False,
+                 solver: str = "opti",
+                 batch_size: int = None,
                  verbose=True,
                  ):
         """
@@ -128,6 +131,30 @@ class FittedModel(SurrogateModel):
 
             Note: If any model outputs or data are negative, this will raise an error!
 
+            solver: Which backend should be used to solve for the fit parameters? Options:
+
+                * "opti": formulates the fit as a general nonlinear program and solves it with `aerosandbox.Opti`.
+                Works with any `residual_norm_type` and `fit_type`. The default.
+
+                * "least_squares": solves the fit with a (bound-constrained, by projection) Levenberg-Marquardt
+                method, using the exact residual Jacobian from CasADi's automatic differentiation. Only works with
+                `residual_norm_type="L2"` and `fit_type="best"`. Much faster and leaner for large datasets,
+                as no NLP is constructed and no per-datapoint variables or constraints are added.
+
+                * "auto": uses "least_squares" if possible, and "opti" otherwise.
+
+            If the solver does not converge, a RuntimeError is raised.
+
+            batch_size: Optional: if given (and the "least_squares" solver is used), the dataset is processed in
+            batches of (at most) this many data points, and the normal equations of the least-squares problem are
+            accumulated batch-by-batch. The model's computational graph and its Jacobian are built for a single
+            batch (with the data as symbolic inputs) and then evaluated on each batch in turn, which caps their
+            memory use; otherwise, both scale with the size of the dataset. The result is identical to a
+            full-batch fit.
+
+            (If the model can't be evaluated on symbolic x_data, each batch gets its own graph with its data embedded
+            as constants, so only the memory of the Jacobian evaluation is capped.)
+
             verbose: Should the progress of the optimization solve that is part of the fitting be displayed? See
             `aerosandbox.Opti.solve(verbose=)` syntax for more details.
 
@@ -204,106 +231,200 @@ class FittedModel(SurrogateModel):
                 raise ValueError(
                     f"The supplied data series \"{key}\" has length {series_length}, but y_data has length {n_datapoints}.")
 
+        ### Determine which solver to use
+        if solver == "auto":
+            if residual_norm_type.lower() == "l2" and fit_type == "best":
+                solver = "least_squares"
+            else:
+                solver = "opti"
+
         ##### Formulate and solve the fitting optimization problem
+        if solver == "least_squares":
+            if not (residual_norm_type.lower() == "l2" and fit_type == "best"):
+                raise ValueError(
+                    "The \"least_squares\" solver only works with `residual_norm_type=\"L2\"` and `fit_type=\"best\"`.")
+
+            if batch_size is None:
+                batch_size = n_datapoints
+            batch_size = int(batch_size)
+            if batch_size < 1:
+                raise ValueError("`batch_size` must be a positive integer.")
+
+            ### Initialize the parameters as a single symbolic vector
+            param_names = list(parameter_guesses.keys())
+            p = _cas.MX.sym("p", len(param_names))
+            params = {
+                param_name: p[i]
+                for i, param_name in enumerate(param_names)
+            }
 
-        ### Initialize an optimization environment
-        opti = Opti()
-
-        ### Initialize the parameters as optimization variables
-        params = {}
-        for param_name, param_initial_guess in parameter_guesses.items():
-            if param_name in parameter_bounds:
-                params[param_name] = opti.variable(
-                    init_guess=param_initial_guess,
-                    lower_bound=parameter_bounds[param_name][0],
-                    upper_bound=parameter_bounds[param_name][1],
+            def build_functions(x_batch, y_batch, weights_batch, data_inputs):
+                """
+                Builds the cost and normal equations functions of one batch of data, as functions of (p,
+                *data_inputs). Reduces each batch to its contribution to the cost and the normal equations within
+                CasADi, so that only small (n_params-sized) outputs are returned for each batch.
+                """
+                y_model = _evaluate_model(model, x_batch, params)
+
+                error = _residuals(
+                    y_model=y_model,
+                    y_data=y_batch,
+                    put_residuals_in_logspace=put_residuals_in_logspace,
                 )
-            else:
-                params[param_name] = opti.variable(
-                    init_guess=param_initial_guess,
+                residual = np.sqrt(weights_batch) * error  # So that sum(residual ** 2) is the weighted L2 objective.
+                residual = _cas.vec(_cas.MX(residual))
+
+                jacobian = _cas.jacobian(residual, p)
+                cost = _cas.sumsqr(residual)
+                return (
+                    _cas.Function("cost", [p, *data_inputs], [cost]),
+                    _cas.Function("normal_equations", [p, *data_inputs], [
+                        cost,
+                        _cas.mtimes(jacobian.T, jacobian),
+                        _cas.mtimes(jacobian.T, residual),
+                    ]),
                 )
 
-        ### Evaluate the model at the data points you're trying to fit
-        x_data_original = copy.deepcopy(
-            x_data)  # Make a copy of x_data so that you can determine if the model did in-place operations on x and tattle on the user.
+            ### Build the functions for each batch of the data. Where possible, the data enters as symbolic inputs,
+            ### so that one pair of functions (per batch length) is reused across all batches, and the graph only
+            ### ever holds one batch. Models that can't be evaluated on symbolic data have each batch's data
+            ### embedded as constants instead.
+            functions_by_batch_length = {}
+            data_is_symbolic = True
+            batch_functions = []
+            for batch_start in range(0, n_datapoints, batch_size):
+                batch = slice(batch_start, batch_start + batch_size)
+                if x_data_is_dict:
+                    x_batch = {k: v[batch] for k, v in x_data.items()}
+                    data_batch = [*x_batch.values(), y_data[batch], weights[batch]]
+                else:
+                    x_batch = x_data[batch]
+                    data_batch = [x_batch, y_data[batch], weights[batch]]
+                batch_length = np.length(data_batch[-1])
+
+                if data_is_symbolic and batch_length not in functions_by_batch_length:
+                    if x_data_is_dict:
+                        x_symbolic = {k: _cas.MX.sym(k, batch_length) for k in x_data.keys()}
+                        data_inputs = list(x_symbolic.values())
+                    else:
+                        x_symbolic = _cas.MX.sym("x", batch_length)
+                        data_inputs = [x_symbolic]
+                    data_inputs += [_cas.MX.sym("y", batch_length), _cas.MX.sym("weights", batch_length)]
+                    try:
+                        functions_by_batch_length[batch_length] = build_functions(
+                            x_symbolic, data_inputs[-2], data_inputs[-1], data_inputs
+                        )
+                    except Exception:
+                        data_is_symbolic = False
+
+                if data_is_symbolic:
+                    batch_functions.append((*functions_by_batch_length[batch_length], data_batch))
+                else:
+                    batch_functions.append((
+                        *build_functions(x_batch, y_data[batch], weights[batch], []),
+                        [],
+                    ))
+
+            ### Solve
+            lower_bounds = np.array([
+                parameter_bounds.get(param_name, (None, None))[0]
+                for param_name in param_names
+            ], dtype=float)
+            upper_bounds = np.array([
+                parameter_bounds.get(param_name, (None, None))[1]
+                for param_name in param_names
+            ], dtype=float)
+
+            p_solved = _solve_least_squares(
+                batch_functions=batch_functions,
+                p0=np.array([parameter_guesses[param_name] for param_name in param_names], dtype=float),
+                lower_bounds=np.where(np.isnan(lower_bounds), -np.inf, lower_bounds),
+                upper_bounds=np.where(np.isnan(upper_bounds), np.inf, upper_bounds),
+                verbose=verbose,
+            )
 
-        try:
-            y_model = model(x_data, params)  # Evaluate the model
-        except Exception:
-            raise Exception("""
-            There was an error when evaluating the model you supplied with the x_data you supplied.
-            Likely possible causes:
-                * Your model() does not have the call syntax model(x, p), where x is the x_data and p are parameters.
-                * Your model should take in p as a dict of parameters, but it does not.
-                * Your model assumes x is an array-like but you provided x_data as a dict, or vice versa.
-            See the docstring of FittedModel() if you have other usage questions or would like to see examples.
-            """)
-
-        try:  ### If the model did in-place operations on x_data, throw an error
-            x_data_is_unchanged = np.all(x_data == x_data_original)
-        except ValueError:
-            x_data_is_unchanged = np.all([
-                x_series == x_series_original
-                for x_series, x_series_original in zip(x_data, x_data_original)
-            ])
-        if not x_data_is_unchanged:
-            raise TypeError("model(x_data, parameter_guesses) did in-place operations on x, which is not allowed!")
-        if y_model is None:  # Make sure that y_model actually returned something sensible
-            raise TypeError("model(x_data, parameter_guesses) returned None, when it should've returned a 1D ndarray.")
-
-        ### Compute how far off you are (error)
-        if not put_residuals_in_logspace:
-            error = y_model - y_data
-        else:
-            y_model = np.fmax(y_model, 1e-300)  # Keep y_model very slightly always positive, so that log() doesn't NaN.
-            error = np.log(y_model) - np.log(y_data)
-
-        ### Set up the optimization problem to minimize some norm(error), which looks different depending on the norm used:
-        if residual_norm_type.lower() == "l1":  # Minimize the L1 norm
-            abs_error = opti.variable(init_guess=0,
-                                      n_vars=np.length(y_data))  # Make the abs() of each error entry an opt. var.
-            opti.subject_to([
-                abs_error >= error,
-                abs_error >= -error,
-            ])
-            opti.minimize(np.sum(weights * abs_error))
-
-        elif residual_norm_type.lower() == "l2":  # Minimize the L2 norm
-            opti.minimize(np.sum(weights * error ** 2))
-
-        elif residual_norm_type.lower() == "linf":  # Minimize the L-infinity norm
-            linf_value = opti.variable(init_guess=0)  # Make the value of the L-infinity norm an optimization variable
-            opti.subject_to([
-                linf_value >= weights * error,
-                linf_value >= -weights * error
-            ])
-            opti.minimize(linf_value)
+            params_solved = {
+                param_name: float(p_solved[i])
+                for i, param_name in enumerate(param_names)
+            }
 
-        else:
-            raise ValueError("Bad input for the 'residual_type' parameter.")
-
-        ### Add in the constraints specified by fit_type, which force the model to stay above / below the data points.
-        if fit_type == "best":
-            pass
-        elif fit_type == "upper bound":
-            opti.subject_to(y_model >= y_data)
-        elif fit_type == "lower bound":
-            opti.subject_to(y_model <= y_data)
-        else:
-            raise ValueError("Bad input for the 'fit_type' parameter.")
+        elif solver == "opti":
+            ### Initialize an optimization environment
+            opti = Opti()
+
+            ### Initialize the parameters as optimization variables
+            params = {}
+            for param_name, param_initial_guess in parameter_guesses.items():
+                if param_name in parameter_bounds:
+                    params[param_name] = opti.variable(
+                        init_guess=param_initial_guess,
+                        lower_bound=parameter_bounds[param_name][0],
+                        upper_bound=parameter_bounds[param_name][1],
+                    )
+                else:
+                    params[param_name] = opti.variable(
+                        init_guess=param_initial_guess,
+                    )
+
+            ### Evaluate the model at the data points you're trying to fit
+            y_model = _evaluate_model(model, x_data, params)
+
+            ### Compute how far off you are (error)
+            error = _residuals(
+                y_model=y_model,
+                y_data=y_data,
+                put_residuals_in_logspace=put_residuals_in_logspace,
+            )
 
-        ### Solve
-        sol = opti.solve(verbose=verbose)
+            ### Set up the optimization problem to minimize some norm(error), which looks different depending on the norm used:
+            if residual_norm_type.lower() == "l1":  # Minimize the L1 norm
+                abs_error = opti.variable(init_guess=0,
+                                          n_vars=np.length(y_data))  # Make the abs() of each error entry an opt. var.
+                opti.subject_to([
+                    abs_error >= error,
+                    abs_error >= -error,
+                ])
+                opti.minimize(np.sum(weights * abs_error))
+
+            elif residual_norm_type.lower() == "l2":  # Minimize the L2 norm
+                opti.minimize(np.sum(weights * error ** 2))
+
+            elif residual_norm_type.lower() == "linf":  # Minimize the L-infinity norm
+                linf_value = opti.variable(init_guess=0)  # Make the value of the L-infinity norm an optimization variable
+                opti.subject_to([
+                    linf_value >= weights * error,
+                    linf_value >= -weights * error
+                ])
+                opti.minimize(linf_value)
 
-        ##### Construct a FittedModel
+            else:
+                raise ValueError("Bad input for the 'residual_type' parameter.")
+
+            ### Add in the constraints specified by fit_type, which force the model to stay above / below the data points.
+            if fit_type == "best":
+                pass
+            elif fit_type == "upper bound":
+                opti.subject_to(y_model >= y_data)
+            elif fit_type == "lower bound":
+                opti.subject_to(y_model <= y_data)
+            else:
+                raise ValueError("Bad input for the 'fit_type' parameter.")
+
+            ### Solve
+            sol = opti.solve(verbose=verbose)
 
-        ### Create a vector of solved parameters
-        params_solved = {}
-        for param_name in params:
-            try:
-                params_solved[param_name] = sol.value(params[param_name])
-            except:
-                params_solved[param_name] = np.nan
+            ### Create a vector of solved parameters
+            params_solved = {}
+            for param_name in params:
+                try:
+                    params_solved[param_name] = sol.value(params[param_name])
+                except:
+                    params_solved[param_name] = np.nan
+
+        else:
+            raise ValueError("Bad input for the 'solver' parameter.")
+
+        ##### Construct a FittedModel
 
         ### Store all the data and inputs
         self.model = model
@@ -316,6 +437,8 @@ class FittedModel(SurrogateModel):
         self.fit_type = fit_type
         self.weights = weights
         self.put_residuals_in_logspace = put_residuals_in_logspace
+        self.solver = solver
+        self.batch_size = batch_size
 
     def __call__(self, x):
         super().__call__(x)
@@ -325,6 +448,239 @@ class FittedModel(SurrogateModel):
         raise DeprecationWarning(
             "Use FittedModel.plot() instead, which generalizes plotting to non-fitted surrogate models")
 
+    def _refit_kwargs(self) -> Dict:
+        """
+        Returns the keyword arguments to `FittedModel.__init__()` for refitting this model to (a subset of) its data,
+        with parameter guesses warm-started from this fit's parameters.
+        """
+        return dict(
+            model=self.model,
+            parameter_guesses=self.parameters,
+            parameter_bounds=self.parameter_bounds,
+            residual_norm_type=self.residual_norm_type,
+            fit_type=self.fit_type,
+            put_residuals_in_logspace=self.put_residuals_in_logspace,
+            solver=self.solver,
+            batch_size=self.batch_size,
+        )
+
+    def _refit_many(self,
+                    subsets: List[np.ndarray],
+                    n_workers: int = 1,
+                    ) -> List[Dict[str, float]]:
+        """
+        Refits this model to many subsets of its data (given as arrays of data point indices), and returns the
+        parameters of each refit. Refits where the solver fails to converge have NaN parameters (and a warning is
+        given with the number of these); any other error is raised.
+
+        If `n_workers` is not 1, refits are done in a process pool of that many workers (or one per CPU, if None).
+        """
+        refit_kwargs = self._refit_kwargs()
+
+        def subset_of(data, indices):
+            if isinstance(data, dict):
+                return {k: v[indices] for k, v in data.items()}
+            else:
+                return data[indices]
+
+        refit_args = [
+            (
+                refit_kwargs,
+                subset_of(self.x_data, indices),
+                self.y_data[indices],
+                self.weights[indices],
+            )
+            for indices in subsets
+        ]
+
+        if n_workers == 1:
+            refit_parameters = [
+                _refit(*args)
+                for args in refit_args
+            ]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                refit_parameters = list(executor.map(
+                    _refit,
+                    *zip(*refit_args)
+                ))
+
+        n_failed = sum(parameters is None for parameters in refit_parameters)
+        if n_failed > 0:
+            warnings.warn(
+                f"{n_failed} of {len(refit_parameters)} refits did not converge; their parameters are NaN.",
+                stacklevel=3
+            )
+
+        return [
+            parameters if parameters is not None else {
+                param_name: np.nan
+                for param_name in self.parameters
+            }
+            for parameters in refit_parameters
+        ]
+
+    def bootstrap(self,
+                  n_bootstraps: int = 100,
+                  confidence_level: float = 0.95,
+                  seed: int = None,
+                  n_workers: int = 1,
+                  ) -> Dict[str, Dict]:
+        """
+        Estimates the uncertainty in the fitted parameters by bootstrapping: the model is refit many times to
+        datasets resampled (with replacement) from the original data, and the spread of the refit parameters is
+        reported.
+
+        Each refit is warm-started from this fit's parameters, so it typically converges in just a few iterations.
+
+        Args:
+
+            n_bootstraps: The number of bootstrap resamples (i.e., refits) to do.
+
+            confidence_level: The confidence level of the reported (percentile) confidence intervals.
+
+            seed: [Optional] A seed for the random number generator, for reproducibility.
+
+            n_workers: The number of worker processes to use for the refits. If 1, refits are done serially in this
+            process. If None, uses one worker per CPU. (If not 1, the model must be picklable - e.g., a function
+            defined at the top level of a module, not a lambda.)
+
+        Returns: A dictionary with keys:
+
+            * "parameters": A dict of {param_name: a 1D array of that parameter's value in each refit}. Refits that
+            did not converge are NaN (and a warning is given).
+
+            * "confidence_intervals": A dict of {param_name: (lower, upper)}.
+
+            * "standard_errors": A dict of {param_name: the standard deviation of the refit values}.
+
+        Example:
+            >>> fm = FittedModel(...)
+            >>> fm.bootstrap(n_bootstraps=200)["confidence_intervals"]
+            {'a': (0.93, 1.08), 'b': (1.85, 2.11)}
+
+        """
+        rng = np.random.default_rng(seed)
+        n_datapoints = np.length(self.y_data)
+
+        subsets = [
+            rng.integers(0, n_datapoints, n_datapoints)
+            for _ in range(n_bootstraps)
+        ]
+
+        refit_parameters = self._refit_many(subsets, n_workers=n_workers)
+
+        parameters = {
+            param_name: np.array([
+                refit[param_name]
+                for refit in refit_parameters
+            ], dtype=float)
+            for param_name in self.parameters
+        }
+
+        alpha = 1 - confidence_level
+
+        return {
+            "parameters"          : parameters,
+            "confidence_intervals": {
+                param_name: tuple(np.nanquantile(values, [alpha / 2, 1 - alpha / 2]))
+                for param_name, values in parameters.items()
+            },
+            "standard_errors"     : {
+                param_name: float(np.nanstd(values, ddof=1))
+                for param_name, values in parameters.items()
+            },
+        }
+
+    def cross_validate(self,
+                       n_folds: int = 5,
+                       shuffle: bool = True,
+                       seed: int = None,
+                       n_workers: int = 1,
+                       ) -> Dict[str, Any]:
+        """
+        Estimates how well this model generalizes to unseen data, using k-fold cross-validation: the data is split
+        into `n_folds` folds, and for each fold, the model is refit to the other folds and evaluated on this fold.
+
+        Each refit is warm-started from this fit's parameters.
+
+        Errors are the residuals that this model was fitted to (i.e., in logspace, if `put_residuals_in_logspace`),
+        weighted by the data point weights.
+
+        Args:
+
+            n_folds: The number of folds.
+
+            shuffle: Whether to shuffle the data before splitting it into folds. (If False, the folds are
+            contiguous blocks of the data, in order.)
+
+            seed: [Optional] A seed for the random number generator used for shuffling, for reproducibility.
+
+            n_workers: The number of worker processes to use for the refits. See `FittedModel.bootstrap()`.
+
+        Returns: A dictionary with keys:
+
+            * "parameters": A list with the parameters (as a dict) of each fold's refit.
+
+            * "train_error": A 1D array with the root-mean-square error of each fold's refit on its training data.
+
+            * "test_error": A 1D array with the root-mean-square error of each fold's refit on its held-out data.
+
+            * "mean_test_error": The root-mean-square test error across all folds; the usual single-number
+            cross-validation score.
+
+        """
+        n_datapoints = np.length(self.y_data)
+        if not 2 <= n_folds <= n_datapoints:
+            raise ValueError("`n_folds` must be at least 2, and no more than the number of data points.")
+
+        indices = np.arange(n_datapoints)
+        if shuffle:
+            indices = np.random.default_rng(seed).permutation(indices)
+        folds = np.array_split(indices, n_folds)
+
+        train_subsets = [
+            np.sort(np.concatenate(folds[:i] + folds[i + 1:]))
+            for i in range(n_folds)
+        ]
+
+        refit_parameters = self._refit_many(train_subsets, n_workers=n_workers)
+
+        def squared_errors(parameters, indices):
+            if isinstance(self.x_data, dict):
+                x = {k: v[indices] for k, v in self.x_data.items()}
+            else:
+                x = self.x_data[indices]
+
+            error = _residuals(
+                y_model=np.array(self.model(x, parameters), dtype=float),
+                y_data=self.y_data[indices],
+                put_residuals_in_logspace=self.put_residuals_in_logspace,
+            )
+            return np.sum(self.weights[indices] * error ** 2), np.sum(self.weights[indices])
+
+        train_error = []
+        test_error = []
+        test_sum_squared_errors = 0.
+        test_sum_weights = 0.
+        for parameters, train_indices, test_indices in zip(refit_parameters, train_subsets, folds):
+            sse, sum_weights = squared_errors(parameters, train_indices)
+            train_error.append(np.sqrt(sse / sum_weights))
+
+            sse, sum_weights = squared_errors(parameters, test_indices)
+            test_error.append(np.sqrt(sse / sum_weights))
+            test_sum_squared_errors += sse
+            test_sum_weights += sum_weights
+
+        return {
+            "parameters"     : refit_parameters,
+            "train_error"    : np.array(train_error),
+            "test_error"     : np.array(test_error),
+            "mean_test_error": float(np.sqrt(test_sum_squared_errors / test_sum_weights)),
+        }
+
     def goodness_of_fit(self,
                         type="R^2"
                         ):
@@ -368,3 +724,182 @@ class FittedModel(SurrogateModel):
 
         else:
             raise ValueError("Bad value of `type`!")
+
+
+def _refit(
+        refit_kwargs: Dict,
+        x_data: Union[np.ndarray, Dict[str, np.ndarray]],
+        y_data: np.ndarray,
+        weights: np.ndarray,
+) -> Optional[Dict[str, float]]:
+    """
+    Refits a FittedModel to the given data, and returns the fitted parameters (or None, if the solver fails to
+    converge). Defined at the module level so that it can be run in a worker process.
+    """
+    try:
+        return FittedModel(
+            x_data=x_data,
+            y_data=y_data,
+            weights=weights,
+            verbose=False,
+            **refit_kwargs
+        ).parameters
+    except RuntimeError:  # Both solvers (Opti and least-squares) raise this if they fail to converge.
+        return None
+
+
+def _evaluate_model(
+        model: Callable,
+        x_data: Union[np.ndarray, Dict[str, np.ndarray]],
+        params: Dict,
+):
+    """
+    Evaluates `model(x_data, params)`, and makes sure that the model did not do in-place operations on `x_data`.
+
+    Rather than copying `x_data` to compare against afterwards (which doubles the memory footprint of a large
+    dataset), the arrays in `x_data` are made read-only while the model is evaluated, so that any in-place operation
+    on them fails immediately.
+
+    Returns: The model output.
+    """
+    if isinstance(x_data, dict):
+        x_data_items_original = list(x_data.items())
+        x_arrays = list(x_data.values())
+    else:
+        x_arrays = [x_data]
+    x_arrays = [x_array for x_array in x_arrays if isinstance(x_array, np.ndarray)]  # Skips symbolic x_data
+
+    writeable_original = [x_array.flags.writeable for x_array in x_arrays]
+    for x_array in x_arrays:
+        x_array.flags.writeable = False
+
+    model_error_message = """
+    There was an error when evaluating the model you supplied with the x_data you supplied.
+    Likely possible causes:
+        * Your model() does not have the call syntax model(x, p), where x is the x_data and p are parameters.
+        * Your model should take in p as a dict of parameters, but it does not.
+        * Your model assumes x is an array-like but you provided x_data as a dict, or vice versa.
+    See the docstring of FittedModel() if you have other usage questions or would like to see examples.
+    """
+    in_place_error_message = "model(x_data, parameter_guesses) did in-place operations on x, which is not allowed!"
+
+    try:
+        y_model = model(x_data, params)  # Evaluate the model
+    except ValueError as e:
+        if "read-only" in str(e):
+            raise TypeError(in_place_error_message)
+        raise Exception(model_error_message)
+    except Exception:
+        raise Exception(model_error_message)
+    finally:
+        for x_array, writeable in zip(x_arrays, writeable_original):
+            x_array.flags.writeable = writeable
+
+    if isinstance(x_data, dict):  # Check that the model didn't add, remove, or reassign any entries of x.
+        x_data_items = list(x_data.items())
+        if not (
+                len(x_data_items) == len(x_data_items_original) and
+                all(
+                    k == k_original and v is v_original
+                    for (k, v), (k_original, v_original) in zip(x_data_items, x_data_items_original)
+                )
+        ):
+            raise TypeError(in_place_error_message)
+
+    if y_model is None:  # Make sure that y_model actually returned something sensible
+        raise TypeError("model(x_data, parameter_guesses) returned None, when it should've returned a 1D ndarray.")
+
+    return y_model
+
+
+def _residuals(
+        y_model,
+        y_data: np.ndarray,
+        put_residuals_in_logspace: bool,
+):
+    """
+    Computes the (unweighted) residuals of a fit. See `FittedModel.__init__()` for the meaning of the arguments.
+    """
+    if not put_residuals_in_logspace:
+        return y_model - y_data
+    else:
+        y_model = np.fmax(y_model, 1e-300)  # Keep y_model very slightly always positive, so that log() doesn't NaN.
+        return np.log(y_model) - np.log(y_data)
+
+
+def _solve_least_squares(
+        batch_functions: List,
+        p0: np.ndarray,
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        max_iter: int = 500,
+        verbose: bool = True,
+) -> np.ndarray:
+    """
+    Minimizes sum(r(p) ** 2) over parameters p, subject to simple bounds on p, with a Levenberg-Marquardt method (see
+    `aerosandbox.optimization.least_squares.solve_least_squares()`).
+
+    The residual vector r(p) may be split across several batches of data, in which case the normal equations (J^T J
+    and J^T r) are accumulated batch-by-batch; only one batch's residuals and Jacobian are in memory at once.
+
+    Args:
+        batch_functions: A list with one entry per batch of data. Each entry is a tuple of (cost function, normal
+        equations function, batch data), where the functions are CasADi Functions with call syntax f(p,
+        *batch_data). The cost function returns the batch's cost, sum(r ** 2), and the normal equations function
+        returns the batch's (cost, J^T J, J^T r), where J is the (sparse) Jacobian of the batch's residual vector r
+        with respect to p. The same Functions may be shared by several batches (of the same length).
+
+        p0: The initial guess for the parameters.
+
+        lower_bounds: Lower bounds on each parameter (use -np.inf for none).
+
+        upper_bounds: Upper bounds on each parameter (use np.inf for none).
+
+        max_iter: The maximum number of iterations.
+
+        verbose: Whether to print the progress of the solve.
+
+    Returns: The optimal parameters, as a 1D array.
+
+    Raises: RuntimeError, if the solve does not converge.
+
+    """
+    n_params = len(p0)
+
+    def cost(p):
+        cost = 0.
+        for cost_function, _, batch_data in batch_functions:
+            cost += float(cost_function(p[0], *batch_data))
+        return np.array([cost])
+
+    def normal_equations(p):
+        cost = 0.
+        JTJ = np.zeros((n_params, n_params))
+        JTr = np.zeros(n_params)
+        for _, normal_equations_function, batch_data in batch_functions:
+            batch_cost, batch_JTJ, batch_JTr = normal_equations_function(p[0], *batch_data)
+            cost += float(batch_cost)
+            JTJ += batch_JTJ.full()
+            JTr += batch_JTr.full().reshape(-1)
+        return np.array([cost]), JTJ[None, :, :], JTr[None, :]
+
+    if not np.isfinite(cost(np.clip(p0, lower_bounds, upper_bounds)[None, :])[0]):
+        raise ValueError("The model evaluates to a non-finite value at `parameter_guesses`; try a different guess.")
+
+    p, converged = solve_least_squares(
+        cost=cost,
+        normal_equations=normal_equations,
+        x0=p0[None, :],
+        lower_bounds=lower_bounds,
+        upper_bounds=upper_bounds,
+        max_iter=max_iter,
+        verbose=verbose,
+    )
+
+    if not converged[0]:
+        raise RuntimeError(
+            f"The least-squares fit did not converge (within {max_iter} iterations, or no step decreases the cost at "
+            f"a point that is not a minimum)."
+        )
+
+    return p[0]
@@ -1,5 +1,6 @@
 from typing import Union, Dict
 import aerosandbox.numpy as np
+from aerosandbox.numpy.interpolate import _get_casadi_interpolant
 from aerosandbox.modeling.surrogate_model import SurrogateModel
 
 
@@ -96,7 +97,7 @@ class InterpolatedModel(SurrogateModel):
                         * In the general N-dimensional case, a dict where values are 1D ndarrays defining the coordinates of each axis.
                         * In the 1D case, can also be a 1D ndarray.
                     """)
-        implied_y_data_shape = tuple(len(coordinates) for coordinates in x_data_coordinates_values)
+        implied_y_data_shape = tuple(len(coordinates) for coordinates in x_data_coordinates_values) + self._output_shape
         if not y_data_structured.shape == implied_y_data_shape:
             raise ValueError(f"""
             The shape of `y_data_structured` should be {implied_y_data_shape}
@@ -109,6 +110,9 @@ class InterpolatedModel(SurrogateModel):
         self.method = method
         self.fill_value = fill_value
 
+        # CasADi interpolants of this data, keyed by method; built lazily on first use. See _get_interpolant().
+        self._interpolants = {}
+
         ### Create unstructured versions of the data for plotting, etc.
         x_data = x_data_coordinates
         if isinstance(x_data, dict):
@@ -120,46 +124,113 @@ class InterpolatedModel(SurrogateModel):
         self.x_data = x_data
         self.y_data = np.ravel(y_data_structured, order="F")
 
+    @property
+    def _output_shape(self) -> tuple:
+        """
+        The shape of the model output at a single point, which `y_data_structured` has as trailing axes.
+        """
+        return tuple()
+
     def __call__(self, x):
-        if isinstance(self.x_data_coordinates, dict):
-            def get_shape(value):
-                if np.is_casadi_type(value, recursive=False):
-                    if value.shape[1] == 1:
-                        return (np.length(value),)
-
-                try:
-                    return value.shape
-                except AttributeError:
-                    return tuple()
-
-            shape = np.broadcast_shapes(
-                *[get_shape(v) for v in x.values()]
-            )
-            shape_for_reshaping = (int(np.product(shape)),)
-
-            def reshape(value):
-                try:
-                    return np.reshape(value, shape_for_reshaping)
-                except ValueError:
-                    if isinstance(value, int) or isinstance(value, float) or value.shape == tuple() or np.product(
-                            value.shape) == 1:
-                        return value * np.ones(shape_for_reshaping)
-                raise ValueError("Could not reshape value of one of the inputs!")
-
-            x = np.stack(tuple(
-                reshape(x[k])
-                for k, v in self.x_data_coordinates.items()
-            ), axis=1)
-
-        output = np.interpn(
+        x, shape = self._stack_inputs(x)
+        output = self._interpolate(x)
+        if shape is None:
+            return output
+        return np.reshape(output, shape)
+
+    def _interpolate(self, xi):
+        """
+        Interpolates this model's data at the query points `xi` (see `_stack_inputs()`) with `np.interpn()`,
+        reusing this model's CasADi interpolant if the CasADi implementation of `np.interpn()` will be used.
+        """
+        if self.method == "bspline" or (
+                self.method == "linear" and np.is_casadi_type(xi, recursive=True)
+        ):
+            interpolant = self._get_interpolant()
+        else:
+            interpolant = None
+
+        return np.interpn(
             points=self.x_data_coordinates_values,
             values=self.y_data_structured,
-            xi=x,
+            xi=xi,
             method=self.method,
             bounds_error=False,  # Can't be set true if general MX-type inputs are to be expected.
-            fill_value=self.fill_value
+            fill_value=self.fill_value,
+            interpolant=interpolant,
+        )
+
+    def _stack_inputs(self, x):
+        """
+        Converts an input `x` (see `InterpolatedModel.__call__()`) into an array of query points.
+
+        Returns: A tuple of (xi, shape), where `xi` is the query points (with one column per input dimension, in the
+        case of dict inputs), and `shape` is the broadcasted shape of the inputs (or None, if the input was not a
+        dict).
+        """
+        if not isinstance(self.x_data_coordinates, dict):
+            return x, None
+
+        def get_shape(value):
+            if np.is_casadi_type(value, recursive=False):
+                if value.shape[1] == 1:
+                    return (np.length(value),)
+
+            try:
+                return value.shape
+            except AttributeError:
+                return tuple()
+
+        shape = np.broadcast_shapes(
+            *[get_shape(v) for v in x.values()]
         )
+        shape_for_reshaping = (int(np.product(shape)),)
+
+        def reshape(value):
+            try:
+                return np.reshape(value, shape_for_reshaping)
+            except ValueError:
+                if isinstance(value, int) or isinstance(value, float) or value.shape == tuple() or np.product(
+                        value.shape) == 1:
+                    return value * np.ones(shape_for_reshaping)
+            raise ValueError("Could not reshape value of one of the inputs!")
+
+        x = np.stack(tuple(
+            reshape(x[k])
+            for k, v in self.x_data_coordinates.items()
+        ), axis=1)
+
+        return x, shape
+
+    def _get_interpolant(self):
+        """
+        Returns the CasADi interpolant for this model's data and current method, building it (once) on first use.
+        This same interpolant is then reused for all subsequent numeric and symbolic evaluations.
+
+        (The data is treated as immutable; if you modify `y_data_structured` in-place, clear `_interpolants`.)
+        """
         try:
-            return np.reshape(output, shape)
-        except UnboundLocalError:
-            return output
+            interpolants = self._interpolants
+        except AttributeError:  # For instances that were created (e.g., unpickled) without this attribute.
+            interpolants = self._interpolants = {}
+
+        try:
+            return interpolants[self.method]
+        except KeyError:
+            if self.method == "bspline" and np.all(self.y_data_structured == 0):
+                interpolant = None  # np.interpn() special-cases this, due to a CasADi bug with all-zero B-splines.
+            else:
+                interpolant = _get_casadi_interpolant(
+                    points=self.x_data_coordinates_values,
+                    values=self.y_data_structured,
+                    method=self.method,
+                    use_cache=False,
+                )
+            interpolants[self.method] = interpolant
+            return interpolant
+
+    def __getstate__(self):
+        # The cached interpolants are rebuilt lazily, so don't pickle them.
+        state = self.__dict__.copy()
+        state.pop("_interpolants", None)
+        return state
@@ -0,0 +1,130 @@
+from typing import Union, Dict
+import aerosandbox.numpy as np
+from aerosandbox.modeling.interpolation import InterpolatedModel
+
+
+class MultiOutputInterpolatedModel(InterpolatedModel):
+    """
+    A model that is interpolated to several fields of structured (i.e., gridded) N-dimensional data, all defined on
+    the same grid. Maps from R^N -> R^M.
+
+    This is equivalent to (but faster than) creating one InterpolatedModel per output field: the interpolation
+    indices and weights are computed only once per query point, and then applied to all output fields at once. In
+    the CasADi case, all outputs come from a single CasADi interpolant Function, so a symbolic graph only gains one
+    interpolant call (rather than one per output field).
+
+    You can evaluate this model at a given point by calling it just like a function, e.g.:
+
+    >>> y = my_multi_output_interpolated_model(x)
+    >>> CL = y["CL"]
+    >>> CD = y["CD"]
+
+    The input to the model (`x` in the example above) is the same as for InterpolatedModel:
+        * in the general N-dimensional case, a dictionary where: keys are variable names and values are float/array
+        * in the case of a 1-dimensional input (R^1 -> R^1), it can optionally just be a float/array.
+
+    The output of the model (`y` in the example above) is a dictionary where keys are output names and values are
+    float/array, with the same shape as a single-output InterpolatedModel would give.
+
+    See the docstring __init__ method of MultiOutputInterpolatedModel for more details of how to instantiate and use
+    it.
+
+    """
+
+    def __init__(self,
+                 x_data_coordinates: Union[np.ndarray, Dict[str, np.ndarray]],
+                 y_data_structured: Dict[str, np.ndarray],
+                 method: str = "bspline",
+                 fill_value=np.nan,  # Default behavior: return NaN for all inputs outside data range.
+                 ):
+        """
+        Create the interpolator. Note that data must be structured (i.e., gridded on a hypercube) for general
+        N-dimensional interpolation.
+
+        Args:
+            x_data_coordinates: The coordinates of each axis of the cube; see `InterpolatedModel.__init__()`.
+
+            y_data_structured: The dependent variables, expressed as a dictionary where the keys are output names
+            [str] and the values are structured data "cubes" (each with the shape that `InterpolatedModel` would
+            expect for `y_data_structured`).
+
+            These are stored stacked along a trailing axis, in the order of `output_names`: `self.y_data_structured`
+            has shape (*grid_shape, n_outputs), and `self.y_data` has shape (n_points, n_outputs).
+
+            Usage example:
+
+            >>> alpha = np.linspace(-10, 10, 21)
+            >>> Re = np.geomspace(1e5, 1e7, 11)
+            >>> Alpha, Re_grid = np.meshgrid(alpha, Re, indexing="ij")
+            >>>
+            >>> model = MultiOutputInterpolatedModel(
+            >>>     x_data_coordinates={"alpha": alpha, "Re": Re},
+            >>>     y_data_structured={
+            >>>         "CL": CL_function(Alpha, Re_grid), # 2D ndarray of shape (21, 11)
+            >>>         "CD": CD_function(Alpha, Re_grid), # 2D ndarray of shape (21, 11)
+            >>>     }
+            >>> )
+
+            method: The method of interpolation to perform. See `InterpolatedModel.__init__()`.
+
+            fill_value: Gives the value that the interpolator should return for points outside of the interpolation
+            domain. If fill_value is None, then the interpolator will attempt to extrapolate if the interpolation
+            method allows.
+
+        """
+        if not isinstance(y_data_structured, dict) or len(y_data_structured) == 0:
+            raise ValueError("`y_data_structured` must be a non-empty dict, where values are structured data cubes.")
+        self.output_names = list(y_data_structured.keys())
+
+        try:
+            x_data_coordinates_values = x_data_coordinates.values()
+        except AttributeError:  # If x_data_coordinates is not a dict
+            x_data_coordinates_values = tuple([x_data_coordinates])
+        implied_y_data_shape = tuple(len(coordinates) for coordinates in x_data_coordinates_values)
+        for k, v in y_data_structured.items():
+            if not np.shape(v) == implied_y_data_shape:
+                raise ValueError(
+                    f"The shape of `y_data_structured['{k}']` should be {implied_y_data_shape}."
+                )
+
+        ### Stack all output fields along a trailing axis, and interpolate them together.
+        super().__init__(
+            x_data_coordinates=x_data_coordinates,
+            y_data_structured=np.stack(
+                [np.asarray(v, dtype=float) for v in y_data_structured.values()],
+                axis=-1
+            ),  # Shape: (*grid_shape, n_outputs)
+            method=method,
+            fill_value=fill_value,
+        )
+        self.y_data = self.y_data_structured.reshape((-1, len(self.output_names)), order="F")
+
+    def __repr__(self) -> str:
+        input_names = self.input_names()
+        if input_names is not None:
+            input_description = f"a dict with: keys {input_names}, values as float or array"
+        else:
+            input_description = f"a float or array"
+        return "\n".join([
+            f"MultiOutputInterpolatedModel(x) [R^{self.input_dimensionality()} -> R^{len(self.output_names)}]",
+            f"\tInput: {input_description}",
+            f"\tOutput: a dict with: keys {self.output_names}, values as float or array",
+        ])
+
+    @property
+    def _output_shape(self) -> tuple:
+        return (len(self.output_names),)
+
+    def __call__(self, x):
+        x, shape = self._stack_inputs(x)
+        outputs = self._interpolate(x)  # Shape: (n_points, n_outputs)
+
+        def format_output(output):
+            if shape is None:
+                return output
+            return np.reshape(output, shape)
+
+        return {
+            k: format_output(outputs[:, i])
+            for i, k in enumerate(self.output_names)
+        }
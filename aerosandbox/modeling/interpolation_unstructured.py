@@ -1,8 +1,18 @@
 from typing import Union, Dict, Any
+from pathlib import Path
+import hashlib
+import json
+import os
+import threading
+import types
+import warnings
+import zipfile
 import aerosandbox.numpy as np
 from aerosandbox.modeling.interpolation import InterpolatedModel
 from scipy import interpolate
 
+_save_format_version = 1
+
 
 class UnstructuredInterpolatedModel(InterpolatedModel):
     """
@@ -33,6 +43,10 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
                  resampling_interpolator_kwargs: Dict[str, Any] = None,
                  fill_value=np.nan,  # Default behavior: return NaN for all inputs outside data range.
                  interpolated_model_kwargs: Dict[str, Any] = None,
+                 neighbors: int = None,
+                 max_resample_memory: float = 256e6,
+                 n_threads: int = 1,
+                 cache_directory: Union[str, Path] = None,
                  ):
         """
         Creates the interpolator. Note that data must be unstructured (i.e., point cloud) for general N-dimensional
@@ -82,6 +96,28 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
             interpolated_model_kwargs: Indicates keyword arguments to pass into the (structured) InterpolatedModel.
             Also a dictionary. See aerosandbox.InterpolatedModel for documentation on possible inputs here.
 
+            neighbors: [Optional] If given, the resampling RBF is made local: each resampled point is computed
+            using only this many of its nearest data points, rather than all of them. This makes fitting scale
+            roughly linearly (rather than cubically) with the number of data points, which makes large (e.g.,
+            tens of thousands of points) datasets feasible. A few tens of neighbors is usually plenty. Only
+            applicable if `resampling_interpolator` is scipy.interpolate.RBFInterpolator.
+
+            max_resample_memory: The approximate maximum memory, in bytes, to use at once when evaluating the
+            resampling interpolator on the structured grid. The grid is evaluated in chunks sized to fit within
+            this.
+
+            n_threads: The number of threads to use when evaluating the resampling interpolator on the structured
+            grid. Chunks are evaluated in parallel; most of the work is in compiled code that releases the GIL.
+
+            cache_directory: [Optional] A directory in which to cache the built model. Fitting the resampling
+            interpolator can be expensive (RBF fitting is O(N^3) in the number of data points), so if this is given:
+
+                * The model is looked up in this directory by a hash of all of the inputs above (data and
+                settings). If it's found, it's loaded (see `UnstructuredInterpolatedModel.load()`) without refitting.
+
+                * Otherwise, the model is built as usual, and then saved to this directory for next time. Cache
+                files are written atomically, and any that can't be read (e.g., corrupted ones) are rebuilt.
+
         """
         if resampling_interpolator_kwargs is None:
             resampling_interpolator_kwargs = {}
@@ -97,6 +133,32 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
         except ValueError:
             pass
 
+        # If a cached build exists, load it rather than refitting.
+        if cache_directory is not None:
+            build_key = self._build_key(
+                x_data=x_data,
+                y_data=y_data,
+                x_data_resample=x_data_resample,
+                resampling_interpolator=resampling_interpolator,
+                resampling_interpolator_kwargs=resampling_interpolator_kwargs,
+                fill_value=fill_value,
+                interpolated_model_kwargs=interpolated_model_kwargs,
+                neighbors=neighbors,
+            )
+            cache_filename = Path(cache_directory) / f"{build_key}.npz"
+            try:
+                self._load_state(cache_filename)
+                return
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+                # A corrupt or unreadable cache file (e.g., from an interrupted write) is treated as a cache miss.
+                warnings.warn(
+                    f"Could not read the cached model at '{cache_filename}' ({type(e).__name__}: {e}), so it will "
+                    f"be rebuilt.",
+                    stacklevel=2,
+                )
+
         # If it didn't work, this implies that x_data is multidimensional, and hence a dict-like object. Validate this.
         try:  # Determine type of `x_data`
             x_data.keys()
@@ -113,6 +175,14 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
                 **resampling_interpolator_kwargs
             }
 
+        if neighbors is not None:
+            if resampling_interpolator != interpolate.RBFInterpolator:
+                raise ValueError("`neighbors` can only be used if `resampling_interpolator` is an RBFInterpolator.")
+            resampling_interpolator_kwargs = {
+                **resampling_interpolator_kwargs,
+                "neighbors": neighbors,
+            }
+
         interpolator = resampling_interpolator(
             y=np.stack(tuple(x_data.values()), axis=1),
             d=y_data,
@@ -125,6 +195,8 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
                 k: x_data_resample
                 for k in x_data.keys()
             }
+        else:
+            x_data_resample = dict(x_data_resample)  # Copy, so that the user's dict isn't modified below.
 
         # Now, x_data_resample should be dict-like. Validate this.
         try:
@@ -154,8 +226,18 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
             for k, xi in zip(x_data.keys(), x_data_structured_values)
         }
 
-        y_data_structured = interpolator(
-            np.stack(tuple(x_data_structured_values), axis=1)
+        ### Evaluate the interpolator on the structured grid, in chunks that fit within the memory limit.
+        # Each query point needs a row of kernel evaluations against every data point it uses (for a local RBF,
+        # it also needs a small dense system of that size to be solved).
+        n_data_used = np.length(y_data) if neighbors is None else min(neighbors, np.length(y_data))
+        bytes_per_query_point = 8 * (n_data_used + len(x_data)) * (1 if neighbors is None else n_data_used + 1)
+        chunk_size = max(int(max_resample_memory // bytes_per_query_point), 1)
+
+        y_data_structured = _evaluate_in_chunks(
+            interpolator,
+            np.stack(tuple(x_data_structured_values), axis=1),
+            chunk_size=chunk_size,
+            n_threads=n_threads,
         )
         y_data_structured = y_data_structured.reshape([
             np.length(xi)
@@ -176,6 +258,202 @@ class UnstructuredInterpolatedModel(InterpolatedModel):
         self.x_data_raw_unstructured = x_data
         self.y_data_raw = y_data
 
+        if cache_directory is not None:
+            Path(cache_directory).mkdir(parents=True, exist_ok=True)
+            self.save(cache_filename)
+
+    @staticmethod
+    def _build_key(**inputs) -> str:
+        """
+        Returns a hash of all of the inputs used to build a model, which is used as its cache key.
+
+        Python functions (e.g., a custom resampling interpolator or kernel) are hashed by their name, bytecode,
+        constants, default arguments, and closure values, so that two lambdas or closures defined in the same scope
+        get different keys. (Global variables that a function reads are not included.)
+        """
+        hasher = hashlib.sha256(f"version {_save_format_version}".encode())
+        functions_seen = set()  # Guards against infinite recursion, e.g., for recursive closures
+
+        def update(item):
+            if isinstance(item, dict):
+                hasher.update(b"dict")
+                for k in sorted(item.keys(), key=str):
+                    update(k)
+                    update(item[k])
+            elif isinstance(item, (set, frozenset)):
+                hasher.update(b"set")
+                for i in sorted(item, key=repr):
+                    update(i)
+            elif isinstance(item, (list, tuple)):
+                hasher.update(b"list")
+                for i in item:
+                    update(i)
+            elif isinstance(item, np.ndarray):
+                hasher.update(f"array {item.dtype.str} {item.shape}".encode())
+                hasher.update(np.ascontiguousarray(item).tobytes())
+            elif isinstance(item, types.FunctionType):
+                hasher.update(f"function {item.__module__}.{item.__qualname__}".encode())
+                if id(item) in functions_seen:
+                    return
+                functions_seen.add(id(item))
+                update(item.__code__)
+                update(item.__defaults__)
+                update(item.__kwdefaults__)
+                update([cell.cell_contents for cell in (item.__closure__ or [])])
+            elif isinstance(item, types.CodeType):
+                hasher.update(b"code")
+                hasher.update(item.co_code)
+                update(item.co_names)
+                update(item.co_consts)  # Includes the code objects of any nested functions
+            elif isinstance(item, type) or callable(item):
+                hasher.update(f"{getattr(item, '__module__', '')}.{getattr(item, '__qualname__', item)}".encode())
+            else:
+                hasher.update(repr(item).encode())
+
+        update(inputs)
+        return hasher.hexdigest()
+
+    def save(self, filename: Union[str, Path]) -> None:
+        """
+        Saves this model to a file, so that it can later be restored with `UnstructuredInterpolatedModel.load()`.
+
+        The file stores the resampled structured grid (plus the raw data, for reference), rather than the resampling
+        interpolator itself, so loading it does not require refitting anything. The format is a NumPy `.npz`
+        archive with no pickled objects, so it's safe to load from untrusted sources.
+
+        Args:
+            filename: The file to save to. Conventionally, a "*.npz" file.
+
+        Returns: None
+
+        """
+        arrays = {}
+
+        def add_data(prefix, data):
+            if isinstance(data, dict):
+                keys = list(data.keys())
+                for i, k in enumerate(keys):
+                    arrays[f"{prefix}_{i}"] = np.asarray(data[k])
+                return keys
+            else:
+                arrays[f"{prefix}_0"] = np.asarray(data)
+                return None
+
+        metadata = {
+            "format_version"    : _save_format_version,
+            "x_data_coordinates": add_data("x_data_coordinates", self.x_data_coordinates),
+            "method"            : self.method,
+            "fill_value"        : None if self.fill_value is None else float(self.fill_value),
+        }
+        arrays["y_data_structured"] = np.asarray(self.y_data_structured)
+
+        if hasattr(self, "x_data_raw_unstructured"):
+            metadata["x_data_raw_unstructured"] = add_data("x_data_raw_unstructured", self.x_data_raw_unstructured)
+            arrays["y_data_raw"] = np.asarray(self.y_data_raw)
+
+        # Write to a temporary file in the same directory, then move it into place. This way, the file at
+        # `filename` is always either absent or complete, even if this is interrupted or run concurrently.
+        filename = Path(filename)
+        temporary_filename = filename.with_name(f"{filename.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temporary_filename, "wb") as f:
+                np.savez(
+                    f,
+                    metadata=np.array(json.dumps(metadata)),
+                    **arrays
+                )
+            os.replace(temporary_filename, filename)
+        except BaseException:
+            if temporary_filename.exists():
+                temporary_filename.unlink()
+            raise
+
+    @classmethod
+    def load(cls, filename: Union[str, Path]) -> "UnstructuredInterpolatedModel":
+        """
+        Loads a model that was saved with `UnstructuredInterpolatedModel.save()`.
+
+        Args:
+            filename: The file to load from.
+
+        Returns: An UnstructuredInterpolatedModel, which behaves identically to the one that was saved.
+
+        """
+        self = cls.__new__(cls)
+        self._load_state(filename)
+        return self
+
+    def _load_state(self, filename: Union[str, Path]) -> None:
+        """
+        Initializes this instance in-place from a file saved with `UnstructuredInterpolatedModel.save()`.
+        """
+        with np.load(filename, allow_pickle=False) as archive:
+            metadata = json.loads(str(archive["metadata"]))
+
+            if metadata["format_version"] != _save_format_version:
+                raise ValueError(
+                    f"This file was saved in format version {metadata['format_version']}, but this version of "
+                    f"AeroSandbox reads format version {_save_format_version}."
+                )
+
+            def get_data(prefix, keys):
+                if keys is None:
+                    return archive[f"{prefix}_0"]
+                else:
+                    return {
+                        k: archive[f"{prefix}_{i}"]
+                        for i, k in enumerate(keys)
+                    }
+
+            InterpolatedModel.__init__(
+                self,
+                x_data_coordinates=get_data("x_data_coordinates", metadata["x_data_coordinates"]),
+                y_data_structured=archive["y_data_structured"],
+                method=metadata["method"],
+                fill_value=metadata["fill_value"],
+            )
+
+            if "x_data_raw_unstructured" in metadata:
+                self.x_data_raw_unstructured = get_data("x_data_raw_unstructured", metadata["x_data_raw_unstructured"])
+                self.y_data_raw = archive["y_data_raw"]
+
+
+def _evaluate_in_chunks(
+        interpolator,
+        points: np.ndarray,
+        chunk_size: int,
+        n_threads: int = 1,
+) -> np.ndarray:
+    """
+    Evaluates `interpolator(points)` in chunks of at most `chunk_size` points, optionally in parallel threads.
+
+    Args:
+        interpolator: A callable that maps an (n_points, n_dimensions) array to an (n_points,) array.
+
+        points: The points to evaluate at, as an (n_points, n_dimensions) array.
+
+        chunk_size: The maximum number of points to evaluate in each call to `interpolator`.
+
+        n_threads: The number of threads to use.
+
+    Returns: The concatenated results.
+
+    """
+    chunks = [
+        points[i:i + chunk_size]
+        for i in range(0, len(points), chunk_size)
+    ]
+
+    if n_threads == 1 or len(chunks) <= 1:
+        results = [interpolator(chunk) for chunk in chunks]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            results = list(executor.map(interpolator, chunks))
+
+    return np.concatenate(results)
+
 
 if __name__ == '__main__':
     x = np.arange(10)
@@ -0,0 +1,191 @@
+from aerosandbox.modeling.fitting import FittedModel, _solve_least_squares
+import pytest
+import aerosandbox.numpy as np
+import casadi as cas
+
+
+def dataset(n=200):
+    np.random.seed(0)  # Set a seed for repeatability.
+    x1 = np.random.uniform(0, 5, n)
+    x2 = np.random.uniform(1, 3, n)
+    y = 2 * np.exp(-0.5 * x1) + 0.3 * x2 ** 1.5 + 0.05 * np.random.randn(n)
+    return {"x1": x1, "x2": x2}, y
+
+
+def model(x, p):
+    return p["a"] * np.exp(-p["b"] * x["x1"]) + p["c"] * x["x2"] ** p["d"]
+
+
+parameter_guesses = {"a": 1, "b": 1, "c": 1, "d": 1}
+
+
+def fit(solver, **kwargs):
+    x_data, y_data = dataset()
+    return FittedModel(
+        model=model,
+        x_data=x_data,
+        y_data=y_data,
+        parameter_guesses=parameter_guesses,
+        solver=solver,
+        verbose=False,
+        **kwargs
+    )
+
+
+def test_least_squares_matches_opti():
+    fit_opti = fit("opti")
+    fit_lsq = fit("least_squares")
+    assert fit_lsq.solver == "least_squares"
+    for k in parameter_guesses:
+        assert fit_lsq.parameters[k] == pytest.approx(fit_opti.parameters[k], rel=1e-5)
+
+
+def test_auto_solver_selection():
+    x_data, y_data = dataset()
+    assert FittedModel(
+        model=model,
+        x_data=x_data,
+        y_data=y_data,
+        parameter_guesses=parameter_guesses,
+        verbose=False,
+    ).solver == "opti"  # The least-squares backend is opt-in.
+
+    assert fit("auto").solver == "least_squares"
+    assert fit("auto", residual_norm_type="L1").solver == "opti"
+    assert fit("auto", fit_type="upper bound").solver == "opti"
+    with pytest.raises(ValueError):
+        fit("least_squares", residual_norm_type="Linf")
+
+
+def test_least_squares_with_bounds_and_weights():
+    x_data, y_data = dataset()
+    weights = 1 + x_data["x1"]
+    kwargs = dict(
+        parameter_bounds={"b": (0.6, None), "d": (None, 1.2)},
+        weights=weights,
+        put_residuals_in_logspace=True,
+    )
+    fit_opti = fit("opti", **kwargs)
+    fit_lsq = fit("least_squares", **kwargs)
+    assert fit_lsq.parameters["b"] >= 0.6
+    assert fit_lsq.parameters["d"] == pytest.approx(1.2)
+    for k in parameter_guesses:
+        assert fit_lsq.parameters[k] == pytest.approx(fit_opti.parameters[k], rel=1e-4)
+
+
+def test_mini_batches(monkeypatch):
+    from aerosandbox.modeling import fitting
+
+    solve_least_squares = fitting._solve_least_squares
+    batch_functions_used = []
+
+    def recording_solve_least_squares(batch_functions, **kwargs):
+        batch_functions_used.append(batch_functions)
+        return solve_least_squares(batch_functions=batch_functions, **kwargs)
+
+    monkeypatch.setattr(fitting, "_solve_least_squares", recording_solve_least_squares)
+
+    fit_full = fit("least_squares")
+    fit_batched = fit("least_squares", batch_size=37)
+    for k in parameter_guesses:
+        assert fit_batched.parameters[k] == pytest.approx(fit_full.parameters[k], rel=1e-8)
+
+    ### The 200 data points are split into 5 batches of 37 and one of 15, which share two pairs of functions.
+    batch_functions = batch_functions_used[-1]
+    assert len(batch_functions) == 6
+    assert len(set(id(cost_function) for cost_function, _, _ in batch_functions)) == 2
+
+
+def test_mini_batches_with_numeric_only_model():
+    import numpy as onp
+
+    def numeric_only_model(x, p):  # Plain NumPy can't evaluate this on symbolic x
+        return p["a"] * onp.exp(-0.5 * onp.asarray(x["x1"], dtype=float)) + p["c"] * x["x2"] ** 1.5
+
+    x_data, y_data = dataset()
+    fits = [
+        FittedModel(
+            model=numeric_only_model,
+            x_data=x_data,
+            y_data=y_data,
+            parameter_guesses={"a": 1, "c": 1},
+            solver="least_squares",
+            batch_size=batch_size,
+            verbose=False,
+        )
+        for batch_size in [None, 37]
+    ]
+    assert fits[0].parameters["a"] == pytest.approx(2, rel=0.05)
+    for k in ["a", "c"]:
+        assert fits[1].parameters[k] == pytest.approx(fits[0].parameters[k], rel=1e-8)
+
+
+def linear_least_squares_problem():
+    np.random.seed(0)
+    A = np.random.randn(20, 3)
+    b = np.random.randn(20)
+
+    p = cas.MX.sym("p", 3)
+    residual = cas.mtimes(A, p) - b
+    jacobian = cas.jacobian(residual, p)
+    batch_functions = [(
+        cas.Function("cost", [p], [cas.sumsqr(residual)]),
+        cas.Function("normal_equations", [p], [
+            cas.sumsqr(residual),
+            cas.mtimes(jacobian.T, jacobian),
+            cas.mtimes(jacobian.T, residual),
+        ]),
+        [],
+    )]
+    return A, b, batch_functions
+
+
+def test_solve_least_squares_at_optimum():
+    A, b, batch_functions = linear_least_squares_problem()
+    p_optimal = np.linalg.lstsq(A, b, rcond=None)[0]
+
+    ### Starting at the optimum (with a nonzero residual) is converged, not a failure
+    p = _solve_least_squares(
+        batch_functions=batch_functions,
+        p0=p_optimal,
+        lower_bounds=-np.inf * np.ones(3),
+        upper_bounds=np.inf * np.ones(3),
+        verbose=False,
+    )
+    assert p == pytest.approx(p_optimal)
+
+
+def test_solve_least_squares_non_convergence_raises():
+    A, b, batch_functions = linear_least_squares_problem()
+    with pytest.raises(RuntimeError):
+        _solve_least_squares(
+            batch_functions=batch_functions,
+            p0=np.array([100., -100., 100.]),
+            lower_bounds=-np.inf * np.ones(3),
+            upper_bounds=np.inf * np.ones(3),
+            max_iter=1,
+            verbose=False,
+        )
+
+
+@pytest.mark.parametrize("solver", ["opti", "least_squares"])
+def test_in_place_operations_are_caught(solver):
+    x_data, y_data = dataset()
+
+    def bad_model(x, p):
+        x["x1"] *= 2
+        return model(x, p)
+
+    with pytest.raises(TypeError):
+        FittedModel(
+            model=bad_model,
+            x_data=x_data,
+            y_data=y_data,
+            parameter_guesses=parameter_guesses,
+            solver=solver,
+            verbose=False,
+        )
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,105 @@
+from aerosandbox.modeling.fitting import FittedModel
+import aerosandbox.modeling.fitting as fitting
+import pytest
+import aerosandbox.numpy as np
+
+
+def model(x, p):
+    return p["m"] * x + p["b"]
+
+
+def fitted_model(**kwargs):
+    np.random.seed(0)  # Set a seed for repeatability.
+    x = np.linspace(0, 10, 100)
+    y = 2 * x + 1 + np.random.randn(len(x))
+    return FittedModel(
+        model=model,
+        x_data=x,
+        y_data=y,
+        parameter_guesses={"m": 0, "b": 0},
+        verbose=False,
+        **kwargs
+    )
+
+
+def test_bootstrap():
+    fm = fitted_model()
+    result = fm.bootstrap(n_bootstraps=200, seed=0)
+
+    assert result["parameters"]["m"].shape == (200,)
+
+    ### Compare against the analytical standard errors of a linear regression
+    x = fm.x_data
+    residuals = fm.y_data - fm(x)
+    sigma = np.sqrt(np.sum(residuals ** 2) / (len(x) - 2))
+    se_m = sigma / np.sqrt(np.sum((x - np.mean(x)) ** 2))
+    assert result["standard_errors"]["m"] == pytest.approx(se_m, rel=0.2)
+
+    lower, upper = result["confidence_intervals"]["m"]
+    assert lower < fm.parameters["m"] < upper
+    assert upper - lower == pytest.approx(2 * 1.96 * se_m, rel=0.25)
+
+    ### Reproducibility
+    assert np.all(fm.bootstrap(n_bootstraps=10, seed=1)["parameters"]["b"] ==
+                  fm.bootstrap(n_bootstraps=10, seed=1)["parameters"]["b"])
+
+
+def test_cross_validate():
+    fm = fitted_model()
+    result = fm.cross_validate(n_folds=5, seed=0)
+
+    assert len(result["parameters"]) == 5
+    assert result["test_error"].shape == (5,)
+    assert result["mean_test_error"] == pytest.approx(1, rel=0.2)  # The noise level of the data
+    assert np.mean(result["train_error"]) <= result["mean_test_error"]
+
+    with pytest.raises(ValueError):
+        fm.cross_validate(n_folds=1)
+
+
+def test_cross_validate_opti_solver():
+    fm = fitted_model(residual_norm_type="L1")
+    result = fm.cross_validate(n_folds=4, shuffle=False)
+    assert result["mean_test_error"] == pytest.approx(1, rel=0.3)
+
+
+def test_parallel_refits():
+    fm = fitted_model()
+    serial = fm.bootstrap(n_bootstraps=8, seed=0)
+    parallel = fm.bootstrap(n_bootstraps=8, seed=0, n_workers=2)
+    assert parallel["parameters"]["m"] == pytest.approx(serial["parameters"]["m"])
+
+
+def test_failed_refits(monkeypatch):
+    fm = fitted_model(solver="least_squares")
+
+    ### Refits where the solver doesn't converge give NaNs, with a warning
+    solve_least_squares = fitting._solve_least_squares
+    n_calls = [0]
+
+    def sometimes_failing_solve_least_squares(*args, **kwargs):
+        n_calls[0] += 1
+        if n_calls[0] % 3 == 0:
+            raise RuntimeError("Did not converge.")
+        return solve_least_squares(*args, **kwargs)
+
+    monkeypatch.setattr(fitting, "_solve_least_squares", sometimes_failing_solve_least_squares)
+
+    with pytest.warns(UserWarning, match="3 of 10 refits"):
+        result = fm.bootstrap(n_bootstraps=10, seed=0)
+    assert np.sum(np.isnan(result["parameters"]["m"])) == 3
+    assert np.isfinite(result["standard_errors"]["m"])
+
+    ### Other errors are raised, rather than hidden as NaNs
+    def broken_model(x, p):
+        if len(x) != 100:
+            raise ValueError("Unexpected data.")
+        return model(x, p)
+
+    fm.model = broken_model
+    with pytest.raises(Exception):
+        fm.cross_validate(n_folds=4)
+
+
+if __name__ == '__main__':
+    pytest.main()
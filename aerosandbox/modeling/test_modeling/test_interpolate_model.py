@@ -44,6 +44,29 @@ def test_interpolated_model_zeros_patch():
     assert f == pytest.approx(0)
 
 
+def test_interpolated_model_reuses_interpolant():
+    import casadi as cas
+    import pickle
+
+    model = interpolated_model()
+    model(5.5)
+    interpolant = model._interpolants["bspline"]
+
+    ### Numeric and symbolic calls share one interpolant
+    x = cas.MX.sym("x", 3)
+    y = model(x)
+    assert model._interpolants["bspline"] is interpolant
+    f = cas.Function("f", [x], [y])
+    assert np.all(
+        f(np.array([1.5, 2.5, 3.5])).full().reshape(-1) ==
+        pytest.approx(underlying_function_1D(np.array([1.5, 2.5, 3.5])))
+    )
+
+    ### The interpolant is rebuilt lazily after pickling
+    model_unpickled = pickle.loads(pickle.dumps(model))
+    assert model_unpickled(5.5) == pytest.approx(underlying_function_1D(5.5))
+
+
 if __name__ == '__main__':
     test_interpolated_model_zeros_patch()
     pytest.main()
@@ -0,0 +1,98 @@
+from aerosandbox.modeling.interpolation import InterpolatedModel
+from aerosandbox.modeling.interpolation_multi_output import MultiOutputInterpolatedModel
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def dataset():
+    x1 = np.linspace(-2, 2, 11)
+    x2 = np.linspace(0, 3, 13)
+    X1, X2 = np.meshgrid(x1, x2, indexing="ij")
+    return {"x1": x1, "x2": x2}, {
+        "a": X1 ** 2 + np.sin(X2),
+        "b": X1 * X2,
+        "c": np.cos(X1) - X2,
+    }
+
+
+@pytest.mark.parametrize("method", ["bspline", "linear", "nearest"])
+def test_matches_single_output_models(method):
+    x_data_coordinates, y_data_structured = dataset()
+    model = MultiOutputInterpolatedModel(
+        x_data_coordinates=x_data_coordinates,
+        y_data_structured=y_data_structured,
+        method=method,
+    )
+
+    x_test = {
+        "x1": np.linspace(-2.5, 2.5, 30).reshape((5, 6)),
+        "x2": 1.3,
+    }
+    outputs = model(x_test)
+
+    assert list(outputs.keys()) == ["a", "b", "c"]
+    for k, v in y_data_structured.items():
+        single_output_model = InterpolatedModel(
+            x_data_coordinates=x_data_coordinates,
+            y_data_structured=v,
+            method=method,
+        )
+        expected = single_output_model(x_test)
+        assert outputs[k].shape == (5, 6)
+        assert outputs[k] == pytest.approx(expected, nan_ok=True)
+
+    assert np.isnan(outputs["a"][0, 0])  # Out of bounds
+
+
+def test_scalar_and_1D_inputs():
+    x = np.linspace(0, 1, 21)
+    model = MultiOutputInterpolatedModel(
+        x_data_coordinates=x,
+        y_data_structured={"y1": x ** 2, "y2": -x},
+        fill_value=None,
+    )
+    outputs = model(0.5)
+    assert outputs["y1"] == pytest.approx(0.25)
+    assert outputs["y2"] == pytest.approx(-0.5)
+
+    outputs = model(np.array([0.2, 0.4, 1.5]))
+    assert outputs["y1"] == pytest.approx([0.04, 0.16, 1])  # Clipped to the domain, as with InterpolatedModel
+    assert outputs["y2"] == pytest.approx([-0.2, -0.4, -1])
+
+
+def test_optimize_through_multi_output_model():
+    x_data_coordinates, y_data_structured = dataset()
+    model = MultiOutputInterpolatedModel(
+        x_data_coordinates=x_data_coordinates,
+        y_data_structured=y_data_structured,
+        fill_value=None,  # IPOPT may evaluate slightly outside of the variable bounds.
+    )
+
+    opti = asb.Opti()
+    x1 = opti.variable(init_guess=1, lower_bound=-2, upper_bound=2)
+    x2 = opti.variable(init_guess=1, lower_bound=0, upper_bound=3)
+    outputs = model({"x1": x1, "x2": x2})
+    opti.minimize(outputs["a"] + outputs["b"] ** 2)
+    opti.subject_to(outputs["c"] >= -2)
+    sol = opti.solve(verbose=False)
+
+    single_output_models = {
+        k: InterpolatedModel(x_data_coordinates, v, fill_value=None)
+        for k, v in y_data_structured.items()
+    }
+    x_opt = {"x1": sol.value(x1), "x2": sol.value(x2)}
+    assert sol.value(outputs["a"]) == pytest.approx(single_output_models["a"](x_opt))
+    assert sol.value(outputs["c"]) == pytest.approx(single_output_models["c"](x_opt))
+    assert sol.value(outputs["c"]) >= -2 - 1e-6
+
+
+def test_bad_shape():
+    x_data_coordinates, y_data_structured = dataset()
+    y_data_structured["d"] = np.zeros((3, 3))
+    with pytest.raises(ValueError):
+        MultiOutputInterpolatedModel(x_data_coordinates, y_data_structured)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,141 @@
+from aerosandbox.modeling.interpolation_unstructured import UnstructuredInterpolatedModel
+import aerosandbox.numpy as np
+import pytest
+
+
+def underlying_function_2D(x1, x2):
+    return x1 ** 2 + np.sin(x2)
+
+
+def dataset():
+    np.random.seed(0)  # Set a seed for repeatability.
+    x1 = np.random.uniform(-2, 2, 200)
+    x2 = np.random.uniform(-2, 2, 200)
+    return {"x1": x1, "x2": x2}, underlying_function_2D(x1, x2)
+
+
+def test_unstructured_interpolated_model():
+    x_data, y_data = dataset()
+    model = UnstructuredInterpolatedModel(
+        x_data=x_data,
+        y_data=y_data,
+        x_data_resample=20,
+    )
+    assert model({"x1": 0.5, "x2": 0.5}) == pytest.approx(underlying_function_2D(0.5, 0.5), abs=0.05)
+
+
+def test_save_and_load(tmp_path):
+    x_data, y_data = dataset()
+    model = UnstructuredInterpolatedModel(
+        x_data=x_data,
+        y_data=y_data,
+        x_data_resample=20,
+    )
+    model.save(tmp_path / "model.npz")
+    model_loaded = UnstructuredInterpolatedModel.load(tmp_path / "model.npz")
+
+    x_test = {"x1": np.linspace(-1, 1, 7), "x2": np.linspace(1, -1, 7)}
+    assert np.all(model_loaded(x_test) == model(x_test))
+    assert np.all(model_loaded.y_data_raw == y_data)
+    assert np.isnan(model_loaded({"x1": 10, "x2": 0}))
+
+
+def test_cached_build(tmp_path):
+    x_data, y_data = dataset()
+
+    def build(y_data, **kwargs):
+        return UnstructuredInterpolatedModel(
+            x_data=x_data,
+            y_data=y_data,
+            x_data_resample=20,
+            cache_directory=tmp_path,
+            **kwargs
+        )
+
+    model = build(y_data)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    model_cached = build(y_data)  # Should load from the cache
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    assert np.all(model_cached.y_data_structured == model.y_data_structured)
+
+    ### Changing the data or settings should miss the cache
+    build(y_data + 1)
+    build(y_data, resampling_interpolator_kwargs={"kernel": "cubic"})
+    assert len(list(tmp_path.glob("*.npz"))) == 3
+
+
+def test_build_key_distinguishes_functions():
+    build_key = UnstructuredInterpolatedModel._build_key
+
+    def make_kernel(power):
+        return lambda r: r ** power
+
+    kernels = [lambda r: r ** 3, lambda r: r ** 5, make_kernel(3), make_kernel(5)]
+    keys = [build_key(kernel=kernel) for kernel in kernels]
+    assert len(set(keys)) == len(kernels)
+
+    assert build_key(kernel=make_kernel(3)) == keys[2]
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    x_data, y_data = dataset()
+
+    def build():
+        return UnstructuredInterpolatedModel(
+            x_data=x_data,
+            y_data=y_data,
+            x_data_resample=20,
+            cache_directory=tmp_path,
+        )
+
+    model = build()
+    (cache_file,) = tmp_path.glob("*.npz")
+
+    ### Truncate the cache file, as an interrupted write would
+    cache_file.write_bytes(cache_file.read_bytes()[:100])
+
+    with pytest.warns(UserWarning):
+        model_rebuilt = build()
+    assert np.all(model_rebuilt.y_data_structured == model.y_data_structured)
+
+    ### The cache file should have been replaced with a good one, and no temporary files left behind
+    assert list(tmp_path.iterdir()) == [cache_file]
+    model_cached = build()
+    assert np.all(model_cached.y_data_structured == model.y_data_structured)
+
+
+def test_local_rbf():
+    np.random.seed(0)
+    x1 = np.random.uniform(-2, 2, 5000)
+    x2 = np.random.uniform(-2, 2, 5000)
+
+    model = UnstructuredInterpolatedModel(
+        x_data={"x1": x1, "x2": x2},
+        y_data=underlying_function_2D(x1, x2),
+        x_data_resample=20,
+        neighbors=30,
+    )
+    assert model({"x1": 0.5, "x2": 0.5}) == pytest.approx(underlying_function_2D(0.5, 0.5), abs=0.02)
+
+
+def test_chunked_parallel_resampling():
+    x_data, y_data = dataset()
+
+    def build(**kwargs):
+        return UnstructuredInterpolatedModel(
+            x_data=x_data,
+            y_data=y_data,
+            x_data_resample=20,
+            **kwargs
+        ).y_data_structured
+
+    reference = build()
+    assert build(max_resample_memory=1e5, n_threads=4) == pytest.approx(reference, abs=1e-12)
+    assert build(max_resample_memory=1e4, neighbors=20, n_threads=3) == pytest.approx(
+        build(neighbors=20), abs=1e-12
+    )
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -15,6 +15,7 @@ from aerosandbox.numpy.linalg_top_level import *
 import aerosandbox.numpy.linalg as linalg
 from aerosandbox.numpy.logicals import *
 from aerosandbox.numpy.rotations import *
+from aerosandbox.numpy.sparse_operators import *
 from aerosandbox.numpy.spacing import *
 from aerosandbox.numpy.surrogate_model_tools import *
 from aerosandbox.numpy.trig import *
@@ -5,34 +5,42 @@ from typing import Tuple, Iterable, Union
 from aerosandbox.numpy.determine_type import is_casadi_type
 
 
+def _shape_2D(object: Union[float, int, Iterable, _onp.ndarray]) -> Tuple:
+    shape = _onp.shape(object)
+    if len(shape) == 0:
+        return (1, 1)
+    elif len(shape) == 1:
+        return (1, shape[0])
+    elif len(shape) == 2:
+        return shape
+    else:
+        raise ValueError("CasADi can't handle arrays with >2 dimensions, unfortunately.")
+
+
 def _make_casadi_types_broadcastable(x1, x2):
-    def shape_2D(object: Union[float, int, Iterable, _onp.ndarray]) -> Tuple:
-        shape = _onp.shape(object)
-        if len(shape) == 0:
-            return (1, 1)
-        elif len(shape) == 1:
-            return (1, shape[0])
-        elif len(shape) == 2:
-            return shape
-        else:
-            raise ValueError("CasADi can't handle arrays with >2 dimensions, unfortunately.")
-
-    x1_shape = shape_2D(x1)
-    x2_shape = shape_2D(x2)
+    x1_shape = _shape_2D(x1)
+    x2_shape = _shape_2D(x2)
+
+    ### Fast path: CasADi natively handles same-shape operands and scalar (1x1) operands, so no tiling is needed.
+    if x1_shape == x2_shape or x1_shape == (1, 1) or x2_shape == (1, 1):
+        return x1, x2
+
     shape = _onp.broadcast_shapes(x1_shape, x2_shape)
 
-    x1_tiled = _cas.repmat(
-        x1,
-        shape[0] // x1_shape[0],
-        shape[1] // x1_shape[1],
-    )
-    x2_tiled = _cas.repmat(
-        x2,
-        shape[0] // x2_shape[0],
-        shape[1] // x2_shape[1],
-    )
-
-    return x1_tiled, x2_tiled
+    if x1_shape != shape:
+        x1 = _cas.repmat(
+            x1,
+            shape[0] // x1_shape[0],
+            shape[1] // x1_shape[1],
+        )
+    if x2_shape != shape:
+        x2 = _cas.repmat(
+            x2,
+            shape[0] // x2_shape[0],
+            shape[1] // x2_shape[1],
+        )
+
+    return x1, x2
 
 
 def add(
@@ -1,4 +1,24 @@
 import casadi as cas
+import numpy as _onp
+
+_casadi_types = (cas.MX, cas.DM, cas.SX)
+
+# A dispatch table mapping each (non-container) type seen so far to whether it is a CasADi type. Checking
+# `isinstance()` against the SWIG-generated CasADi classes is comparatively slow, and these checks run at the start
+# of nearly every function in aerosandbox.numpy, so we only do it once per type. Seeded with the common cases.
+_is_casadi_type_lookup = {
+    **{
+        t: False
+        for t in (
+            float, int, bool, complex, type(None), str,
+            _onp.ndarray, _onp.float64, _onp.float32, _onp.int64, _onp.int32, _onp.bool_,
+        )
+    },
+    **{
+        t: True
+        for t in _casadi_types
+    },
+}
 
 
 def is_casadi_type(array_like, recursive=True) -> bool:
@@ -15,16 +35,31 @@ def is_casadi_type(array_like, recursive=True) -> bool:
     Returns: A boolean if the object is a CasADi data type.
 
     """
-    if recursive and (isinstance(array_like, list) or isinstance(array_like, tuple)):
-        for element in array_like:
-            if is_casadi_type(element, recursive=True):
-                return True
-
-    return (
-            isinstance(array_like, cas.MX) or
-            isinstance(array_like, cas.DM) or
-            isinstance(array_like, cas.SX)
-    )
+    t = type(array_like)
+
+    ### Fast path for containers: check each element's exact type against the dispatch table.
+    if t is list or t is tuple:
+        if recursive:
+            for element in array_like:
+                element_is_casadi = _is_casadi_type_lookup.get(type(element))
+                if element_is_casadi is None:
+                    element_is_casadi = is_casadi_type(element, recursive=True)
+                if element_is_casadi:
+                    return True
+        return False
+
+    ### Fast path for everything else: a dictionary lookup on the exact type.
+    result = _is_casadi_type_lookup.get(t)
+    if result is not None:
+        return result
+
+    ### Slow path, for types not yet seen.
+    if isinstance(array_like, (list, tuple)):  # Subclasses of containers are never cached, since contents vary.
+        return is_casadi_type(list(array_like), recursive=recursive)
+
+    result = isinstance(array_like, _casadi_types)
+    _is_casadi_type_lookup[t] = result
+    return result
 
 
 def is_iterable(x):
@@ -1,4 +1,5 @@
 from aerosandbox.numpy.array import array, length
+from aerosandbox.numpy.sparse_operators import SparseOperator
 import numpy as _onp
 
 
@@ -97,3 +98,88 @@ def finite_difference_coefficients(
     coefficients = array([*coefficients_object_array])  # Reconstructs using aerosandbox.numpy to intelligently type
 
     return coefficients
+
+
+def finite_difference_matrix(
+        x: _onp.ndarray,
+        derivative_degree: int = 1,
+        order_of_accuracy: int = 2,
+        stencil: str = "central",
+) -> SparseOperator:
+    """
+    Computes a sparse (banded) matrix that approximates a derivative of a function sampled on a 1D grid with
+    arbitrary spacing.
+
+    If `f` is sampled at the points `x`, then the derivative of `f` at each of the points `x` is approximately:
+
+        D @ f
+
+    where `D` is the matrix returned here. Since `D` is a SparseOperator, it can be computed once for a grid and then
+    applied to both NumPy and CasADi vectors.
+
+    Each row uses the finite difference coefficients (see `finite_difference_coefficients()`) on a stencil of
+    `derivative_degree + order_of_accuracy` adjacent points, placed according to `stencil` where possible and
+    one-sided near the ends of the grid. The derivative is exact for polynomials of degree below the stencil size.
+
+    Args:
+
+        x: The grid points. A 1D array of length N, which should be monotonically increasing. Must be numeric.
+
+        derivative_degree: The degree of the derivative to approximate (e.g., 1 for the first derivative).
+
+        order_of_accuracy: The (minimum) order of accuracy of the approximation. The stencil size is reduced if the
+        grid has too few points.
+
+        stencil: Where each point's stencil is placed, relative to the point. One of:
+
+            * "central" - centered on the point (biased forward by one point, if the stencil size is even).
+
+            * "forward" - starting at the point, and extending forward.
+
+            * "backward" - ending at the point, and extending backward.
+
+    Returns: A SparseOperator of shape (N, N).
+
+    """
+    x = _onp.array(x, dtype=float).reshape(-1)
+    N = length(x)
+
+    if derivative_degree < 1:
+        raise ValueError("The parameter derivative_degree must be an integer >= 1.")
+    if order_of_accuracy < 1:
+        raise ValueError("The parameter order_of_accuracy must be an integer >= 1.")
+    if N < derivative_degree + 1:
+        raise ValueError("You need to provide at least (derivative_degree+1) grid points in the x vector.")
+
+    stencil_size = min(derivative_degree + order_of_accuracy, N)
+
+    if stencil == "central":
+        stencil_offset = (stencil_size - 1) // 2
+    elif stencil == "forward":
+        stencil_offset = 0
+    elif stencil == "backward":
+        stencil_offset = stencil_size - 1
+    else:
+        raise ValueError("Bad value of `stencil`!")
+
+    ### Find the stencil used at each point; `stencil_indices` has shape (stencil_size, N).
+    stencil_starts = _onp.clip(
+        _onp.arange(N) - stencil_offset,
+        0,
+        N - stencil_size
+    )
+    stencil_indices = stencil_starts + _onp.arange(stencil_size).reshape((-1, 1))
+
+    ### Compute the coefficients for all points at once (the algorithm vectorizes over columns of `x`).
+    coefficients = finite_difference_coefficients(
+        x=x[stencil_indices],
+        x0=x,
+        derivative_degree=derivative_degree,
+    )
+
+    return SparseOperator(
+        rows=_onp.broadcast_to(_onp.arange(N), stencil_indices.shape),
+        cols=stencil_indices,
+        values=coefficients,
+        shape=(N, N),
+    )
@@ -1,3 +1,336 @@
-# A mirror scipy.integrate
+import numpy as _onp
+from aerosandbox.numpy.array import length
+from aerosandbox.numpy.calculus import diff
+from aerosandbox.numpy.sparse_operators import SparseOperator
 
-# TODO
+
+### Quadrature rules on the unit interval, as (weight of each endpoint, interior nodes, interior weights). Values at the
+### interior nodes are found by local cubic interpolation.
+_interval_quadrature_rules = {
+    "simpson"       : (1 / 6, [1 / 2], [4 / 6]),
+    "simpson_3/8"   : (1 / 8, [1 / 3, 2 / 3], [3 / 8, 3 / 8]),
+    "gauss_legendre": (0, [1 / 2 - 3 ** 0.5 / 6, 1 / 2 + 3 ** 0.5 / 6], [1 / 2, 1 / 2]),
+}
+
+
+def _interval_stencil_weights(
+        x,
+        method: str,
+):
+    """
+    For one of the `_interval_quadrature_rules`, computes the weight with which each sample on an interval's
+    interpolation stencil contributes to the integral over that interval. Shared by `integrate_discrete_intervals()`
+    and `integration_matrix()`, so that both give the same result.
+
+    Args:
+
+        x: The grid points. A 1D array-like of length N (N >= 2); may be NumPy or CasADi.
+
+        method: A key of `_interval_quadrature_rules`.
+
+    Returns: A tuple of (stencil_indices, stencil_weights), where:
+
+        * stencil_indices is an integer NumPy array of shape (stencil_size, N-1).
+
+        * stencil_weights is a list of `stencil_size` vectors of length N-1 (of the same type as `x`).
+
+        The integral over the i-th interval is then `sum(stencil_weights[k][i] * f[stencil_indices[k, i]])`, summed
+        over k.
+
+    """
+    N = length(x)
+    dx = diff(x)
+    intervals = _onp.arange(N - 1)
+    endpoint_weight, interior_nodes, interior_weights = _interval_quadrature_rules[method]
+
+    ### Find the stencil used to interpolate on each interval.
+    stencil_size = min(4, N)
+    stencil_starts = _onp.clip(
+        intervals - 1,
+        0,
+        N - stencil_size
+    )
+    stencil_indices = stencil_starts + _onp.arange(stencil_size).reshape((-1, 1))
+    x_stencil = [x[list(indices)] for indices in stencil_indices]
+
+    stencil_weights = []
+    for k in range(stencil_size):
+        is_endpoint = (stencil_indices[k] == intervals) | (stencil_indices[k] == intervals + 1)
+        weight_k = dx * (endpoint_weight * is_endpoint)
+
+        for node, weight in zip(interior_nodes, interior_weights):
+            x_query = x[:-1] + node * dx
+
+            # Evaluate the k-th Lagrange basis polynomial on the stencil at the query points.
+            basis = 1
+            for j in range(stencil_size):
+                if j == k:
+                    continue
+                basis = basis * (x_query - x_stencil[j]) / (x_stencil[k] - x_stencil[j])
+
+            weight_k = weight_k + weight * basis * dx
+
+        stencil_weights.append(weight_k)
+
+    return stencil_indices, stencil_weights
+
+
+def integrate_discrete_intervals(
+        f,
+        x=None,
+        method: str = "trapezoidal",
+):
+    """
+    Given a function `f` sampled at discrete points `x`, computes the integral of `f` over each of the intervals
+    between adjacent points. Returns a vector of length N-1, where N is the number of points; the i-th element is
+    the integral of `f` from x[i] to x[i+1].
+
+    All of the higher-order methods here are "local": they reconstruct `f` on each interval using only the few
+    nearest sample points, so the result is banded (and sparse in CasADi graphs).
+
+    Works with both NumPy and CasADi types, for both `f` and `x`.
+
+    Args:
+
+        f: The function values at each of the sample points. A 1D array-like of length N.
+
+        x: The locations of each of the sample points. A 1D array-like of length N, which should be monotonically
+        increasing. If not provided, defaults to unit spacing (i.e., `x = [0, 1, 2, ...]`).
+
+        method: The integration method to use. Options are:
+
+            * "forward_euler" - uses the value at the left end of each interval. First-order accurate.
+
+            * "backward_euler" - uses the value at the right end of each interval. First-order accurate.
+
+            * "trapezoidal" (or "trapezoid", "midpoint") - averages the values at both ends of each interval.
+            Second-order accurate.
+
+            * "simpson" - Simpson's rule on each interval. The value of `f` at the midpoint of the interval is found
+            by interpolating a cubic through the four nearest points (the two endpoints of the interval, plus one
+            more point on each side). Fourth-order accurate; exact for cubic `f`.
+
+            * "simpson_3/8" - Simpson's 3/8 rule on each interval, with the values at the 1/3 and 2/3 points of
+            the interval found by the same cubic interpolation. Fourth-order accurate; exact for cubic `f`.
+
+            * "gauss_legendre" - Two-point Gauss-Legendre quadrature on each interval, with the values at the Gauss
+            points found by the same cubic interpolation. Fourth-order accurate; exact for cubic `f`.
+
+            For the higher-order methods, intervals at the ends of the domain use a one-sided stencil. If fewer than
+            four points are given, the order of the interpolant is reduced accordingly.
+
+    Returns: A vector of length N-1, with the integral of `f` over each interval.
+
+    """
+    N = length(f)
+
+    if x is None:
+        x = _onp.arange(N)
+
+    if not length(x) == N:
+        raise ValueError("The inputs `f` and `x` must be vectors of the same length!")
+
+    dx = diff(x)
+
+    method = method.lower().replace(" ", "_")
+
+    if method in ["forward_euler", "forward", "forwards"]:
+        return f[:-1] * dx
+
+    elif method in ["backward_euler", "backward", "backwards"]:
+        return f[1:] * dx
+
+    elif method in ["trapezoidal", "trapezoid", "midpoint"]:
+        return (f[:-1] + f[1:]) / 2 * dx
+
+    elif method in _interval_quadrature_rules:
+        stencil_indices, stencil_weights = _interval_stencil_weights(x, method)
+
+        integral = 0
+        for indices, weights in zip(stencil_indices, stencil_weights):
+            integral = integral + f[list(indices)] * weights
+
+        return integral
+
+    else:
+        raise ValueError("Bad value of `method`!")
+
+
+def lagrange_integration_matrix(
+        x,
+        collocation_indices=None,
+) -> _onp.ndarray:
+    """
+    Computes the matrix that integrates a global Lagrange interpolating polynomial over each interval of a grid.
+
+    Specifically, if `f` is sampled at the points `x[collocation_indices]`, then the integral of the (unique)
+    polynomial interpolant of `f` from x[i] to x[i+1] is:
+
+        (W @ f)[i]
+
+    where `W` is the matrix returned here. This is the building block of pseudospectral (global polynomial)
+    collocation methods, such as Legendre-Gauss-Radau collocation.
+
+    Args:
+
+        x: The grid points. A 1D NumPy array of length N. Must be numeric.
+
+        collocation_indices: The indices of the grid points at which `f` is sampled. Defaults to all grid points.
+
+    Returns: A 2D NumPy array of shape (N-1, len(collocation_indices)).
+
+    """
+    x = _onp.array(x, dtype=float).reshape(-1)
+
+    if collocation_indices is None:
+        collocation_indices = _onp.arange(length(x))
+
+    x_colloc = x[collocation_indices]
+    n_colloc = length(x_colloc)
+
+    ### Normalize to [-1, 1] for conditioning
+    center = (x[0] + x[-1]) / 2
+    half_width = (x[-1] - x[0]) / 2
+    t = (x - center) / half_width
+    t_colloc = (x_colloc - center) / half_width
+
+    W = _onp.zeros((length(x) - 1, n_colloc))
+
+    for j in range(n_colloc):
+        others = _onp.delete(t_colloc, j)
+        basis = _onp.polynomial.Polynomial.fromroots(others) / _onp.prod(t_colloc[j] - others)
+        antiderivative = basis.integ()(t)
+        W[:, j] = _onp.diff(antiderivative) * half_width
+
+    return W
+
+
+def integration_matrix(
+        x,
+        method: str = "trapezoidal",
+) -> SparseOperator:
+    """
+    Computes a sparse (banded) matrix that integrates a function sampled on a 1D grid over each interval of the grid.
+
+    If `f` is sampled at the points `x`, then:
+
+        W @ f
+
+    is equivalent to `integrate_discrete_intervals(f, x, method)`, where `W` is the matrix returned here. Since `W` is
+    a SparseOperator, it can be computed once for a grid and then applied to both NumPy and CasADi vectors as a
+    single sparse product.
+
+    Args:
+
+        x: The grid points. A 1D array of length N, which should be monotonically increasing. Must be numeric.
+
+        method: The integration method to use. Same options as in `integrate_discrete_intervals()`: "forward_euler",
+        "backward_euler", "trapezoidal", "simpson", "simpson_3/8", or "gauss_legendre".
+
+    Returns: A SparseOperator of shape (N-1, N).
+
+    """
+    x = _onp.array(x, dtype=float).reshape(-1)
+    N = length(x)
+
+    if N < 2:
+        raise ValueError("You need to provide at least two grid points in the x vector.")
+
+    dx = _onp.diff(x)
+    intervals = _onp.arange(N - 1)
+
+    method = method.lower().replace(" ", "_")
+
+    if method in ["forward_euler", "forward", "forwards"]:
+        rows = intervals
+        cols = intervals
+        values = dx
+
+    elif method in ["backward_euler", "backward", "backwards"]:
+        rows = intervals
+        cols = intervals + 1
+        values = dx
+
+    elif method in ["trapezoidal", "trapezoid", "midpoint"]:
+        rows = [intervals, intervals]
+        cols = [intervals, intervals + 1]
+        values = [dx / 2, dx / 2]
+
+    elif method in _interval_quadrature_rules:
+        stencil_indices, stencil_weights = _interval_stencil_weights(x, method)
+
+        rows = [intervals] * len(stencil_indices)
+        cols = list(stencil_indices)
+        values = stencil_weights
+
+    else:
+        raise ValueError("Bad value of `method`!")
+
+    return SparseOperator(
+        rows=_onp.concatenate(rows, axis=None),
+        cols=_onp.concatenate(cols, axis=None),
+        values=_onp.concatenate(values, axis=None),
+        shape=(N - 1, N),
+    )
+
+
+def cumulative_integration_matrix(
+        x,
+        method: str = "trapezoidal",
+) -> SparseOperator:
+    """
+    Computes a matrix that gives the cumulative integral of a function sampled on a 1D grid.
+
+    If `f` is sampled at the points `x`, then the integral of `f` from x[0] to x[i] is approximately:
+
+        (C @ f)[i]
+
+    where `C` is the matrix returned here. (So, `(C @ f)[0]` is always zero.)
+
+    Note that `C` is lower-triangular, so it has O(N^2) nonzeros. For long grids in optimization problems, it is
+    usually cheaper to impose the equivalent constraint `np.diff(F) == integration_matrix(x, method) @ f` on a
+    cumulative-integral variable `F`, which only uses banded operators.
+
+    Args:
+
+        x: The grid points. A 1D array of length N, which should be monotonically increasing. Must be numeric.
+
+        method: The integration method to use. Same options as in `integration_matrix()`.
+
+    Returns: A SparseOperator of shape (N, N).
+
+    """
+    W = integration_matrix(x, method=method)
+    N = W.shape[1]
+
+    ### The cumulative sum of the interval integrals: row i sums intervals 0 through i-1.
+    rows, cols = _onp.tril_indices(N, k=-1)
+    cumulative_sum = SparseOperator(
+        rows=rows,
+        cols=cols,
+        values=_onp.ones_like(rows, dtype=float),
+        shape=(N, N - 1),
+    )
+
+    return cumulative_sum @ W
+
+
+def quadrature_weights(
+        x,
+        method: str = "trapezoidal",
+) -> _onp.ndarray:
+    """
+    Computes the weights of a quadrature rule over a 1D grid, so that the integral of `f` from x[0] to x[-1] is
+    approximately `np.sum(weights * f)` (or `np.dot(weights, f)`).
+
+    Args:
+
+        x: The grid points. A 1D array of length N, which should be monotonically increasing. Must be numeric.
+
+        method: The integration method to use. Same options as in `integration_matrix()`.
+
+    Returns: A 1D NumPy array of length N, with the weight of each grid point.
+
+    """
+    W = integration_matrix(x, method=method)
+    return _onp.ones(W.shape[0]) @ W
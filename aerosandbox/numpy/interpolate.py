@@ -1,11 +1,14 @@
 import numpy as _onp
 import casadi as _cas
 from aerosandbox.numpy.determine_type import is_casadi_type
-from aerosandbox.numpy.array import array, zeros_like
+from aerosandbox.numpy.array import array
 from aerosandbox.numpy.conditionals import where
 from aerosandbox.numpy.logicals import all, any, logical_or
 from typing import Tuple
-from scipy import interpolate as _interpolate
+import hashlib as _hashlib
+
+_casadi_interpolant_cache = {}  # Memo of CasADi interpolants, keyed by a hash of their dataset and method.
+_casadi_interpolant_cache_max_size = 64
 
 
 def interp(x, xp, fp, left=None, right=None, period=None):
@@ -120,13 +123,84 @@ def is_data_structured(
     return True
 
 
+def _get_casadi_interpolant(
+        points: Tuple[_onp.ndarray],
+        values: _onp.ndarray,
+        method: str = "bspline",
+        use_cache: bool = True,
+) -> _cas.Function:
+    """
+    Returns a CasADi interpolant Function for the given structured dataset, mapping an (n_dimensions, n_points)
+    input to an (n_outputs, n_points) output.
+
+    Building a CasADi interpolant is expensive (for "bspline", it involves fitting the spline coefficients), and each
+    one that is built adds a new, separate Function to any symbolic graph it's used in. So, by default, interpolants
+    are memoized by a hash of (points, values, method), and identical datasets share a single interpolant.
+
+    Args:
+        points: The points defining the regular grid in n dimensions. Tuple of coordinates of each axis.
+
+        values: The data on the regular grid in n dimensions. Shape (m1, ..., mn), or (m1, ..., mn, n_outputs) for
+        several output fields on the same grid.
+
+        method: The CasADi interpolation method; either "linear" or "bspline".
+
+        use_cache: If True, looks up (and stores) the interpolant in the memo.
+
+    Returns: A CasADi Function.
+
+    """
+    points = [_onp.asarray(points_axis, dtype=float) for points_axis in points]
+    values = _onp.asarray(values, dtype=float)
+
+    if use_cache:
+        hasher = _hashlib.blake2b(method.encode(), digest_size=20)
+        for array_to_hash in [*points, values]:
+            hasher.update(str(array_to_hash.shape).encode())
+            hasher.update(_onp.ascontiguousarray(array_to_hash).tobytes())
+        key = hasher.digest()
+
+        try:
+            return _casadi_interpolant_cache[key]
+        except KeyError:
+            pass
+
+    if len(values.shape) == len(points):
+        interpolant = _cas.interpolant(
+            'Interpolator',
+            method,
+            points,
+            _onp.ravel(values, order='F')
+        )
+    else:
+        n_outputs = values.shape[-1]
+        interpolant = _cas.interpolant(
+            'Interpolator',
+            method,
+            points,
+            # CasADi expects the grid flattened in column-major order, with the output index varying fastest.
+            _onp.ravel(_onp.reshape(values, (-1, n_outputs), order='F'), order='C'),
+            # A sparse direct solve for the B-spline coefficients; for multi-dimensional, multi-output data, this is an
+            # order of magnitude faster to build than the default iterative solver.
+            {"linear_solver": "csparse"} if method == "bspline" else {}
+        )
+
+    if use_cache:
+        if len(_casadi_interpolant_cache) >= _casadi_interpolant_cache_max_size:
+            del _casadi_interpolant_cache[next(iter(_casadi_interpolant_cache))]  # Evict the oldest entry
+        _casadi_interpolant_cache[key] = interpolant
+
+    return interpolant
+
+
 def interpn(
         points: Tuple[_onp.ndarray],
         values: _onp.ndarray,
         xi: _onp.ndarray,
         method: str = "linear",
         bounds_error=True,
-        fill_value=_onp.nan
+        fill_value=_onp.nan,
+        interpolant: _cas.Function = None,
 ) -> _onp.ndarray:
     """
     Performs multidimensional interpolation on regular grids. Analogue to scipy.interpolate.interpn().
@@ -138,7 +212,9 @@ def interpn(
         points: The points defining the regular grid in n dimensions. Tuple of coordinates of each axis. Shapes (m1,
         ), ..., (mn,)
 
-        values: The data on the regular grid in n dimensions. Shape (m1, ..., mn)
+        values: The data on the regular grid in n dimensions. Shape (m1, ..., mn). To interpolate several output
+        fields that are defined on the same grid at once, stack them along a trailing axis: shape (m1, ..., mn,
+        n_outputs).
 
         xi: The coordinates to sample the gridded data at. (..., ndim)
 
@@ -158,7 +234,15 @@ def interpn(
         fill_value: If provided, the value to use for points outside of the interpolation domain. If None,
         values outside the domain are extrapolated.
 
-    Returns: Interpolated values at input coordinates.
+        interpolant: [Optional] A prebuilt CasADi interpolant of this dataset and method (see
+        `_get_casadi_interpolant()`), to be used instead of looking one up. Only used by the CasADi implementation.
+
+            If not provided, CasADi interpolants are memoized by a hash of (points, values, method), so repeated
+            calls on the same dataset reuse a single CasADi Function rather than adding a new one to the graph each
+            time.
+
+    Returns: Interpolated values at input coordinates. If `values` has a trailing output axis, the result has
+    shape (n_points, n_outputs).
 
     """
     ### Check input types for points and values
@@ -173,16 +257,21 @@ def interpn(
 
     ### Check dimensions of values
     implied_values_shape = tuple(len(points_axis) for points_axis in points)
-    if not values.shape == implied_values_shape:
+    if not values.shape[:len(implied_values_shape)] == implied_values_shape or not (
+            len(implied_values_shape) <= len(values.shape) <= len(implied_values_shape) + 1
+    ):
         raise ValueError(f"""
-        The shape of `values` should be {implied_values_shape}. 
+        The shape of `values` should be {implied_values_shape} (or {implied_values_shape + ('n_outputs',)}). 
         """)
+    is_multi_output = len(values.shape) > len(implied_values_shape)
 
     if (  ### NumPy implementation
             not is_casadi_type([points, values, xi], recursive=True)
     ) and (
             (method == "linear") or (method == "nearest")
     ):
+        from scipy import interpolate as _interpolate
+
         xi = _onp.array(xi).reshape((-1, len(implied_values_shape)))
         return _interpolate.interpn(
             points=points,
@@ -196,11 +285,6 @@ def interpn(
     elif (  ### CasADi implementation
             (method == "linear") or (method == "bspline")
     ):
-        ### Add handling to patch a specific bug in CasADi that occurs when `values` is all zeros.
-        ### For more information, see: https://github.com/casadi/casadi/issues/2837
-        if method == "bspline" and all(values == 0):
-            return zeros_like(xi)
-
         ### If xi is an int or float, promote it to an array
         if isinstance(xi, int) or isinstance(xi, float):
             xi = array([xi])
@@ -265,15 +349,19 @@ def interpn(
                     )
 
         ### Do the interpolation
-        values_flattened = _onp.ravel(values, order='F')
-        interpolator = _cas.interpolant(
-            'Interpolator',
-            method,
-            points,
-            values_flattened
-        )
+        if method == "bspline" and all(values == 0):
+            ### Add handling to patch a specific bug in CasADi that occurs when `values` is all zeros.
+            ### For more information, see: https://github.com/casadi/casadi/issues/2837
+            fi = _cas.DM.zeros(xi.shape[0], values.shape[-1] if is_multi_output else 1)
+        else:
+            if interpolant is None:
+                interpolant = _get_casadi_interpolant(
+                    points=points,
+                    values=values,
+                    method=method,
+                )
 
-        fi = interpolator(xi.T).T
+            fi = interpolant(xi.T).T  # Shape: (n_points, n_outputs)
 
         ### If fill_value is a scalar, replace all out-of-bounds xi with that value.
         if fill_value is not None:
@@ -292,7 +380,9 @@ def interpn(
 
         ### If DM output (i.e. a numeric value), convert that back to an array
         if isinstance(fi, _cas.DM):
-            if fi.shape == (1, 1):
+            if is_multi_output:
+                return _onp.array(fi, dtype=float)
+            elif fi.shape == (1, 1):
                 return float(fi)
             else:
                 return _onp.array(fi, dtype=float).reshape(-1)
@@ -120,3 +120,38 @@ def geomspace(
         if start <= 0 or stop <= 0:
             raise ValueError("Both start and stop must be positive!")
         return _onp.log10(10 ** linspace(start, stop, num))
+
+
+def radauspace(
+        start: float = 0.,
+        stop: float = 1.,
+        num: int = 50,
+):
+    """
+    Makes a vector of Legendre-Gauss-Radau (LGR) points, plus the endpoint `stop`.
+
+    The first `num - 1` points are the LGR points mapped to the interval [start, stop) (these include `start`, but not
+    `stop`); the last point is `stop` itself. Points are bunched near both ends of the interval.
+
+    This is the grid to use with pseudospectral Radau collocation; see `Opti.constrain_derivative(method="radau")`.
+
+    To learn more about LGR points: https://mathworld.wolfram.com/RadauQuadrature.html
+
+    Args:
+        start: Value to start at.
+        stop: Value to end at.
+        num: Number of points in the vector. Must be at least 2.
+    """
+    if num < 2:
+        raise ValueError("`num` must be at least 2.")
+
+    n_collocation = num - 1
+
+    # The LGR points are the roots of P_{n-1}(t) + P_n(t), where P_n is the n-th Legendre polynomial.
+    coefficients = _onp.zeros(n_collocation + 1)
+    coefficients[-2:] = 1
+    tau = _onp.sort(_onp.real(_onp.polynomial.legendre.legroots(coefficients)))
+    tau[0] = -1  # Clean up floating-point error on the fixed endpoint
+    tau = _onp.concatenate([tau, [1]])
+
+    return start + (stop - start) * (tau + 1) / 2
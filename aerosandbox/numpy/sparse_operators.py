@@ -0,0 +1,172 @@
+import numpy as _onp
+import casadi as _cas
+from aerosandbox.numpy.determine_type import is_casadi_type
+
+
+class SparseOperator:
+    """
+    A sparse linear operator (i.e., a sparse matrix), which can be applied to both NumPy and CasADi arrays.
+
+    Intended for operators that are precomputed once for a given grid and then applied many times, such as
+    finite-difference and integration matrices. The matrix is applied with a single sparse matrix product; for CasADi
+    inputs, the sparsity pattern is preserved in the computational graph, which keeps both the graph and the
+    Jacobians assembled from it small.
+
+    Usage:
+
+        >>> D = np.finite_difference_matrix(x)  # A SparseOperator
+        >>> dfdx = D @ f  # `f` may be a NumPy array or a CasADi vector
+
+    Operators can also be composed (`D @ D`), transposed (`D.T`), and converted to other formats (`D.toarray()`,
+    `D.to_scipy()`, `D.to_casadi()`).
+    """
+
+    __array_ufunc__ = None  # Makes NumPy defer to this class for `ndarray @ SparseOperator`.
+
+    def __init__(self,
+                 rows,
+                 cols,
+                 values,
+                 shape,
+                 ):
+        """
+        Initializes a new SparseOperator from its nonzero entries, in coordinate (triplet) form.
+
+        Duplicate (row, column) entries are summed.
+
+        Args:
+
+            rows: The row index of each entry. A 1D array of integers.
+
+            cols: The column index of each entry. A 1D array of integers, of the same length as `rows`.
+
+            values: The value of each entry. A 1D array of floats, of the same length as `rows`.
+
+            shape: The shape of the matrix, as a tuple (n_rows, n_cols).
+
+        """
+        from scipy import sparse as _sparse
+
+        self._matrix = _sparse.csr_matrix(
+            (
+                _onp.reshape(_onp.array(values, dtype=float), -1),
+                (
+                    _onp.reshape(_onp.array(rows, dtype=int), -1),
+                    _onp.reshape(_onp.array(cols, dtype=int), -1),
+                )
+            ),
+            shape=tuple(shape),
+        )
+        self._matrix.sum_duplicates()
+        self._matrix.eliminate_zeros()
+        self._casadi_matrix = None
+
+    @classmethod
+    def from_scipy(cls, matrix) -> "SparseOperator":
+        """
+        Creates a SparseOperator from a SciPy sparse matrix (or a dense 2D array).
+        """
+        from scipy import sparse as _sparse
+
+        matrix = _sparse.coo_matrix(matrix)
+        return cls(
+            rows=matrix.row,
+            cols=matrix.col,
+            values=matrix.data,
+            shape=matrix.shape,
+        )
+
+    def __repr__(self) -> str:
+        return f"SparseOperator (shape: {self.shape}, nonzeros: {self.nnz})"
+
+    @property
+    def shape(self):
+        return self._matrix.shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        The number of (structurally) nonzero entries.
+        """
+        return self._matrix.nnz
+
+    @property
+    def T(self) -> "SparseOperator":
+        return self.from_scipy(self._matrix.T)
+
+    def toarray(self) -> _onp.ndarray:
+        """
+        Returns the operator as a dense 2D NumPy array.
+        """
+        return self._matrix.toarray()
+
+    def to_scipy(self):
+        """
+        Returns the operator as a SciPy CSR matrix. (A copy; modifying it does not modify this operator.)
+        """
+        return self._matrix.copy()
+
+    def to_casadi(self) -> _cas.DM:
+        """
+        Returns the operator as a sparse CasADi DM matrix. This is computed once and then cached.
+        """
+        if self._casadi_matrix is None:
+            matrix = self._matrix.tocoo()
+            self._casadi_matrix = _cas.DM.triplet(
+                matrix.row.tolist(),
+                matrix.col.tolist(),
+                matrix.data.tolist(),
+                matrix.shape[0],
+                matrix.shape[1],
+            )
+        return self._casadi_matrix
+
+    def __matmul__(self, other):
+        """
+        Applies the operator: computes `self @ other`.
+
+        Args:
+
+            other: A vector (of length `self.shape[1]`) or a 2D array (with `self.shape[1]` rows), either NumPy or
+            CasADi. May also be another SparseOperator, in which case the composed operator is returned.
+
+        Returns: The product. NumPy inputs give NumPy outputs of the same dimensionality; CasADi inputs give CasADi
+        outputs.
+
+        """
+        if isinstance(other, SparseOperator):
+            return self.from_scipy(self._matrix @ other._matrix)
+
+        if is_casadi_type(other, recursive=False):
+            if other.shape[0] != self.shape[1] and other.shape[0] == 1:
+                other = other.T  # Treat row vectors as column vectors
+            return _cas.mtimes(self.to_casadi(), other)
+
+        if is_casadi_type(other, recursive=True):
+            return self.__matmul__(_cas.vertcat(*other))
+
+        return self._matrix @ _onp.asarray(other)
+
+    def __rmatmul__(self, other):
+        """
+        Computes `other @ self`, for a NumPy `other`. (For CasADi, use `(self.T @ other.T).T`.)
+        """
+        return _onp.asarray((self._matrix.T @ _onp.asarray(other).T).T)
+
+    def __mul__(self, other) -> "SparseOperator":
+        """
+        Scales the operator by a scalar.
+        """
+        return self.from_scipy(self._matrix * float(other))
+
+    def __rmul__(self, other) -> "SparseOperator":
+        return self.__mul__(other)
+
+    def __add__(self, other: "SparseOperator") -> "SparseOperator":
+        return self.from_scipy(self._matrix + other._matrix)
+
+    def __sub__(self, other: "SparseOperator") -> "SparseOperator":
+        return self.from_scipy(self._matrix - other._matrix)
+
+    def __neg__(self) -> "SparseOperator":
+        return self.__mul__(-1)
@@ -36,5 +36,23 @@ def test_cumsum():
     # )
 
 
+def test_add_multiply_broadcasting_casadi():
+    a = np.arange(6).reshape((3, 2))
+    row = np.array([[10, 20]])
+    col = np.array([[1], [2], [3]])
+
+    for x1, x2 in [
+        (a, a),
+        (a, 5),
+        (a, row),
+        (col, a),
+        (col, row),
+    ]:
+        for f in [np.add, np.multiply]:
+            expected = f(x1, x2)
+            assert np.all(cas.DM(f(cas.DM(x1), x2)) == expected)
+            assert np.all(cas.DM(f(x1, cas.DM(x2))) == expected)
+
+
 if __name__ == '__main__':
     pytest.main()
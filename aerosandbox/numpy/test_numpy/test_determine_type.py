@@ -86,5 +86,22 @@ def test_multi_level_contaminated_list():
     assert is_casadi_type(a, recursive=True) == False
 
 
+def test_type_lookup_is_not_poisoned():
+    class MyMX(cas.MX):
+        pass
+
+    class MyList(list):
+        pass
+
+    for _ in range(2):  # Once to populate the lookup table, once to read from it.
+        assert is_casadi_type(np.float64(1)) == False
+        assert is_casadi_type(MyMX(1)) == True
+        assert is_casadi_type(MyList([1, 2]), recursive=True) == False
+        assert is_casadi_type(MyList([1, cas.SX(2)]), recursive=True) == True
+        assert is_casadi_type(MyList([1, cas.SX(2)]), recursive=False) == False
+        assert is_casadi_type((cas.DM(1),), recursive=True) == True
+        assert is_casadi_type((), recursive=True) == False
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,37 @@
+import aerosandbox.numpy as np
+import numpy as onp
+import pytest
+
+"""
+Benchmarks the overhead of the type dispatch in aerosandbox.numpy (i.e., deciding whether to call NumPy or CasADi),
+relative to calling NumPy directly, for purely numeric inputs.
+
+The tests here only check that each dispatched call gives the same result as the raw NumPy call; timings are not
+asserted, as they depend on the machine. Run this file directly to print a table of timings.
+"""
+
+a = onp.linspace(0, 1, 5)
+
+benchmarks = {  # Name: (aerosandbox.numpy call, raw NumPy call)
+    "add(float, float)"     : (lambda: np.add(1., 2.), lambda: onp.add(1., 2.)),
+    "add(array, array)"     : (lambda: np.add(a, a), lambda: onp.add(a, a)),
+    "multiply(array, float)": (lambda: np.multiply(a, 2.), lambda: onp.multiply(a, 2.)),
+    "where"                 : (lambda: np.where(a > 0.5, a, 0.), lambda: onp.where(a > 0.5, a, 0.)),
+    "concatenate"           : (lambda: np.concatenate([a, a]), lambda: onp.concatenate([a, a])),
+    "length"                : (lambda: np.length(a), lambda: len(a)),
+    "interp"                : (lambda: np.interp(0.5, a, a), lambda: onp.interp(0.5, a, a)),
+}
+
+
+@pytest.mark.parametrize("name", benchmarks.keys())
+def test_dispatch_matches_numpy(name):
+    wrapped, raw = benchmarks[name]
+    result = wrapped()
+    assert type(result) is type(raw())
+    assert result == pytest.approx(raw())
+
+
+if __name__ == '__main__':
+    from aerosandbox.tools.code_benchmarking import print_timing_comparison
+
+    print_timing_comparison(benchmarks, labels=("asb.numpy", "NumPy"))
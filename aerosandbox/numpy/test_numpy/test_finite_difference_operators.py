@@ -1,6 +1,7 @@
 import pytest
 import aerosandbox as asb
 import aerosandbox.numpy as np
+import casadi as cas
 
 
 def test_uniform_forward_difference_first_degree():
@@ -99,5 +100,58 @@ def test_nonuniform_difference():
     )
 
 
+def test_finite_difference_matrix_exact_for_polynomials():
+    x = np.sinspace(0, 3, 30) ** 1.2  # Nonuniform
+    f = x ** 3 - 2 * x ** 2 + 1
+
+    for derivative_degree, expected in [
+        (1, 3 * x ** 2 - 4 * x),
+        (2, 6 * x - 4),
+        (3, 6 * np.ones_like(x)),
+    ]:
+        D = np.finite_difference_matrix(  # A 4-point stencil is exact for cubics
+            x,
+            derivative_degree=derivative_degree,
+            order_of_accuracy=4 - derivative_degree,
+        )
+        assert D.shape == (30, 30)
+        assert D @ f == pytest.approx(expected)
+
+
+def test_finite_difference_matrix_order_of_accuracy():
+    def max_error(N, order_of_accuracy):
+        x = np.linspace(0, 1, N)
+        D = np.finite_difference_matrix(x, order_of_accuracy=order_of_accuracy)
+        return np.max(np.abs(D @ np.sin(3 * x) - 3 * np.cos(3 * x)))
+
+    for order_of_accuracy in [1, 2, 4]:
+        convergence_rate = np.log2(max_error(40, order_of_accuracy) / max_error(80, order_of_accuracy))
+        assert convergence_rate == pytest.approx(order_of_accuracy, abs=0.3)
+
+
+def test_finite_difference_matrix_one_sided_stencils():
+    x = np.array([0, 1, 3, 4, 7], dtype=float)
+    f = x ** 2
+
+    forward = np.finite_difference_matrix(x, order_of_accuracy=1, stencil="forward")
+    backward = np.finite_difference_matrix(x, order_of_accuracy=1, stencil="backward")
+
+    slopes = np.diff(f) / np.diff(x)
+    assert forward @ f == pytest.approx(np.concatenate([slopes, slopes[-1:]]))
+    assert backward @ f == pytest.approx(np.concatenate([slopes[:1], slopes]))
+
+
+def test_finite_difference_matrix_casadi():
+    x = np.linspace(0, 1, 500)
+    D = np.finite_difference_matrix(x, derivative_degree=2)
+
+    f_sym = cas.MX.sym("f", 500)
+    d2f = D @ f_sym
+    assert cas.jacobian(d2f, f_sym).nnz() == D.nnz  # Banded; sparsity is preserved in the graph
+
+    func = cas.Function("d2f", [f_sym], [d2f])
+    assert func(x ** 2).full().flatten() == pytest.approx(2 * np.ones(500))
+
+
 if __name__ == '__main__':
     pytest.main()
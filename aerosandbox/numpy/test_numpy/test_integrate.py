@@ -0,0 +1,76 @@
+import aerosandbox.numpy as np
+import casadi as cas
+import pytest
+
+
+def test_integrate_discrete_intervals_exact_for_cubics():
+    x = np.sinspace(0, 2, 8)
+    f = x ** 3 - 2 * x
+
+    exact = np.diff(x ** 4 / 4 - x ** 2)
+
+    for method in ["simpson", "simpson_3/8"]:
+        assert np.integrate_discrete_intervals(f, x, method=method) == pytest.approx(exact)
+
+
+def test_integrate_discrete_intervals_casadi():
+    x = np.linspace(0, 1, 6)
+    f_sym = cas.MX.sym("f", 6)
+
+    integral = np.integrate_discrete_intervals(f_sym, x, method="simpson")
+
+    func = cas.Function("integral", [f_sym], [integral])
+    assert func(x ** 2).full().flatten() == pytest.approx(np.diff(x ** 3 / 3))
+
+
+def test_lagrange_integration_matrix():
+    x = np.radauspace(0, 3, 7)
+    W = np.lagrange_integration_matrix(x, collocation_indices=np.arange(6))
+
+    f = np.cos(x[:-1])
+
+    assert np.sum(W @ f) == pytest.approx(np.sin(3), abs=1e-4)
+    assert W @ (x[:-1] ** 5) == pytest.approx(np.diff(x ** 6 / 6))
+
+
+methods = ["forward_euler", "backward_euler", "trapezoidal", "simpson", "simpson_3/8", "gauss_legendre"]
+
+
+@pytest.mark.parametrize("method", methods)
+def test_integration_matrix_matches_integrate_discrete_intervals(method):
+    x = np.sinspace(0, 2, 11) ** 1.5
+    f = np.exp(x) * np.cos(3 * x)
+
+    W = np.integration_matrix(x, method=method)
+    assert W.shape == (10, 11)
+    assert W @ f == pytest.approx(np.integrate_discrete_intervals(f, x, method=method))
+
+    f_sym = cas.MX.sym("f", 11)
+    func = cas.Function("integral", [f_sym], [W @ f_sym])
+    assert func(f).full().flatten() == pytest.approx(W @ f)
+
+
+def test_integration_matrix_exact_for_cubics():
+    x = np.sinspace(0, 2, 8)
+    f = x ** 3 - 2 * x
+    exact = np.diff(x ** 4 / 4 - x ** 2)
+
+    for method in ["simpson", "simpson_3/8", "gauss_legendre"]:
+        assert np.integration_matrix(x, method=method) @ f == pytest.approx(exact)
+        assert np.sum(np.quadrature_weights(x, method=method) * f) == pytest.approx(np.sum(exact))
+        assert np.cumulative_integration_matrix(x, method=method) @ f == pytest.approx(
+            np.concatenate([[0], np.cumsum(exact)])
+        )
+
+
+def test_integration_matrix_is_banded():
+    W = np.integration_matrix(np.linspace(0, 1, 1000), method="simpson")
+    assert W.nnz <= 4 * 999
+
+    f_sym = cas.MX.sym("f", 1000)
+    jacobian = cas.jacobian(W @ f_sym, f_sym)
+    assert jacobian.nnz() == W.nnz
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -204,6 +204,51 @@ def test_interpn_fill_value():
     assert value == pytest.approx(value_func_3d(5, 3.12, 1.15))
 
 
+def test_interpn_caches_casadi_interpolant():
+    from aerosandbox.numpy.interpolate import _get_casadi_interpolant
+
+    points = (np.linspace(0, 1, 5), np.linspace(0, 2, 7))
+    values = np.arange(35, dtype=float).reshape((5, 7))
+
+    interpolant = _get_casadi_interpolant(points, values, "bspline")
+    assert _get_casadi_interpolant(points, values.copy(), "bspline") is interpolant
+    assert _get_casadi_interpolant(points, values, "linear") is not interpolant
+    assert _get_casadi_interpolant(points, values + 1, "bspline") is not interpolant
+
+    assert np.interpn(
+        points, values, np.array([[0.5, 1]]), method="bspline"
+    ) == pytest.approx(
+        np.interpn(points, values, np.array([[0.5, 1]]), method="linear")
+    )
+
+
+
+@pytest.mark.parametrize("method", ["linear", "bspline"])
+def test_interpn_multi_output(method):
+    points = (np.linspace(0, 1, 5), np.linspace(0, 2, 7))
+    X1, X2 = np.meshgrid(*points, indexing="ij")
+    fields = [X1 ** 2 + X2, np.sin(X1 * X2), np.zeros_like(X1)]
+    values = np.stack(fields, axis=-1)
+    xi = np.array([[0.5, 1], [0.3, 1.7], [1.5, 1]])  # The last point is out of bounds
+
+    fi = np.interpn(points, values, xi, method=method, bounds_error=False)
+    assert fi.shape == (3, 3)
+    for i, field in enumerate(fields):
+        assert fi[:, i] == pytest.approx(
+            np.interpn(points, field, xi, method=method, bounds_error=False),
+            nan_ok=True
+        )
+    assert np.all(np.isnan(fi[2, :]))
+
+    ### Symbolic
+    x = cas.MX.sym("x", 3, 2)
+    fi_symbolic = np.interpn(points, values, x, method=method, bounds_error=False)
+    assert fi_symbolic.shape == (3, 3)
+    assert onp.array(
+        cas.Function("f", [x], [fi_symbolic])(xi)
+    ) == pytest.approx(fi, nan_ok=True)
+
+
 if __name__ == '__main__':
     test_interpn_fill_value()
     pytest.main()
@@ -1 +1,5 @@
 from aerosandbox.optimization.opti import *
+from aerosandbox.optimization.solve_report import *
+from aerosandbox.optimization.scaling import *
+from aerosandbox.optimization.multistart import *
+from aerosandbox.optimization.least_squares import *
@@ -0,0 +1,199 @@
+from typing import Callable, Tuple
+import numpy as np
+
+__all__ = ["solve_least_squares"]
+
+
+def solve_least_squares(
+        cost: Callable[[np.ndarray], np.ndarray],
+        normal_equations: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        x0: np.ndarray,
+        lower_bounds: np.ndarray = None,
+        upper_bounds: np.ndarray = None,
+        max_iter: int = 500,
+        cost_tolerance: float = 1e-15,
+        step_tolerance: float = 1e-12,
+        gradient_tolerance: float = 1e-10,
+        absolute_cost_tolerance: float = 0.,
+        verbose: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves many independent nonlinear least-squares problems at once, each of the form:
+
+        minimize sum(r(x) ** 2) over x, subject to lower_bounds <= x <= upper_bounds
+
+    with a Levenberg-Marquardt method. All problems are iterated together, so each iteration needs just one
+    (batched) evaluation of the cost and normal equations - which is efficient when these come from a mapped
+    CasADi Function. Problems that have converged are left unchanged in subsequent iterations.
+
+    The residuals are only accessed through the normal equations (J^T J and J^T r, where J is the Jacobian of r),
+    so these may be accumulated in pieces (e.g., batch-by-batch over a large dataset) by the caller.
+
+    Bounds are handled by projecting each trial point onto the feasible box, and holding fixed any unknowns that are
+    at a bound where the cost decreases outside of it.
+
+    Example:
+        >>> def cost(x):  # x has shape (n_problems, n_unknowns)
+        >>>     return np.sum(residuals(x) ** 2, axis=1)
+        >>>
+        >>> def normal_equations(x):
+        >>>     r = residuals(x)  # Shape: (n_problems, n_residuals)
+        >>>     J = jacobians(x)  # Shape: (n_problems, n_residuals, n_unknowns)
+        >>>     return np.sum(r ** 2, axis=1), np.einsum("nri,nrj->nij", J, J), np.einsum("nri,nr->ni", J, r)
+        >>>
+        >>> x, converged = solve_least_squares(cost, normal_equations, x0=np.zeros((10, 2)))
+
+    Args:
+
+        cost: A function that takes an array of unknowns of shape (n_problems, n_unknowns), and returns the cost of
+        each problem, sum(r ** 2), as an array of shape (n_problems,).
+
+        normal_equations: A function that takes an array of unknowns of shape (n_problems, n_unknowns), and returns a
+        tuple of (cost, J^T J, J^T r), with shapes (n_problems,), (n_problems, n_unknowns, n_unknowns),
+        and (n_problems, n_unknowns).
+
+        x0: The initial guess, of shape (n_problems, n_unknowns).
+
+        lower_bounds: [Optional] Lower bounds on the unknowns (use -np.inf for none). Broadcastable to the shape of
+        `x0`.
+
+        upper_bounds: [Optional] Upper bounds on the unknowns (use np.inf for none). Broadcastable to the shape of
+        `x0`.
+
+        max_iter: The maximum number of iterations.
+
+        cost_tolerance: A problem has converged when an accepted step decreases its cost by less than this fraction.
+
+        step_tolerance: A problem has converged when an accepted step changes every unknown by less than this
+        (relative) amount.
+
+        gradient_tolerance: A problem has converged when its residual vector is orthogonal to each (free) column of
+        its Jacobian, to within this tolerance on the cosine of the angle between them. (This is first-order
+        optimality, in a scale-invariant form; the same test as MINPACK's `gtol`.)
+
+        absolute_cost_tolerance: A problem has converged when its cost is at or below this value. Useful for
+        problems where the residuals are expected to go to zero (i.e., solving nonlinear equations).
+
+        verbose: Whether to print the progress of the solve.
+
+    Returns: A tuple of (x, converged), where:
+
+        * x is the solution, of shape (n_problems, n_unknowns). For problems that did not converge, this is the
+        best point found.
+
+        * converged is a boolean array of shape (n_problems,). A problem does not converge if `max_iter` is reached,
+        if its cost is not finite, or if no step can be found that decreases its cost at a point that is not a
+        minimum.
+
+    """
+    x = np.array(x0, dtype=float)
+    n_problems, n_unknowns = x.shape
+
+    if lower_bounds is None:
+        lower_bounds = -np.inf
+    if upper_bounds is None:
+        upper_bounds = np.inf
+    lower_bounds = np.broadcast_to(np.array(lower_bounds, dtype=float), x.shape)
+    upper_bounds = np.broadcast_to(np.array(upper_bounds, dtype=float), x.shape)
+
+    x = np.clip(x, lower_bounds, upper_bounds)
+    cost_x, JTJ, JTr = normal_equations(x)
+
+    converged = np.zeros(n_problems, dtype=bool)
+    active = np.isfinite(cost_x)  # Problems that are still being iterated on.
+    damping = 1e-3 * np.ones(n_problems)
+
+    if verbose:
+        print(f"{'iter':>6} {'cost':>14} {'damping':>10} {'active':>8}")
+
+    for iteration in range(max_iter):
+        ### Hold fixed any unknowns that are at a bound, where the cost decreases outside of the bound.
+        free = ~(
+                ((x <= lower_bounds) & (JTr > 0)) |
+                ((x >= upper_bounds) & (JTr < 0))
+        )
+        JTJ_diagonal = np.einsum("nii->ni", JTJ)
+
+        ### Check for convergence (by cost, or by first-order optimality)
+        converged_now = active & (
+                (cost_x <= absolute_cost_tolerance) |
+                np.all(
+                    ~free | (np.abs(JTr) <= gradient_tolerance * np.sqrt(JTJ_diagonal * cost_x[:, None])),
+                    axis=1
+                )
+        )
+        converged |= converged_now
+        active &= ~converged_now
+
+        if verbose:
+            print(
+                f"{iteration:6d} {np.sum(cost_x[active | converged]):14.8e} "
+                f"{np.max(damping[active], initial=0):10.2e} {np.sum(active):8d}"
+            )
+
+        if not np.any(active):
+            break
+
+        ### Find a step that decreases the cost of each active problem, increasing the damping until one is found.
+        scaling = np.fmax(JTJ_diagonal, 1e-12 * np.max(JTJ_diagonal, axis=1, keepdims=True) + 1e-300)
+        free_pairs = free[:, :, None] & free[:, None, :]
+        identity = np.eye(n_unknowns)
+
+        searching = active.copy()
+        accepted = np.zeros(n_problems, dtype=bool)
+        x_new = x.copy()
+        cost_new = cost_x.copy()
+
+        while np.any(searching):
+            # Solve the damped normal equations for the free unknowns; fixed unknowns get a zero step.
+            damped_JTJ = np.where(
+                free_pairs,
+                JTJ + damping[:, None, None] * scaling[:, :, None] * identity,
+                identity,
+            )
+            rhs = np.where(free, -JTr, 0)
+            try:
+                step = np.linalg.solve(damped_JTJ, rhs[:, :, None])[:, :, 0]
+            except np.linalg.LinAlgError:
+                step = np.stack([
+                    np.linalg.lstsq(damped_JTJ[i], rhs[i], rcond=None)[0]
+                    for i in range(n_problems)
+                ], axis=0)
+
+            x_trial = np.where(
+                searching[:, None],
+                np.clip(x + step, lower_bounds, upper_bounds),
+                x_new,
+            )
+            cost_trial = cost(x_trial)
+
+            decreased = searching & np.isfinite(cost_trial) & (cost_trial < cost_x)
+            x_new[decreased] = x_trial[decreased]
+            cost_new[decreased] = cost_trial[decreased]
+            accepted |= decreased
+            searching &= ~decreased
+
+            damping = np.where(searching, damping * 10, damping)
+            stalled = searching & (damping > 1e16)  # No step decreases the cost, though this isn't a minimum.
+            active &= ~stalled
+            searching &= ~stalled
+
+        ### Accept the steps, and check for convergence
+        step = x_new - x
+        converged_now = accepted & (
+                (cost_x - cost_new <= cost_tolerance * cost_x) |
+                np.all(np.abs(step) <= step_tolerance * (np.abs(x_new) + step_tolerance), axis=1)
+        )
+        converged |= converged_now
+        active &= ~converged_now
+
+        x = x_new
+        damping = np.where(accepted, np.fmax(damping / 10, 1e-12), damping)
+
+        if not np.any(active):
+            cost_x = cost_new
+            break
+
+        cost_x, JTJ, JTr = normal_equations(x)
+
+    return x, converged
@@ -0,0 +1,215 @@
+from typing import Dict, Any, List
+import casadi as cas
+import aerosandbox.numpy as np
+
+__all__ = ["MultiStartSolution", "sample_initial_guesses", "deduplicate_solutions"]
+
+_solver_cache = {}  # Per-process cache of NLP solvers, keyed by their serialized problem and options
+
+
+class MultiStartSolution:
+    """
+    One distinct locally-optimal solution found by `Opti.solve_multistart()`.
+
+    Attributes:
+
+        x: The values of the decision variables (in the same order as `Opti.x`).
+
+        lam_g: The values of the constraint dual variables (in the same order as `Opti.g`).
+
+        objective: The value of the objective function.
+
+        success: Whether the solver converged.
+
+        return_status: The return status string from the solver.
+
+        iter_count: The number of iterations taken by the solver.
+
+        start_indices: The indices of all starting points (i.e., initial guesses) that converged to this solution.
+
+    """
+
+    def __init__(self,
+                 x: np.ndarray,
+                 lam_g: np.ndarray,
+                 objective: float,
+                 success: bool,
+                 return_status: str,
+                 iter_count: int,
+                 start_indices: List[int],
+                 ):
+        self.x = x
+        self.lam_g = lam_g
+        self.objective = objective
+        self.success = success
+        self.return_status = return_status
+        self.iter_count = iter_count
+        self.start_indices = start_indices
+
+    @property
+    def n_hits(self) -> int:
+        """
+        The number of starting points that converged to this solution.
+        """
+        return len(self.start_indices)
+
+    def __repr__(self) -> str:
+        return (
+            f"MultiStartSolution(objective={self.objective:.6g}, success={self.success}, "
+            f"found from {self.n_hits} starting point{'s' if self.n_hits != 1 else ''})"
+        )
+
+
+def sample_initial_guesses(
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        n_samples: int,
+        sampling: str = "lhs",
+        seed: int = None,
+) -> np.ndarray:
+    """
+    Samples points within a box, with a space-filling design.
+
+    Args:
+        lower_bounds: The lower bound of the box in each dimension. Must be finite.
+
+        upper_bounds: The upper bound of the box in each dimension. Must be finite.
+
+        n_samples: The number of points to sample.
+
+        sampling: The sampling method to use. One of:
+
+            * "lhs": Latin hypercube sampling.
+
+            * "sobol": A scrambled Sobol sequence. Most uniform, especially if `n_samples` is a power of two.
+
+            * "random": Uniform random sampling.
+
+        seed: [Optional] A seed for the random number generator, for reproducibility.
+
+    Returns: An array of shape (n_samples, n_dimensions).
+
+    """
+    from scipy.stats import qmc
+
+    lower_bounds = np.array(lower_bounds, dtype=float).reshape(-1)
+    upper_bounds = np.array(upper_bounds, dtype=float).reshape(-1)
+    n_dimensions = len(lower_bounds)
+
+    if n_dimensions == 0:
+        return np.zeros((n_samples, 0))
+
+    if sampling == "lhs":
+        unit_samples = qmc.LatinHypercube(d=n_dimensions, seed=seed).random(n_samples)
+    elif sampling == "sobol":
+        unit_samples = qmc.Sobol(d=n_dimensions, scramble=True, seed=seed).random(n_samples)
+    elif sampling == "random":
+        unit_samples = np.random.default_rng(seed).random((n_samples, n_dimensions))
+    else:
+        raise ValueError("Bad value of `sampling`!")
+
+    return lower_bounds + unit_samples * (upper_bounds - lower_bounds)
+
+
+def _solve_from_initial_guess(
+        serialized_nlp: str,
+        x0: np.ndarray,
+        p: np.ndarray,
+        lbg: np.ndarray,
+        ubg: np.ndarray,
+        solver_options: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Solves an NLP from a given initial guess. Defined at the module level so that it can be run in a worker process.
+
+    Args:
+        serialized_nlp: A serialized CasADi Function with inputs (x, p) and outputs (f, g).
+
+        x0: The initial guess.
+
+        p: The parameter values.
+
+        lbg: Lower bounds on the constraints.
+
+        ubg: Upper bounds on the constraints.
+
+        solver_options: Options to pass to the IPOPT solver.
+
+    Returns: A dictionary with the solution.
+
+    """
+    cache_key = (serialized_nlp, repr(sorted(solver_options.items())))
+
+    if cache_key not in _solver_cache:
+        nlp_function = cas.Function.deserialize(serialized_nlp)
+        x = cas.MX.sym("x", nlp_function.size1_in(0))
+        p_sym = cas.MX.sym("p", nlp_function.size1_in(1))
+        f, g = nlp_function(x, p_sym)
+        _solver_cache[cache_key] = cas.nlpsol(
+            "solver",
+            "ipopt",
+            {"x": x, "p": p_sym, "f": f, "g": g},
+            solver_options
+        )
+
+    solver = _solver_cache[cache_key]
+
+    result = solver(x0=x0, p=p, lbg=lbg, ubg=ubg)
+    stats = solver.stats()
+
+    return {
+        "x"            : result["x"].full().reshape(-1),
+        "lam_g"        : result["lam_g"].full().reshape(-1),
+        "objective"    : float(result["f"]),
+        "success"      : bool(stats["success"]),
+        "return_status": str(stats["return_status"]),
+        "iter_count"   : int(stats["iter_count"]),
+    }
+
+
+def deduplicate_solutions(
+        results: List[Dict[str, Any]],
+        x_tolerance: float = 1e-4,
+        objective_tolerance: float = 1e-6,
+) -> List[MultiStartSolution]:
+    """
+    Groups the results of several solves into distinct solutions, and ranks them.
+
+    Two results are considered to be the same solution if their objectives agree to within `objective_tolerance` (
+    relative) and their decision variables agree to within `x_tolerance` (in the infinity-norm, in the scaled
+    variables seen by the optimizer).
+
+    Returns: A list of MultiStartSolutions, with successful solves first, then sorted by objective value.
+
+    """
+    solutions = []
+
+    order = sorted(
+        range(len(results)),
+        key=lambda i: (not results[i]["success"], results[i]["objective"])
+    )
+
+    for i in order:
+        result = results[i]
+
+        for solution in solutions:
+            if (
+                    solution.success == result["success"] and
+                    np.abs(solution.objective - result["objective"]) <= objective_tolerance * max(
+                        1, np.abs(solution.objective)) and
+                    (len(result["x"]) == 0 or np.max(np.abs(solution.x - result["x"])) <= x_tolerance)
+            ):
+                solution.start_indices.append(i)
+                break
+        else:
+            solutions.append(MultiStartSolution(
+                x=result["x"],
+                lam_g=result["lam_g"],
+                objective=result["objective"],
+                success=result["success"],
+                return_status=result["return_status"],
+                iter_count=result["iter_count"],
+                start_indices=[i],
+            ))
+
+    return solutions
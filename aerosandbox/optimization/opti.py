@@ -1,8 +1,12 @@
-from typing import Union, List, Dict, Callable, Any
+from typing import Union, List, Dict, Callable, Any, Tuple
 import json
+import time as _time
 import casadi as cas
 import aerosandbox.numpy as np
 from aerosandbox.tools import inspect_tools
+from aerosandbox.optimization.solve_report import SolveReport
+from aerosandbox.optimization.scaling import ScalingReport
+from aerosandbox.optimization import multistart as _multistart
 from sortedcontainers import SortedDict
 
 
@@ -57,6 +61,15 @@ class Opti(cas.Opti):
         self._constraint_declarations = SortedDict()  # first index in super().g : (filename, lineno, code_context, n_cons)
         self._variable_index_counter = 0
         self._constraint_index_counter = 0
+        self._variable_symbols = []  # The underlying CasADi symbol of each variable declaration, in order
+        self._variable_bounds = []  # (lower, upper) bounds on each of these symbols, as arrays
+
+        # Performance instrumentation of the most recent solve; see Opti.solve().
+        self.solve_report = None
+
+        # The distinct solutions found by the most recent multi-start solve; see Opti.solve_multistart().
+        self.multistart_solutions = None
+        self.scaling_report = None
 
     ### Primary Methods
 
@@ -287,14 +300,30 @@ class Opti(cas.Opti):
             else:
                 raise ValueError("Bad value of `Opti.freeze_style`!")
         else:
+            raw_var = super().variable(n_vars)
             if not log_transform:
-                var = scale * super().variable(n_vars)
+                var = scale * raw_var
                 self.set_initial(var, init_guess)
             else:
                 log_scale = scale / init_guess
-                log_var = log_scale * super().variable(n_vars)
+                log_var = log_scale * raw_var
                 var = np.exp(log_var)
                 self.set_initial(log_var, np.log(init_guess))
+            self._variable_symbols.append(raw_var)
+
+            # Track the bounds of this variable, in terms of the underlying symbol. Used by `Opti.solve_multistart()`.
+            raw_bounds = []
+            for bound, default in [(lower_bound, -np.inf), (upper_bound, np.inf)]:
+                raw_bound = default * np.ones(n_vars)
+                if bound is not None and not np.is_casadi_type(bound, recursive=True):
+                    bound = np.ones(n_vars) * np.array(bound, dtype=float)
+                    if not log_transform:
+                        raw_bound = bound / scale
+                    else:
+                        with np.errstate(divide="ignore", invalid="ignore"):
+                            raw_bound = np.where(bound > 0, np.log(bound), -np.inf) / log_scale
+                raw_bounds.append(raw_bound)
+            self._variable_bounds.append(tuple(raw_bounds))
 
             # Track where this variable was declared in code.
             filename, lineno, code_context = inspect_tools.get_caller_source_location(stacklevel=_stacklevel + 1)
@@ -504,6 +533,8 @@ class Opti(cas.Opti):
               max_iter: int = 1000,
               max_runtime: float = 1e20,
               callback: Callable[[int], Any] = None,
+              progress_hook: Callable[[Dict[str, float]], Any] = None,
+              autoscale: bool = False,
               verbose: bool = True,
               jit: bool = False,  # TODO document, add unit tests for jit
               options: Dict = None,  # TODO document
@@ -539,6 +570,31 @@ class Opti(cas.Opti):
                 quantities of optimization variables (e.g. for plotting), use the `Opti.debug.value(x)` syntax for
                 each variable `x`.
 
+            progress_hook: [Optional] A function to be called at each iteration of the optimization algorithm with a
+            dictionary describing the progress of the solve so far. The dictionary has the keys:
+
+                * "iteration": the current iteration number.
+                * "wall_time": the wall-clock time elapsed since the start of the solve, in seconds.
+                * "objective": the current value of the objective function.
+                * "constraint_violation": the current maximum constraint violation.
+
+                Each of these dictionaries is also recorded in `Opti.solve_report.trace`. Note that evaluating these
+                quantities at each iteration has a (small) cost, so this is off by default.
+
+            autoscale: [Optional] If True, automatically rescales the constraints and objective before solving,
+            based on the constraint Jacobian and objective gradient at the initial guess (see
+            `Opti.analyze_scaling()`). Each constraint is divided by the largest entry of its Jacobian row (i.e.,
+            row equilibration). (The objective is left to IPOPT's own gradient-based scaling, as scaling it up or
+            down also changes the effective convergence tolerance.) The resulting ScalingReport is stored at
+            `Opti.scaling_report`, so it can be inspected for variables that would benefit from a better `scale`.
+
+                The scaling is only applied for the duration of this solve: the scaled problem is solved first,
+                in a separate solver instance, and then the original problem is solved warm-started from that
+                solution (typically in a few iterations). If the scaled solve fails, the original problem is
+                instead solved from the initial guess, as without `autoscale`. The constraints and initial guesses
+                of this Opti instance (and any dual variables returned by `Opti.subject_to()`) are left untouched,
+                and `Opti.solve_report` covers both solves.
+
             verbose: Should we print the output of IPOPT?
 
             jit: # TODO
@@ -552,6 +608,10 @@ class Opti(cas.Opti):
                 >>> sol = opti.solve()
                 >>> x_opt = sol.value(x) # Get the value of variable x at the optimum.
 
+            Performance statistics of the solve (function evaluation counts and times, iteration history,
+            etc.) are recorded in `Opti.solve_report` as a SolveReport object, regardless of whether the solve
+            succeeds.
+
         """
         if parameter_mapping is None:
             parameter_mapping = {}
@@ -617,23 +677,294 @@ class Opti(cas.Opti):
             default_options["print_time"] = False  # No time printing
             default_options["ipopt.print_level"] = 0  # No printing from IPOPT
 
-        self.solver('ipopt', {
+        solver_options = {
             **default_options,
             **options,
-        })
+        }
+
+        if autoscale:
+            self.scaling_report = self.analyze_scaling()
+            initial_guesses = self._get_initial_guesses()
+            scaled_solve_report = self._warm_start_from_scaled_problem(
+                constraint_scale_factors=self.scaling_report.constraint_scale_factors,
+                solver_options=solver_options,
+            )
+        else:
+            scaled_solve_report = None
+
+        if scaled_solve_report is not None and scaled_solve_report.success:
+            solver_options = {
+                "ipopt.warm_start_init_point"     : "yes",
+                "ipopt.warm_start_bound_push"     : 1e-9,
+                "ipopt.warm_start_mult_bound_push": 1e-9,
+                "ipopt.mu_init"                   : 1e-8,
+                **solver_options,
+            }
+
+        self.solver('ipopt', solver_options)
 
         # Set the callback
-        if callback is not None:
+        trace = []
+        start_time = _time.perf_counter()
+
+        if progress_hook is not None:
+            def progress_callback(iteration: int) -> None:
+                g = np.array(self.debug.value(self.g)).reshape(-1)
+                if len(g) != 0:
+                    lbg = np.array(self.debug.value(self.lbg)).reshape(-1)
+                    ubg = np.array(self.debug.value(self.ubg)).reshape(-1)
+                    constraint_violation = float(np.max(np.maximum(
+                        np.maximum(lbg - g, g - ubg),
+                        0
+                    )))
+                else:
+                    constraint_violation = 0.
+
+                progress = {
+                    "iteration"           : iteration,
+                    "wall_time"           : _time.perf_counter() - start_time,
+                    "objective"           : float(self.debug.value(self.f)),
+                    "constraint_violation": constraint_violation,
+                }
+                trace.append(progress)
+                progress_hook(progress)
+
+                if callback is not None:
+                    callback(iteration)
+
+            self.callback(progress_callback)
+
+        elif callback is not None:
             self.callback(callback)
 
-        # Do the actual solve
-        sol = super().solve()
+        # Do the actual solve, recording performance statistics even if it fails.
+        try:
+            sol = super().solve()
+        finally:
+            wall_time = _time.perf_counter() - start_time
+            try:
+                stats = self.stats()
+            except RuntimeError:
+                stats = {}
+            self.solve_report = SolveReport.from_stats(
+                stats=stats,
+                wall_time=wall_time,
+                trace=trace,
+                n_variables=self.nx,
+                n_constraints=self.ng,
+                n_parameters=self.np,
+            )
+            if scaled_solve_report is not None:
+                self.solve_report = SolveReport.concatenate([scaled_solve_report, self.solve_report])
+            if autoscale:
+                self._set_initial_guesses(initial_guesses)
 
         if self.save_to_cache_on_solve:
             self.save_solution()
 
         return sol
 
+    def solve_multistart(self,
+                         n_starts: int = 16,
+                         sampling: str = "lhs",
+                         n_workers: int = 1,
+                         seed: int = None,
+                         include_initial_guess: bool = True,
+                         unbounded_spread: float = 1.,
+                         x_tolerance: float = 1e-4,
+                         objective_tolerance: float = 1e-6,
+                         max_iter: int = 1000,
+                         max_runtime: float = 1e20,
+                         verbose: bool = False,
+                         options: Dict = None,
+                         parameter_mapping: Dict[cas.MX, float] = None,
+                         **solve_kwargs,
+                         ) -> cas.OptiSol:
+        """
+        Solves the optimization problem from many different initial guesses, in an attempt to find the global
+        optimum of a nonconvex problem. Each individual solve is a regular local (IPOPT) solve.
+
+        Initial guesses are sampled within the bounds of each variable (i.e., the `lower_bound` and `upper_bound`
+        arguments to `Opti.variable()`). For variables without finite bounds, samples are drawn within
+        `unbounded_spread` (in units of the variable's `scale`) of the variable's initial guess.
+
+        Once all solves are done, distinct solutions are identified and ranked (see `Opti.multistart_solutions`),
+        and then the problem is solved one last time, warm-started from the best solution found. This means that the
+        returned OptiSol (and `Opti.solve_report`) can be used exactly like those from `Opti.solve()`.
+
+        Note that, to warm-start that final solve, the initial guesses of this Opti instance (primal and dual) are
+        set to the best solution found, and are not restored afterwards. (Changing them after the solve would discard
+        the solution stored in this instance, e.g., for `Opti.value()` and `Opti.stats()`.) To re-run from the
+        original initial guesses, set them again with `Opti.set_initial()`.
+
+        Example:
+            >>> opti = asb.Opti()
+            >>> x = opti.variable(init_guess=1, lower_bound=-3, upper_bound=3)
+            >>> opti.minimize(x ** 4 - 4 * x ** 2 + x)  # Local minima near x = -1.47 and x = 1.35.
+            >>> sol = opti.solve_multistart(n_starts=8)
+            >>> sol.value(x)  # -1.47, the global minimum.
+
+        Args:
+            n_starts: The number of initial guesses to sample.
+
+            sampling: How to sample the initial guesses. One of "lhs" (Latin hypercube), "sobol", or "random".
+
+            n_workers: The number of worker processes to use for the solves. If 1, solves are done serially in this
+            process. If None, uses one worker per CPU.
+
+            seed: [Optional] A seed for the random number generator, for reproducibility.
+
+            include_initial_guess: If True, the user-supplied initial guess is used as one of the starting points (
+            replacing one of the sampled points).
+
+            unbounded_spread: For variables without finite bounds, the half-width of the interval (in units of the
+            variable's `scale`, or in e-foldings of the variable for log-transformed variables) around the initial
+            guess within which to sample.
+
+            x_tolerance: Solutions whose (scaled) decision variables differ by less than this (in the
+            infinity-norm) are considered duplicates.
+
+            objective_tolerance: Solutions whose objectives differ by more than this (relative) are considered
+            distinct.
+
+            max_iter: The maximum number of iterations allowed for each solve.
+
+            max_runtime: The maximum runtime allowed for each solve.
+
+            verbose: Should we print the output of IPOPT for the final solve?
+
+            options: [Optional] Additional IPOPT options, as in `Opti.solve()`.
+
+            parameter_mapping: [Optional] Values for parameters, as in `Opti.solve()`. Used for all solves.
+
+            **solve_kwargs: [Optional] Any other keyword arguments of `Opti.solve()` (e.g., `callback`,
+            `progress_hook`, `autoscale`), which are passed to the final, warm-started solve.
+
+        Returns: An OptiSol object, as in `Opti.solve()`, at the best solution found.
+
+            All distinct solutions found are stored in `Opti.multistart_solutions`, as a list of MultiStartSolution
+            objects, ranked with converged solutions first and then by objective value.
+
+        """
+        if options is None:
+            options = {}
+        if parameter_mapping is None:
+            parameter_mapping = {}
+
+        for k, v in parameter_mapping.items():
+            self.set_value(k, v)
+
+        ### Assemble the problem in terms of the underlying variables
+        if len(self._variable_symbols) == 0:
+            x = cas.MX(0, 1)
+        else:
+            x = cas.vertcat(*[cas.vec(v) for v in self._variable_symbols])
+
+        x0 = np.concatenate([
+            np.array(cas.DM(self.value(v, self.initial())).full(), dtype=float).reshape(-1)
+            for v in self._variable_symbols
+        ]) if len(self._variable_symbols) != 0 else np.zeros(0)
+        p = self.value(self.p) if self.p.shape[0] != 0 else cas.DM(0, 1)
+        p = np.array(cas.DM(p).full(), dtype=float).reshape(-1)
+        if self.ng != 0:
+            lbg = np.array(cas.DM(self.value(self.lbg)).full(), dtype=float).reshape(-1)
+            ubg = np.array(cas.DM(self.value(self.ubg)).full(), dtype=float).reshape(-1)
+        else:
+            lbg = np.zeros(0)
+            ubg = np.zeros(0)
+
+        serialized_nlp = cas.Function(
+            "nlp",
+            [x, self.p],
+            [self.f, self.g],
+        ).serialize()
+
+        ### Sample the initial guesses
+        if len(self._variable_bounds) != 0:
+            lower_bounds = np.concatenate([b[0] for b in self._variable_bounds])
+            upper_bounds = np.concatenate([b[1] for b in self._variable_bounds])
+        else:
+            lower_bounds = np.zeros(0)
+            upper_bounds = np.zeros(0)
+
+        sample_lower_bounds = np.where(
+            np.isfinite(lower_bounds),
+            lower_bounds,
+            np.minimum(x0, upper_bounds) - unbounded_spread
+        )
+        sample_upper_bounds = np.where(
+            np.isfinite(upper_bounds),
+            upper_bounds,
+            np.maximum(x0, lower_bounds) + unbounded_spread
+        )
+
+        initial_guesses = _multistart.sample_initial_guesses(
+            lower_bounds=sample_lower_bounds,
+            upper_bounds=sample_upper_bounds,
+            n_samples=n_starts,
+            sampling=sampling,
+            seed=seed,
+        )
+        if include_initial_guess and n_starts > 0:
+            initial_guesses[0] = x0
+
+        ### Do the solves
+        solver_options = {
+            "ipopt.sb"                   : 'yes',
+            "ipopt.max_iter"             : max_iter,
+            "ipopt.max_cpu_time"         : max_runtime,
+            "ipopt.mu_strategy"          : "adaptive",
+            "ipopt.fast_step_computation": "yes",
+            "ipopt.print_level"          : 0,
+            "print_time"                 : False,
+            **options,
+        }
+
+        solve_args = [
+            (serialized_nlp, initial_guess, p, lbg, ubg, solver_options)
+            for initial_guess in initial_guesses
+        ]
+
+        if n_workers == 1:
+            results = [
+                _multistart._solve_from_initial_guess(*args)
+                for args in solve_args
+            ]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(
+                    _multistart._solve_from_initial_guess,
+                    *zip(*solve_args)
+                ))
+
+        self.multistart_solutions = _multistart.deduplicate_solutions(
+            results,
+            x_tolerance=x_tolerance,
+            objective_tolerance=objective_tolerance,
+        )
+
+        ### Warm-start a final solve from the best solution found
+        if len(self.multistart_solutions) != 0:
+            best = self.multistart_solutions[0]
+            index = 0
+            for v in self._variable_symbols:
+                n = v.shape[0] * v.shape[1]
+                self.set_initial(v, best.x[index:index + n].reshape(v.shape, order="F"))
+                index += n
+            if self.ng != 0:
+                self.set_initial(self.lam_g, best.lam_g)
+
+        return self.solve(
+            parameter_mapping=parameter_mapping,
+            max_iter=max_iter,
+            max_runtime=max_runtime,
+            verbose=verbose,
+            options=options,
+            **solve_kwargs,
+        )
+
     ### Debugging Methods
     def find_variable_declaration(self,
                                   index: int,
@@ -705,6 +1036,162 @@ class Opti(cas.Opti):
         ])
         )
 
+    def analyze_scaling(self,
+                        min_scale_factor: float = 1e-8,
+                        max_scale_factor: float = 1e8,
+                        ) -> ScalingReport:
+        """
+        Analyzes how well-scaled this optimization problem is, by evaluating the constraint Jacobian and objective
+        gradient at the initial guess. Poor scaling is one of the most common causes of slow (or failed) convergence.
+
+        This only diagnoses the problem; to also apply the constraint scaling, use `Opti.solve(autoscale=True)`.
+
+        Example:
+            >>> report = opti.analyze_scaling()
+            >>> print(report)  # Lists the worst-scaled variable and constraint declarations in your code.
+
+        Args:
+            min_scale_factor: The smallest allowable scale factor.
+
+            max_scale_factor: The largest allowable scale factor.
+
+        Returns: A ScalingReport. See its docstring for details.
+
+        """
+        ### Collect the underlying variables and their initial values
+        if len(self._variable_symbols) == 0:
+            x = cas.MX(0, 1)
+        else:
+            x = cas.vertcat(*[cas.vec(v) for v in self._variable_symbols])
+
+        x0 = cas.vertcat(*[
+            cas.vec(cas.DM(self.value(v, self.initial())))
+            for v in self._variable_symbols
+        ])
+        p0 = self.value(self.p) if self.p.shape[0] != 0 else cas.DM(0, 1)
+
+        ### Evaluate the constraint Jacobian and objective gradient
+        from scipy import sparse
+
+        scaling_function = cas.Function(
+            "scaling",
+            [x, self.p],
+            [cas.jacobian(self.g, x), cas.gradient(self.f, x)],
+        )
+        jacobian, objective_gradient = scaling_function(x0, p0)
+        rows, cols = jacobian.sparsity().get_triplet()
+        jacobian = sparse.csr_matrix(
+            (np.array(jacobian.nonzeros()), (rows, cols)),
+            shape=jacobian.shape,
+        )
+
+        ### Map back to the declarations
+        def declaration_list(declarations):
+            return [
+                {
+                    "filename"    : filename,
+                    "lineno"      : lineno,
+                    "code_context": code_context,
+                    "start_index" : start_index,
+                    "n"           : n,
+                }
+                for start_index, (filename, lineno, code_context, n) in declarations.items()
+            ]
+
+        return ScalingReport.from_jacobian(
+            jacobian=jacobian,
+            objective_gradient=objective_gradient.full().reshape(-1),
+            variable_declarations=declaration_list(self._variable_declarations),
+            constraint_declarations=declaration_list(self._constraint_declarations),
+            min_scale_factor=min_scale_factor,
+            max_scale_factor=max_scale_factor,
+        )
+
+    def _get_initial_guesses(self) -> Tuple[cas.DM, cas.DM]:
+        """
+        Returns the current initial guesses of the problem, as a tuple of (primal, dual) vectors.
+        """
+        return (
+            cas.DM(self.value(self.x, self.initial())),
+            cas.DM(self.value(self.lam_g, self.initial())),
+        )
+
+    def _set_initial_guesses(self, initial_guesses: Tuple[cas.DM, cas.DM]) -> None:
+        """
+        Sets the initial guesses of the problem, in the format returned by `Opti._get_initial_guesses()`.
+        """
+        x0, lam_g0 = initial_guesses
+        if self.nx != 0:
+            self.set_initial(self.x, x0)
+        if self.ng != 0:
+            self.set_initial(self.lam_g, lam_g0)
+
+    def _warm_start_from_scaled_problem(self,
+                                        constraint_scale_factors: np.ndarray,
+                                        solver_options: Dict,
+                                        ) -> Union[SolveReport, None]:
+        """
+        Solves a copy of this problem in which each constraint is multiplied by the given (positive) scale factor,
+        in a separate solver instance. If that solve succeeds, the initial guesses (primal and dual) of this problem
+        are then set to its solution; otherwise, they are left as-is, and a warning is raised. The constraints of
+        this problem are not modified.
+
+        Returns: A SolveReport of the scaled solve, or None if there are no constraints to scale (in which case
+        nothing is solved).
+        """
+        if self.ng == 0:
+            return None
+
+        factors = cas.DM(constraint_scale_factors)
+
+        nlp = cas.Function(
+            "nlp",
+            [self.x, self.p],
+            [self.f, self.g * factors],
+        )
+        x = cas.MX.sym("x", self.nx)
+        p = cas.MX.sym("p", self.np)
+        f, g = nlp(x, p)
+        solver = cas.nlpsol(
+            "scaled_solver",
+            "ipopt",
+            {"x": x, "p": p, "f": f, "g": g},
+            {
+                **solver_options,
+                "ipopt.print_level": 0,
+                "print_time"       : False,
+            },
+        )
+
+        x0, lam_g0 = self._get_initial_guesses()
+        start_time = _time.perf_counter()
+        result = solver(
+            x0=x0,
+            lam_g0=lam_g0 / factors,
+            p=self.value(self.p) if self.np != 0 else cas.DM(0, 1),
+            lbg=cas.DM(self.value(self.lbg)) * factors,
+            ubg=cas.DM(self.value(self.ubg)) * factors,
+        )
+        report = SolveReport.from_stats(
+            stats=solver.stats(),
+            wall_time=_time.perf_counter() - start_time,
+            n_variables=self.nx,
+            n_constraints=self.ng,
+            n_parameters=self.np,
+        )
+
+        if report.success:
+            self._set_initial_guesses((result["x"], result["lam_g"] * factors))
+        else:
+            import warnings
+            warnings.warn(
+                f"The autoscaled solve failed (return status: {report.return_status}), so the problem will be "
+                f"solved from its initial guess instead.",
+                stacklevel=3,
+            )
+
+        return report
+
     ### Advanced Methods
 
     def set_initial_from_sol(self,
@@ -828,13 +1315,18 @@ class Opti(cas.Opti):
 
                     Citation: https://en.wikipedia.org/wiki/Midpoint_method
 
-                * "simpson" - Simpson's rule for integration
+                * "simpson" - Simpson's rule for integration, a fourth-order-accurate method. The value of the
+                derivative at the midpoint of each interval is found by cubic interpolation through the nearest four
+                points.
 
                     Citation: https://en.wikipedia.org/wiki/Simpson%27s_rule
 
                 * "runge-kutta" or "rk4" - a fourth-order-accurate Runge-Kutta method. I suppose that technically,
                 "forward euler", "backward euler", and "midpoint" are all (lower-order) Runge-Kutta methods...
 
+                    Because the derivative is only known at the discrete points, the intermediate stages are found
+                    by cubic interpolation, just as with "simpson". (In this case, the two methods are equivalent.)
+
                     Citation: https://en.wikipedia.org/wiki/Runge%E2%80%93Kutta_methods#The_Runge%E2%80%93Kutta_method
 
                 * "runge-kutta-3/8" - A modified version of the Runge-Kutta 4 proposed by Kutta in 1901. Also
@@ -845,6 +1337,15 @@ class Opti(cas.Opti):
                     Citation: Kutta, Martin (1901), "Beitrag zur näherungsweisen Integration totaler
                     Differentialgleichungen", Zeitschrift für Mathematik und Physik, 46: 435–453
 
+                * "radau" or "pseudospectral" - Legendre-Gauss-Radau pseudospectral collocation. The variable is
+                represented as a single global polynomial, and its derivative is enforced at every point except the
+                last. Converges exponentially fast for smooth problems, but only if `with_respect_to` is spaced at the
+                Legendre-Gauss-Radau points; use `np.radauspace()` to generate these. Leads to dense constraints,
+                so it's best for problems with few (roughly <50) points.
+
+                    Citation: Garg et al., "A unified framework for the numerical solution of optimal control
+                    problems using pseudospectral methods", Automatica, 2010.
+
             explicit: If true, returns an explicit derivative rather than an implicit one. In other words,
             this *defines* the output to be a derivative of the input rather than *constraining* the output to the a
             derivative of the input.
@@ -855,7 +1356,11 @@ class Opti(cas.Opti):
                 states, while implicit derivatives are better for complex, potentially-unstable systems with many
                 states.
 
-                # TODO implement explicit
+                Explicit derivatives add no new variables or constraints; instead, the derivative is computed from
+                `variable` with a (sparse) finite-difference matrix of an order of accuracy that matches `method`.
+                `derivative_init_guess` and `derivative_scale` are ignored in this case. If you have a dynamics
+                function (i.e., you want to integrate forward in time rather than differentiate), see
+                `Opti.shooting_trajectory()` instead.
 
             _stacklevel: Optional and advanced, purely used for debugging. Allows users to correctly track where
             constraints are declared in the event that they are subclassing `aerosandbox.Opti`. Modifies the
@@ -880,6 +1385,12 @@ class Opti(cas.Opti):
         ### Clean inputs
         method = method.lower()
 
+        if method == "hermite-simpson":
+            raise ValueError(
+                "The \"hermite-simpson\" method introduces midpoint variables that need to be constrained "
+                "separately, so use `Opti.constrain_derivative()` directly instead."
+            )
+
         ### Implement the derivative
         if not explicit:
             derivative = self.variable(
@@ -897,17 +1408,71 @@ class Opti(cas.Opti):
             )
 
         else:
-            raise NotImplementedError("Haven't yet implemented explicit derivatives! Use implicit ones for now...")
+            derivative = self._explicit_derivative(
+                variable=variable,
+                with_respect_to=with_respect_to,
+                method=method,
+            )
 
         return derivative
 
+    def _explicit_derivative(self,
+                             variable: cas.MX,
+                             with_respect_to: Union[np.ndarray, cas.MX],
+                             method: str = "midpoint",
+                             ) -> cas.MX:
+        """
+        Computes the derivative of `variable` with respect to `with_respect_to` explicitly, as a sparse matrix-vector
+        product with a finite-difference differentiation matrix. Used by `Opti.derivative_of(explicit=True)`.
+
+        The stencil (and hence order of accuracy) is chosen to match `method`; see `Opti.derivative_of()` for options.
+        """
+        N = np.length(variable)
+
+        ### Determine the stencil for each point
+        if method == "forward euler" or method == "forward" or method == "forwards":
+            stencil_kwargs = dict(order_of_accuracy=1, stencil="forward")
+        elif method == "backward euler" or method == "backward" or method == "backwards":
+            stencil_kwargs = dict(order_of_accuracy=1, stencil="backward")
+        elif method == "midpoint" or method == "trapezoid" or method == "trapezoidal":
+            stencil_kwargs = dict(order_of_accuracy=2)
+        elif method in ["simpson", "runge-kutta", "rk4", "runge-kutta-3/8"]:
+            stencil_kwargs = dict(order_of_accuracy=4)
+        elif method == "radau" or method == "pseudospectral":
+            stencil_kwargs = dict(order_of_accuracy=N - 1)  # A global stencil
+        else:
+            raise ValueError("Bad value of `method`!")
+
+        ### Compute the differentiation matrix on a normalized grid, then rescale.
+        # (Like in `constrain_derivative()`, this allows `with_respect_to` to be symbolic, as long as its normalized
+        # spacing is fixed.)
+        wrt_range = with_respect_to[-1] - with_respect_to[0]
+        wrt_normalized = (with_respect_to - with_respect_to[0]) / wrt_range
+        if np.is_casadi_type(wrt_normalized, recursive=False):
+            wrt_normalized = self.value(wrt_normalized, self.initial())
+        wrt_normalized = np.array(wrt_normalized, dtype=float).reshape(-1)
+
+        differentiation_matrix = np.finite_difference_matrix(
+            wrt_normalized,
+            derivative_degree=1,
+            **stencil_kwargs
+        )
+
+        if np.is_casadi_type(variable, recursive=False):
+            derivative = differentiation_matrix @ variable
+        else:
+            derivative = differentiation_matrix @ np.array(variable).reshape(-1)
+
+        return derivative / wrt_range
+
     def constrain_derivative(self,
                              derivative: cas.MX,
                              variable: cas.MX,
                              with_respect_to: Union[np.ndarray, cas.MX],
                              method: str = "midpoint",
+                             derivative_midpoints: cas.MX = None,
                              _stacklevel: int = 1,
-                             ) -> None:
+                             ) -> Union[None, Tuple[cas.MX, cas.MX]]:
         """
         Adds a constraint to the optimization problem such that:
 
@@ -941,13 +1506,18 @@ class Opti(cas.Opti):
 
                     Citation: https://en.wikipedia.org/wiki/Midpoint_method
 
-                * "simpson" - Simpson's rule for integration
+                * "simpson" - Simpson's rule for integration, a fourth-order-accurate method. The value of the
+                derivative at the midpoint of each interval is found by cubic interpolation through the nearest four
+                points.
 
                     Citation: https://en.wikipedia.org/wiki/Simpson%27s_rule
 
                 * "runge-kutta" or "rk4" - a fourth-order-accurate Runge-Kutta method. I suppose that technically,
                 "forward euler", "backward euler", and "midpoint" are all (lower-order) Runge-Kutta methods...
 
+                    Because the derivative is only known at the discrete points, the intermediate stages are found
+                    by cubic interpolation, just as with "simpson". (In this case, the two methods are equivalent.)
+
                     Citation: https://en.wikipedia.org/wiki/Runge%E2%80%93Kutta_methods#The_Runge%E2%80%93Kutta_method
 
                 * "runge-kutta-3/8" - A modified version of the Runge-Kutta 4 proposed by Kutta in 1901. Also
@@ -958,17 +1528,52 @@ class Opti(cas.Opti):
                     Citation: Kutta, Martin (1901), "Beitrag zur näherungsweisen Integration totaler
                     Differentialgleichungen", Zeitschrift für Mathematik und Physik, 46: 435–453
 
+                * "radau" or "pseudospectral" - Legendre-Gauss-Radau pseudospectral collocation. The variable is
+                represented as a single global polynomial, and its derivative is enforced at every point except the
+                last. Converges exponentially fast for smooth problems, but only if `with_respect_to` is spaced at the
+                Legendre-Gauss-Radau points; use `np.radauspace()` to generate these. Leads to dense constraints,
+                so it's best for problems with few (roughly <50) points.
+
+                    Citation: Garg et al., "A unified framework for the numerical solution of optimal control
+                    problems using pseudospectral methods", Automatica, 2010.
+
+                * "hermite-simpson" - Hermite-Simpson collocation (separated form), a fourth-order-accurate method.
+                Unlike all other methods, this one adds new midpoint variables to the problem: the value of the
+                derivative at the midpoint of each interval becomes a new decision variable (unless you supply it
+                with `derivative_midpoints`). In this case, this function returns a tuple of
+                (`variable_midpoints`, `derivative_midpoints`), where `variable_midpoints` is the value of the
+                variable at the midpoint of each interval (found by cubic Hermite interpolation). You must then
+                close the loop by constraining `derivative_midpoints` to equal the derivative evaluated at
+                `variable_midpoints`. For example, for the dynamics dx/dt = -x:
+
+                    >>> x_mid, dxdt_mid = opti.constrain_derivative(
+                    >>>     derivative=-x,
+                    >>>     variable=x,
+                    >>>     with_respect_to=time,
+                    >>>     method="hermite-simpson"
+                    >>> )
+                    >>> opti.subject_to(dxdt_mid == -x_mid)
+
+                    Citation: Kelly, Matthew, "An Introduction to Trajectory Optimization: How to Do Your Own Direct
+                    Collocation", SIAM Review, 2017.
+
             Note that all methods are expressed as integrators rather than differentiators; this prevents
             singularities from forming in the limit of timestep approaching zero. (For those coming from the PDE
             world, this is analogous to using finite volume methods rather than finite difference methods to allow
             shock capturing.)
 
+            All constraints are constructed in vectorized form (one vector constraint per call).
+
+            derivative_midpoints: [Optional] Only used with method="hermite-simpson". The value of the derivative
+            at the midpoint of each interval (a vector of length N-1). If not provided, new decision variables are
+            created for it.
+
             _stacklevel: Optional and advanced, purely used for debugging. Allows users to correctly track where
             constraints are declared in the event that they are subclassing `aerosandbox.Opti`. Modifies the
             stacklevel of the declaration tracked, which is then presented using
             `aerosandbox.Opti.variable_declaration()` and `aerosandbox.Opti.constraint_declaration()`.
 
-        Returns: None (adds constraint in-place).
+        Returns: None (adds constraint in-place), except if method="hermite-simpson"; see above.
 
         """
         try:
@@ -981,10 +1586,10 @@ class Opti(cas.Opti):
         except (TypeError, IndexError):
             derivative = np.full_like(with_respect_to, fill_value=derivative)
 
+        N = np.length(with_respect_to)
         d_time = np.diff(with_respect_to)  # Calculate the timestep
 
-        # TODO scale constraints by variable scale?
-        # TODO make
+        # These constraints are not scaled here; see `Opti.analyze_scaling()` and `Opti.solve(autoscale=True)`.
 
         if method == "forward euler" or method == "forward" or method == "forwards":
             # raise NotImplementedError
@@ -1006,18 +1611,333 @@ class Opti(cas.Opti):
                 _stacklevel=_stacklevel + 1
             )
 
-        elif method == "simpson":
-            raise NotImplementedError
-
-        elif method == "runge-kutta" or method == "rk4":
-            raise NotImplementedError
+        elif method == "simpson" or method == "runge-kutta" or method == "rk4":
+            self.subject_to(
+                d_var == np.integrate_discrete_intervals(
+                    f=derivative,
+                    x=with_respect_to,
+                    method="simpson"
+                ),
+                _stacklevel=_stacklevel + 1
+            )
 
         elif method == "runge-kutta-3/8":
-            raise NotImplementedError
+            self.subject_to(
+                d_var == np.integrate_discrete_intervals(
+                    f=derivative,
+                    x=with_respect_to,
+                    method="simpson_3/8"
+                ),
+                _stacklevel=_stacklevel + 1
+            )
+
+        elif method == "radau" or method == "pseudospectral":
+            # The integration matrix is invariant to affine transformations of the grid (up to a scale factor),
+            # so compute it on the normalized grid. This allows `with_respect_to` to be symbolic (e.g., time with a
+            # variable final time), as long as its normalized spacing is fixed.
+            wrt_normalized = (with_respect_to - with_respect_to[0]) / (with_respect_to[-1] - with_respect_to[0])
+            if np.is_casadi_type(wrt_normalized, recursive=False):
+                wrt_normalized = self.value(wrt_normalized, self.initial())
+
+            W = np.lagrange_integration_matrix(
+                x=np.array(wrt_normalized).reshape(-1),
+                collocation_indices=np.arange(N - 1),
+            ) * (with_respect_to[-1] - with_respect_to[0])
+
+            if np.is_casadi_type([W, derivative], recursive=True):
+                integral = cas.mtimes(W, derivative[:-1])
+            else:
+                integral = W @ derivative[:-1]
+
+            self.subject_to(
+                d_var == integral,
+                _stacklevel=_stacklevel + 1
+            )
+
+        elif method == "hermite-simpson":
+            if derivative_midpoints is None:
+                try:
+                    derivative_midpoints_init_guess = self.value(np.trapz(derivative), self.initial())
+                except RuntimeError:
+                    derivative_midpoints_init_guess = 0
+
+                derivative_midpoints = self.variable(
+                    init_guess=derivative_midpoints_init_guess,
+                    n_vars=N - 1,
+                    _stacklevel=_stacklevel + 1
+                )
+
+            variable_midpoints = (
+                    (variable[:-1] + variable[1:]) / 2 +
+                    (derivative[:-1] - derivative[1:]) * d_time / 8
+            )
+
+            self.subject_to(
+                d_var == (derivative[:-1] + 4 * derivative_midpoints + derivative[1:]) / 6 * d_time,
+                _stacklevel=_stacklevel + 1
+            )
+
+            return variable_midpoints, derivative_midpoints
 
         else:
             raise ValueError("Bad value of `method`!")
 
+    def shooting_trajectory(self,
+                            dynamics: Union[cas.Function, Callable],
+                            time: Union[np.ndarray, cas.MX],
+                            state_init_guess: Union[np.ndarray, List[float]],
+                            controls: Union[np.ndarray, cas.MX] = None,
+                            state_scale: Union[float, np.ndarray] = None,
+                            shooting: str = "multiple",
+                            integrator: str = "rk4",
+                            n_substeps: int = 1,
+                            parallelization: str = "thread",
+                            n_threads: int = None,
+                            _stacklevel: int = 1,
+                            ) -> cas.MX:
+        """
+        Defines a state trajectory that obeys the given dynamics by explicit time integration (i.e., shooting),
+        rather than by constraining derivatives (i.e., collocation, as in `Opti.constrain_derivative()`).
+
+        The dynamics are traced once into a CasADi Function, which is wrapped in a compiled integrator for one time
+        interval and then mapped over all intervals.
+
+        For example, to simulate a damped oscillator:
+
+        >>> opti = asb.Opti()
+        >>> time = np.linspace(0, 10, 101)
+        >>> states = opti.shooting_trajectory(
+        >>>     dynamics=lambda x, u, t: [x[1], -x[0] - 0.1 * x[1] + u[0]],
+        >>>     time=time,
+        >>>     state_init_guess=[1, 0],
+        >>>     controls=opti.variable(init_guess=0, n_vars=101),
+        >>> )
+        >>> position = states[:, 0]
+        >>> opti.subject_to(position[0] == 1)
+
+        Args:
+
+            dynamics: The dynamics of the system, either as a CasADi Function or as a Python function. In either
+            case, the call signature should be `dynamics(state, controls, time) -> state_derivative`, where:
+
+                * `state` is a vector of length `n_states`.
+
+                * `controls` is a vector of length `n_controls` (which may be zero).
+
+                * `time` is a scalar.
+
+                * `state_derivative` is a vector of length `n_states` (or a list of `n_states` scalars).
+
+                Python functions are traced once with CasADi symbolics, so they should be written using
+                `aerosandbox.numpy` functions.
+
+            time: A vector of times, of length N, at which the state trajectory is returned. Can be symbolic (e.g.,
+            if the final time is a variable).
+
+            state_init_guess: Initial guess for the state trajectory. Either a vector of length `n_states` (in which
+            case it is used at all times), or an array of shape (N, n_states). This also defines `n_states`.
+
+            controls: [Optional] Control inputs at each time, as an array of shape (N, n_controls) (or a vector of
+            length N, if there is a single control). Controls are held constant (i.e., zero-order hold) across each
+            time interval, at their value at the start of the interval.
+
+            state_scale: [Optional] Scale of the state variables, either a scalar or a vector of length `n_states`.
+            See the `scale` parameter of `Opti.variable()`.
+
+            shooting: The type of shooting method to use. One of:
+
+                * "multiple" - Multiple shooting. The state at each time is a decision variable, and continuity
+                between intervals is enforced with constraints. The integrations of each interval are independent,
+                so they are evaluated in parallel. More robust for unstable or nonlinear systems.
+
+                * "single" - Single shooting. Only the initial state is a decision variable; the rest of the
+                trajectory is found by integrating forward sequentially. Gives the smallest possible NLP, but is only
+                suitable for short horizons and stable systems.
+
+            integrator: The integrator to use across each time interval. One of:
+
+                * "rk4" - A fixed-step, fourth-order Runge-Kutta method with `n_substeps` steps per interval. Fast and
+                differentiable; the default.
+
+                * Any CasADi integrator plugin name, such as "cvodes" (adaptive, for stiff systems) or "collocation".
+
+            n_substeps: Number of integration substeps per time interval. Only used with the "rk4" integrator.
+
+            parallelization: How mapped integrator calls are evaluated in multiple shooting. One of "serial",
+            "thread", or "openmp". See CasADi's `Function.map()`.
+
+            n_threads: [Optional] The maximum number of threads to use with "thread" parallelization. Defaults to
+            the number of time intervals.
+
+            _stacklevel: Optional and advanced, purely used for debugging. Allows users to correctly track where
+            variables and constraints are declared in the event that they are subclassing `aerosandbox.Opti`.
+
+        Returns: The state trajectory, as a CasADi array of shape (N, n_states).
+
+        """
+        ### Check and clean inputs
+        N = np.length(time)
+
+        state_init_guess = np.array(state_init_guess, dtype=float)
+        if state_init_guess.ndim == 1:
+            n_states = len(state_init_guess)
+            state_init_guess = np.tile(state_init_guess, (N, 1))
+        elif state_init_guess.ndim == 2 and state_init_guess.shape[0] == N:
+            n_states = state_init_guess.shape[1]
+        else:
+            raise ValueError("`state_init_guess` must be a vector of length `n_states` or an array of shape (N, n_states)!")
+
+        if controls is None:
+            n_controls = 0
+            controls = cas.DM(N, 0)
+        else:
+            if not np.is_casadi_type(controls, recursive=False):
+                controls = np.array(controls)
+                if not np.is_casadi_type(controls, recursive=False):
+                    controls = cas.DM(controls)
+            if controls.shape[0] != N:
+                raise ValueError("`controls` must have one row per time!")
+            n_controls = controls.shape[1]
+
+        if state_scale is None:  # Infer a scale from state_init_guess, like in `Opti.variable()`
+            state_scale = np.mean(np.abs(state_init_guess), axis=0)
+            state_scale = np.where(state_scale == 0, 1, state_scale)
+        state_scale = np.ones(n_states) * np.array(state_scale, dtype=float)
+
+        time = cas.vec(time) if np.is_casadi_type(time, recursive=False) else cas.DM(np.array(time, dtype=float))
+
+        ### Trace the dynamics into a CasADi Function
+        if not isinstance(dynamics, cas.Function):
+            x_sym = cas.MX.sym("x", n_states)
+            u_sym = cas.MX.sym("u", n_controls)
+            t_sym = cas.MX.sym("t")
+            x_dot = dynamics(x_sym, u_sym, t_sym)
+            if isinstance(x_dot, (list, tuple)):
+                x_dot = cas.vertcat(*x_dot)
+            dynamics = cas.Function("dynamics", [x_sym, u_sym, t_sym], [x_dot])
+
+        ### Build the integrator across one time interval, F(x0, u, t0, dt) -> x1
+        F = _interval_integrator_function(
+            dynamics=dynamics,
+            integrator=integrator,
+            n_substeps=n_substeps,
+        )
+
+        ### Set up the trajectory
+        t_starts = cas.transpose(time[:-1])
+        dts = cas.transpose(time[1:] - time[:-1])
+        u_starts = cas.transpose(controls[:-1, :])
+
+        if shooting == "multiple":
+            states = cas.transpose(cas.horzcat(*[
+                self.variable(
+                    init_guess=state_init_guess[:, i],
+                    scale=state_scale[i],
+                    _stacklevel=_stacklevel + 1,
+                )
+                for i in range(n_states)
+            ]))  # Each column is the state at one time
+
+            if parallelization == "serial":
+                F_mapped = F.map(N - 1)
+            elif parallelization == "thread" and n_threads is not None:
+                F_mapped = F.map(N - 1, "thread", n_threads)
+            else:
+                F_mapped = F.map(N - 1, parallelization)
+
+            self.subject_to(
+                cas.vec(
+                    (states[:, 1:] - F_mapped(states[:, :-1], u_starts, t_starts, dts)) /
+                    cas.repmat(cas.DM(state_scale), 1, N - 1)
+                ) == 0,
+                _stacklevel=_stacklevel + 1,
+            )
+
+        elif shooting == "single":
+            initial_state = cas.vertcat(*[
+                self.variable(
+                    init_guess=state_init_guess[0, i],
+                    scale=state_scale[i],
+                    _stacklevel=_stacklevel + 1,
+                )
+                for i in range(n_states)
+            ])
+            F_accumulated = F.mapaccum(N - 1)
+            states = cas.horzcat(
+                initial_state,
+                F_accumulated(initial_state, u_starts, t_starts, dts)
+            )
+
+        else:
+            raise ValueError("Bad value of `shooting`!")
+
+        return cas.transpose(states)
+
+
+def _interval_integrator_function(dynamics: cas.Function,
+                                  integrator: str = "rk4",
+                                  n_substeps: int = 1,
+                                  integrator_options: Dict = None,
+                                  ) -> cas.Function:
+    """
+    Builds a CasADi Function that integrates a system of ODEs across one time interval, with the controls held
+    constant over the interval.
+
+    Args:
+
+        dynamics: A CasADi Function with call syntax `dynamics(state, controls, time) -> state_derivative`.
+
+        integrator: "rk4" for a fixed-step, fourth-order Runge-Kutta method with `n_substeps` steps, or any CasADi
+        integrator plugin name (e.g., "cvodes").
+
+        n_substeps: Number of RK4 steps per interval. Only used with the "rk4" integrator.
+
+        integrator_options: Options to pass to `casadi.integrator()`. Not used with the "rk4" integrator.
+
+    Returns: A CasADi Function with call syntax `F(x0, u, t0, dt) -> x1`.
+
+    """
+    x0 = cas.MX.sym("x0", dynamics.size1_in(0))
+    u = cas.MX.sym("u", dynamics.size1_in(1))
+    t0 = cas.MX.sym("t0")
+    dt = cas.MX.sym("dt")
+
+    if integrator == "rk4":
+        h = dt / n_substeps
+        x = x0
+        t = t0
+        for _ in range(n_substeps):
+            k1 = dynamics(x, u, t)
+            k2 = dynamics(x + h / 2 * k1, u, t + h / 2)
+            k3 = dynamics(x + h / 2 * k2, u, t + h / 2)
+            k4 = dynamics(x + h * k3, u, t + h)
+            x = x + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            t = t + h
+        x1 = x
+
+    else:
+        # Integrate in normalized time tau in [0, 1], so that the interval length can be a parameter.
+        tau = cas.MX.sym("tau")
+        x_tau = cas.MX.sym("x", x0.shape[0])
+        p = cas.vertcat(u, t0, dt)
+        dae = {
+            "x"  : x_tau,
+            "p"  : p,
+            "t"  : tau,
+            "ode": dt * dynamics(x_tau, u, t0 + tau * dt),
+        }
+        integrator_options = {} if integrator_options is None else dict(integrator_options)
+
+        casadi_version = tuple(int(v) for v in cas.__version__.split(".")[:2])
+        if casadi_version >= (3, 6):
+            integrator_function = cas.integrator("integrator", integrator, dae, 0, 1, integrator_options)
+        else:  # CasADi 3.5 specifies the time horizon via options.
+            integrator_function = cas.integrator("integrator", integrator, dae, {**integrator_options, "tf": 1})
+
+        x1 = integrator_function(x0=x0, p=p)["xf"]
+
+    return cas.Function("F", [x0, u, t0, dt], [x1])
+
 
 if __name__ == '__main__':
     import pytest
@@ -0,0 +1,198 @@
+from typing import List, Dict, Any
+import aerosandbox.numpy as np
+
+__all__ = ["ScalingReport"]
+
+
+class ScalingReport:
+    """
+    A diagnostic of how well-scaled an optimization problem is, evaluated at its initial guess. Generated by
+    `Opti.analyze_scaling()` (and by `Opti.solve(autoscale=True)`, which also applies it).
+
+    The scaling is assessed using the infinity-norms of the rows and columns of the constraint Jacobian (plus the
+    objective gradient), which should all be of order one in a well-scaled problem:
+
+        * For each constraint row, the scale factor is the one that would make its largest Jacobian entry equal to
+        one (i.e., row equilibration).
+
+        * For each variable column, after row equilibration has been applied, the scale factor is the one that would
+        make its largest Jacobian entry equal to one. This is a factor to multiply that variable's `scale` by.
+
+    These are then aggregated for each variable and constraint declaration (i.e., each line of code that declared
+    them), so that the worst-scaled parts of a problem can be traced back to their source.
+
+    Example usage:
+
+    >>> report = opti.analyze_scaling()
+    >>> print(report)  # Prints the worst-scaled variable and constraint declarations.
+    """
+
+    def __init__(self,
+                 constraint_scale_factors: np.ndarray,
+                 objective_scale_factor: float,
+                 variable_scale_factors: np.ndarray,
+                 variable_declarations: List[Dict[str, Any]],
+                 constraint_declarations: List[Dict[str, Any]],
+                 ):
+        """
+        Generally, you won't need to call this directly; use `ScalingReport.from_jacobian()` or
+        `Opti.analyze_scaling()`.
+
+        Args:
+            constraint_scale_factors: The scale factor for each scalar constraint (a vector of length n_constraints).
+
+            objective_scale_factor: The scale factor for the objective.
+
+            variable_scale_factors: The suggested factor to multiply each scalar variable's `scale` by (a vector of
+            length n_variables).
+
+            variable_declarations: A list of dictionaries, one per variable declaration. See
+            `ScalingReport.from_jacobian()` for the keys.
+
+            constraint_declarations: A list of dictionaries, one per constraint declaration. See
+            `ScalingReport.from_jacobian()` for the keys.
+
+        """
+        self.constraint_scale_factors = constraint_scale_factors
+        self.objective_scale_factor = objective_scale_factor
+        self.variable_scale_factors = variable_scale_factors
+        self.variable_declarations = variable_declarations
+        self.constraint_declarations = constraint_declarations
+
+    @classmethod
+    def from_jacobian(cls,
+                      jacobian,
+                      objective_gradient: np.ndarray,
+                      variable_declarations: List[Dict[str, Any]] = None,
+                      constraint_declarations: List[Dict[str, Any]] = None,
+                      min_scale_factor: float = 1e-8,
+                      max_scale_factor: float = 1e8,
+                      ) -> "ScalingReport":
+        """
+        Computes a ScalingReport from the constraint Jacobian and objective gradient at a point.
+
+        Args:
+            jacobian: The constraint Jacobian, as a SciPy sparse matrix of shape (n_constraints, n_variables).
+
+            objective_gradient: The objective gradient, as a vector of length n_variables.
+
+            variable_declarations: A list of dictionaries, one per variable declaration, with the keys
+            "filename", "lineno", "code_context", "start_index", and "n". If None, each scalar variable is treated as
+            its own declaration.
+
+            constraint_declarations: Same as `variable_declarations`, but for constraints.
+
+            min_scale_factor: The smallest allowable scale factor.
+
+            max_scale_factor: The largest allowable scale factor.
+
+        Returns: A ScalingReport. Each declaration dictionary is extended with the keys:
+
+            * "min_factor" and "max_factor": the smallest and largest scale factors of the scalar variables (or
+            constraints) in this declaration.
+
+            * "factor": the geometric mean of the scale factors in this declaration.
+
+            * "badness": the largest magnitude (in orders of magnitude) of any scale factor in this declaration.
+            Zero is perfectly scaled.
+
+        """
+        jacobian = jacobian.tocsr()
+        n_constraints, n_variables = jacobian.shape
+        objective_gradient = np.array(objective_gradient, dtype=float).reshape(-1)
+
+        def factors_from_norms(norms):
+            factors = np.ones_like(norms)
+            nonzero = norms > 0
+            factors[nonzero] = 1 / norms[nonzero]
+            return np.clip(factors, min_scale_factor, max_scale_factor)
+
+        ### Row (constraint and objective) equilibration
+        abs_jacobian = abs(jacobian)
+        row_norms = np.array(abs_jacobian.max(axis=1).todense()).reshape(-1) if n_constraints > 0 else np.zeros(0)
+        constraint_scale_factors = factors_from_norms(row_norms)
+
+        objective_norm = np.max(np.abs(objective_gradient)) if n_variables > 0 else 0
+        objective_scale_factor = float(factors_from_norms(np.array([objective_norm]))[0])
+
+        ### Column (variable) norms, after row equilibration
+        if n_constraints > 0:
+            scaled_jacobian = abs_jacobian.multiply(constraint_scale_factors.reshape((-1, 1))).tocsc()
+            column_norms = np.array(scaled_jacobian.max(axis=0).todense()).reshape(-1)
+        else:
+            column_norms = np.zeros(n_variables)
+        column_norms = np.maximum(column_norms, np.abs(objective_gradient) * objective_scale_factor)
+        variable_scale_factors = factors_from_norms(column_norms)
+
+        ### Aggregate by declaration
+        def aggregate(declarations, factors):
+            if declarations is None:
+                declarations = [
+                    {
+                        "filename"    : None,
+                        "lineno"      : None,
+                        "code_context": None,
+                        "start_index" : i,
+                        "n"           : 1,
+                    }
+                    for i in range(len(factors))
+                ]
+
+            aggregated = []
+            for declaration in declarations:
+                start = declaration["start_index"]
+                declaration_factors = factors[start:start + declaration["n"]]
+                if len(declaration_factors) == 0:
+                    continue
+                log_factors = np.log10(declaration_factors)
+                aggregated.append({
+                    **declaration,
+                    "min_factor": float(np.min(declaration_factors)),
+                    "max_factor": float(np.max(declaration_factors)),
+                    "factor"    : float(10 ** np.mean(log_factors)),
+                    "badness"   : float(np.max(np.abs(log_factors))),
+                })
+            return aggregated
+
+        return cls(
+            constraint_scale_factors=constraint_scale_factors,
+            objective_scale_factor=objective_scale_factor,
+            variable_scale_factors=variable_scale_factors,
+            variable_declarations=aggregate(variable_declarations, variable_scale_factors),
+            constraint_declarations=aggregate(constraint_declarations, constraint_scale_factors),
+        )
+
+    def worst_variable_declarations(self, n: int = 5) -> List[Dict[str, Any]]:
+        """
+        Returns the `n` worst-scaled variable declarations, worst first.
+        """
+        return sorted(self.variable_declarations, key=lambda d: -d["badness"])[:n]
+
+    def worst_constraint_declarations(self, n: int = 5) -> List[Dict[str, Any]]:
+        """
+        Returns the `n` worst-scaled constraint declarations, worst first.
+        """
+        return sorted(self.constraint_declarations, key=lambda d: -d["badness"])[:n]
+
+    def __repr__(self) -> str:
+
+        def describe(declaration):
+            if declaration["filename"] is None:
+                location = f"index {declaration['start_index']}"
+            else:
+                location = f"`{declaration['filename'].name}`, line {declaration['lineno']}"
+            code = "" if declaration["code_context"] is None else declaration["code_context"].strip()
+            return (
+                f"\t\t{declaration['badness']:5.1f} orders of magnitude off "
+                f"(factor {declaration['factor']:.3g}) | {location}: {code}"
+            )
+
+        lines = [
+            "ScalingReport:",
+            f"\tObjective scale factor: {self.objective_scale_factor:.3g}",
+            "\tWorst-scaled variable declarations (multiply their `scale` by the factor):",
+            *[describe(d) for d in self.worst_variable_declarations()],
+            "\tWorst-scaled constraint declarations (divide each constraint by its Jacobian row norm):",
+            *[describe(d) for d in self.worst_constraint_declarations()],
+        ]
+        return "\n".join(lines)
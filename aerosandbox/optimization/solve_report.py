@@ -0,0 +1,452 @@
+from typing import Union, List, Dict, Any
+from pathlib import Path
+import json
+import csv
+import aerosandbox.numpy as np
+
+__all__ = ["SolveReport", "compare_solve_reports"]
+
+
+class SolveReport:
+    """
+    A structured record of where the time went during an `Opti.solve()` call.
+
+    A SolveReport is automatically generated on every call to `Opti.solve()`, and is then accessible at
+    `Opti.solve_report`. It collects:
+
+        * The solver's return status and iteration count.
+
+        * The number of calls to (and time spent in) each of the NLP functions: the objective (`nlp_f`), the
+        constraints (`nlp_g`), the objective gradient (`nlp_grad_f`), the constraint Jacobian (`nlp_jac_g`),
+        and the Lagrangian Hessian (`nlp_hess_l`).
+
+        * The per-iteration history of the solve (objective value, primal and dual infeasibilities, barrier
+        parameter, step sizes, etc.)
+
+        * Some problem-size metadata (number of variables, constraints, and parameters).
+
+    Example usage:
+
+    >>> opti = asb.Opti()
+    >>> x = opti.variable(init_guess=5)
+    >>> opti.minimize(x ** 2)
+    >>> sol = opti.solve()
+    >>> report = opti.solve_report
+    >>> print(report)  # Prints a human-readable summary
+    >>> report.to_json("report.json")  # Saves the full report
+    >>> report.to_csv("iterations.csv")  # Saves the per-iteration history
+
+    Reports from different runs can be compared with `SolveReport.compare()` or `compare_solve_reports()`,
+    which is useful for detecting performance regressions.
+    """
+
+    nlp_function_names = [
+        "nlp_f",
+        "nlp_g",
+        "nlp_grad",
+        "nlp_grad_f",
+        "nlp_jac_g",
+        "nlp_hess_l",
+        "callback_fun",
+    ]
+
+    def __init__(self,
+                 return_status: str = "Unknown",
+                 success: bool = False,
+                 iter_count: int = 0,
+                 wall_time: float = np.nan,
+                 function_evaluations: Dict[str, Dict[str, float]] = None,
+                 iterations: Dict[str, List[float]] = None,
+                 trace: List[Dict[str, float]] = None,
+                 n_variables: int = 0,
+                 n_constraints: int = 0,
+                 n_parameters: int = 0,
+                 ):
+        """
+        Generally, you won't need to call this directly; use `SolveReport.from_stats()` or let `Opti.solve()`
+        generate one for you.
+
+        Args:
+            return_status: The return status string from the solver (e.g. "Solve_Succeeded").
+
+            success: Whether the solver reported success.
+
+            iter_count: The number of iterations taken by the solver.
+
+            wall_time: The total wall-clock time of the solve, in seconds.
+
+            function_evaluations: A dictionary where keys are NLP function names (e.g. "nlp_f") and values are
+            dictionaries with keys "n_calls", "t_wall", and "t_proc".
+
+            iterations: A dictionary where keys are per-iteration quantities (e.g. "obj", "inf_pr") and values are
+            lists with one entry per iteration.
+
+            trace: A list of dictionaries, one per iteration, as recorded live by the callback during the solve (
+            only populated if a `progress_hook` was given to `Opti.solve()`).
+
+            n_variables: Number of scalar decision variables in the problem.
+
+            n_constraints: Number of scalar constraints in the problem.
+
+            n_parameters: Number of scalar parameters in the problem.
+
+        """
+        if function_evaluations is None:
+            function_evaluations = {}
+        if iterations is None:
+            iterations = {}
+        if trace is None:
+            trace = []
+
+        self.return_status = return_status
+        self.success = success
+        self.iter_count = iter_count
+        self.wall_time = wall_time
+        self.function_evaluations = function_evaluations
+        self.iterations = iterations
+        self.trace = trace
+        self.n_variables = n_variables
+        self.n_constraints = n_constraints
+        self.n_parameters = n_parameters
+
+    @classmethod
+    def from_stats(cls,
+                   stats: Dict[str, Any],
+                   wall_time: float = np.nan,
+                   trace: List[Dict[str, float]] = None,
+                   n_variables: int = 0,
+                   n_constraints: int = 0,
+                   n_parameters: int = 0,
+                   ) -> "SolveReport":
+        """
+        Builds a SolveReport from the dictionary returned by CasADi's `stats()` (either `Opti.stats()` or
+        `OptiSol.stats()`).
+
+        Args:
+            stats: The stats dictionary from CasADi.
+
+            wall_time: The total wall-clock time of the solve, in seconds.
+
+            See `SolveReport.__init__()` for the remaining arguments.
+
+        Returns: A SolveReport.
+
+        """
+        function_evaluations = {}
+        for name in cls.nlp_function_names:
+            if f"n_call_{name}" not in stats:
+                continue
+            function_evaluations[name] = {
+                "n_calls": int(stats.get(f"n_call_{name}", 0)),
+                "t_wall" : float(stats.get(f"t_wall_{name}", 0.)),
+                "t_proc" : float(stats.get(f"t_proc_{name}", 0.)),
+            }
+
+        iterations = {
+            k: [float(vi) for vi in v]
+            for k, v in stats.get("iterations", {}).items()
+        }
+
+        return cls(
+            return_status=str(stats.get("return_status", "Unknown")),
+            success=bool(stats.get("success", False)),
+            iter_count=int(stats.get("iter_count", 0)),
+            wall_time=wall_time,
+            function_evaluations=function_evaluations,
+            iterations=iterations,
+            trace=trace,
+            n_variables=n_variables,
+            n_constraints=n_constraints,
+            n_parameters=n_parameters,
+        )
+
+    @classmethod
+    def concatenate(cls,
+                    reports: List["SolveReport"],
+                    ) -> "SolveReport":
+        """
+        Combines the reports of several solves of the same problem that were run one after another (e.g., a solve
+        that is then used to warm-start another) into a single report that covers all of them.
+
+        Iteration counts, wall times, and function evaluation counts and times are summed, and the per-iteration
+        histories are concatenated. The return status is that of the last solve.
+
+        Args:
+            reports: The SolveReports, in the order that the solves were run.
+
+        Returns: A SolveReport.
+
+        """
+        function_evaluations = {}
+        for report in reports:
+            for name, evals in report.function_evaluations.items():
+                total = function_evaluations.setdefault(name, {"n_calls": 0, "t_wall": 0., "t_proc": 0.})
+                for k in total:
+                    total[k] += evals[k]
+
+        iterations = {}
+        for report in reports:
+            for k, v in report.iterations.items():
+                iterations.setdefault(k, []).extend(v)
+
+        return cls(
+            return_status=reports[-1].return_status,
+            success=reports[-1].success,
+            iter_count=sum([report.iter_count for report in reports]),
+            wall_time=sum([report.wall_time for report in reports]),
+            function_evaluations=function_evaluations,
+            iterations=iterations,
+            trace=[point for report in reports for point in report.trace],
+            n_variables=reports[-1].n_variables,
+            n_constraints=reports[-1].n_constraints,
+            n_parameters=reports[-1].n_parameters,
+        )
+
+    ### Derived quantities
+
+    @property
+    def nlp_function_time(self) -> float:
+        """
+        The total wall-clock time spent evaluating NLP functions (objective, constraints, and their derivatives),
+        in seconds.
+        """
+        return sum([
+            v["t_wall"]
+            for k, v in self.function_evaluations.items()
+            if k != "callback_fun"
+        ])
+
+    @property
+    def solver_time(self) -> float:
+        """
+        The wall-clock time spent outside of NLP function evaluations, in seconds. This includes solver setup (
+        e.g., building the derivative functions) as well as the solver itself; for IPOPT on large problems,
+        this is typically dominated by the linear solver (e.g. MUMPS).
+        """
+        return self.wall_time - self.nlp_function_time
+
+    @property
+    def constraint_violation_history(self) -> List[float]:
+        """
+        The primal infeasibility (i.e., maximum constraint violation) at each iteration.
+        """
+        return self.iterations.get("inf_pr", [])
+
+    @property
+    def objective_history(self) -> List[float]:
+        """
+        The objective function value at each iteration.
+        """
+        return self.iterations.get("obj", [])
+
+    def summary_metrics(self) -> Dict[str, float]:
+        """
+        Returns a flat dictionary of the key scalar metrics of this solve, suitable for tabulation and comparison.
+        """
+        metrics = {
+            "success"           : float(self.success),
+            "iter_count"        : float(self.iter_count),
+            "wall_time"         : float(self.wall_time),
+            "nlp_function_time" : float(self.nlp_function_time),
+            "solver_time"       : float(self.solver_time),
+        }
+        for name, evals in self.function_evaluations.items():
+            metrics[f"n_call_{name}"] = float(evals["n_calls"])
+            metrics[f"t_wall_{name}"] = float(evals["t_wall"])
+
+        return metrics
+
+    ### Export
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary representation of this SolveReport.
+        """
+        return {
+            "return_status"       : self.return_status,
+            "success"             : self.success,
+            "iter_count"          : self.iter_count,
+            "wall_time"           : self.wall_time,
+            "function_evaluations": self.function_evaluations,
+            "iterations"          : self.iterations,
+            "trace"               : self.trace,
+            "n_variables"         : self.n_variables,
+            "n_constraints"       : self.n_constraints,
+            "n_parameters"        : self.n_parameters,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "SolveReport":
+        """
+        Reconstructs a SolveReport from the output of `SolveReport.to_dict()`.
+        """
+        return cls(**d)
+
+    def to_json(self,
+                filename: Union[str, Path] = None,
+                ) -> str:
+        """
+        Serializes this SolveReport to JSON.
+
+        Args:
+            filename: [Optional] If given, the JSON is also written to this file.
+
+        Returns: The JSON string.
+
+        """
+        s = json.dumps(self.to_dict(), indent=4)
+        if filename is not None:
+            with open(filename, "w+") as f:
+                f.write(s)
+        return s
+
+    @classmethod
+    def from_json(cls,
+                  filename: Union[str, Path],
+                  ) -> "SolveReport":
+        """
+        Loads a SolveReport from a JSON file written by `SolveReport.to_json()`.
+        """
+        with open(filename, "r") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_csv(self,
+               filename: Union[str, Path],
+               ) -> None:
+        """
+        Writes the per-iteration history of this solve to a CSV file, with one row per iteration.
+
+        Args:
+            filename: The file to write to.
+
+        Returns: None
+
+        """
+        columns = list(self.iterations.keys())
+        n_rows = max([len(v) for v in self.iterations.values()], default=0)
+
+        with open(filename, "w+", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["iteration"] + columns)
+            for i in range(n_rows):
+                writer.writerow([i] + [
+                    self.iterations[k][i] if i < len(self.iterations[k]) else ""
+                    for k in columns
+                ])
+
+    ### Comparison
+
+    def compare(self,
+                baseline: "SolveReport",
+                rtol: float = 0.2,
+                metrics: List[str] = None,
+                ) -> Dict[str, Dict[str, Any]]:
+        """
+        Compares this SolveReport against a baseline SolveReport (e.g., from a previous nightly run).
+
+        Args:
+            baseline: The SolveReport to compare against.
+
+            rtol: The relative increase in a metric (compared to the baseline) above which it is flagged as a
+            regression. For example, `rtol=0.2` flags any metric that is more than 20% higher than the baseline.
+
+            metrics: [Optional] The names of the metrics to compare (see `SolveReport.summary_metrics()`). Defaults
+            to all metrics common to both reports.
+
+        Returns: A dictionary where keys are metric names and values are dictionaries with the keys:
+
+            * "baseline": the value of the metric in the baseline report.
+            * "current": the value of the metric in this report.
+            * "ratio": current / baseline.
+            * "regression": True if the metric got worse by more than `rtol`.
+
+        """
+        current_metrics = self.summary_metrics()
+        baseline_metrics = baseline.summary_metrics()
+
+        if metrics is None:
+            metrics = [k for k in current_metrics.keys() if k in baseline_metrics]
+
+        comparison = {}
+        for k in metrics:
+            current = current_metrics[k]
+            base = baseline_metrics[k]
+
+            if base == 0:
+                ratio = 1. if current == 0 else np.inf
+            else:
+                ratio = current / base
+
+            if k == "success":  # For success, a regression is a drop, not a rise.
+                regression = current < base
+            else:
+                regression = bool(ratio > 1 + rtol)
+
+            comparison[k] = {
+                "baseline"  : base,
+                "current"   : current,
+                "ratio"     : ratio,
+                "regression": regression,
+            }
+
+        return comparison
+
+    def __repr__(self) -> str:
+        lines = [
+            f"SolveReport: {self.return_status} in {self.iter_count} iterations, {self.wall_time:.4g} s wall time",
+            f"\tProblem size: {self.n_variables} variables, {self.n_constraints} constraints, {self.n_parameters} parameters",
+            f"\tNLP function time: {self.nlp_function_time:.4g} s; solver time: {self.solver_time:.4g} s",
+        ]
+        for name, evals in self.function_evaluations.items():
+            if evals["n_calls"] == 0:
+                continue
+            lines.append(
+                f"\t\t{name:<12}: {evals['n_calls']:>6} calls, {evals['t_wall']:.4g} s"
+            )
+        if len(self.constraint_violation_history) > 0:
+            lines.append(
+                f"\tFinal constraint violation: {self.constraint_violation_history[-1]:.4g}"
+            )
+        return "\n".join(lines)
+
+
+def compare_solve_reports(
+        reports: Dict[str, SolveReport],
+        baseline: str = None,
+        rtol: float = 0.2,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compares a set of named SolveReports (e.g., one per nightly run, or one per solver setting) against a baseline.
+
+    Example:
+
+    >>> comparison = compare_solve_reports({
+    >>>     "last_night": SolveReport.from_json("last_night.json"),
+    >>>     "tonight"   : SolveReport.from_json("tonight.json"),
+    >>> }, baseline="last_night")
+
+    Args:
+        reports: A dictionary where keys are run names and values are SolveReports.
+
+        baseline: The name of the run to use as the baseline. Defaults to the first run in `reports`.
+
+        rtol: The relative increase in a metric above which it is flagged as a regression. See
+        `SolveReport.compare()`.
+
+    Returns: A dictionary where keys are run names (excluding the baseline) and values are the output of
+    `SolveReport.compare()` against the baseline.
+
+    """
+    if len(reports) == 0:
+        raise ValueError("You must supply at least one SolveReport!")
+
+    if baseline is None:
+        baseline = list(reports.keys())[0]
+
+    baseline_report = reports[baseline]
+
+    return {
+        name: report.compare(baseline_report, rtol=rtol)
+        for name, report in reports.items()
+        if name != baseline
+    }
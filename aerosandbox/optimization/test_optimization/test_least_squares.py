@@ -0,0 +1,96 @@
+from aerosandbox.optimization.least_squares import solve_least_squares
+import numpy as np
+import pytest
+
+
+def rosenbrock_problems(a):
+    """
+    Returns the cost and normal equations functions for a batch of Rosenbrock problems, with residuals r(x) = [
+    10 * (x1 - x0 ** 2), a - x0 ], which have minima at x = (a, a ** 2).
+    """
+
+    def residuals(x):
+        return np.stack([
+            10 * (x[:, 1] - x[:, 0] ** 2),
+            a - x[:, 0],
+        ], axis=1)
+
+    def jacobians(x):
+        J = np.zeros((len(x), 2, 2))
+        J[:, 0, 0] = -20 * x[:, 0]
+        J[:, 0, 1] = 10
+        J[:, 1, 0] = -1
+        return J
+
+    def cost(x):
+        return np.sum(residuals(x) ** 2, axis=1)
+
+    def normal_equations(x):
+        r = residuals(x)
+        J = jacobians(x)
+        return np.sum(r ** 2, axis=1), np.einsum("nri,nrj->nij", J, J), np.einsum("nri,nr->ni", J, r)
+
+    return cost, normal_equations
+
+
+def test_batched_rosenbrock():
+    a = np.linspace(-1, 2, 7)
+    cost, normal_equations = rosenbrock_problems(a)
+
+    x, converged = solve_least_squares(
+        cost=cost,
+        normal_equations=normal_equations,
+        x0=np.tile([-1.2, 1], (len(a), 1)),
+    )
+    assert np.all(converged)
+    assert x[:, 0] == pytest.approx(a, abs=1e-6)
+    assert x[:, 1] == pytest.approx(a ** 2, abs=1e-6)
+
+
+def test_bounds():
+    cost, normal_equations = rosenbrock_problems(np.array([1., 1.]))
+
+    x, converged = solve_least_squares(
+        cost=cost,
+        normal_equations=normal_equations,
+        x0=np.array([[0., 0.], [0., 0.]]),
+        upper_bounds=np.array([[0.5, np.inf], [np.inf, np.inf]]),  # Only the first problem is bounded
+    )
+    assert np.all(converged)
+    assert x[0, 0] == pytest.approx(0.5)
+    assert x[0, 1] == pytest.approx(0.25, abs=1e-6)
+    assert x[1] == pytest.approx([1, 1], abs=1e-6)
+
+
+def test_non_convergence():
+    cost, normal_equations = rosenbrock_problems(np.array([1., 1.]))
+
+    def cost_nan_in_second_problem(x):
+        c = cost(x)
+        c[1] = np.nan
+        return c
+
+    def normal_equations_nan_in_second_problem(x):
+        c, JTJ, JTr = normal_equations(x)
+        c[1] = np.nan
+        return c, JTJ, JTr
+
+    x, converged = solve_least_squares(
+        cost=cost_nan_in_second_problem,
+        normal_equations=normal_equations_nan_in_second_problem,
+        x0=np.array([[-1.2, 1], [-1.2, 1]]),
+    )
+    assert converged[0] and not converged[1]
+    assert x[1] == pytest.approx([-1.2, 1])
+
+    _, converged = solve_least_squares(
+        cost=cost,
+        normal_equations=normal_equations,
+        x0=np.array([[-1.2, 1], [-1.2, 1]]),
+        max_iter=2,
+    )
+    assert not np.any(converged)
+
+
+if __name__ == '__main__':
+    pytest.main()
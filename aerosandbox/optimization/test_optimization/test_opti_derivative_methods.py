@@ -0,0 +1,120 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+"""
+These tests solve the initial value problem:
+
+    dx/dt = -x, x(0) = 1
+
+on t in [0, 2] with various integration methods, and compare against the exact solution x = exp(-t).
+"""
+
+
+def solve_decay(method, time):
+    opti = asb.Opti()
+
+    x = opti.variable(init_guess=1, n_vars=np.length(time))
+
+    opti.constrain_derivative(
+        derivative=-x,
+        variable=x,
+        with_respect_to=time,
+        method=method,
+    )
+    opti.subject_to(x[0] == 1)
+
+    sol = opti.solve(verbose=False)
+
+    return np.max(np.abs(sol.value(x) - np.exp(-time)))
+
+
+def test_trapezoidal():
+    error = solve_decay("trapezoidal", np.linspace(0, 2, 11))
+    assert 1e-5 < error < 1e-2  # Second-order accurate
+
+
+@pytest.mark.parametrize("method", ["simpson", "rk4", "runge-kutta-3/8"])
+def test_fourth_order_methods(method):
+    error_coarse = solve_decay(method, np.linspace(0, 2, 11))
+    error_fine = solve_decay(method, np.linspace(0, 2, 21))
+    assert error_coarse < 1e-4
+    assert error_coarse / error_fine > 10  # At least fourth-order convergence, roughly 2^4 = 16
+
+
+def test_radau():
+    error = solve_decay("radau", np.radauspace(0, 2, 11))
+    assert error < 1e-9  # Spectral accuracy
+
+
+def test_radau_variable_final_time():
+    opti = asb.Opti()
+
+    time_final = opti.variable(init_guess=1)
+    time = np.radauspace(0, 1, 11) * time_final
+
+    x = opti.variable(init_guess=1, n_vars=11)
+    opti.constrain_derivative(
+        derivative=-x,
+        variable=x,
+        with_respect_to=time,
+        method="radau",
+    )
+    opti.subject_to([
+        x[0] == 1,
+        x[-1] == np.exp(-2)
+    ])
+
+    sol = opti.solve(verbose=False)
+    assert sol.value(time_final) == pytest.approx(2, rel=1e-6)
+
+
+def test_hermite_simpson():
+    time = np.linspace(0, 2, 11)
+
+    opti = asb.Opti()
+
+    x = opti.variable(init_guess=1, n_vars=np.length(time))
+
+    x_mid, dxdt_mid = opti.constrain_derivative(
+        derivative=-x,
+        variable=x,
+        with_respect_to=time,
+        method="hermite-simpson",
+    )
+    opti.subject_to([
+        dxdt_mid == -x_mid,
+        x[0] == 1,
+    ])
+
+    sol = opti.solve(verbose=False)
+    assert np.max(np.abs(sol.value(x) - np.exp(-time))) < 1e-5
+
+
+@pytest.mark.parametrize("method,tolerance", [
+    ("forward euler", 1e-1),
+    ("midpoint", 1e-2),
+    ("rk4", 1e-4),
+    ("radau", 1e-8),
+])
+def test_explicit_derivative(method, tolerance):
+    time = np.radauspace(0, 2, 21)
+
+    opti = asb.Opti()
+
+    x = opti.variable(init_guess=np.sin(time))
+    dxdt = opti.derivative_of(
+        x,
+        with_respect_to=time,
+        derivative_init_guess=0,
+        method=method,
+        explicit=True,
+    )
+    assert opti._variable_index_counter == 21  # No new variables are added
+
+    dxdt_value = opti.value(dxdt, opti.initial())
+    assert np.max(np.abs(dxdt_value - np.cos(time))) < tolerance
+
+
+if __name__ == '__main__':
+    pytest.main()
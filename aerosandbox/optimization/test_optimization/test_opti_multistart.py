@@ -0,0 +1,77 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def test_multistart_finds_global_minimum():
+    opti = asb.Opti()
+    x = opti.variable(init_guess=1, lower_bound=-3, upper_bound=3)
+    opti.minimize(x ** 4 - 4 * x ** 2 + x)
+
+    ### A regular solve from this initial guess finds the local minimum
+    sol = opti.solve(verbose=False)
+    assert sol.value(x) == pytest.approx(1.3474, abs=1e-3)
+
+    ### Multi-start finds the global one
+    sol = opti.solve_multistart(n_starts=8, seed=0)
+    assert sol.value(x) == pytest.approx(-1.4730, abs=1e-3)
+
+    solutions = opti.multistart_solutions
+    assert len(solutions) == 2
+    assert solutions[0].objective < solutions[1].objective
+    assert sum(s.n_hits for s in solutions) == 8
+
+
+def test_multistart_parallel():
+    opti = asb.Opti()
+    x = opti.variable(init_guess=0.5, lower_bound=0, upper_bound=10)
+    y = opti.variable(init_guess=0.5, scale=2)  # Unbounded
+    opti.minimize(
+        -np.cos(2 * x) + x / 10 + (y - 1) ** 2
+    )
+    opti.subject_to(y >= x / 5)
+
+    sol = opti.solve_multistart(
+        n_starts=16,
+        sampling="sobol",
+        n_workers=2,
+        seed=0,
+    )
+    assert sol.value(x) == pytest.approx(0, abs=1e-4)
+    assert sol.value(y) == pytest.approx(1, abs=1e-4)
+    assert len(opti.multistart_solutions) > 1
+    assert opti.solve_report.success
+
+
+def test_multistart_log_transform_and_parameters():
+    opti = asb.Opti()
+    p = opti.parameter(value=2)
+    x = opti.variable(init_guess=1, log_transform=True, lower_bound=1e-2, upper_bound=1e2)
+    opti.minimize((np.log(x) - np.log(p)) ** 2)
+
+    sol = opti.solve_multistart(n_starts=4, sampling="random", seed=0)
+    assert sol.value(x) == pytest.approx(2, rel=1e-4)
+    assert len(opti.multistart_solutions) == 1
+    assert opti.multistart_solutions[0].n_hits == 4
+
+
+def test_multistart_forwards_solve_arguments():
+    opti = asb.Opti()
+    p = opti.parameter(value=1)
+    x = opti.variable(init_guess=0, lower_bound=-3, upper_bound=3)
+    opti.minimize((x - p) ** 2)
+
+    progress = []
+    sol = opti.solve_multistart(
+        n_starts=4,
+        seed=0,
+        parameter_mapping={p: 2},  # Used for all of the solves
+        progress_hook=progress.append,
+    )
+    assert sol.value(x) == pytest.approx(2)
+    assert all(s.x[0] == pytest.approx(2, abs=1e-6) for s in opti.multistart_solutions)
+    assert len(progress) > 0
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,95 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def poorly_scaled_opti(c=1e5):
+    opti = asb.Opti()
+
+    x = opti.variable(init_guess=10)
+    y = opti.variable(init_guess=10)
+    unused = opti.variable(init_guess=1)  # Not part of the problem
+
+    opti.subject_to(x * c <= 0.9 * c)
+    opti.subject_to(y / c <= 0.9 / c)
+    opti.subject_to(x + y <= 10)
+
+    opti.minimize((1 - x) ** 2 + 100 * (y - x ** 2) ** 2)
+
+    return opti, x, y
+
+
+def test_analyze_scaling():
+    opti, x, y = poorly_scaled_opti()
+
+    report = opti.analyze_scaling()
+
+    # Jacobian entries are with respect to the underlying (unscaled) variables, which have a scale of 10 here.
+    assert report.constraint_scale_factors == pytest.approx([1e-6, 1e4, 0.1])
+
+    worst = report.worst_constraint_declarations(n=2)
+    assert [d["lineno"] for d in worst] == [
+        opti._constraint_declarations[0][1],  # x * c <= 0.9 * c
+        opti._constraint_declarations[1][1],  # y / c <= 0.9 / c
+    ]
+    assert worst[0]["badness"] == pytest.approx(6)
+
+    assert len(report.variable_declarations) == 3
+    assert "ScalingReport" in str(report)
+
+
+def test_autoscale_solve():
+    opti, x, y = poorly_scaled_opti()
+
+    sol = opti.solve(autoscale=True, verbose=False)
+
+    assert sol.value(x) == pytest.approx(0.9, abs=1e-4)
+    assert sol.value(y) == pytest.approx(0.81, abs=1e-4)
+    assert opti.scaling_report is not None
+    assert opti.ng == 3
+
+
+def test_autoscale_leaves_problem_untouched():
+    opti = asb.Opti()
+    x = opti.variable(init_guess=10)
+    dual = opti.subject_to(x * 1e5 >= 2e5)
+    opti.minimize(x ** 2)
+    g = opti.g
+
+    for _ in range(2):  # Repeated autoscaled solves shouldn't compound the scaling.
+        sol = opti.solve(autoscale=True, verbose=False)
+        assert str(opti.g) == str(g)
+        assert sol.value(x) == pytest.approx(2)
+        assert sol.value(dual) == pytest.approx(4e-5)  # d(objective) / d(constraint bound), unscaled
+
+
+
+def test_autoscale_restores_initial_guesses_and_reports_both_solves():
+    opti, x, y = poorly_scaled_opti()
+
+    sol = opti.solve(autoscale=True, verbose=False)
+    assert sol.value(x) == pytest.approx(0.9, abs=1e-4)
+    assert opti.value(x, opti.initial()) == pytest.approx(10)
+    assert opti.value(y, opti.initial()) == pytest.approx(10)
+
+    # Each solve's iteration history has one more entry than its iteration count (for the initial point).
+    report = opti.solve_report
+    assert report.success
+    assert len(report.objective_history) == report.iter_count + 2
+    assert report.function_evaluations["nlp_f"]["n_calls"] > 0
+
+
+def test_autoscale_failed_scaled_solve():
+    opti, x, y = poorly_scaled_opti()
+
+    with pytest.warns(UserWarning, match="autoscaled solve failed"):
+        with pytest.raises(RuntimeError):
+            opti.solve(autoscale=True, max_iter=2, verbose=False)
+
+    assert opti.value(x, opti.initial()) == pytest.approx(10)
+    assert opti.solve_report.iter_count == 4
+    assert not opti.solve_report.success
+
+
+if __name__ == '__main__':
+    pytest.main()
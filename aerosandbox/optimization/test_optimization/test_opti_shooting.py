@@ -0,0 +1,84 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def oscillator_dynamics(x, u, t):
+    return [
+        x[1],
+        -x[0] - 0.1 * x[1] + u[0]
+    ]
+
+
+@pytest.mark.parametrize("shooting", ["multiple", "single"])
+def test_minimum_effort_oscillator_control(shooting):
+    """
+    Brings a damped oscillator to rest with minimum control effort. Single and multiple shooting should agree.
+    """
+    N = 51
+    time = np.linspace(0, 10, N)
+
+    opti = asb.Opti()
+
+    u = opti.variable(init_guess=0, n_vars=N)
+
+    states = opti.shooting_trajectory(
+        dynamics=oscillator_dynamics,
+        time=time,
+        state_init_guess=[1, 0],
+        controls=u,
+        shooting=shooting,
+    )
+
+    opti.subject_to([
+        states[0, 0] == 1,
+        states[0, 1] == 0,
+        states[-1, 0] == 0,
+        states[-1, 1] == 0,
+    ])
+    opti.minimize(np.sum(u[:-1] ** 2))
+
+    sol = opti.solve(verbose=False)
+
+    assert sol.value(opti.f) == pytest.approx(0.6290, abs=1e-3)
+
+    if shooting == "single":
+        assert opti.nx == N + 2  # Only the controls and the initial state are variables
+
+
+def test_exponential_decay_accuracy():
+    time = np.linspace(0, 2, 21)
+
+    opti = asb.Opti()
+    states = opti.shooting_trajectory(
+        dynamics=lambda x, u, t: -x,
+        time=time,
+        state_init_guess=[1],
+    )
+    opti.subject_to(states[0, 0] == 1)
+
+    sol = opti.solve(verbose=False)
+
+    assert sol.value(states[:, 0]) == pytest.approx(np.exp(-time), abs=1e-6)
+
+
+def test_cvodes_integrator():
+    time = np.linspace(0, 2, 5)
+
+    opti = asb.Opti()
+    states = opti.shooting_trajectory(
+        dynamics=lambda x, u, t: -x,
+        time=time,
+        state_init_guess=[1],
+        integrator="cvodes",
+        shooting="single",
+    )
+    opti.subject_to(states[0, 0] == 1)
+
+    sol = opti.solve(verbose=False)
+
+    assert sol.value(states[:, 0]) == pytest.approx(np.exp(-time), rel=1e-4)
+
+
+if __name__ == '__main__':
+    pytest.main()
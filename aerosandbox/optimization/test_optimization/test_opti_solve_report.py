@@ -0,0 +1,91 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+
+def rosenbrock_opti():
+    opti = asb.Opti()
+
+    x = opti.variable(init_guess=0)
+    y = opti.variable(init_guess=0)
+
+    opti.subject_to(x ** 2 + y ** 2 <= 1)
+    opti.minimize(
+        (1 - x) ** 2 + 100 * (y - x ** 2) ** 2
+    )
+
+    return opti
+
+
+def test_solve_report_contents():
+    opti = rosenbrock_opti()
+    sol = opti.solve(verbose=False)
+
+    report = opti.solve_report
+    assert report.success
+    assert report.iter_count == sol.stats()['iter_count']
+    assert report.n_variables == 2
+    assert report.n_constraints == 1
+    assert report.function_evaluations["nlp_f"]["n_calls"] > 0
+    assert report.wall_time > 0
+    assert len(report.objective_history) == report.iter_count + 1
+    assert report.constraint_violation_history[-1] == pytest.approx(0, abs=1e-6)
+    assert report.trace == []  # No progress hook given
+
+
+def test_solve_report_progress_hook():
+    opti = rosenbrock_opti()
+
+    progress = []
+    opti.solve(
+        verbose=False,
+        progress_hook=lambda p: progress.append(p),
+    )
+
+    report = opti.solve_report
+    assert len(progress) == report.iter_count + 1
+    assert report.trace == progress
+    assert progress[-1]["objective"] == pytest.approx(report.objective_history[-1])
+    assert progress[-1]["constraint_violation"] == pytest.approx(0, abs=1e-6)
+
+
+def test_solve_report_on_failure():
+    opti = rosenbrock_opti()
+
+    with pytest.raises(RuntimeError):
+        opti.solve(verbose=False, max_iter=2)
+
+    assert not opti.solve_report.success
+    assert opti.solve_report.iter_count == 2
+
+
+def test_solve_report_export_and_compare(tmp_path):
+    opti = rosenbrock_opti()
+    opti.solve(verbose=False)
+    report = opti.solve_report
+
+    report.to_json(tmp_path / "report.json")
+    loaded = asb.SolveReport.from_json(tmp_path / "report.json")
+    assert loaded.iter_count == report.iter_count
+    assert loaded.function_evaluations == report.function_evaluations
+
+    report.to_csv(tmp_path / "iterations.csv")
+    with open(tmp_path / "iterations.csv") as f:
+        assert len(f.readlines()) == report.iter_count + 2  # Header row, plus the initial point
+
+    ### A slower run should be flagged as a regression
+    slow = asb.SolveReport.from_dict(report.to_dict())
+    slow.iter_count = 2 * report.iter_count
+
+    comparison = asb.compare_solve_reports(
+        {
+            "baseline": report,
+            "slow"    : slow,
+        }
+    )
+    assert comparison["slow"]["iter_count"]["regression"]
+    assert not comparison["slow"]["success"]["regression"]
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -1,9 +1,8 @@
-from aerosandbox.common import AeroSandboxObject
+from aerosandbox.common import AeroSandboxObject, _get_init_arg_names
 from aerosandbox import Atmosphere
 import aerosandbox.numpy as np
-from typing import Tuple, Union, Dict, List
+from typing import Tuple, Union, Dict, List, Any
 from aerosandbox.tools.string_formatting import trim_string
-import inspect
 
 
 class OperatingPoint(AeroSandboxObject):
@@ -71,14 +70,10 @@ class OperatingPoint(AeroSandboxObject):
 
         """
 
-        ### Get a list of all the inputs that the class constructor wants to see
-        init_signature = inspect.signature(self.__class__.__init__)
-        init_args = list(init_signature.parameters.keys())[1:]  # Ignore 'self'
-
         ### Create a new instance, and give the constructor all the inputs it wants to see (based on values in this instance)
         new_op_point: __class__ = self.__class__(**{
             k: getattr(self, k)
-            for k in init_args
+            for k in _get_init_arg_names(self.__class__)
         })
 
         ### Overwrite the state variables in the new instance with those from the input
@@ -195,6 +190,8 @@ class OperatingPoint(AeroSandboxObject):
         """
 
         def get_item_of_attribute(a):
+            if isinstance(a, (int, float)):  # Fast path, since scalars are not subscriptable
+                return a
             try:
                 return a[index]
             except TypeError as e:  # object is not subscriptable
@@ -206,8 +203,10 @@ class OperatingPoint(AeroSandboxObject):
 
         new_instance = self.get_new_instance_with_state()
 
-        for k, v in new_instance.__dict__.items():
-            setattr(new_instance, k, get_item_of_attribute(v))
+        new_instance.__dict__.update({
+            k: get_item_of_attribute(v)
+            for k, v in new_instance.__dict__.items()
+        })
 
         return new_instance
 
@@ -348,16 +347,12 @@ class OperatingPoint(AeroSandboxObject):
             y_b = y_from
             z_b = z_from
         elif from_axes == "wind":
-            sa = np.sind(self.alpha)
-            ca = np.cosd(self.alpha)
-            sb = np.sind(self.beta)
-            cb = np.cosd(self.beta)
+            sa, ca, sb, cb = self._get_rotation_cache()["trig"]
             x_b = (cb * ca) * x_from + (-sb * ca) * y_from + (-sa) * z_from
             y_b = (sb) * x_from + (cb) * y_from  # Note: z term is 0; not forgotten.
             z_b = (cb * sa) * x_from + (-sb * sa) * y_from + (ca) * z_from
         elif from_axes == "stability":
-            sa = np.sind(self.alpha)
-            ca = np.cosd(self.alpha)
+            sa, ca, _, _ = self._get_rotation_cache()["trig"]
             x_b = ca * x_from - sa * z_from
             y_b = y_from
             z_b = sa * x_from + ca * z_from
@@ -373,16 +368,12 @@ class OperatingPoint(AeroSandboxObject):
             y_to = y_b
             z_to = z_b
         elif to_axes == "wind":
-            sa = np.sind(self.alpha)
-            ca = np.cosd(self.alpha)
-            sb = np.sind(self.beta)
-            cb = np.cosd(self.beta)
+            sa, ca, sb, cb = self._get_rotation_cache()["trig"]
             x_to = (cb * ca) * x_b + (sb) * y_b + (cb * sa) * z_b
             y_to = (-sb * ca) * x_b + (cb) * y_b + (-sb * sa) * z_b
             z_to = (-sa) * x_b + (ca) * z_b  # Note: y term is 0; not forgotten.
         elif to_axes == "stability":
-            sa = np.sind(self.alpha)
-            ca = np.cosd(self.alpha)
+            sa, ca, _, _ = self._get_rotation_cache()["trig"]
             x_to = ca * x_b + sa * z_b
             y_to = y_b
             z_to = -sa * x_b + ca * z_b
@@ -391,30 +382,209 @@ class OperatingPoint(AeroSandboxObject):
 
         return x_to, y_to, z_to
 
+    def convert_axes_batch(self,
+                           vectors: np.ndarray,
+                           from_axes: str,
+                           to_axes: str,
+                           ) -> np.ndarray:
+        """
+        Converts a batch of vectors, given as the rows of an (N, 3) array (or a single vector, as a (3,) array) in the
+        `from_axes` frame, to the `to_axes` frame. Equivalent to calling `OperatingPoint.convert_axes()` on each row,
+        but does the conversion in a single matrix multiply.
+
+        The OperatingPoint may be array-valued (e.g., a vector of `OperatingPoint.alpha` values of length N), in
+        which case row i of `vectors` is converted using the i-th operating point.
+
+        Useful for converting, e.g., stacked forces and moments at once:
+
+        >>> F_b, M_b = op_point.convert_axes_batch(
+        >>>     np.stack([F_g, M_g]), # Shape: (2, 3)
+        >>>     from_axes="geometry",
+        >>>     to_axes="body",
+        >>> )
+
+        Args:
+            vectors: The vectors to convert, as an (N, 3) array of [x, y, z] rows, or a (3,) array.
+            from_axes: The axes to convert from. See `OperatingPoint.convert_axes()` for valid options.
+            to_axes: The axes to convert to. See `OperatingPoint.convert_axes()` for valid options.
+
+        Returns: The converted vectors, with the same shape as `vectors`.
+
+        """
+        if from_axes == to_axes:
+            return vectors
+
+        R = self._get_rotation_matrix(from_axes=from_axes, to_axes=to_axes)
+
+        if not np.is_casadi_type([vectors, R], recursive=True):
+            vectors = np.asarray(vectors, dtype=float)
+            if len(R.shape) == 2:
+                return vectors @ R.T
+            else:  # An array-valued OperatingPoint, where R has shape (N, 3, 3)
+                return np.einsum("...ij,...j->...i", R, vectors)
+
+        ### CasADi fallback: convert each component separately. (CasADi-typed `vectors` must have shape (N, 3).)
+        if np.is_casadi_type(vectors, recursive=False) or (
+                isinstance(vectors, np.ndarray) and len(vectors.shape) == 2
+        ):
+            return np.stack(
+                self.convert_axes(
+                    vectors[:, 0], vectors[:, 1], vectors[:, 2],
+                    from_axes=from_axes, to_axes=to_axes
+                ),
+                axis=1
+            )
+        else:
+            return np.array(
+                self.convert_axes(
+                    vectors[0], vectors[1], vectors[2],
+                    from_axes=from_axes, to_axes=to_axes
+                )
+            )
+
+    def compute_rotation_matrix(self,
+                                from_axes: str,
+                                to_axes: str,
+                                ) -> np.ndarray:
+        """
+        Computes the rotation matrix R that converts vectors from the `from_axes` frame to the `to_axes` frame,
+        such that `v_to = R @ v_from`. See `OperatingPoint.convert_axes()` for the valid axes and conventions.
+
+        Rotation matrices are cached on the OperatingPoint, so repeated calls at the same `alpha` and `beta` are
+        cheap.
+
+        Args:
+            from_axes: The axes to convert from.
+            to_axes: The axes to convert to.
+
+        Returns: A 3x3 rotation matrix. If this OperatingPoint is array-valued (with N points), an (N, 3, 3) array of
+        rotation matrices instead.
+
+        """
+        R = self._get_rotation_matrix(from_axes=from_axes, to_axes=to_axes)
+        if isinstance(R, np.ndarray):
+            R = R.copy()  # So that the cached copy can't be modified in-place.
+        return R
+
     def compute_rotation_matrix_wind_to_geometry(self) -> np.ndarray:
         """
         Computes the 3x3 rotation matrix that transforms from wind axes to geometry axes.
 
-        Returns: a 3x3 rotation matrix.
+        Note: this matrix takes the opposite sign convention for `beta` from that of `convert_axes()` and
+        `compute_rotation_matrix()`; it's kept as-is, since the freestream of several aerodynamic analyses is defined
+        by it.
+
+        The matrix is cached on the OperatingPoint, so repeated calls at the same `alpha` and `beta` are cheap.
+
+        Returns: a 3x3 rotation matrix. If this OperatingPoint is array-valued (with N points), an (N, 3, 3) array
+        of rotation matrices instead.
 
         """
+        matrices = self._get_rotation_cache()["matrices"]
 
-        alpha_rotation = np.rotation_matrix_3D(
-            angle=np.radians(-self.alpha),
-            axis="y",
-        )
-        beta_rotation = np.rotation_matrix_3D(
-            angle=np.radians(-self.beta),
-            axis="z",
-        )
-        axes_flip = np.rotation_matrix_3D(
-            angle=np.pi,
-            axis="y",
-        )  # Since in geometry axes, X is downstream by convention, while in wind axes, X is upstream by convetion. Same with Z being up/down respectively.
+        try:
+            R = matrices["wind_to_geometry"]
+        except KeyError:
+            sa, ca, sb, cb = self._get_rotation_cache()["trig"]
+
+            # Equivalent to: flip about y @ rotate by -alpha about y @ rotate by -beta about z.
+            # (The flip is since in geometry axes, X is downstream by convention, while in wind axes, X is upstream by
+            # convention. Same with Z being up/down respectively.)
+            R = self._assemble_rotation_matrix([
+                [-ca * cb, -ca * sb, sa],
+                [-sb, cb, 0],
+                [-sa * cb, -sa * sb, -ca],
+            ])
+            matrices["wind_to_geometry"] = R
+
+        if isinstance(R, np.ndarray):
+            R = R.copy()  # So that the cached copy can't be modified in-place.
+        return R
 
-        r = axes_flip @ alpha_rotation @ beta_rotation  # where "@" is the matrix multiplication operator
+    def _get_rotation_matrix(self,
+                             from_axes: str,
+                             to_axes: str,
+                             ) -> np.ndarray:
+        """
+        Returns the (cached) rotation matrix from `from_axes` to `to_axes`; see `compute_rotation_matrix()`. The
+        returned array is shared with the cache, so it must not be modified in-place.
+        """
+        matrices = self._get_rotation_cache()["matrices"]
+
+        key = (from_axes, to_axes)
+        try:
+            return matrices[key]
+        except KeyError:
+            pass
+
+        # The j-th column of the rotation matrix is the j-th basis vector of `from_axes`, expressed in `to_axes`.
+        columns = [
+            self.convert_axes(
+                *basis_vector,
+                from_axes=from_axes,
+                to_axes=to_axes
+            )
+            for basis_vector in [(1., 0., 0.), (0., 1., 0.), (0., 0., 1.)]
+        ]
+        R = self._assemble_rotation_matrix([
+            [columns[j][i] for j in range(3)]
+            for i in range(3)
+        ])
 
-        return r
+        matrices[key] = R
+        return R
+
+    @staticmethod
+    def _assemble_rotation_matrix(entries: List[List]) -> np.ndarray:
+        """
+        Assembles a rotation matrix from a 3x3 nested list of entries, each of which may be a scalar or an array (of
+        a common length N).
+
+        Returns: A 3x3 array (or CasADi matrix, for CasADi entries), or an (N, 3, 3) array for array-valued entries.
+        """
+        if np.is_casadi_type(entries, recursive=True):
+            return np.array(entries)
+
+        R = np.array(np.broadcast_arrays(*sum(entries, [])), dtype=float)  # Shape: (9,) or (9, N)
+        return np.moveaxis(R, 0, -1).reshape(R.shape[1:] + (3, 3))
+
+    def _get_rotation_cache(self) -> Dict[str, Any]:
+        """
+        Returns a cache of the quantities that depend only on `alpha` and `beta`:
+            * "trig": the tuple (sin(alpha), cos(alpha), sin(beta), cos(beta)).
+            * "matrices": a dict of rotation matrices, keyed by (from_axes, to_axes).
+
+        The cache is rebuilt whenever `alpha` or `beta` changes, either by reassignment or (for NumPy arrays) by
+        in-place modification.
+        """
+        alpha = self.alpha
+        beta = self.beta
+
+        def is_unchanged(cached, current) -> bool:
+            if isinstance(current, np.ndarray):
+                return isinstance(cached, np.ndarray) and np.array_equal(cached, current)
+            else:
+                return cached is current
+
+        try:
+            cache = self._rotation_cache
+            if is_unchanged(cache["alpha"], alpha) and is_unchanged(cache["beta"], beta):
+                return cache
+        except AttributeError:
+            pass
+
+        self._rotation_cache = {
+            "alpha"   : alpha.copy() if isinstance(alpha, np.ndarray) else alpha,
+            "beta"    : beta.copy() if isinstance(beta, np.ndarray) else beta,
+            "trig"    : (
+                np.sind(alpha),
+                np.cosd(alpha),
+                np.sind(beta),
+                np.cosd(beta),
+            ),
+            "matrices": {},
+        }
+        return self._rotation_cache
 
     def compute_freestream_direction_geometry_axes(self):
         # Computes the freestream direction (direction the wind is GOING TO) in the geometry axes
@@ -0,0 +1,97 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+axes = ["geometry", "body", "wind", "stability"]
+
+vectors = np.array([
+    [1, 2, 3],
+    [-4, 0.5, 2],
+    [0, 0, -1],
+    [7, -3, 0.1],
+])
+
+
+def convert_rows(op_point, vectors, from_axes, to_axes):
+    return np.stack(
+        op_point.convert_axes(
+            vectors[:, 0], vectors[:, 1], vectors[:, 2],
+            from_axes=from_axes,
+            to_axes=to_axes,
+        ),
+        axis=1
+    )
+
+
+@pytest.mark.parametrize("from_axes", axes)
+@pytest.mark.parametrize("to_axes", axes)
+def test_batch_matches_convert_axes(from_axes, to_axes):
+    op_point = asb.OperatingPoint(alpha=10, beta=5)
+    expected = convert_rows(op_point, vectors, from_axes, to_axes)
+
+    assert op_point.convert_axes_batch(vectors, from_axes, to_axes) == pytest.approx(expected)
+    assert op_point.convert_axes_batch(vectors[1], from_axes, to_axes) == pytest.approx(expected[1])
+    assert op_point.compute_rotation_matrix(from_axes, to_axes) @ vectors[2] == pytest.approx(expected[2])
+
+
+def test_array_valued_op_point():
+    op_point = asb.OperatingPoint(
+        alpha=np.linspace(-10, 10, 4),
+        beta=np.array([0, 2, -3, 5]),
+    )
+    assert op_point.compute_rotation_matrix("body", "wind").shape == (4, 3, 3)
+
+    converted = op_point.convert_axes_batch(vectors, from_axes="body", to_axes="wind")
+    assert converted == pytest.approx(convert_rows(op_point, vectors, "body", "wind"))
+    for i in range(4):
+        assert converted[i] == pytest.approx(
+            op_point[i].convert_axes_batch(vectors[i], from_axes="body", to_axes="wind")
+        )
+
+
+def test_rotation_matrix_wind_to_geometry():
+    alpha = 7
+    beta = -4
+    op_point = asb.OperatingPoint(alpha=alpha, beta=beta)
+
+    expected = (
+            np.rotation_matrix_3D(np.pi, axis="y") @
+            np.rotation_matrix_3D(np.radians(-alpha), axis="y") @
+            np.rotation_matrix_3D(np.radians(-beta), axis="z")
+    )
+    assert op_point.compute_rotation_matrix_wind_to_geometry() == pytest.approx(expected)
+
+    op_point_array = asb.OperatingPoint(alpha=np.array([0, alpha]), beta=np.array([0, beta]))
+    assert op_point_array.compute_rotation_matrix_wind_to_geometry()[1] == pytest.approx(expected)
+
+
+def test_cache_tracks_state_changes():
+    op_point = asb.OperatingPoint(alpha=np.array([0., 5.]), beta=0)
+    R = op_point.compute_rotation_matrix("body", "wind")
+
+    R[0, 0, 0] = 1e3  # Modifying the returned matrix shouldn't corrupt the cache
+    assert op_point.compute_rotation_matrix("body", "wind")[0, 0, 0] == pytest.approx(1)
+
+    op_point.alpha[0] = 90  # In-place modification
+    assert op_point.convert_axes_batch(np.array([1, 0, 0]), "body", "wind")[0] == pytest.approx([0, 0, -1], abs=1e-12)
+
+    op_point.alpha = np.array([0., 5.])  # Reassignment
+    op_point.beta = 90
+    assert op_point.convert_axes_batch(np.array([1, 0, 0]), "body", "wind")[0] == pytest.approx([0, -1, 0], abs=1e-12)
+
+
+def test_symbolic():
+    opti = asb.Opti()
+    alpha = opti.variable(init_guess=0)
+    op_point = asb.OperatingPoint(alpha=alpha, beta=3)
+
+    F_w = op_point.convert_axes_batch(vectors, from_axes="geometry", to_axes="wind")
+    opti.subject_to(F_w[0, 0] == 0.5)
+    sol = opti.solve(verbose=False)
+
+    op_point_solved = asb.OperatingPoint(alpha=sol.value(alpha), beta=3)
+    assert op_point_solved.convert_axes_batch(vectors, "geometry", "wind")[0, 0] == pytest.approx(0.5)
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,86 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+import inspect
+
+"""
+Benchmarks the overhead of creating new OperatingPoint and Dynamics instances from existing ones (i.e.,
+`get_new_instance_with_state()` and indexing), which happens in tight loops during integration and slicing. Compares
+against a reference implementation that inspects the constructor's signature on every call.
+
+The tests here only check that the fast paths are equivalent to the reference; timings are not asserted, as they
+depend on the machine. Run this file directly to print a table of timings.
+"""
+
+op_point = asb.OperatingPoint(
+    velocity=np.linspace(10, 20, 100),
+    alpha=3,
+)
+dyn = asb.DynamicsRigidBody3DBodyEuler(
+    mass_props=asb.MassProperties(mass=1),
+    u_b=np.linspace(10, 20, 100),
+)
+
+
+def get_new_instance_with_state_reference(instance):
+    """
+    A reference implementation of `get_new_instance_with_state()`, which inspects the constructor every time.
+    """
+    init_args = list(inspect.signature(instance.__class__.__init__).parameters.keys())[1:]
+    return instance.__class__(**{
+        k: getattr(instance, k)
+        for k in init_args
+    })
+
+
+def index_reference(instance, index):
+    """
+    A reference implementation of indexing, which copies the instance with the reference implementation above and
+    then indexes each state variable.
+    """
+    return get_new_instance_with_state_reference(instance).get_new_instance_with_state({
+        k: v[index] if np.length(v) != 1 else v
+        for k, v in instance.state.items()
+        if not isinstance(v, asb.Atmosphere)
+    })
+
+
+benchmarks = {  # Name: (current call, reference call)
+    "OperatingPoint.get_new_instance_with_state()": (
+        lambda: op_point.get_new_instance_with_state(),
+        lambda: get_new_instance_with_state_reference(op_point),
+    ),
+    "Dynamics.get_new_instance_with_state()"      : (
+        lambda: dyn.get_new_instance_with_state(),
+        lambda: get_new_instance_with_state_reference(dyn),
+    ),
+    "OperatingPoint[i]"                           : (
+        lambda: op_point[3],
+        lambda: index_reference(op_point, 3),
+    ),
+    "Dynamics[i]"                                 : (
+        lambda: dyn[3],
+        lambda: index_reference(dyn, 3),
+    ),
+}
+
+
+@pytest.mark.parametrize("instance", [op_point, dyn])
+def test_state_copy_is_equivalent(instance):
+    new_instance = instance.get_new_instance_with_state()
+    reference = get_new_instance_with_state_reference(instance)
+    assert new_instance.__class__ is reference.__class__
+    assert new_instance.__dict__.keys() == reference.__dict__.keys()
+
+    indexed = instance[3]
+    for k, v in instance.state.items():
+        if isinstance(v, asb.Atmosphere):
+            continue
+        expected = v[3] if np.length(v) != 1 else v
+        assert indexed.state[k] == pytest.approx(expected)
+
+
+if __name__ == '__main__':
+    from aerosandbox.tools.code_benchmarking import print_timing_comparison
+
+    print_timing_comparison(benchmarks, labels=("Current", "Reference"))
@@ -0,0 +1,125 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+from aerosandbox.structures.tube_spar_bending import TubeSparBendingStructure, TubeSparBendingSolver
+import pytest
+
+span = 34
+half_span = span / 2
+lift = 200 * 9.81
+
+
+def elliptical_load(y):
+    return (lift / span) * (
+            4 / np.pi * (1 - (y / half_span) ** 2) ** 0.5
+    )
+
+
+def tapered_diameter(y):
+    return 0.12 - 0.06 * (y / half_span)
+
+
+@pytest.mark.parametrize("assume_thin_tube", [True, False])
+def test_solver_matches_structure(assume_thin_tube):
+    kwargs = dict(
+        diameter_function=tapered_diameter,
+        wall_thickness_function=2e-3,
+        bending_distributed_force_function=elliptical_load,
+        elastic_modulus_function=228e9,
+    )
+    beam = TubeSparBendingStructure(
+        length=half_span,
+        points_per_point_load=50,
+        assume_thin_tube=assume_thin_tube,
+        **kwargs
+    )
+    result = TubeSparBendingSolver(
+        length=half_span,
+        points_per_point_load=50,
+        assume_thin_tube=assume_thin_tube,
+    ).solve(
+        diameter=tapered_diameter,
+        wall_thickness=2e-3,
+        distributed_force=elliptical_load,
+        elastic_modulus=228e9,
+    )
+
+    for k in ["u", "du", "ddu", "bending_moment", "shear_force", "stress_axial"]:
+        expected = np.array(getattr(beam, k), dtype=float).reshape(-1)
+        assert result[k] == pytest.approx(expected, rel=1e-6, abs=1e-6 * np.max(np.abs(expected)))
+    assert result["volume"] == pytest.approx(beam.volume())
+
+    ### Analytic root bending moment: the load's moment about the root
+    assert result["bending_moment"][0] == pytest.approx(-lift / 2 * 4 * half_span / (3 * np.pi), rel=1e-2)
+
+
+def test_solver_batched():
+    solver = TubeSparBendingSolver(length=half_span, points_per_point_load=30)
+    scale = np.linspace(0.5, 2, 4).reshape((-1, 1))
+    result = solver.solve(
+        diameter=0.1,
+        wall_thickness=np.array([1e-3, 2e-3, 3e-3, 4e-3]).reshape((-1, 1)),
+        distributed_force=lambda y: scale * elliptical_load(y),
+    )
+    assert result["u"].shape == (4, 30)
+    assert result["volume"].shape == (4,)
+
+    for i in range(4):
+        single = solver.solve(
+            diameter=0.1,
+            wall_thickness=1e-3 * (i + 1),
+            distributed_force=scale[i, 0] * elliptical_load(solver.y),
+        )
+        for k in ["u", "stress_axial", "volume"]:
+            assert result[k][i] == pytest.approx(single[k])
+
+
+def test_solver_in_optimization():
+    N = 40
+
+    ### Reference: the Opti-based structure, sized for minimum mass
+    opti = asb.Opti()
+    beam = TubeSparBendingStructure(
+        opti=opti,
+        length=half_span,
+        diameter_function=0.12,
+        points_per_point_load=N,
+        bending_distributed_force_function=elliptical_load,
+    )
+    opti.subject_to([
+        beam.stress_axial <= 500e6,
+        beam.u[-1] <= 3,
+        beam.wall_thickness > 1e-4,
+    ])
+    opti.minimize(beam.volume() * 1600)
+    sol = opti.solve(verbose=False)
+    expected_mass = sol.value(beam.volume() * 1600)
+
+    ### The same problem, with the precompiled solver
+    opti = asb.Opti()
+    wall_thickness = opti.variable(init_guess=1e-2, n_vars=N, lower_bound=1e-4, upper_bound=0.12)
+    result = TubeSparBendingSolver(length=half_span, points_per_point_load=N).solve(
+        diameter=0.12,
+        wall_thickness=wall_thickness,
+        distributed_force=elliptical_load,
+    )
+    opti.subject_to([
+        result["stress_axial"] <= 500e6,
+        result["u"][-1] <= 3,
+    ])
+    mass = result["volume"] * 1600
+    opti.minimize(mass)
+    sol = opti.solve(verbose=False)
+
+    assert sol.value(mass) == pytest.approx(expected_mass, rel=1e-4)
+    assert opti.nx == N  # No variables are added, other than the design variables
+
+
+def test_casadi_function_is_shared():
+    a = TubeSparBendingSolver(length=10, points_per_point_load=25)
+    b = TubeSparBendingSolver(length=10, points_per_point_load=25)
+    assert a.casadi_function is b.casadi_function
+    assert a.casadi_function is not TubeSparBendingSolver(length=10, points_per_point_load=26).casadi_function
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -1,6 +1,8 @@
 import aerosandbox as asb
 import aerosandbox.numpy as np
-from typing import Callable, Union, Dict
+from typing import Callable, Union, Dict, Tuple
+from functools import lru_cache
+import casadi as _cas
 
 
 class TubeSparBendingStructure(asb.ImplicitAnalysis):
@@ -359,6 +361,287 @@ class TubeSparBendingStructure(asb.ImplicitAnalysis):
             p.show_plot("Tube Spar Bending Structure")
 
 
+class TubeSparBendingSolver(asb.AeroSandboxObject):
+    output_names: Tuple[str, ...] = (
+        "I",
+        "u",
+        "du",
+        "ddu",
+        "dEIddu",
+        "bending_moment",
+        "shear_force",
+        "stress_axial",
+        "volume",
+    )
+    """The keys of the dictionary returned by `solve()` (in addition to "y"), in order."""
+
+    def __init__(self,
+                 length: float,
+                 points_per_point_load: int = 20,
+                 assume_thin_tube=True,
+                 ):
+        """
+        A precompiled version of the `TubeSparBendingStructure` model, for a fixed discretization. The spar
+        properties (diameter, wall thickness, load, and elastic modulus) are parameters of the solve, rather than
+        of the construction, so one solver can be reused across many sizing cases.
+
+        Same model (Euler-Bernoulli beam theory for a cantilever tube spar) and discretization (trapezoidal
+        integration on `points_per_point_load` evenly-spaced nodes) as `TubeSparBendingStructure`, so the results
+        are identical. See the docstring of `TubeSparBendingStructure` for details.
+
+        Since a cantilever beam is statically determinate, the discretized governing equations are a banded
+        (bidiagonal) linear system, once ordered from the tip (for shear and moment) and from the root (for slope
+        and displacement). So, rather than solving an optimization problem, `solve()` computes the solution directly
+        by back- and forward-substitution.
+
+            * With numeric inputs, the solution is computed directly with NumPy. Many cases can be solved at once,
+            by giving the inputs a leading batch dimension.
+
+            * With CasADi inputs (e.g., optimization variables), the solution is computed as one call to a single,
+            precompiled CasADi Function (see `TubeSparBendingSolver.casadi_function`). This keeps the problem small:
+            no new variables or constraints are added to your `Opti` instance.
+
+        Example:
+
+            >>> solver = TubeSparBendingSolver(length=17, points_per_point_load=100)
+            >>>
+            >>> ### Numeric: sweep the load over 200 cases at once
+            >>> lift = np.linspace(1000, 3000, 200).reshape((-1, 1))
+            >>> result = solver.solve(
+            >>>     diameter=0.12,
+            >>>     wall_thickness=2e-3,
+            >>>     distributed_force=lambda y: lift / 34 * 4 / np.pi * (1 - (y / 17) ** 2) ** 0.5,
+            >>> )
+            >>> tip_displacements = result["u"][:, -1]  # Shape: (200,)
+            >>>
+            >>> ### Symbolic: size the wall thickness in a larger optimization problem
+            >>> opti = asb.Opti()
+            >>> wall_thickness = opti.variable(init_guess=1e-2, n_vars=100, lower_bound=1e-4)
+            >>> result = solver.solve(
+            >>>     diameter=0.12,
+            >>>     wall_thickness=wall_thickness,
+            >>>     distributed_force=lambda y: 2000 / 34 * 4 / np.pi * (1 - (y / 17) ** 2) ** 0.5,
+            >>> )
+            >>> opti.subject_to(result["stress_axial"] <= 500e6)
+            >>> opti.minimize(result["volume"])
+
+        Args:
+
+            length: Length of the spar [m]. Spar is assumed to go from y=0 (cantilever support) to y=length (free tip).
+
+            points_per_point_load: Controls the discretization resolution of the beam. [int] See
+            `TubeSparBendingStructure`.
+
+            assume_thin_tube: Makes assumptions that are applicable in the limit of a thin-walled (wall_thickness <<
+            diameter) tube. See `TubeSparBendingStructure`.
+
+        """
+        self.length = length
+        self.points_per_point_load = points_per_point_load
+        self.assume_thin_tube = assume_thin_tube
+
+        self.y = np.linspace(
+            0,
+            length,
+            points_per_point_load
+        )
+        self._integration_matrix = np.integration_matrix(self.y, method="trapezoidal")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(length={self.length}, points_per_point_load={self.points_per_point_load})"
+
+    @property
+    def casadi_function(self) -> _cas.Function:
+        """
+        The solution as a single CasADi Function, mapping the column vectors (each of length `points_per_point_load`):
+
+            (diameter, wall_thickness, distributed_force, elastic_modulus)
+
+        to the outputs in `TubeSparBendingSolver.output_names`. Built once per discretization, and shared between
+        all solvers with that discretization.
+        """
+        return _get_tube_spar_bending_function(
+            length=float(self.length),
+            points_per_point_load=int(self.points_per_point_load),
+            assume_thin_tube=bool(self.assume_thin_tube),
+        )
+
+    def solve(self,
+              diameter: Union[float, np.ndarray, Callable[[np.ndarray], np.ndarray]],
+              wall_thickness: Union[float, np.ndarray, Callable[[np.ndarray], np.ndarray]],
+              distributed_force: Union[float, np.ndarray, Callable[[np.ndarray], np.ndarray]] = 0.,
+              elastic_modulus: Union[float, np.ndarray, Callable[[np.ndarray], np.ndarray]] = 175e9,  # Pa
+              ) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Solves for the bending of the spar. Each input can be one of:
+
+            * a float or a CasADi scalar, in which case it's interpreted as a uniform value along the spar.
+
+            * an array (NumPy or CasADi) of values at each node `TubeSparBendingSolver.y`.
+
+            * a function (or other callable) in the form f(y), where y is the coordinate along the length of the
+            spar. This function should be vectorized (e.g., a vector input of y values produces a vector output).
+
+        With all-numeric inputs, NumPy arrays can also have leading batch dimensions (e.g., an array of shape (n_cases,
+        N)), which are broadcast against each other to solve many cases at once.
+
+        Args:
+
+            diameter: The nominal (centerline) diameter of the tube [m].
+
+            wall_thickness: The wall thickness of the tube [m].
+
+            distributed_force: The load per unit span applied to the spar [N/m].
+
+            elastic_modulus: The elastic modulus of the spar [Pa].
+
+        Returns: A dictionary with keys "y" and those in `TubeSparBendingSolver.output_names`. These have the same
+        meanings as the attributes of `TubeSparBendingStructure` of the same names; "volume" is the volume of the
+        spar material [m^3].
+
+        """
+        inputs = [
+            value(self.y) if isinstance(value, Callable) else value
+            for value in [diameter, wall_thickness, distributed_force, elastic_modulus]
+        ]
+
+        if not np.is_casadi_type(inputs, recursive=True):
+            inputs = np.broadcast_arrays(
+                np.asarray(self.y, dtype=float),
+                *[np.asarray(value, dtype=float) for value in inputs]
+            )[1:]
+            result = _solve_tube_spar_bending(
+                self._integration_matrix,
+                *inputs,
+                assume_thin_tube=self.assume_thin_tube,
+            )
+
+        else:
+            N = np.length(self.y)
+
+            def to_column(value):
+                if np.is_casadi_type(value, recursive=False):
+                    if value.shape == (1, 1):
+                        return value * np.ones((N, 1))
+                    return _cas.reshape(value, N, 1)
+                else:
+                    return np.reshape(np.asarray(value, dtype=float) * np.ones(N), (N, 1))
+
+            outputs = self.casadi_function(*[to_column(value) for value in inputs])
+            result = dict(zip(self.output_names, outputs))
+
+        return {
+            "y": self.y,
+            **result,
+        }
+
+
+@lru_cache(maxsize=None)
+def _get_tube_spar_bending_function(
+        length: float,
+        points_per_point_load: int,
+        assume_thin_tube: bool,
+) -> _cas.Function:
+    """
+    Builds the CasADi Function behind `TubeSparBendingSolver.casadi_function`. Cached per discretization.
+    """
+    y = np.linspace(0, length, points_per_point_load)
+    inputs = [
+        _cas.MX.sym(name, points_per_point_load)
+        for name in ["diameter", "wall_thickness", "distributed_force", "elastic_modulus"]
+    ]
+    outputs = _solve_tube_spar_bending(
+        np.integration_matrix(y, method="trapezoidal"),
+        *inputs,
+        assume_thin_tube=assume_thin_tube
+    )
+
+    return _cas.Function(
+        "tube_spar_bending",
+        inputs,
+        [outputs[k] for k in TubeSparBendingSolver.output_names],
+        [symbol.name() for symbol in inputs],
+        list(TubeSparBendingSolver.output_names),
+    )
+
+
+def _solve_tube_spar_bending(
+        integration_matrix: np.SparseOperator,
+        diameter,
+        wall_thickness,
+        distributed_force,
+        elastic_modulus,
+        assume_thin_tube: bool = True,
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Solves the discretized cantilever beam equations of `TubeSparBendingStructure` directly. Inputs are either NumPy
+    arrays with nodes along the last axis, or CasADi column vectors.
+
+    `integration_matrix` is the trapezoidal integration operator over each interval between nodes; see
+    `np.integration_matrix()`.
+    """
+
+    def cumulative_integral(f, from_tip: bool = False):
+        # The trapezoidal integral of f from the root to each node (or, if `from_tip`, from the tip to each node).
+        # This is the solution of the bidiagonal system that `Opti.constrain_derivative()` would set up.
+        if np.is_casadi_type(f, recursive=False):
+            integral = _cas.vertcat(0, _cas.cumsum(integration_matrix @ f))
+            tip_integral = integral[-1]
+        else:  # Nodes are along the last axis, with any batch dimensions before it.
+            f = np.asarray(f)
+            interval_integrals = np.reshape(
+                (integration_matrix @ np.reshape(f, (-1, f.shape[-1])).T).T,
+                f.shape[:-1] + (-1,)
+            )
+            integral = np.concatenate([
+                np.zeros_like(f[..., :1]),
+                np.cumsum(interval_integrals, axis=-1)
+            ], axis=-1)
+            tip_integral = integral[..., -1:]
+
+        if from_tip:
+            return integral - tip_integral
+        else:
+            return integral
+
+    if assume_thin_tube:
+        I = np.pi / 8 * diameter ** 3 * wall_thickness
+        cross_sectional_area = np.pi * diameter * wall_thickness
+    else:
+        I = np.pi / 64 * (
+                (diameter + wall_thickness) ** 4 -
+                (diameter - wall_thickness) ** 4
+        )
+        cross_sectional_area = np.pi / 4 * (
+                (diameter + wall_thickness) ** 2 -
+                (diameter - wall_thickness) ** 2
+        )
+    EI = elastic_modulus * I
+
+    ### Integrate from the free tip (zero shear and moment) to the root, then from the root (zero displacement and
+    # slope) to the tip.
+    dEIddu = cumulative_integral(distributed_force, from_tip=True)
+    EIddu = cumulative_integral(dEIddu, from_tip=True)
+    ddu = EIddu / EI
+    du = cumulative_integral(ddu)
+    u = cumulative_integral(du)
+
+    volume = cumulative_integral(cross_sectional_area)
+    volume = volume[-1] if np.is_casadi_type(volume, recursive=False) else volume[..., -1]
+
+    return {
+        "I"             : I,
+        "u"             : u,
+        "du"            : du,
+        "ddu"           : ddu,
+        "dEIddu"        : dEIddu,
+        "bending_moment": -EIddu,
+        "shear_force"   : -dEIddu,
+        "stress_axial"  : elastic_modulus * ddu * (diameter + wall_thickness) / 2,
+        "volume"        : volume,
+    }
+
+
 if __name__ == '__main__':
     import aerosandbox.tools.units as u
 
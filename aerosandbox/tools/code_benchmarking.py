@@ -0,0 +1,73 @@
+import timeit
+from typing import Callable, Dict, Tuple
+
+
+def time_call(
+        f: Callable[[], object],
+        number: int = 2000,
+        repeat: int = 5,
+) -> float:
+    """
+    Returns the best-case time per call of a function that takes no arguments, in seconds.
+
+    Args:
+
+        f: The function to time. Called as `f()`.
+
+        number: The number of calls to make in each timing run.
+
+        repeat: The number of timing runs. The fastest run is used, as it is the least affected by other processes.
+
+    Returns: The time per call, in seconds.
+
+    """
+    return min(timeit.repeat(f, number=number, repeat=repeat)) / number
+
+
+def print_timing_comparison(
+        benchmarks: Dict[str, Tuple[Callable[[], object], Callable[[], object]]],
+        labels: Tuple[str, str] = ("Current", "Reference"),
+        number: int = 2000,
+        repeat: int = 5,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Times pairs of functions (e.g., an optimized implementation and a reference implementation) and prints a table
+    of the results. The "Difference" column is (time A - time B), and the "Speedup" column is (time B / time A).
+
+    Example:
+        >>> print_timing_comparison({
+        >>>     "sum": (lambda: np.sum(a), lambda: sum(a)),
+        >>> }, labels=("NumPy", "Python"))
+
+    Args:
+
+        benchmarks: A dictionary of {name: (function A, function B)}. Each function is called with no arguments.
+
+        labels: Column labels for function A and function B.
+
+        number: The number of calls to make in each timing run. See `time_call()`.
+
+        repeat: The number of timing runs. See `time_call()`.
+
+    Returns: A dictionary of {name: (time of function A, time of function B)}, in seconds per call.
+
+    """
+    name_width = max([len("Benchmark"), *[len(name) for name in benchmarks.keys()]]) + 2
+    columns = [f"{labels[0]} [us]", f"{labels[1]} [us]", "Difference [us]", "Speedup"]
+
+    print(f"{'Benchmark':<{name_width}}" + "".join(f"{c:>18}" for c in columns))
+
+    timings = {}
+    for name, (f_a, f_b) in benchmarks.items():
+        t_a = time_call(f_a, number=number, repeat=repeat)
+        t_b = time_call(f_b, number=number, repeat=repeat)
+        timings[name] = (t_a, t_b)
+        print(
+            f"{name:<{name_width}}"
+            f"{t_a * 1e6:>18.3f}"
+            f"{t_b * 1e6:>18.3f}"
+            f"{(t_a - t_b) * 1e6:>18.3f}"
+            f"{t_b / t_a:>17.1f}x"
+        )
+
+    return timings
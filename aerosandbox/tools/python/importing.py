@@ -1,4 +1,5 @@
 import importlib
+import importlib.util
 import sys
 
 
@@ -13,9 +14,13 @@ def lazy_import(name):
     Args:
         name: The package name
 
-    Returns: The module itself, to be loaded on first use.
+    Returns: The module itself, to be loaded on first use. If the module has already been imported, it is returned
+    as-is.
 
     """
+    if name in sys.modules:
+        return sys.modules[name]
+
     spec = importlib.util.find_spec(name)
     loader = importlib.util.LazyLoader(spec.loader)
     spec.loader = loader
@@ -0,0 +1,118 @@
+import subprocess
+import sys
+import pytest
+
+"""
+Checks (and benchmarks) the startup cost of `import aerosandbox`, which lazily loads its subpackages.
+
+Run this file directly to print the import times.
+"""
+
+
+def run_in_fresh_interpreter(code: str) -> str:
+    """
+    Runs some Python code in a new interpreter (so that nothing is already imported), and returns its stdout.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def import_time(statement: str = "import aerosandbox as asb", n_runs: int = 5) -> float:
+    """
+    Returns the best-case wall-clock time to run `statement` in a fresh interpreter, in seconds.
+    """
+    return min(
+        float(run_in_fresh_interpreter(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(time.perf_counter() - start)\n"
+        ))
+        for _ in range(n_runs)
+    )
+
+
+def test_import_does_not_load_heavy_dependencies():
+    output = run_in_fresh_interpreter(
+        "import sys\n"
+        "import aerosandbox as asb\n"
+        "print([m for m in ['casadi', 'scipy', 'pandas', 'matplotlib'] if m in sys.modules])\n"
+    )
+    assert output.strip() == "[]"
+
+
+def test_datasets_not_loaded_on_use():
+    output = run_in_fresh_interpreter(
+        "import sys\n"
+        "import aerosandbox as asb\n"
+        "asb.Atmosphere(altitude=1000).density()\n"
+        "asb.Airplane()\n"
+        "print([m for m in ['pandas', 'matplotlib'] if m in sys.modules])\n"
+    )
+    assert output.strip() == "[]"
+
+
+def test_lazy_namespace_matches_eager_namespace():
+    import aerosandbox as asb
+    import importlib
+    import types
+
+    ### Emulate the star-imports of each subpackage, noting which subpackage provides each name
+    eager_namespace = {}
+    eager_homes = {}
+    for subpackage in asb._lazy_subpackages:
+        module = importlib.import_module(f"aerosandbox.{subpackage}")
+        for name in vars(module):
+            if name.startswith("_"):
+                continue
+            if name not in eager_namespace or getattr(module, name) is not eager_namespace[name]:
+                eager_homes[name] = subpackage
+            eager_namespace[name] = getattr(module, name)
+
+    lazy_attributes = asb._lazy_attributes
+
+    for name, subpackage in lazy_attributes.items():
+        assert subpackage == eager_homes[name], name
+        assert getattr(asb, name) is eager_namespace[name]
+
+    ### Every public name should be listed, except for modules (as importing a submodule also attaches it to its
+    ### parent package as a side effect, and star-imports then pass it along).
+    missing = sorted(
+        name
+        for name, value in eager_namespace.items()
+        if name not in lazy_attributes and not isinstance(value, types.ModuleType)
+    )
+    assert missing == [], f"Add these names to `_lazy_attributes` in `aerosandbox/__init__.py`: {missing}"
+
+    for name in ["Airplane", "Opti", "np", "cas", "AeroBuildup", "OperatingPoint"]:
+        assert name in lazy_attributes
+        assert getattr(asb, name) is eager_namespace[name]
+
+    assert "Airplane" in dir(asb)
+    assert "AeroBuildup" in asb.__all__
+
+    with pytest.raises(AttributeError):
+        asb.this_attribute_does_not_exist
+
+
+def test_lazy_attributes_resolve_in_fresh_interpreter():
+    output = run_in_fresh_interpreter(
+        "import aerosandbox as asb\n"
+        "print(asb.AeroSandboxObject.__module__, asb.is_casadi_type.__module__, asb.OperatingPoint.__name__)\n"
+    )
+    assert output.split() == ["aerosandbox.common", "aerosandbox.numpy.determine_type", "OperatingPoint"]
+
+
+if __name__ == '__main__':
+    for statement in [
+        "import aerosandbox as asb",
+        "import aerosandbox as asb; asb.Opti",
+        "import aerosandbox as asb; asb.Airplane",
+        "import aerosandbox as asb; asb.Atmosphere(altitude=1000).density()",
+        "import aerosandbox as asb; asb.AeroBuildup",
+    ]:
+        print(f"{statement:<70} {import_time(statement) * 1e3:8.1f} ms")
@@ -1,6 +1,7 @@
 import aerosandbox.numpy as np
 from aerosandbox.common import AeroSandboxObject
-from typing import Union
+from typing import Union, List, Dict, Any
+import casadi as _cas
 
 
 class MassProperties(AeroSandboxObject):
@@ -165,6 +166,14 @@ class MassProperties(AeroSandboxObject):
             Ixz=total_inertia_tensor_elements[5],
         )
 
+    def __radd__(self, other: "MassProperties") -> "MassProperties":
+        """
+        Allows MassProperties objects to be combined with the built-in `sum()`, which starts from the integer 0.
+        """
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return self.__add__(other)
+
     def __sub__(self, other: "MassProperties") -> "MassProperties":
         """
         Subtracts one MassProperties object from another. (opposite of __add__() )
@@ -336,6 +345,308 @@ class MassProperties(AeroSandboxObject):
             return Jxx, Jyy, Jzz, Jxy, Jyz, Jxz
 
 
+class MassPropertiesSet(AeroSandboxObject):
+    """
+    The mass properties of a collection of rigid components, stored in columnar form (i.e., one array per mass
+    property, indexed by component).
+
+    Where summing N MassProperties objects pairwise takes N-1 parallel-axis shifts, a MassPropertiesSet aggregates the
+    total mass, center of gravity, and inertia tensor in a single vectorized pass. The aggregated moments are kept, so
+    "what-if" queries (e.g., the total without one component, or with one component scaled) are O(1), and the totals
+    with each component removed in turn are a single vectorized operation.
+
+    Works with both NumPy and CasADi arrays.
+
+    Usage:
+
+        >>> mps = MassPropertiesSet.from_mass_properties({
+        >>>     "wing"    : asb.MassProperties(mass=3, x_cg=0.5),
+        >>>     "fuselage": asb.MassProperties(mass=5, x_cg=1.2, Iyy=0.4),
+        >>>     "battery" : asb.MassProperties(mass=2, x_cg=0.3),
+        >>> })
+        >>> mps.total()  # Same as summing the three MassProperties objects
+        >>> mps.total_without("battery")
+        >>> mps.total_with_scaled("wing", 1.1)  # Wing mass grows by 10%
+    """
+
+    _column_names = ("mass", "x_cg", "y_cg", "z_cg", "Ixx", "Iyy", "Izz", "Ixy", "Iyz", "Ixz")
+
+    def __init__(self,
+                 mass: Union[float, np.ndarray],
+                 x_cg: Union[float, np.ndarray] = 0.,
+                 y_cg: Union[float, np.ndarray] = 0.,
+                 z_cg: Union[float, np.ndarray] = 0.,
+                 Ixx: Union[float, np.ndarray] = 0.,
+                 Iyy: Union[float, np.ndarray] = 0.,
+                 Izz: Union[float, np.ndarray] = 0.,
+                 Ixy: Union[float, np.ndarray] = 0.,
+                 Iyz: Union[float, np.ndarray] = 0.,
+                 Ixz: Union[float, np.ndarray] = 0.,
+                 names: List[str] = None,
+                 ):
+        """
+        Initializes a new MassPropertiesSet object from columns of mass properties.
+
+        Each argument has the same meaning as in the MassProperties constructor, but is given as an array with one
+        entry per component (the first axis). Scalars are broadcast to all components.
+
+        The set should be treated as immutable: the aggregated moments are computed once, at construction.
+
+        Args:
+
+            mass: Mass of each component [kg]
+
+            x_cg, y_cg, z_cg: Location of the center of gravity of each component [m]
+
+            Ixx, Iyy, Izz, Ixy, Iyz, Ixz: Components of the inertia tensor of each component, as measured about the
+            component's own center of mass [kg m^2].
+
+            names: Optional. A list of component names, which can then be used to refer to components in
+            `__getitem__()` and the "what-if" queries.
+        """
+        columns = dict(zip(self._column_names, (mass, x_cg, y_cg, z_cg, Ixx, Iyy, Izz, Ixy, Iyz, Ixz)))
+
+        if np.is_casadi_type(list(columns.values()), recursive=True):
+            ### Columns are stored as CasADi column vectors.
+            n_components = max(np.length(v) for v in columns.values())
+
+            def as_column(v):
+                if not np.is_casadi_type(v, recursive=False):
+                    v = _cas.DM(np.broadcast_to(np.reshape(np.array(v, dtype=float), -1), (n_components,)))
+                elif v.shape[0] == 1 and v.shape[1] != 1:
+                    v = v.T
+                if v.shape[0] == 1 and n_components != 1:
+                    v = _cas.repmat(v, n_components, 1)
+                return v
+
+            columns = {k: as_column(v) for k, v in columns.items()}
+
+        else:
+            columns = dict(zip(
+                columns.keys(),
+                np.broadcast_arrays(*[
+                    np.atleast_1d(np.array(v, dtype=float))
+                    for v in columns.values()
+                ])
+            ))
+            n_components = np.length(columns["mass"])
+
+        for k, v in columns.items():
+            setattr(self, k, v)
+
+        if names is not None:
+            names = list(names)
+            if len(names) != n_components:
+                raise ValueError(
+                    f"`names` has {len(names)} entries, but there are {n_components} components."
+                )
+            if len(set(names)) != len(names):
+                raise ValueError("`names` must be unique.")
+        self.names = names
+        self._name_to_index = {} if names is None else {name: i for i, name in enumerate(names)}
+        self._n_components = n_components
+
+        ### Aggregate the moments of all components in one pass.
+        self._component_moments = _mass_moments(**columns)
+        self._total_moments = {
+            k: _sum_components(v)
+            for k, v in self._component_moments.items()
+        }
+
+    @classmethod
+    def from_mass_properties(cls,
+                             mass_properties: Union[Dict[str, MassProperties], List[MassProperties]],
+                             ) -> "MassPropertiesSet":
+        """
+        Creates a MassPropertiesSet from a collection of MassProperties objects.
+
+        Args:
+
+            mass_properties: Either a dictionary of {name: MassProperties}, or a list of MassProperties objects.
+
+        Returns: A MassPropertiesSet, with one component per MassProperties object.
+        """
+        if isinstance(mass_properties, dict):
+            names = list(mass_properties.keys())
+            mass_properties = list(mass_properties.values())
+        else:
+            names = None
+            mass_properties = list(mass_properties)
+
+        if len(mass_properties) == 0:
+            raise ValueError("Cannot create a MassPropertiesSet with no components.")
+
+        columns = {}
+        for k in cls._column_names:
+            values = [getattr(mp, k) for mp in mass_properties]
+            if np.is_casadi_type(values, recursive=True):
+                columns[k] = _cas.vertcat(*values)
+            else:
+                columns[k] = np.array(values, dtype=float)
+
+        return cls(**columns, names=names)
+
+    def __repr__(self) -> str:
+        if self.names is None:
+            return f"MassPropertiesSet ({len(self)} components)"
+        else:
+            return f"MassPropertiesSet ({len(self)} components: {', '.join(self.names)})"
+
+    def __len__(self) -> int:
+        return self._n_components
+
+    def _get_index(self, key: Union[str, int]) -> int:
+        if isinstance(key, str):
+            try:
+                return self._name_to_index[key]
+            except KeyError:
+                raise KeyError(f"No component named '{key}' in this MassPropertiesSet.")
+
+        index = int(key)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Component index {key} is out of range for {len(self)} components.")
+        return index
+
+    def __getitem__(self, key: Union[str, int]) -> MassProperties:
+        """
+        Returns the mass properties of a single component, by name or by index.
+        """
+        index = self._get_index(key)
+        return MassProperties(**{
+            k: getattr(self, k)[index]
+            for k in self._column_names
+        })
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def total(self) -> MassProperties:
+        """
+        Returns the combined mass properties of all components (equivalent to summing the MassProperties of each).
+        """
+        return _mass_properties_from_moments(self._total_moments)
+
+    def total_without(self, key: Union[str, int]) -> MassProperties:
+        """
+        Returns the combined mass properties of all components except one.
+
+        Args:
+
+            key: The name or index of the component to remove.
+        """
+        index = self._get_index(key)
+        return _mass_properties_from_moments({
+            k: v - self._component_moments[k][index]
+            for k, v in self._total_moments.items()
+        })
+
+    def total_with_scaled(self, key: Union[str, int], factor: Union[float, np.ndarray]) -> MassProperties:
+        """
+        Returns the combined mass properties of all components, with one component's mass (and inertia) scaled by
+        a factor, holding its center of gravity fixed. (The same scaling as `MassProperties.__mul__()`.)
+
+        Args:
+
+            key: The name or index of the component to scale.
+
+            factor: The factor by which to scale the component. May be an array, to evaluate many factors at once.
+        """
+        index = self._get_index(key)
+        return _mass_properties_from_moments({
+            k: v + (factor - 1) * self._component_moments[k][index]
+            for k, v in self._total_moments.items()
+        })
+
+    def total_with_replaced(self, key: Union[str, int], mass_properties: MassProperties) -> MassProperties:
+        """
+        Returns the combined mass properties of all components, with one component replaced by another.
+
+        Args:
+
+            key: The name or index of the component to replace.
+
+            mass_properties: The MassProperties of the replacement component.
+        """
+        index = self._get_index(key)
+        new_moments = _mass_moments(**{
+            k: getattr(mass_properties, k)
+            for k in self._column_names
+        })
+        return _mass_properties_from_moments({
+            k: v - self._component_moments[k][index] + new_moments[k]
+            for k, v in self._total_moments.items()
+        })
+
+    def totals_without_each(self) -> MassProperties:
+        """
+        Returns the combined mass properties with each component removed in turn, as a single vectorized
+        MassProperties object. Entry i (e.g., `mps.totals_without_each()[i]`) is the total without component i.
+
+        Useful for sensitivity studies (e.g., how far the center of gravity moves if each component is deleted).
+        """
+        return _mass_properties_from_moments({
+            k: v - self._component_moments[k]
+            for k, v in self._total_moments.items()
+        })
+
+
+def _sum_components(array):
+    """
+    Sums an array of per-component values along its first (component) axis.
+    """
+    if np.is_casadi_type(array, recursive=False):
+        return _cas.sum1(array)
+    else:
+        return array.sum(axis=0)
+
+
+def _mass_moments(mass, x_cg, y_cg, z_cg, Ixx, Iyy, Izz, Ixy, Iyz, Ixz) -> Dict[str, Any]:
+    """
+    Computes the additive moments of a mass distribution: mass, first moments of mass about the origin, and the
+    inertia tensor about the origin. Operates elementwise, so it works on one component or on columns of many.
+    """
+    m_x = mass * x_cg
+    m_y = mass * y_cg
+    m_z = mass * z_cg
+    return {
+        "mass": mass,
+        "m_x" : m_x,
+        "m_y" : m_y,
+        "m_z" : m_z,
+        "Jxx" : Ixx + m_y * y_cg + m_z * z_cg,
+        "Jyy" : Iyy + m_z * z_cg + m_x * x_cg,
+        "Jzz" : Izz + m_x * x_cg + m_y * y_cg,
+        "Jxy" : Ixy - m_x * y_cg,
+        "Jyz" : Iyz - m_y * z_cg,
+        "Jxz" : Ixz - m_z * x_cg,
+    }
+
+
+def _mass_properties_from_moments(moments: Dict[str, Any]) -> MassProperties:
+    """
+    The inverse of `_mass_moments()`: recovers the center of gravity and the inertia tensor about it.
+    """
+    mass = moments["mass"]
+    x_cg = moments["m_x"] / mass
+    y_cg = moments["m_y"] / mass
+    z_cg = moments["m_z"] / mass
+    return MassProperties(
+        mass=mass,
+        x_cg=x_cg,
+        y_cg=y_cg,
+        z_cg=z_cg,
+        Ixx=moments["Jxx"] - moments["m_y"] * y_cg - moments["m_z"] * z_cg,
+        Iyy=moments["Jyy"] - moments["m_z"] * z_cg - moments["m_x"] * x_cg,
+        Izz=moments["Jzz"] - moments["m_x"] * x_cg - moments["m_y"] * y_cg,
+        Ixy=moments["Jxy"] + moments["m_x"] * y_cg,
+        Iyz=moments["Jyz"] + moments["m_y"] * z_cg,
+        Ixz=moments["Jxz"] + moments["m_z"] * x_cg,
+    )
+
+
 if __name__ == '__main__':
     mp1 = MassProperties(
         mass=1
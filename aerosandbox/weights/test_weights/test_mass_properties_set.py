@@ -0,0 +1,142 @@
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import pytest
+
+attributes = ["mass", "x_cg", "y_cg", "z_cg", "Ixx", "Iyy", "Izz", "Ixy", "Iyz", "Ixz"]
+
+
+def random_components(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        f"component_{i}": asb.MassProperties(
+            mass=rng.uniform(0.1, 5),
+            x_cg=rng.uniform(-2, 3),
+            y_cg=rng.uniform(-5, 5),
+            z_cg=rng.uniform(-0.5, 0.5),
+            Ixx=rng.uniform(0, 0.2),
+            Iyy=rng.uniform(0, 0.2),
+            Izz=rng.uniform(0, 0.2),
+            Ixy=rng.uniform(-0.01, 0.01),
+            Iyz=rng.uniform(-0.01, 0.01),
+            Ixz=rng.uniform(-0.01, 0.01),
+        )
+        for i in range(n)
+    }
+
+
+def assert_mass_properties_close(actual, expected):
+    for k in attributes:
+        assert getattr(actual, k) == pytest.approx(getattr(expected, k), rel=1e-9, abs=1e-9), k
+
+
+def test_total_matches_pairwise_sum():
+    components = random_components(20)
+    mps = asb.MassPropertiesSet.from_mass_properties(components)
+    assert len(mps) == 20
+
+    assert_mass_properties_close(mps.total(), sum(components.values()))
+    assert_mass_properties_close(mps["component_3"], components["component_3"])
+    assert_mass_properties_close(mps[-1], components["component_19"])
+
+
+def test_what_if_queries():
+    components = random_components(10)
+    mps = asb.MassPropertiesSet.from_mass_properties(components)
+
+    assert_mass_properties_close(
+        mps.total_without("component_4"),
+        sum(v for k, v in components.items() if k != "component_4")
+    )
+    assert_mass_properties_close(
+        mps.total_with_scaled("component_7", 1.5),
+        sum(v * 1.5 if k == "component_7" else v for k, v in components.items())
+    )
+    replacement = asb.MassProperties(mass=9, x_cg=1, Iyy=0.3)
+    assert_mass_properties_close(
+        mps.total_with_replaced("component_0", replacement),
+        sum(replacement if k == "component_0" else v for k, v in components.items())
+    )
+
+    leave_one_out = mps.totals_without_each()
+    assert np.shape(leave_one_out.mass) == (10,)
+    for i in range(10):
+        assert_mass_properties_close(leave_one_out[i], mps.total_without(i))
+
+    ### Many scale factors at once
+    factors = np.linspace(0.5, 2, 4)
+    scaled = mps.total_with_scaled(2, factors)
+    for i, f in enumerate(factors):
+        assert_mass_properties_close(scaled[i], mps.total_with_scaled(2, f))
+
+    with pytest.raises(KeyError):
+        mps.total_without("not_a_component")
+    with pytest.raises(IndexError):
+        mps[10]
+
+
+def test_columnar_constructor():
+    mps = asb.MassPropertiesSet(
+        mass=np.array([1, 1]),
+        x_cg=np.array([0, 1]),
+        Iyy=0.1,  # Broadcast to all components
+    )
+    total = mps.total()
+    assert total.mass == pytest.approx(2)
+    assert total.x_cg == pytest.approx(0.5)
+    assert total.Iyy == pytest.approx(0.2 + 2 * 0.5 ** 2)
+    assert total.Izz == pytest.approx(2 * 0.5 ** 2)
+
+    with pytest.raises(ValueError):
+        asb.MassPropertiesSet(mass=np.array([1, 2]), names=["a"])
+
+
+def test_casadi():
+    components = random_components(5)
+    opti = asb.Opti()
+    battery_mass = opti.variable(init_guess=1, lower_bound=0)
+    battery_x = opti.variable(init_guess=0)
+    components["battery"] = asb.MassProperties(mass=battery_mass, x_cg=battery_x)
+
+    mps = asb.MassPropertiesSet.from_mass_properties(components)
+    total = mps.total()
+    opti.subject_to([
+        total.x_cg == 0.25,
+        mps.total_without("battery").mass + battery_mass == 15,
+    ])
+    opti.minimize(battery_x ** 2)
+    sol = opti.solve(verbose=False)
+
+    assert sol.value(total.mass) == pytest.approx(15)
+    assert sol.value(total.x_cg) == pytest.approx(0.25)
+
+    solved = dict(components)
+    solved["battery"] = asb.MassProperties(mass=sol.value(battery_mass), x_cg=sol.value(battery_x))
+    expected = sum(solved.values())
+    for k in attributes:
+        assert sol.value(getattr(total, k)) == pytest.approx(getattr(expected, k), rel=1e-6, abs=1e-9)
+
+
+def test_total_without_matches_pairwise_sum():
+    components = list(random_components(300).values())
+    mps = asb.MassPropertiesSet.from_mass_properties(components)
+
+    assert_mass_properties_close(
+        mps.total_without(7),
+        sum(components[:7] + components[8:]),
+    )
+
+
+if __name__ == '__main__':
+    from aerosandbox.tools.code_benchmarking import print_timing_comparison
+
+    components = list(random_components(300).values())
+    mps = asb.MassPropertiesSet.from_mass_properties(components)
+
+    print_timing_comparison({  # Typically ~100x faster
+        "total_without (300 components)": (
+            lambda: mps.total_without(7),
+            lambda: sum(components[:7] + components[8:]),
+        ),
+    }, labels=("MassPropertiesSet", "Pairwise sum"), number=5)
+
+    pytest.main()